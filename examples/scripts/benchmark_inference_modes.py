@@ -0,0 +1,123 @@
+"""
+Benchmark float32, int8 and bfloat16 CPU inference of the PyTorch gait models.
+
+Two Daphnet-scale workloads (Daphnet: 9 channels at 64 Hz, ~8 hours of
+recordings, i.e. ~60k windows of 3 s with a 0.5 s stride):
+
+- feature vectors: LSTMModel, BiLSTMModel and CNNModel trained on synthetic
+  per-window features, predicting every window of the corpus with
+  ``predict_arrays`` after ``optimize_for_inference``
+- raw windows: an LSTM over (192 samples x 9 channels) windows, run through
+  ``torch_utils`` directly
+
+For each mode it reports the agreement with float32 predictions on held-out
+windows, the largest probability difference, the throughput of batched
+prediction and the median latency of single-window prediction.
+
+Usage:
+    python examples/scripts/benchmark_inference_modes.py --windows 60000
+
+Maintainer: @aharshit123456
+"""
+
+import argparse
+import contextlib
+import io
+import time
+
+import numpy as np
+import torch
+
+from gaitsetpy.classification.models import BiLSTMModel, CNNModel, LSTMModel
+from gaitsetpy.classification.models.lstm import LSTMNet
+from gaitsetpy.classification.models.torch_utils import (
+    INFERENCE_MODES,
+    inference_parity,
+    quantize_dynamic,
+    run_inference,
+)
+
+
+def synthetic_features(n_windows, n_features, n_classes, rng):
+    labels = rng.integers(0, n_classes, n_windows)
+    centers = rng.standard_normal((n_classes, n_features)) * 2
+    X = centers[labels] + rng.standard_normal((n_windows, n_features))
+    return X.astype(np.float32), labels
+
+
+def best_of(fn, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def single_latency(fn, X, n=200):
+    times = []
+    for i in range(n):
+        start = time.perf_counter()
+        fn(X[i % len(X)][None])
+        times.append(time.perf_counter() - start)
+    return float(np.median(times))
+
+
+def report(mode, parity, seconds, n, latency):
+    agreement = f"{parity['agreement']:.4f}" if parity else '     -'
+    diff = f"{parity['max_prob_diff']:.5f}" if parity else '      -'
+    print(f"    {mode:9s} agreement {agreement}  max |dp| {diff}  "
+          f"{n / seconds / 1e3:8.1f} k windows/s  single window {latency * 1e3:6.3f} ms")
+
+
+def feature_models(args, rng):
+    X, y = synthetic_features(args.windows, args.features, 3, rng)
+    X_train, y_train = X[:args.train], y[:args.train]
+    X_check = X[args.train:args.train + 5000]
+    print(f"Feature vectors: {args.windows} windows x {args.features} features")
+    for model_class, kwargs in ((LSTMModel, {'input_size': args.features, 'hidden_size': args.hidden, 'num_layers': 2}),
+                                (BiLSTMModel, {'input_size': args.features, 'hidden_size': args.hidden, 'num_layers': 2}),
+                                (CNNModel, {'input_channels': args.features})):
+        model = model_class(num_classes=3, epochs=args.epochs, device='cpu', **kwargs)
+        with contextlib.redirect_stdout(io.StringIO()):
+            model.fit_arrays(X_train, y_train)
+        print(f"  {model_class.__name__}")
+        for mode in INFERENCE_MODES:
+            parity = model.optimize_for_inference(mode, reference=X_check, min_agreement=0.0)
+            seconds = best_of(lambda: model.predict_arrays(X))
+            report(mode, parity, seconds, len(X), single_latency(model.predict_arrays, X))
+
+
+def raw_windows(args, rng):
+    n = args.raw_windows
+    X = torch.from_numpy(rng.standard_normal((n, 192, 9)).astype(np.float32))
+    net = LSTMNet(9, args.hidden, 2, 3).eval()
+    print(f"Raw windows: {n} windows x 192 samples x 9 channels, LSTM hidden {args.hidden} x 2 layers (untrained)")
+    for mode in INFERENCE_MODES:
+        module = quantize_dynamic(net) if mode == 'int8' else net
+        parity = inference_parity(net, module, X[:1000], mode) if mode != 'float32' else None
+        seconds = best_of(lambda: run_inference(module, X, mode, batch_size=256))
+        latency = single_latency(lambda x: run_inference(module, x, mode), X)
+        report(mode, parity, seconds, n, latency)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--windows', type=int, default=60000, help='Feature windows to predict')
+    parser.add_argument('--train', type=int, default=20000, help='Feature windows used for training')
+    parser.add_argument('--features', type=int, default=27, help='Features per window')
+    parser.add_argument('--hidden', type=int, default=128, help='LSTM hidden size')
+    parser.add_argument('--epochs', type=int, default=30, help='Training epochs')
+    parser.add_argument('--raw-windows', type=int, default=4096, help='Raw windows to predict')
+    args = parser.parse_args()
+
+    print(f"torch {torch.__version__}, {torch.get_num_threads()} threads, "
+          f"quantized engine {torch.backends.quantized.engine}")
+    rng = np.random.default_rng(0)
+    torch.manual_seed(0)
+    feature_models(args, rng)
+    raw_windows(args, rng)
+
+
+if __name__ == '__main__':
+    main()
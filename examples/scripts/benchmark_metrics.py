@@ -0,0 +1,90 @@
+"""
+Benchmark per-subject evaluation with sklearn metrics vs streaming confusion matrices.
+
+Simulates the predictions of several models on a windowed corpus and computes
+per-subject accuracy, per-class precision/recall/F1 and the pooled report:
+
+- sklearn: ``accuracy_score``, ``confusion_matrix`` and
+  ``classification_report`` on every subject's arrays
+- streaming: ``confusion_by_group`` (one ``bincount`` per model) with metrics
+  derived from the matrices, and the pooled matrix as their sum
+- chunked: ``StreamingConfusionMatrix.update`` over fixed-size prediction
+  chunks, as for a stream that is never held in memory
+
+Usage:
+    python examples/scripts/benchmark_metrics.py --windows 1000000 --subjects 30 --models 5
+
+Maintainer: @aharshit123456
+"""
+
+import argparse
+import time
+
+import numpy as np
+from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
+
+from gaitsetpy.classification import StreamingConfusionMatrix, StreamingEventLatency, confusion_by_group
+
+
+def timed(fn, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--windows', type=int, default=1000000, help='Windows per model')
+    parser.add_argument('--subjects', type=int, default=30, help='Subjects')
+    parser.add_argument('--classes', type=int, default=5, help='Classes')
+    parser.add_argument('--models', type=int, default=5, help='Models evaluated')
+    parser.add_argument('--chunk', type=int, default=4096, help='Chunk size of the streamed evaluation')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, args.classes, args.windows)
+    groups = np.sort(rng.integers(0, args.subjects, args.windows))
+    predictions = [np.where(rng.random(args.windows) < 0.8, y_true, rng.integers(0, args.classes, args.windows))
+                   for _ in range(args.models)]
+    print(f"{args.models} models x {args.windows} windows, {args.subjects} subjects, {args.classes} classes")
+
+    def sklearn_metrics():
+        for y_pred in predictions:
+            for subject in range(args.subjects):
+                mask = groups == subject
+                accuracy_score(y_true[mask], y_pred[mask])
+                confusion_matrix(y_true[mask], y_pred[mask])
+                classification_report(y_true[mask], y_pred[mask], output_dict=True, zero_division=0)
+            classification_report(y_true, y_pred, output_dict=True, zero_division=0)
+
+    def streaming_metrics():
+        for y_pred in predictions:
+            matrices = confusion_by_group(y_true, y_pred, groups, n_classes=args.classes)
+            for confusion in matrices.values():
+                confusion.accuracy()
+                confusion.classification_report()
+            sum(matrices.values()).classification_report()
+
+    def chunked_metrics():
+        for y_pred in predictions:
+            confusion = StreamingConfusionMatrix(args.classes)
+            events = StreamingEventLatency(event_class=1)
+            for start in range(0, args.windows, args.chunk):
+                confusion.update(y_true[start:start + args.chunk], y_pred[start:start + args.chunk])
+                events.update(y_true[start:start + args.chunk], y_pred[start:start + args.chunk])
+            confusion.summary()
+            events.result()
+
+    sklearn_seconds = timed(sklearn_metrics, repeat=1)
+    streaming_seconds = timed(streaming_metrics)
+    chunked_seconds = timed(chunked_metrics)
+    print(f"  sklearn per subject              {sklearn_seconds:8.3f} s")
+    print(f"  confusion_by_group               {streaming_seconds:8.3f} s  ({sklearn_seconds / streaming_seconds:.0f}x)")
+    print(f"  streamed in {args.chunk}-window chunks  {chunked_seconds:8.3f} s  (with event latency)")
+
+
+if __name__ == '__main__':
+    main()
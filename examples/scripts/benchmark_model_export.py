@@ -0,0 +1,135 @@
+"""
+Benchmark model loading: training checkpoints vs inference exports.
+
+Trains a Random Forest and an LSTM on synthetic features, saves each with
+``save_model`` (full training checkpoint) and with ``export_model`` (inference
+artifact + schema), then loads every file in a fresh Python process, as a cold
+inference worker would, and reports the file size, the load time and the
+resident memory (RSS) added by loading.
+
+Usage:
+    python examples/scripts/benchmark_model_export.py --trees 300 --windows 20000
+
+Maintainer: @aharshit123456
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+from gaitsetpy.classification import export_model
+from gaitsetpy.classification.models.random_forest import RandomForestModel
+
+try:
+    from gaitsetpy.classification.models.lstm import LSTMModel
+    PYTORCH_AVAILABLE = True
+except ImportError:
+    PYTORCH_AVAILABLE = False
+
+# Runs in a fresh interpreter; prints {"seconds": ..., "rss_mb": ...}
+LOADER = r'''
+import json, sys, time
+
+def rss():
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) * 1024
+    return 0
+
+kind, path, arg = sys.argv[1], sys.argv[2], sys.argv[3]
+import gaitsetpy.classification as classification
+from gaitsetpy.classification.models.random_forest import RandomForestModel
+if kind == 'checkpoint_lstm':
+    import torch
+    from gaitsetpy.classification.models.lstm import LSTMModel
+before = rss()
+start = time.perf_counter()
+if kind == 'checkpoint_rf':
+    model = RandomForestModel()
+    model.load_model(path)
+elif kind == 'checkpoint_lstm':
+    model = LSTMModel(**json.loads(arg), device='cpu')
+    model.load_model(path)
+else:
+    model = classification.load_exported(path, mmap_mode=None if arg == 'none' else arg)
+seconds = time.perf_counter() - start
+print(json.dumps({'seconds': seconds, 'rss_mb': (rss() - before) / 1e6}))
+'''
+
+
+def synthetic_features(n_windows, n_features, n_classes, rng):
+    labels = rng.integers(0, n_classes, n_windows)
+    features = {f'f{i}': (labels * (i % 3) + rng.standard_normal(n_windows)).tolist() for i in range(n_features)}
+    return [{'name': 'sensor', 'annotations': labels.tolist(), 'features': features}]
+
+
+def size_mb(path):
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path)) / 1e6
+    return os.path.getsize(path) / 1e6
+
+
+def cold_load(kind, path, arg, repeat):
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', LOADER, kind, path, arg], capture_output=True, text=True, check=True)
+        runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return min(r['seconds'] for r in runs), min(r['rss_mb'] for r in runs)
+
+
+def report(name, kind, path, arg, repeat):
+    seconds, rss_mb = cold_load(kind, path, arg, repeat)
+    print(f"  {name:28s} {size_mb(path):8.1f} MB on disk   load {seconds * 1000:8.1f} ms   +RSS {rss_mb:7.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--trees', type=int, default=300, help='Random Forest trees')
+    parser.add_argument('--windows', type=int, default=20000, help='Training windows')
+    parser.add_argument('--features', type=int, default=20, help='Features per window')
+    parser.add_argument('--repeat', type=int, default=3, help='Cold loads per artifact (best is reported)')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    features = synthetic_features(args.windows, args.features, 4, rng)
+    root = tempfile.mkdtemp()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            forest = RandomForestModel(n_estimators=args.trees)
+            forest.train(features, validation_split=False)
+            forest.save_model(os.path.join(root, 'rf.pkl'))
+            export_model(forest, os.path.join(root, 'rf_export'))
+            export_model(forest, os.path.join(root, 'rf_export_z3'), compress=3)
+
+        print(f"Random Forest: {args.trees} trees, {args.windows} windows x {args.features} features")
+        report('save_model (joblib dict)', 'checkpoint_rf', os.path.join(root, 'rf.pkl'), '', args.repeat)
+        report('export, read into memory', 'export', os.path.join(root, 'rf_export'), 'none', args.repeat)
+        report("export, mmap_mode='r'", 'export', os.path.join(root, 'rf_export'), 'r', args.repeat)
+        report('export, compress=3', 'export', os.path.join(root, 'rf_export_z3'), 'none', args.repeat)
+
+        if PYTORCH_AVAILABLE:
+            lstm_config = {'input_size': args.features, 'hidden_size': 128, 'num_layers': 2, 'num_classes': 4}
+            with contextlib.redirect_stdout(io.StringIO()):
+                lstm = LSTMModel(epochs=2, device='cpu', **lstm_config)
+                lstm.train(features, validation_split=False)
+                lstm.save_model(os.path.join(root, 'lstm.pt'))
+                export_model(lstm, os.path.join(root, 'lstm_export'))
+            print(f"LSTM: {lstm_config}")
+            report('save_model (checkpoint)', 'checkpoint_lstm', os.path.join(root, 'lstm.pt'),
+                   json.dumps(lstm_config), args.repeat)
+            report('export (TorchScript)', 'export', os.path.join(root, 'lstm_export'), 'none', args.repeat)
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark in-memory vs out-of-core training of the scikit-learn models.
+
+Writes a synthetic feature corpus (per-subject offsets, several classes) to a
+memory-mapped CorpusStore, holds out the last subjects for testing, and trains
+on the rest:
+
+- Random Forest: ``train``-equivalent in-memory fit vs ``fit_batches`` (warm
+  start, ``trees_per_batch`` trees per batch) for several batch sizes
+- MLP: in-memory fit vs ``fit_batches`` (``partial_fit``)
+
+For each run it reports the fit time, the throughput, the peak traced memory
+(NumPy/Python allocations, including the in-memory copy of the training
+matrix; tree buffers allocated by scikit-learn are not traced) and the
+accuracy on the held-out subjects.
+
+Usage:
+    python examples/scripts/benchmark_out_of_core.py --subjects 20 --windows 5000
+
+Maintainer: @aharshit123456
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from gaitsetpy.classification.models.mlp import MLPModel
+from gaitsetpy.classification.models.random_forest import RandomForestModel
+from gaitsetpy.dataset.corpus import CorpusWriter
+
+
+def write_synthetic_corpus(path, subjects, windows, n_features, n_classes, rng):
+    centers = rng.standard_normal((n_classes, n_features))
+    with CorpusWriter(path) as writer:
+        for s in range(subjects):
+            labels = rng.integers(0, n_classes, windows)
+            offset = rng.normal(0, 0.5, n_features)
+            features = centers[labels] + offset + rng.normal(0, 1.5, (windows, n_features))
+            features[:, 0] = np.sin(features[:, 0] * 2) + labels * 0.2
+            writer.add_recording(f"S{s:02d}_R01", features=features.astype(np.float32),
+                                 labels=labels.astype(np.int8), subject=s)
+    return writer.store
+
+
+def measure(name, fit, predict, X_test, y_test, n_rows):
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fit()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    accuracy = (predict(X_test) == y_test).mean()
+    print(f"  {name:40s} {seconds:7.2f} s  {n_rows / seconds / 1e3:8.1f} k rows/s  "
+          f"peak {peak / 1e6:7.1f} MB  accuracy {accuracy:.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--subjects', type=int, default=20, help='Subjects (the last quarter is held out)')
+    parser.add_argument('--windows', type=int, default=5000, help='Windows per subject')
+    parser.add_argument('--features', type=int, default=24, help='Features per window')
+    parser.add_argument('--trees', type=int, default=60, help='Random Forest trees in total')
+    parser.add_argument('--epochs', type=int, default=5, help='MLP passes over the data')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    root = tempfile.mkdtemp()
+    try:
+        store = write_synthetic_corpus(os.path.join(root, 'corpus'), args.subjects, args.windows,
+                                       args.features, 5, rng)
+        test_subjects = store.subjects[-max(1, args.subjects // 4):]
+        test = store.rows(subjects=test_subjects)
+        train = np.setdiff1d(np.arange(len(store)), test)
+        # Training rows are a contiguous prefix, so this stays a memory-mapped view
+        X_train, y_train = store.features[:len(train)], store.labels[:len(train)]
+        X_test, y_test = np.asarray(store.features[test]), np.asarray(store.labels[test])
+        n = len(train)
+        print(f"{n} training windows x {args.features} features "
+              f"({X_train.nbytes / 1e6:.1f} MB), {len(test)} held-out windows")
+
+        print("Random Forest")
+        forest = RandomForestModel(n_estimators=args.trees, max_workers=1)
+        measure('in memory', lambda: forest.fit_arrays(np.array(X_train), y_train),
+                forest.predict_arrays, X_test, y_test, n)
+        for batch_size in (n // 2, n // 6, n // 12):
+            n_batches = -(-n // batch_size)
+            trees = max(1, args.trees // n_batches)
+            model = RandomForestModel(max_workers=1)
+            measure(f'fit_batches {n_batches:2d} x {batch_size} rows, {trees} trees',
+                    lambda: model.fit_batches((X_train, y_train), trees_per_batch=trees,
+                                              batch_size=batch_size, random_state=0),
+                    model.predict_arrays, X_test, y_test, n)
+
+        print("MLP")
+        mlp = MLPModel(hidden_layer_sizes=(64,), max_iter=args.epochs)
+        measure(f'in memory, {args.epochs} epochs', lambda: mlp.fit_arrays(np.array(X_train), y_train),
+                mlp.predict_arrays, X_test, y_test, n * args.epochs)
+        for batch_size in (n // 4, 4096):
+            model = MLPModel(hidden_layer_sizes=(64,))
+            measure(f'fit_batches {batch_size} rows, {args.epochs} epochs',
+                    lambda: model.fit_batches((X_train, y_train), epochs=args.epochs,
+                                              batch_size=batch_size, random_state=0),
+                    model.predict_arrays, X_test, y_test, n * args.epochs)
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
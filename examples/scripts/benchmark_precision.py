@@ -0,0 +1,142 @@
+"""
+Benchmark the float64 and float32 precision policies end to end.
+
+Writes synthetic HAR-UP (CSV per trial) and PhysioNet (tab-separated VGRF)
+recordings in the datasets' on-disk formats, then runs load -> sliding windows
+-> feature extraction -> preprocess_features under each precision policy and
+reports the wall time, the peak traced memory and the size of the loaded data.
+
+Usage:
+    python examples/scripts/benchmark_precision.py --subjects 4 --seconds 60
+
+Maintainer: @aharshit123456
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+import gaitsetpy as gsp
+from gaitsetpy.classification.utils.preprocess import preprocess_features
+from gaitsetpy.dataset.harup import HARUPLoader
+from gaitsetpy.dataset.physionet import PhysioNetLoader
+from gaitsetpy.features.gait_features import GaitFeatureExtractor
+
+HARUP_COLUMNS = [
+    'BELT_ACC_X', 'BELT_ACC_Y', 'BELT_ACC_Z', 'BELT_ANG_X', 'BELT_ANG_Y', 'BELT_ANG_Z',
+    'NECK_ACC_X', 'NECK_ACC_Y', 'NECK_ACC_Z', 'WRST_ACC_X', 'WRST_ACC_Y', 'WRST_ACC_Z',
+]
+
+
+def write_harup(root, subjects, activities, seconds, rng):
+    dataset = os.path.join(root, 'UP_Fall_Detection_Dataset')
+    n = seconds * 100
+    times = pd.date_range('2018-07-04', periods=n, freq='10ms').strftime('%Y-%m-%dT%H:%M:%S.%f')
+    for s in range(1, subjects + 1):
+        for a in range(1, activities + 1):
+            folder = os.path.join(dataset, f'Subject_{s:02d}', f'A{a:02d}')
+            os.makedirs(folder, exist_ok=True)
+            df = pd.DataFrame(rng.standard_normal((n, len(HARUP_COLUMNS))), columns=HARUP_COLUMNS)
+            df.insert(0, 'TIME', times)
+            df.to_csv(os.path.join(folder, f'S{s:02d}_A{a:02d}_T01.csv'), index=False)
+
+
+def write_physionet(root, subjects, seconds, rng):
+    dataset = os.path.join(root, 'physionet_gaitpdb')
+    os.makedirs(dataset)
+    n = seconds * 100
+    for i in range(1, subjects + 1):
+        for kind in ('Co', 'Pt'):
+            values = np.column_stack([np.arange(n) / 100, np.abs(rng.standard_normal((n, 18))) * 300])
+            np.savetxt(os.path.join(dataset, f'Ga{kind}{i:02d}_01.txt'), values, fmt='%.3f', delimiter='\t')
+
+
+def harup_pipeline(root):
+    loader = HARUPLoader()
+    data, names = loader.load_data(root, subjects=None, activities=None, trials=[1])
+    windows = loader.create_sliding_windows(data, names)
+    features = loader.extract_features(windows, freq_domain_features=True)
+    per_sensor = []
+    for recording, recording_windows in zip(features, windows):
+        labels = next(w['data'] for w in recording_windows['windows'] if w['name'] == 'labels')
+        rows = pd.DataFrame(recording['features'])
+        for sensor, group in rows.groupby('sensor', sort=False):
+            per_sensor.append({'name': sensor, 'annotations': labels,
+                               'features': {k: group[k].tolist() for k in group.columns if k not in ('sensor', 'label')}})
+    return data, preprocess_features(per_sensor)
+
+
+def physionet_pipeline(root):
+    loader = PhysioNetLoader()
+    data, names = loader.load_data(root)
+    windows = loader.create_sliding_windows(data, names)
+    extractor = GaitFeatureExtractor(verbose=False)
+    per_sensor = []
+    for recording in windows:
+        sensors = recording['windows'][:4]
+        for sensor in extractor.extract_features(sensors, fs=100, frequency_domain=False):
+            sensor['annotations'] = [recording['metadata']['label']] * len(sensors[0]['data'])
+            per_sensor.append(sensor)
+    return data, preprocess_features(per_sensor)
+
+
+def run(pipeline, root):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return pipeline(root)
+
+
+def measure(pipeline, root, name, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        data, (X, y) = run(pipeline, root)
+        times.append(time.perf_counter() - start)
+    # Memory is traced in a separate run: tracemalloc slows allocation-heavy code down
+    tracemalloc.start()
+    run(pipeline, root)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    loaded = sum(df.memory_usage(deep=False).sum() for df in data)
+    print(f"  {name:8s} {min(times):7.2f} s   peak {peak / 1e6:8.1f} MB   loaded {loaded / 1e6:7.1f} MB   "
+          f"X {X.shape} {X.dtype}   y {y.dtype}")
+    return min(times), peak, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--subjects', type=int, default=4, help='Subjects per dataset')
+    parser.add_argument('--activities', type=int, default=11, help='HAR-UP activities per subject')
+    parser.add_argument('--seconds', type=int, default=60, help='Recording length in seconds')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per policy (best is reported)')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    harup_root, physionet_root = tempfile.mkdtemp(), tempfile.mkdtemp()
+    try:
+        write_harup(harup_root, args.subjects, args.activities, args.seconds, rng)
+        write_physionet(physionet_root, args.subjects, args.seconds, rng)
+        for title, pipeline, root in (('HAR-UP', harup_pipeline, harup_root),
+                                      ('PhysioNet', physionet_pipeline, physionet_root)):
+            print(f"{title}: {args.subjects} subjects, {args.seconds} s recordings")
+            results = {}
+            for name in ('float64', 'float32'):
+                with gsp.precision(name):
+                    results[name] = measure(pipeline, root, name, args.repeat)
+            (t64, m64, l64), (t32, m32, l32) = results['float64'], results['float32']
+            print(f"  float32: {t64 / t32:.2f}x speed, {m32 / m64:.0%} of float64 peak memory, "
+                  f"{l32 / l64:.0%} of float64 loaded data")
+    finally:
+        shutil.rmtree(harup_root)
+        shutil.rmtree(physionet_root)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark a shared TensorCache and batch prefetching for repeated PyTorch training runs.
+
+On a synthetic feature matrix it measures:
+
+- tensor creation: ``torch.tensor`` (a copy, as each train call used to make)
+  vs wrapping the array in a ``TensorCache`` (no copy)
+- one epoch of mini-batches gathered in the training thread vs gathered ahead
+  in the background thread (``prefetch_depth``)
+- a small hyperparameter sweep of short LSTM runs, each fitted on copied
+  training arrays vs on row indices of one shared cache
+
+Usage:
+    python examples/scripts/benchmark_tensor_cache.py --windows 200000 --features 64
+
+Maintainer: @aharshit123456
+"""
+
+import argparse
+import contextlib
+import io
+import time
+
+import numpy as np
+import torch
+
+from gaitsetpy.classification import TensorCache
+from gaitsetpy.classification.models import LSTMModel
+
+
+def timed(fn, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def epoch(cache, rows, batch_size, depth, net, optimizer):
+    criterion = torch.nn.CrossEntropyLoss()
+    for X, y in cache.batches(rows, batch_size, shuffle=True, prefetch_depth=depth):
+        optimizer.zero_grad()
+        loss = criterion(net(X), y)
+        loss.backward()
+        optimizer.step()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--windows', type=int, default=200000, help='Feature windows')
+    parser.add_argument('--features', type=int, default=64, help='Features per window')
+    parser.add_argument('--batch-size', type=int, default=256, help='Training batch size')
+    parser.add_argument('--configs', type=int, default=6, help='Configurations in the sweep')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    y = rng.integers(0, 3, args.windows)
+    X = (y[:, None] + rng.normal(0, 1, (args.windows, args.features))).astype(np.float32)
+    rows = np.sort(rng.choice(args.windows, int(args.windows * 0.8), replace=False))
+    print(f"torch {torch.__version__}, {torch.get_num_threads()} threads; "
+          f"{args.windows} windows x {args.features} features ({X.nbytes / 1e6:.0f} MB)")
+
+    copy_seconds = timed(lambda: torch.tensor(X, dtype=torch.float32))
+    cache_seconds = timed(lambda: TensorCache(X, y))
+    print(f"  torch.tensor copy        {copy_seconds * 1e3:8.2f} ms")
+    print(f"  TensorCache (zero copy)  {cache_seconds * 1e3:8.3f} ms")
+
+    cache = TensorCache(X, y)
+    net = torch.nn.Sequential(torch.nn.Linear(args.features, 128), torch.nn.ReLU(), torch.nn.Linear(128, 3))
+    optimizer = torch.optim.Adam(net.parameters())
+    for depth in (0, 1, 2):
+        seconds = timed(lambda: epoch(cache, rows, args.batch_size, depth, net, optimizer), repeat=2)
+        print(f"  epoch, prefetch_depth={depth}  {seconds:8.3f} s  {len(rows) / seconds / 1e3:8.1f} k rows/s")
+
+    test = np.setdiff1d(np.arange(args.windows), rows)
+    sweep = [{'hidden_size': h, 'lr': lr} for h in (16, 32, 64) for lr in (1e-3, 1e-2)][:args.configs]
+
+    def run(shared):
+        for params in sweep:
+            model = LSTMModel(input_size=args.features, num_classes=3, epochs=1,
+                              batch_size=args.batch_size, device='cpu', mini_batch=True, **params)
+            with contextlib.redirect_stdout(io.StringIO()):
+                if shared:
+                    model.fit_arrays(cache, rows=rows)
+                    model.predict_arrays(cache, rows=test)
+                else:
+                    model.fit_arrays(X[rows], y[rows])
+                    model.predict_arrays(X[test])
+
+    for shared in (False, True):
+        seconds = timed(lambda: run(shared), repeat=2)
+        label = 'shared cache, row indices' if shared else 'copied arrays per config'
+        print(f"  sweep of {len(sweep)} x 1 epoch, {label:26s} {seconds:8.2f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -35,7 +35,10 @@ from .core import (
     FeatureManager,
     PreprocessingManager,
     EDAManager,
-    ClassificationManager
+    ClassificationManager,
+    set_precision,
+    get_precision,
+    precision
 )
 
 # New class-based API
@@ -336,6 +339,9 @@ __all__ = [
     'PreprocessingManager',
     'EDAManager',
     'ClassificationManager',
+    'set_precision',
+    'get_precision',
+    'precision',
     
     # New class-based API
     'DaphnetLoader',
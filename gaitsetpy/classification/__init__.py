@@ -10,22 +10,41 @@ Available Models:
 - LSTM (PyTorch) - TODO  
 - BiLSTM (PyTorch) - TODO
 - GNN (PyTorch Geometric) - TODO
+- Ensemble (soft/hard voting and stacking over a shared feature matrix)
 
 Utilities:
 - Dataset loading and preprocessing
 - Model training and evaluation
 - Feature preprocessing and preparation
+- Compact inference-only model export
+- Subject-grouped cross-validation and hyperparameter search
+- Shared tensor cache and background batch prefetching for the PyTorch models
+- Streaming confusion matrices and event detection latency metrics
+- Early-exit cascade (cheap screening stage before full feature extraction)
 
 Maintainer: @aharshit123456
 """
 
 # Import the new class-based classification models
 from .models.random_forest import RandomForestModel
+from .models.ensemble import EnsembleModel
 
 # Import legacy functions for backward compatibility
 from .models.random_forest import create_random_forest_model
-from .utils.preprocess import preprocess_features
+from .utils.preprocess import preprocess_features, feature_widths
 from .utils.eval import evaluate_model
+from .utils.export import export_model, load_exported, InferenceModel
+from .utils.cv import subject_folds, cross_validate, grid_search
+from .utils.batches import iter_batches
+from .utils.metrics import StreamingConfusionMatrix, StreamingEventLatency, confusion_by_group
+from .utils.cascade import CascadeClassifier, cheap_features, recall_threshold
+
+# Optional PyTorch-dependent utilities
+try:
+    from .utils.tensor_cache import TensorCache, prefetch
+except ImportError:
+    TensorCache = None
+    prefetch = None
 
 # Import managers
 from ..core.managers import ClassificationManager
@@ -35,6 +54,7 @@ def _register_models():
     """Register all available classification models with the ClassificationManager."""
     manager = ClassificationManager()
     manager.register_model("random_forest", RandomForestModel)
+    manager.register_model("ensemble", EnsembleModel)
 
 # Auto-register models when module is imported
 _register_models()
@@ -127,10 +147,33 @@ def train_random_forest(features, **kwargs):
 __all__ = [
     # New class-based models
     'RandomForestModel',
+    'EnsembleModel',
     # Legacy functions for backward compatibility
     'create_random_forest_model',
     'preprocess_features',
+    'feature_widths',
     'evaluate_model',
+    # Inference export
+    'export_model',
+    'load_exported',
+    'InferenceModel',
+    # Cross-validation
+    'subject_folds',
+    'cross_validate',
+    'grid_search',
+    # Out-of-core training
+    'iter_batches',
+    # Streaming metrics
+    'StreamingConfusionMatrix',
+    'StreamingEventLatency',
+    'confusion_by_group',
+    # Cascade inference
+    'CascadeClassifier',
+    'cheap_features',
+    'recall_threshold',
+    # Tensor caching (PyTorch)
+    'TensorCache',
+    'prefetch',
     # Manager functions
     'get_classification_manager',
     'get_available_models',
@@ -1,5 +1,6 @@
 from .random_forest import RandomForestModel
 from .mlp import MLPModel
+from .ensemble import EnsembleModel
 
 # Optional PyTorch-dependent imports
 try:
@@ -15,46 +16,64 @@ except ImportError:
     CNNModel = None
     PYTORCH_AVAILABLE = False
 
-def get_classification_model(name: str, **kwargs):
+def _model_class(name: str):
     """
-    Factory function to get a classification model by name.
+    Look up the class of a classification model by name, without instantiating it.
 
     Args:
-        name (str): Name of the model. One of: 'random_forest', 'mlp', 'lstm', 'bilstm', 'gnn', 'cnn'.
-        **kwargs: Model-specific parameters.
+        name (str): Name of the model (see ``get_classification_model``).
 
     Returns:
-        An instance of the requested model.
+        The model class.
 
     Raises:
-        ValueError: If the model name is not recognized or PyTorch is not available for PyTorch models.
-
-    Example:
-        model = get_classification_model('cnn', input_channels=20, num_classes=4)
+        ValueError: If the model name is not recognized.
+        ImportError: If the model requires PyTorch and PyTorch is not available.
     """
     name = name.lower().strip()
     if name == 'random_forest':
-        return RandomForestModel(**kwargs)
+        return RandomForestModel
     elif name == 'mlp':
-        return MLPModel(**kwargs)
+        return MLPModel
+    elif name == 'ensemble':
+        return EnsembleModel
     elif name == 'lstm':
         if not PYTORCH_AVAILABLE or LSTMModel is None:
             raise ImportError("LSTM model requires PyTorch. Please install PyTorch to use this model.")
-        return LSTMModel(**kwargs)
+        return LSTMModel
     elif name == 'bilstm':
         if not PYTORCH_AVAILABLE or BiLSTMModel is None:
             raise ImportError("BiLSTM model requires PyTorch. Please install PyTorch to use this model.")
-        return BiLSTMModel(**kwargs)
+        return BiLSTMModel
     elif name == 'gnn':
         if not PYTORCH_AVAILABLE or GNNModel is None:
             raise ImportError("GNN model requires PyTorch. Please install PyTorch to use this model.")
-        return GNNModel(**kwargs)
+        return GNNModel
     elif name == 'cnn':
         if not PYTORCH_AVAILABLE or CNNModel is None:
             raise ImportError("CNN model requires PyTorch. Please install PyTorch to use this model.")
-        return CNNModel(**kwargs)
+        return CNNModel
     else:
-        available_models = ['random_forest', 'mlp']
+        available_models = ['random_forest', 'mlp', 'ensemble']
         if PYTORCH_AVAILABLE:
             available_models.extend(['lstm', 'bilstm', 'gnn', 'cnn'])
         raise ValueError(f"Unknown model name: {name}. Supported: {available_models}.")
+
+def get_classification_model(name: str, **kwargs):
+    """
+    Factory function to get a classification model by name.
+
+    Args:
+        name (str): Name of the model. One of: 'random_forest', 'mlp', 'lstm', 'bilstm', 'gnn', 'cnn', 'ensemble'.
+        **kwargs: Model-specific parameters.
+
+    Returns:
+        An instance of the requested model.
+
+    Raises:
+        ValueError: If the model name is not recognized or PyTorch is not available for PyTorch models.
+
+    Example:
+        model = get_classification_model('cnn', input_channels=20, num_classes=4)
+    """
+    return _model_class(name)(**kwargs)
@@ -0,0 +1,425 @@
+'''
+Ensemble Classification Model
+
+This module contains the EnsembleModel class, which trains several
+classification models on one shared feature matrix and combines their
+predictions by soft voting, hard voting or stacking.
+
+The feature dictionaries are converted with ``preprocess_features`` once; every
+member is trained and queried through ``fit_arrays`` / ``predict_arrays`` on
+the same matrix, and prediction computes each member's probabilities once for
+both the ensemble and the per-member metrics. Members run in a thread pool:
+scikit-learn and PyTorch release the GIL in their numerical kernels, so members
+overlap without copying the feature matrix into worker processes. Timings of
+every member are kept in ``timings``.
+
+Example:
+    ensemble = EnsembleModel(['random_forest', 'mlp', ('lstm', {'epochs': 30})], voting='soft')
+    ensemble.train(features)
+    metrics = ensemble.evaluate(features)
+    print(metrics['members'], ensemble.timings)
+
+Maintainer: @aharshit123456
+'''
+
+import copy
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import joblib
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import StratifiedKFold, train_test_split
+
+from ...core.base_classes import BaseClassificationModel
+from ..utils.preprocess import preprocess_features
+from ..utils.metrics import StreamingConfusionMatrix
+
+VOTING_METHODS = ('soft', 'hard', 'stacking')
+
+# Constructor arguments sized from the data for members given by name
+_SHAPE_ARGUMENTS = {
+    'lstm': ('input_size', 'num_classes'),
+    'bilstm': ('input_size', 'num_classes'),
+    'cnn': ('input_channels', 'num_classes'),
+}
+
+MemberSpec = Union[str, Tuple[str, Dict[str, Any]], BaseClassificationModel]
+
+
+def _supports_arrays(model_class: type) -> bool:
+    return model_class.fit_arrays is not BaseClassificationModel.fit_arrays
+
+
+class EnsembleModel(BaseClassificationModel):
+    """
+    Ensemble of classification models trained on one shared feature matrix.
+
+    Members are given by name (``'random_forest'``), as ``(name, params)`` or
+    as model instances. Members given by name have their input size and number
+    of classes set from the data. Every member must support ``fit_arrays``
+    (all models except the GNN).
+    """
+
+    def __init__(self, models: Sequence[MemberSpec] = ('random_forest', 'mlp'), voting: str = 'soft',
+                 weights: Optional[Sequence[float]] = None, max_workers: Optional[int] = None,
+                 stack_folds: int = 5, final_estimator: Optional[Any] = None, random_state: int = 42):
+        """
+        Initialize the ensemble.
+
+        Args:
+            models: Member specifications (names, (name, params) tuples or model instances)
+            voting: 'soft' (weighted mean of class probabilities), 'hard'
+                    (weighted majority of predicted labels) or 'stacking'
+                    (a final estimator trained on out-of-fold member probabilities)
+            weights: Member weights for voting (default: None, equal weights)
+            max_workers: Threads running members in parallel (default: None, one
+                         per member up to the CPU count; 1 runs members in turn)
+            stack_folds: Folds for the out-of-fold probabilities of stacking
+            final_estimator: scikit-learn classifier for stacking (default:
+                             multinomial logistic regression)
+            random_state: Random state of the validation split and stacking folds
+        """
+        super().__init__(
+            name="ensemble",
+            description="Voting and stacking ensemble of gait classifiers"
+        )
+        if voting not in VOTING_METHODS:
+            raise ValueError(f"Unsupported voting: {voting}. Supported: {list(VOTING_METHODS)}")
+        if not models:
+            raise ValueError("An ensemble needs at least one model")
+        if weights is not None and len(weights) != len(models):
+            raise ValueError(f"Expected {len(models)} weights, got {len(weights)}")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if stack_folds < 2:
+            raise ValueError("stack_folds must be at least 2")
+        self.member_names, self._factories = self._resolve_members(models)
+        self.config = {
+            'models': list(self.member_names),
+            'voting': voting,
+            'weights': None if weights is None else [float(w) for w in weights],
+            'max_workers': max_workers,
+            'stack_folds': stack_folds,
+            'random_state': random_state
+        }
+        self.final_estimator = final_estimator
+        self.members = {}
+        self.model = None
+        self.n_classes = 0
+        self.feature_names = []
+        self.class_names = []
+        self.timings = {}
+
+    @staticmethod
+    def _resolve_members(models: Sequence[MemberSpec]) -> Tuple[List[str], List[Callable]]:
+        """Unique member names and factories taking (n_features, n_classes)."""
+        from . import _model_class, get_classification_model
+
+        names, factories, bases = [], [], []
+        for spec in models:
+            if isinstance(spec, BaseClassificationModel):
+                if not _supports_arrays(type(spec)):
+                    raise ValueError(f"Model '{spec.name}' does not support training from arrays")
+                template = copy.deepcopy(spec)
+                name = spec.name
+                factory = lambda n_features, n_classes, template=template: copy.deepcopy(template)
+            else:
+                name, params = (spec, {}) if isinstance(spec, str) else spec
+                name = name.lower().strip()
+                if not _supports_arrays(_model_class(name)):
+                    raise ValueError(f"Model '{name}' does not support training from arrays")
+
+                def factory(n_features, n_classes, name=name, params=dict(params)):
+                    sized = dict(zip(_SHAPE_ARGUMENTS.get(name, ()), (n_features, n_classes)))
+                    return get_classification_model(name, **{**sized, **params})
+            # Repeated models are numbered: 'mlp', 'mlp_2', ...
+            bases.append(name)
+            names.append(name if bases.count(name) == 1 else f"{name}_{bases.count(name)}")
+            factories.append(factory)
+        return names, factories
+
+    def _map(self, fn: Callable, items: Sequence) -> List:
+        """Run fn over items in the member thread pool, keeping the order."""
+        workers = self.config['max_workers'] or min(len(items), os.cpu_count() or 1)
+        if workers <= 1 or len(items) <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fn, items))
+
+    def _probabilities(self, model: BaseClassificationModel, X: np.ndarray) -> np.ndarray:
+        """Class probabilities of a member with one column per ensemble class."""
+        proba = np.asarray(model.predict_arrays(X, return_probabilities=True), dtype=np.float64)
+        classes = getattr(model.model, 'classes_', None)
+        if classes is not None and len(classes) != self.n_classes:
+            # scikit-learn members trained without some class only return columns for their classes
+            full = np.zeros((len(proba), self.n_classes))
+            full[:, np.asarray(classes, dtype=np.int64)] = proba
+            return full
+        if proba.shape[1] < self.n_classes:
+            raise ValueError(f"Member returns {proba.shape[1]} class probabilities, expected {self.n_classes}")
+        return proba[:, :self.n_classes]
+
+    def _fit_member(self, task: Tuple[int, np.ndarray, np.ndarray, Optional[np.ndarray]]):
+        """Fit a fresh member on rows of X; returns (model, fit seconds, out-of-fold probabilities)."""
+        index, X, y, holdout = task
+        model = self._factories[index](X.shape[1], self.n_classes)
+        rows = slice(None) if holdout is None else np.setdiff1d(np.arange(len(X)), holdout)
+        start = time.perf_counter()
+        model.fit_arrays(X[rows], y[rows])
+        seconds = time.perf_counter() - start
+        proba = None if holdout is None else self._probabilities(model, X[holdout])
+        return model, seconds, proba
+
+    def train(self, features: List[Dict], **kwargs):
+        """
+        Train every member on the shared feature matrix.
+
+        Args:
+            features: List of feature dictionaries
+            **kwargs: Additional arguments including test_size and validation_split
+        """
+        start = time.perf_counter()
+        X, y = preprocess_features(features)
+        preprocess_seconds = time.perf_counter() - start
+
+        test_size = kwargs.get('test_size', 0.2)
+        validation_split = kwargs.get('validation_split', True)
+        if validation_split:
+            X_train, X_test, y_train, y_test = train_test_split(
+                X, y, test_size=test_size, random_state=self.config['random_state']
+            )
+            self.X_test = X_test
+            self.y_test = y_test
+        else:
+            X_train, y_train = X, y
+        self.fit_arrays(X_train, y_train)
+        self.timings['preprocess_seconds'] = preprocess_seconds
+        print(f"Ensemble of {len(self.members)} models trained successfully.")
+
+    def fit_arrays(self, X: np.ndarray, y: np.ndarray, **kwargs):
+        """
+        Train every member on a feature matrix and label codes.
+
+        Args:
+            X: Feature matrix in the layout of ``preprocess_features``
+            y: Zero-based label codes
+            **kwargs: Additional arguments including groups (subject of every
+                      row; stacking folds then keep subjects together)
+        """
+        start = time.perf_counter()
+        X = np.asarray(X, dtype=np.float32)
+        y = np.asarray(y)
+        self.n_classes = int(y.max()) + 1
+        self.feature_names = [f"feature_{i}" for i in range(X.shape[1])]
+        self.class_names = list(set(y))
+        members = range(len(self._factories))
+
+        tasks = [(i, X, y, None) for i in members]
+        folds = []
+        if self.config['voting'] == 'stacking':
+            folds = self._stack_folds(y, kwargs.get('groups'))
+            tasks += [(i, X, y, holdout) for i in members for holdout in folds]
+        outputs = self._map(self._fit_member, tasks)
+
+        self.members = {name: outputs[i][0] for i, name in enumerate(self.member_names)}
+        self.timings = {'members': {name: {'fit_seconds': outputs[i][1]} for i, name in enumerate(self.member_names)}}
+        if folds:
+            # Out-of-fold probabilities of every member, in row order, are the stacker's features
+            stacked = np.zeros((len(X), len(self.members) * self.n_classes))
+            for k, (i, _, _, holdout) in enumerate(tasks[len(members):], start=len(members)):
+                stacked[holdout, i * self.n_classes:(i + 1) * self.n_classes] = outputs[k][2]
+                self.timings['members'][self.member_names[i]].setdefault('stack_fit_seconds', 0.0)
+                self.timings['members'][self.member_names[i]]['stack_fit_seconds'] += outputs[k][1]
+            self.model = (copy.deepcopy(self.final_estimator) if self.final_estimator is not None
+                          else LogisticRegression(max_iter=1000))
+            self.model.fit(stacked, y)
+        self.timings['fit_wall_seconds'] = time.perf_counter() - start
+        self.trained = True
+
+    def _stack_folds(self, y: np.ndarray, groups: Optional[Sequence]) -> List[np.ndarray]:
+        """Held-out rows of every stacking fold."""
+        if groups is not None:
+            from ..utils.cv import subject_folds
+            n_groups = len(np.unique(np.asarray(groups)))
+            return [test for _, test in subject_folds(groups, min(self.config['stack_folds'], n_groups))]
+        n_splits = min(self.config['stack_folds'], int(np.bincount(y).max()))
+        splitter = StratifiedKFold(n_splits=max(n_splits, 2), shuffle=True, random_state=self.config['random_state'])
+        return [test for _, test in splitter.split(np.empty((len(y), 0)), y)]
+
+    def member_probabilities(self, X: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Class probabilities of every member, computed in parallel.
+
+        Args:
+            X: Feature matrix
+
+        Returns:
+            Dictionary of member name -> (samples, classes) probabilities
+        """
+        if not self.trained:
+            raise ValueError("Model must be trained before making predictions")
+        X = np.asarray(X, dtype=np.float32)
+
+        def run(name):
+            start = time.perf_counter()
+            proba = self._probabilities(self.members[name], X)
+            self.timings['members'][name]['predict_seconds'] = time.perf_counter() - start
+            return proba
+        return dict(zip(self.member_names, self._map(run, self.member_names)))
+
+    def combine(self, probabilities: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Ensemble class probabilities from member probabilities.
+
+        Args:
+            probabilities: Output of ``member_probabilities``
+
+        Returns:
+            (samples, classes) probabilities (vote shares for hard voting)
+        """
+        start = time.perf_counter()
+        probas = [probabilities[name] for name in self.member_names]
+        weights = np.ones(len(probas)) if self.config['weights'] is None else np.asarray(self.config['weights'])
+        voting = self.config['voting']
+        if voting == 'stacking':
+            combined = np.zeros_like(probas[0])
+            combined[:, self.model.classes_] = self.model.predict_proba(np.hstack(probas))
+        elif voting == 'soft':
+            combined = np.tensordot(weights, np.stack(probas), axes=1) / weights.sum()
+        else:
+            n = len(probas[0])
+            combined = np.zeros_like(probas[0])
+            for weight, proba in zip(weights, probas):
+                combined[np.arange(n), proba.argmax(axis=1)] += weight
+            combined /= weights.sum()
+        self.timings['combine_seconds'] = time.perf_counter() - start
+        return combined
+
+    def predict_arrays(self, X: np.ndarray, **kwargs) -> np.ndarray:
+        """
+        Make ensemble predictions for a feature matrix.
+
+        Args:
+            X: Feature matrix in the layout of ``preprocess_features``
+            **kwargs: Additional arguments including return_probabilities
+
+        Returns:
+            Label codes or class probabilities
+        """
+        combined = self.combine(self.member_probabilities(X))
+        if kwargs.get('return_probabilities', False):
+            return combined
+        return combined.argmax(axis=1)
+
+    def predict(self, features: List[Dict], **kwargs) -> np.ndarray:
+        """
+        Make ensemble predictions.
+
+        Args:
+            features: List of feature dictionaries
+            **kwargs: Additional arguments including return_probabilities
+
+        Returns:
+            Array of predictions
+        """
+        if not self.trained:
+            raise ValueError("Model must be trained before making predictions")
+        X, _ = preprocess_features(features)
+        return self.predict_arrays(X, **kwargs)
+
+    def evaluate(self, features: List[Dict], **kwargs) -> Dict[str, float]:
+        """
+        Evaluate the ensemble and every member on the same predictions.
+
+        Args:
+            features: List of feature dictionaries
+            **kwargs: Additional arguments including detailed_report
+
+        Returns:
+            Dictionary containing evaluation metrics, per-member metrics
+            ('members') and the timing breakdown ('timings')
+        """
+        if not self.trained:
+            raise ValueError("Model must be trained before evaluation")
+
+        # Use validation data if available, otherwise use provided features
+        if hasattr(self, 'X_test') and hasattr(self, 'y_test'):
+            X_test, y_test = self.X_test, self.y_test
+        else:
+            X_test, y_test = preprocess_features(features)
+
+        probabilities = self.member_probabilities(X_test)
+        confusion = StreamingConfusionMatrix.from_predictions(y_test, self.combine(probabilities).argmax(axis=1),
+                                                              n_classes=self.n_classes)
+        metrics = {
+            'accuracy': confusion.accuracy(),
+            'confusion_matrix': confusion.matrix.tolist(),
+            'members': {}
+        }
+        detailed_report = kwargs.get('detailed_report', False)
+        for name, proba in probabilities.items():
+            member = StreamingConfusionMatrix.from_predictions(y_test, proba.argmax(axis=1), n_classes=self.n_classes)
+            metrics['members'][name] = {'accuracy': member.accuracy(), 'macro_f1': float(member.f1().mean())}
+            if detailed_report:
+                metrics['members'][name]['classification_report'] = member.classification_report()
+        if detailed_report:
+            metrics['classification_report'] = confusion.classification_report()
+        metrics['timings'] = copy.deepcopy(self.timings)
+        return metrics
+
+    def timing_report(self) -> str:
+        """
+        Per-member timing breakdown as a printable table.
+
+        Returns:
+            Table of fit, stacking and prediction seconds per member
+        """
+        lines = [f"{'model':16s} {'fit s':>9s} {'stack fit s':>12s} {'predict s':>10s}"]
+        for name, timing in self.timings.get('members', {}).items():
+            lines.append(f"{name:16s} {timing.get('fit_seconds', 0.0):9.3f} "
+                         f"{timing.get('stack_fit_seconds', 0.0):12.3f} {timing.get('predict_seconds', 0.0):10.3f}")
+        for key in ('preprocess_seconds', 'fit_wall_seconds', 'combine_seconds'):
+            if key in self.timings:
+                lines.append(f"{key.replace('_seconds', '').replace('_', ' '):16s} {self.timings[key]:9.3f}")
+        return "\n".join(lines)
+
+    def save_model(self, filepath: str):
+        """
+        Save the trained ensemble (members, stacker and configuration).
+
+        Args:
+            filepath: Path to save the model
+        """
+        if not self.trained:
+            raise ValueError("Model must be trained before saving")
+        joblib.dump({
+            'members': self.members,
+            'model': self.model,
+            'config': self.config,
+            'n_classes': self.n_classes,
+            'feature_names': self.feature_names,
+            'class_names': self.class_names
+        }, filepath)
+        print(f"Ensemble model saved to {filepath}")
+
+    def load_model(self, filepath: str):
+        """
+        Load a trained ensemble.
+
+        Args:
+            filepath: Path to the saved model
+        """
+        state = joblib.load(filepath)
+        self.members = state['members']
+        self.model = state['model']
+        self.config = state['config']
+        self.member_names = list(self.members)
+        self.n_classes = state['n_classes']
+        self.feature_names = state['feature_names']
+        self.class_names = state['class_names']
+        self.timings = {'members': {name: {} for name in self.member_names}}
+        self.trained = True
+        print(f"Ensemble model loaded from {filepath}")
@@ -2,11 +2,43 @@ import torch
 import torch.nn as nn
 import torch.optim as optim
 import numpy as np
-from typing import List, Dict, Any, Optional, Union
+import scipy.sparse as sp
+from typing import List, Dict, Any, Optional, Sequence, Union
 from ...core.base_classes import BaseClassificationModel
 from ..utils.preprocess import preprocess_features
+from ..utils.metrics import StreamingConfusionMatrix
+from ..utils.graph import GRAPH_TYPES, NeighborSampler, feature_node_layout, knn_graph, topology_graph
 from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, confusion_matrix, classification_report
+
+
+def _propagate(adj, x):
+    """Aggregate neighbour features, adj @ x, for dense or sparse adjacency."""
+    if adj.is_sparse or adj.layout == torch.sparse_csr:
+        return torch.sparse.mm(adj, x)
+    return torch.matmul(adj, x)
+
+
+def to_torch_sparse(adj, device=None) -> torch.Tensor:
+    """
+    Convert an adjacency matrix to a float32 sparse COO tensor.
+
+    Args:
+        adj: scipy sparse matrix, dense array, or (dense or sparse) torch tensor
+        device: Target device
+
+    Returns:
+        Coalesced torch.sparse_coo_tensor
+    """
+    if isinstance(adj, torch.Tensor):
+        adj = adj.to_sparse() if adj.layout == torch.strided else adj.to_sparse_coo()
+        return adj.coalesce().to(dtype=torch.float32, device=device)
+    coo = sp.csr_matrix(adj, dtype=np.float32)
+    coo.sum_duplicates()
+    coo = coo.tocoo()
+    indices = torch.from_numpy(np.vstack([coo.row, coo.col]).astype(np.int64))
+    return torch.sparse_coo_tensor(indices, torch.from_numpy(coo.data), coo.shape, device=device,
+                                   is_coalesced=True, check_invariants=False)
+
 
 class SimpleGCN(nn.Module):
     def __init__(self, input_dim, hidden_dim, output_dim):
@@ -14,27 +46,68 @@ class SimpleGCN(nn.Module):
         self.fc1 = nn.Linear(input_dim, hidden_dim)
         self.fc2 = nn.Linear(hidden_dim, output_dim)
     def forward(self, x, adj):
-        h = torch.relu(self.fc1(torch.matmul(adj, x)))
-        out = self.fc2(torch.matmul(adj, h))
+        """
+        Args:
+            x: Node features
+            adj: (N, N) dense or sparse adjacency shared by both layers, or a pair of
+                 sampled bipartite blocks (input layer first) from NeighborSampler
+        """
+        adj1, adj2 = adj if isinstance(adj, (list, tuple)) else (adj, adj)
+        h = torch.relu(self.fc1(_propagate(adj1, x)))
+        out = self.fc2(_propagate(adj2, h))
         return out
 
 class GNNModel(BaseClassificationModel):
     """
     Simple Graph Neural Network (GCN) classification model using PyTorch.
     Implements the BaseClassificationModel interface.
-    Expects features as node features and adjacency matrix in kwargs.
+    Expects features as node features and an adjacency matrix in kwargs, or a
+    graph construction rule ('knn' feature graph or sensor 'topology' graph)
+    that builds a sparse adjacency matrix automatically.
+
+    Adjacency matrices may be dense arrays, scipy sparse matrices or (dense or
+    sparse COO/CSR) torch tensors; they are propagated as sparse tensors. With
+    ``batch_size`` set, training and inference run on neighbour-sampled
+    mini-batches so memory stays bounded by the batch instead of the graph.
     """
-    def __init__(self, input_dim=10, hidden_dim=32, output_dim=2, lr=0.001, epochs=20, device=None):
+    def __init__(self, input_dim=10, hidden_dim=32, output_dim=2, lr=0.001, epochs=20, device=None,
+                 graph: Optional[str] = None, k: int = 10, batch_size: Optional[int] = None,
+                 num_neighbors: Sequence[Optional[int]] = (10, 10), random_state: Optional[int] = None):
+        """
+        Args:
+            input_dim: Number of node features
+            hidden_dim: Hidden layer size
+            output_dim: Number of classes
+            lr: Learning rate
+            epochs: Training epochs
+            device: Torch device (default: CUDA if available)
+            graph: Graph built when no 'adjacency_matrix' is given: 'knn' or
+                   'topology' (default: None, an adjacency matrix is required)
+            k: Neighbours per node for the 'knn' graph
+            batch_size: Target nodes per mini-batch (default: None, full graph)
+            num_neighbors: Neighbours sampled per node and layer for mini-batch
+                           training (output layer first; None takes all)
+            random_state: Seed for mini-batch shuffling and neighbour sampling
+        """
         super().__init__(
             name="gnn",
             description="Graph Convolutional Network (GCN) classifier for gait data classification"
         )
+        if graph is not None and graph not in GRAPH_TYPES:
+            raise ValueError(f"Unknown graph type: {graph}. Supported: {list(GRAPH_TYPES)}")
+        if len(num_neighbors) != 2:
+            raise ValueError("num_neighbors needs one entry per GCN layer (2)")
         self.config = {
             'input_dim': input_dim,
             'hidden_dim': hidden_dim,
             'output_dim': output_dim,
             'lr': lr,
-            'epochs': epochs
+            'epochs': epochs,
+            'graph': graph,
+            'k': k,
+            'batch_size': batch_size,
+            'num_neighbors': list(num_neighbors),
+            'random_state': random_state
         }
         self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
         self.model = SimpleGCN(input_dim, hidden_dim, output_dim).to(self.device)
@@ -43,28 +116,99 @@ class GNNModel(BaseClassificationModel):
         self.feature_names = []
         self.class_names = []
 
+    def _adjacency(self, features: List[Dict], X: np.ndarray, kwargs: Dict, action: str) -> sp.csr_matrix:
+        """Adjacency matrix from kwargs, or built with the configured graph rule."""
+        adj = kwargs.get('adjacency_matrix')
+        graph = kwargs.get('graph', self.config.get('graph'))
+        if adj is None and graph is None:
+            raise ValueError(f"Adjacency matrix must be provided as 'adjacency_matrix' in kwargs for GNN {action} "
+                             "(or set graph='knn' or graph='topology' to build one).")
+        if adj is None:
+            if graph == 'knn':
+                adj = knn_graph(X, k=kwargs.get('k', self.config.get('k', 10)))
+            elif graph == 'topology':
+                sensors, windows = feature_node_layout(features)
+                if len(sensors) != len(X):
+                    raise ValueError(f"Sensor layout has {len(sensors)} nodes but the feature matrix has {len(X)} rows")
+                adj = topology_graph(sensors, windows)
+            else:
+                raise ValueError(f"Unknown graph type: {graph}. Supported: {list(GRAPH_TYPES)}")
+        elif isinstance(adj, torch.Tensor):
+            adj = adj.to_sparse() if adj.layout == torch.strided else adj.to_sparse_coo()
+            adj = adj.coalesce().cpu()
+            indices = adj.indices().numpy()
+            adj = sp.csr_matrix((adj.values().numpy(), (indices[0], indices[1])), shape=tuple(adj.shape))
+        adj = sp.csr_matrix(adj, dtype=np.float32)
+        if adj.shape != (len(X), len(X)):
+            raise ValueError(f"Adjacency matrix shape {adj.shape} does not match {len(X)} nodes")
+        return adj
+
+    def _sampler(self, adj: sp.csr_matrix, training: bool) -> NeighborSampler:
+        """Mini-batch sampler; inference aggregates over all neighbours."""
+        num_neighbors = self.config['num_neighbors'] if training else [None, None]
+        return NeighborSampler(adj, num_neighbors, batch_size=self.config['batch_size'],
+                               shuffle=training, random_state=self.config.get('random_state'))
+
+    def _blocks_to_device(self, blocks):
+        return [to_torch_sparse(block, self.device) for block in blocks]
+
+    def _forward_all(self, X: np.ndarray, adj: sp.csr_matrix) -> torch.Tensor:
+        """Logits of every node, on the full graph or in mini-batches."""
+        self.model.eval()
+        with torch.no_grad():
+            if not self.config.get('batch_size'):
+                x = torch.tensor(X, dtype=torch.float32).to(self.device)
+                return self.model(x, to_torch_sparse(adj, self.device)).cpu()
+            x = torch.tensor(X, dtype=torch.float32)
+            outputs = torch.empty((len(X), self.config['output_dim']), dtype=torch.float32)
+            for node_ids, blocks in self._sampler(adj, training=False):
+                n_targets = blocks[-1].shape[0]
+                batch_x = x[torch.from_numpy(node_ids)].to(self.device)
+                outputs[torch.from_numpy(node_ids[:n_targets])] = \
+                    self.model(batch_x, self._blocks_to_device(blocks)).cpu()
+            return outputs
+
     def train(self, features: List[Dict], **kwargs):
         X, y = preprocess_features(features)
         # X: (num_nodes, num_features), y: (num_nodes,)
-        adj = kwargs.get('adjacency_matrix')
-        if adj is None:
-            raise ValueError("Adjacency matrix must be provided as 'adjacency_matrix' in kwargs for GNN training.")
-        X = torch.tensor(X, dtype=torch.float32).to(self.device)
-        y = torch.tensor(y, dtype=torch.long).to(self.device)
-        adj = torch.tensor(adj, dtype=torch.float32).to(self.device)
+        adj = self._adjacency(features, X, kwargs, "training")
         self.feature_names = [f"feature_{i}" for i in range(X.shape[1])]
-        self.class_names = list(set(y.cpu().numpy()))
+        self.class_names = list(set(y))
         criterion = nn.CrossEntropyLoss()
         optimizer = optim.Adam(self.model.parameters(), lr=self.config['lr'])
+        if self.config.get('batch_size'):
+            # Features stay on the CPU; only each batch's neighbourhood moves to the device
+            x_all = torch.tensor(X, dtype=torch.float32)
+            y_all = torch.tensor(y, dtype=torch.long)
+            sampler = self._sampler(adj, training=True)
+        else:
+            x_all = torch.tensor(X, dtype=torch.float32).to(self.device)
+            y_all = torch.tensor(y, dtype=torch.long).to(self.device)
+            adj_t = to_torch_sparse(adj, self.device)
         for epoch in range(self.epochs):
             self.model.train()
-            optimizer.zero_grad()
-            outputs = self.model(X, adj)
-            loss = criterion(outputs, y)
-            loss.backward()
-            optimizer.step()
+            if self.config.get('batch_size'):
+                total, count = 0.0, 0
+                for node_ids, blocks in sampler:
+                    n_targets = blocks[-1].shape[0]
+                    ids = torch.from_numpy(node_ids)
+                    optimizer.zero_grad()
+                    outputs = self.model(x_all[ids].to(self.device), self._blocks_to_device(blocks))
+                    loss = criterion(outputs, y_all[ids[:n_targets]].to(self.device))
+                    loss.backward()
+                    optimizer.step()
+                    total += loss.item() * n_targets
+                    count += n_targets
+                epoch_loss = total / max(count, 1)
+            else:
+                optimizer.zero_grad()
+                outputs = self.model(x_all, adj_t)
+                loss = criterion(outputs, y_all)
+                loss.backward()
+                optimizer.step()
+                epoch_loss = loss.item()
             if (epoch+1) % 5 == 0 or epoch == 0:
-                print(f"Epoch [{epoch+1}/{self.epochs}], Loss: {loss.item():.4f}")
+                print(f"Epoch [{epoch+1}/{self.epochs}], Loss: {epoch_loss:.4f}")
         self.trained = True
         print("GNN model trained successfully.")
 
@@ -72,42 +216,28 @@ class GNNModel(BaseClassificationModel):
         if not self.trained:
             raise ValueError("Model must be trained before making predictions")
         X, _ = preprocess_features(features)
-        adj = kwargs.get('adjacency_matrix')
-        if adj is None:
-            raise ValueError("Adjacency matrix must be provided as 'adjacency_matrix' in kwargs for GNN prediction.")
-        X = torch.tensor(X, dtype=torch.float32).to(self.device)
-        adj = torch.tensor(adj, dtype=torch.float32).to(self.device)
-        self.model.eval()
-        with torch.no_grad():
-            outputs = self.model(X, adj)
-            _, predicted = torch.max(outputs.data, 1)
-        return predicted.cpu().numpy()
+        adj = self._adjacency(features, X, kwargs, "prediction")
+        outputs = self._forward_all(X, adj)
+        _, predicted = torch.max(outputs, 1)
+        return predicted.numpy()
 
     def evaluate(self, features: List[Dict], **kwargs) -> Dict[str, float]:
         if not self.trained:
             raise ValueError("Model must be trained before evaluation")
         X, y = preprocess_features(features)
-        adj = kwargs.get('adjacency_matrix')
-        if adj is None:
-            raise ValueError("Adjacency matrix must be provided as 'adjacency_matrix' in kwargs for GNN evaluation.")
-        X = torch.tensor(X, dtype=torch.float32).to(self.device)
+        adj = self._adjacency(features, X, kwargs, "evaluation")
         y = np.array(y)
-        adj = torch.tensor(adj, dtype=torch.float32).to(self.device)
-        self.model.eval()
-        with torch.no_grad():
-            outputs = self.model(X, adj)
-            _, y_pred = torch.max(outputs.data, 1)
-        y_pred = y_pred.cpu().numpy()
-        accuracy = accuracy_score(y, y_pred)
-        conf_matrix = confusion_matrix(y, y_pred)
+        outputs = self._forward_all(X, adj)
+        _, y_pred = torch.max(outputs, 1)
+        y_pred = y_pred.numpy()
+        confusion = StreamingConfusionMatrix.from_predictions(y, y_pred)
         metrics = {
-            'accuracy': accuracy,
-            'confusion_matrix': conf_matrix.tolist()
+            'accuracy': confusion.accuracy(),
+            'confusion_matrix': confusion.matrix.tolist()
         }
         detailed_report = kwargs.get('detailed_report', False)
         if detailed_report:
-            class_report = classification_report(y, y_pred, output_dict=True)
-            metrics['classification_report'] = class_report
+            metrics['classification_report'] = confusion.classification_report()
         return metrics
 
     def save_model(self, filepath: str):
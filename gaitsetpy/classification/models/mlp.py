@@ -1,11 +1,13 @@
 from typing import List, Dict, Any, Optional, Union
 import joblib
 import numpy as np
+from sklearn.base import clone
 from sklearn.neural_network import MLPClassifier
 from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, confusion_matrix, classification_report
 from ...core.base_classes import BaseClassificationModel
 from ..utils.preprocess import preprocess_features
+from ..utils.metrics import StreamingConfusionMatrix
+from ..utils.batches import encode_batch, is_reiterable, iter_batches, source_classes
 
 class MLPModel(BaseClassificationModel):
     """
@@ -58,6 +60,88 @@ class MLPModel(BaseClassificationModel):
         self.trained = True
         print("MLP model trained successfully.")
 
+    def fit_arrays(self, X: np.ndarray, y: np.ndarray, **kwargs):
+        """
+        Train the MLP on a feature matrix and label codes.
+
+        Args:
+            X: Feature matrix in the layout of ``preprocess_features``
+            y: Zero-based label codes
+            **kwargs: Additional arguments
+        """
+        X = np.asarray(X, dtype=np.float32)
+        y = np.asarray(y)
+        self.feature_names = [f"feature_{i}" for i in range(X.shape[1])]
+        self.class_names = list(set(y))
+        self.model.fit(X, y)
+        self.trained = True
+
+    def predict_arrays(self, X: np.ndarray, **kwargs) -> np.ndarray:
+        """
+        Make predictions for a feature matrix.
+
+        Args:
+            X: Feature matrix in the layout of ``preprocess_features``
+            **kwargs: Additional arguments including return_probabilities
+
+        Returns:
+            Label codes or class probabilities
+        """
+        if not self.trained:
+            raise ValueError("Model must be trained before making predictions")
+        X = np.asarray(X, dtype=np.float32)
+        if kwargs.get('return_probabilities', False):
+            return self.model.predict_proba(X)
+        return self.model.predict(X)
+
+    def fit_batches(self, source, classes=None, epochs: int = 1, batch_size: int = 4096,
+                    shuffle: bool = True, random_state: Optional[int] = None):
+        """
+        Train out of core with ``partial_fit``, one feature batch at a time.
+
+        Memory is bounded by one batch plus the network. Each epoch is one pass
+        of the optimiser over every batch; compared with ``train`` there is no
+        early stopping or convergence check, so set ``epochs`` explicitly.
+
+        Args:
+            source: (X, y) arrays (e.g. memory-mapped), a CorpusStore, or an
+                    iterable of (X, y) batches; labels are raw values
+            classes: All label values (required for batch iterables; read from the
+                     labels of array and corpus sources)
+            epochs: Passes over the source (requires a re-iterable source if > 1)
+            batch_size: Rows per batch for array and corpus sources
+            shuffle: Draw batches as random subsamples of the rows
+            random_state: Seed for batch shuffling
+
+        Raises:
+            ValueError: If the solver does not support partial_fit, epochs is not
+                        positive or a one-shot iterator is given for several epochs
+        """
+        if self.config['solver'] not in ('adam', 'sgd'):
+            raise ValueError("Out-of-core training requires the 'adam' or 'sgd' solver")
+        if epochs < 1:
+            raise ValueError("epochs must be at least 1")
+        if epochs > 1 and not is_reiterable(source):
+            raise ValueError("Training for several epochs requires a re-iterable source")
+        classes = np.unique(np.asarray(classes)) if classes is not None else source_classes(source)
+        codes = np.arange(len(classes))
+        rng = np.random.default_rng(random_state)
+
+        # Start from a fresh, unfitted network
+        self.model = clone(self.model)
+        seen = 0
+        for epoch in range(epochs):
+            for X, labels in iter_batches(source, batch_size=batch_size, shuffle=shuffle, random_state=rng):
+                if len(X):
+                    self.model.partial_fit(X, encode_batch(labels, classes), classes=codes)
+                    seen += len(X)
+        if not seen:
+            raise ValueError("No valid features or labels found.")
+        self.feature_names = [f"feature_{i}" for i in range(self.model.n_features_in_)]
+        self.class_names = list(codes)
+        self.trained = True
+        print(f"MLP model trained out of core ({epochs} epochs, {seen} rows).")
+
     def predict(self, features: List[Dict], **kwargs) -> Union[np.ndarray, Any]:
         if not self.trained:
             raise ValueError("Model must be trained before making predictions")
@@ -76,16 +160,14 @@ class MLPModel(BaseClassificationModel):
         else:
             X_test, y_test = preprocess_features(features)
         y_pred = self.model.predict(X_test)
-        accuracy = accuracy_score(y_test, y_pred)
-        conf_matrix = confusion_matrix(y_test, y_pred)
+        confusion = StreamingConfusionMatrix.from_predictions(y_test, y_pred)
         metrics = {
-            'accuracy': accuracy,
-            'confusion_matrix': conf_matrix.tolist()
+            'accuracy': confusion.accuracy(),
+            'confusion_matrix': confusion.matrix.tolist()
         }
         detailed_report = kwargs.get('detailed_report', False)
         if detailed_report:
-            class_report = classification_report(y_test, y_pred, output_dict=True)
-            metrics['classification_report'] = class_report
+            metrics['classification_report'] = confusion.classification_report()
         return metrics
 
     def save_model(self, filepath: str):
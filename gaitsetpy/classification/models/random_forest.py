@@ -9,12 +9,14 @@ Maintainer: @aharshit123456
 
 import joblib
 import numpy as np
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Sequence, Union
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, confusion_matrix, classification_report
 from ...core.base_classes import BaseClassificationModel
 from ..utils.preprocess import preprocess_features
+from ..utils.metrics import StreamingConfusionMatrix
+from ...core.precision import encode_labels, label_dtype
+from ..utils.batches import encode_batch, iter_batches, source_classes
 
 
 class RandomForestModel(BaseClassificationModel):
@@ -22,26 +24,80 @@ class RandomForestModel(BaseClassificationModel):
     Random Forest classification model.
     
     This class provides Random Forest classification functionality with
-    comprehensive training, prediction, and evaluation capabilities.
+    comprehensive training, prediction, and evaluation capabilities. Trees are
+    fitted and queried in parallel, and ``add_trees`` grows a trained forest
+    with trees fitted on new recordings (warm start) instead of retraining.
     """
     
-    def __init__(self, n_estimators: int = 100, random_state: int = 42, max_depth: Optional[int] = None):
+    def __init__(self, n_estimators: int = 100, random_state: int = 42, max_depth: Optional[int] = None,
+                 max_workers: Optional[int] = None):
+        """
+        Initialize the Random Forest model.
+        
+        Args:
+            n_estimators: Number of trees in the forest
+            random_state: Random state for reproducibility
+            max_depth: Maximum depth of the trees
+            max_workers: Number of threads for fitting and prediction
+                         (default: None, all CPU cores; 1 disables parallelism)
+        """
         super().__init__(
             name="random_forest",
             description="Random Forest classifier for gait data classification"
         )
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
         self.config = {
             'n_estimators': n_estimators,
             'random_state': random_state,
-            'max_depth': max_depth
+            'max_depth': max_depth,
+            'max_workers': max_workers
         }
         self.model = RandomForestClassifier(
             n_estimators=n_estimators,
             random_state=random_state,
-            max_depth=max_depth
+            max_depth=max_depth,
+            n_jobs=self._n_jobs(max_workers)
         )
         self.feature_names = []
         self.class_names = []
+        self.label_map = None
+    
+    @property
+    def n_trees(self) -> int:
+        """
+        Number of trees in the fitted forest.
+        
+        This differs from ``config['n_estimators']`` after ``fit_batches`` or
+        ``add_trees``; a fresh ``train`` or ``fit_arrays`` always grows the
+        configured number of trees.
+        """
+        return len(getattr(self.model, 'estimators_', []))
+    
+    @staticmethod
+    def _n_jobs(max_workers: Optional[int]) -> int:
+        """scikit-learn n_jobs for a max_workers setting (None -> all cores)."""
+        return -1 if max_workers is None else max_workers
+    
+    def set_max_workers(self, max_workers: Optional[int]):
+        """
+        Set the number of threads used for fitting and prediction.
+        
+        Args:
+            max_workers: Number of threads (must be positive), or None for all CPU cores
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.config['max_workers'] = max_workers
+        self.model.set_params(n_jobs=self._n_jobs(max_workers))
+    
+    @staticmethod
+    def _annotation_label_map(features: List[Dict]) -> Dict[Any, int]:
+        """Label -> code map matching the codes produced by preprocess_features."""
+        annotations = [np.asarray(f["annotations"]) for f in features if len(f.get("annotations", []))]
+        if not annotations:
+            return {}
+        return encode_labels(np.concatenate(annotations))[1]
         
     def train(self, features: List[Dict], **kwargs):
         """
@@ -49,7 +105,9 @@ class RandomForestModel(BaseClassificationModel):
         
         Args:
             features: List of feature dictionaries
-            **kwargs: Additional arguments including test_size, validation_split
+            **kwargs: Additional arguments including test_size, validation_split and
+                      report_accuracy (score the fitted forest on the training and
+                      validation splits and print the accuracies, default: False)
         """
         # Preprocess features
         X, y = preprocess_features(features)
@@ -57,10 +115,15 @@ class RandomForestModel(BaseClassificationModel):
         # Store feature and class information
         self.feature_names = [f"feature_{i}" for i in range(X.shape[1])]
         self.class_names = list(set(y))
+        self.label_map = self._annotation_label_map(features)
+        
+        # A fresh fit replaces any trees grown with add_trees
+        self.model.set_params(warm_start=False, n_estimators=self.config['n_estimators'])
         
         # Split data if test_size is specified
         test_size = kwargs.get('test_size', 0.2)
         validation_split = kwargs.get('validation_split', True)
+        report_accuracy = kwargs.get('report_accuracy', False)
         
         if validation_split:
             X_train, X_test, y_train, y_test = train_test_split(
@@ -74,21 +137,183 @@ class RandomForestModel(BaseClassificationModel):
             self.X_test = X_test
             self.y_test = y_test
             
-            # Print training accuracy
-            train_accuracy = self.model.score(X_train, y_train)
-            test_accuracy = self.model.score(X_test, y_test)
-            
-            print(f"Training accuracy: {train_accuracy:.4f}")
-            print(f"Validation accuracy: {test_accuracy:.4f}")
+            if report_accuracy:
+                train_accuracy = self.model.score(X_train, y_train)
+                test_accuracy = self.model.score(X_test, y_test)
+                
+                print(f"Training accuracy: {train_accuracy:.4f}")
+                print(f"Validation accuracy: {test_accuracy:.4f}")
         else:
             # Train on all data
             self.model.fit(X, y)
-            train_accuracy = self.model.score(X, y)
-            print(f"Training accuracy: {train_accuracy:.4f}")
+            if report_accuracy:
+                train_accuracy = self.model.score(X, y)
+                print(f"Training accuracy: {train_accuracy:.4f}")
         
         self.trained = True
         print("Random Forest model trained successfully.")
     
+    def fit_arrays(self, X: np.ndarray, y: np.ndarray, **kwargs):
+        """
+        Train the Random Forest on a feature matrix and label codes.
+        
+        Args:
+            X: Feature matrix in the layout of ``preprocess_features``
+            y: Zero-based label codes
+            **kwargs: Additional arguments including label_map (original label ->
+                      code map, kept for export and required by add_trees)
+        """
+        X = np.asarray(X, dtype=np.float32)
+        y = np.asarray(y)
+        self.feature_names = [f"feature_{i}" for i in range(X.shape[1])]
+        self.class_names = list(set(y))
+        self.label_map = kwargs.get('label_map')
+        self.model.set_params(warm_start=False, n_estimators=self.config['n_estimators'])
+        self.model.fit(X, y)
+        self.trained = True
+    
+    def predict_arrays(self, X: np.ndarray, **kwargs) -> np.ndarray:
+        """
+        Make predictions for a feature matrix.
+        
+        Args:
+            X: Feature matrix in the layout of ``preprocess_features``
+            **kwargs: Additional arguments including return_probabilities
+            
+        Returns:
+            Label codes or class probabilities
+        """
+        if not self.trained:
+            raise ValueError("Model must be trained before making predictions")
+        X = np.asarray(X, dtype=np.float32)
+        if kwargs.get('return_probabilities', False):
+            return self.model.predict_proba(X)
+        return self.model.predict(X)
+    
+    @staticmethod
+    def _pad_missing_classes(X: np.ndarray, y: np.ndarray, classes: np.ndarray):
+        """
+        Append one zero-weight row per class missing from a batch, so trees
+        fitted on it share the forest's class columns without learning from them.
+        """
+        missing = np.setdiff1d(classes, y)
+        sample_weight = np.ones(len(y) + len(missing))
+        sample_weight[len(y):] = 0.0
+        X = np.vstack([X, np.repeat(X[:1], len(missing), axis=0)])
+        y = np.concatenate([y, missing.astype(y.dtype)])
+        return X, y, sample_weight
+    
+    def fit_batches(self, source, classes: Optional[Sequence] = None, trees_per_batch: int = 10,
+                    batch_size: int = 20000, shuffle: bool = True, random_state: Optional[int] = None):
+        """
+        Train the forest out of core, growing ``trees_per_batch`` trees per batch.
+        
+        Each batch is fitted by its own trees (warm start), so memory stays bounded
+        by one batch plus the forest, whatever the size of the source. With
+        ``shuffle=True`` every batch is a random subsample of all rows and the
+        forest is a subsampled bagging ensemble; with ``shuffle=False`` batches
+        follow storage order (e.g. recording by recording), which reads fastest
+        but gives trees that each know only a few subjects.
+        
+        Accuracy/throughput tradeoff: every tree sees at most ``batch_size`` rows
+        instead of a bootstrap of the full data, so trees are shallower and the
+        forest needs more of them to match in-memory training; fitting time grows
+        roughly linearly with total rows instead of as n log n per tree. See
+        examples/scripts/benchmark_out_of_core.py for measurements.
+        
+        Args:
+            source: (X, y) arrays (e.g. memory-mapped), a CorpusStore, or an
+                    iterable of (X, y) batches; labels are raw values
+            classes: All label values (required for batch iterables; read from the
+                     labels of array and corpus sources)
+            trees_per_batch: Trees fitted on each batch
+            batch_size: Rows per batch for array and corpus sources
+            shuffle: Draw batches as random subsamples of the rows
+            random_state: Seed for batch shuffling
+            
+        Raises:
+            ValueError: If trees_per_batch is not positive, the source is empty,
+                        batches disagree on the feature count or have unknown labels
+        """
+        if trees_per_batch < 1:
+            raise ValueError("trees_per_batch must be at least 1")
+        classes = np.unique(np.asarray(classes)) if classes is not None else source_classes(source)
+        codes = np.arange(len(classes))
+        y_dtype = label_dtype(len(classes))
+        
+        n_trees = 0
+        for X, labels in iter_batches(source, batch_size=batch_size, shuffle=shuffle, random_state=random_state):
+            if not len(X):
+                continue
+            if n_trees and X.shape[1] != len(self.feature_names):
+                raise ValueError(f"Expected {len(self.feature_names)} features per row, got {X.shape[1]}")
+            self.feature_names = [f"feature_{i}" for i in range(X.shape[1])]
+            y = encode_batch(labels, classes).astype(y_dtype)
+            X, y, sample_weight = self._pad_missing_classes(X, y, codes)
+            n_trees += trees_per_batch
+            # The first batch starts a new forest; later batches add trees
+            self.model.set_params(warm_start=n_trees > trees_per_batch, n_estimators=n_trees)
+            self.model.fit(X, y, sample_weight=sample_weight)
+        if not n_trees:
+            raise ValueError("No valid features or labels found.")
+        
+        self.class_names = list(codes)
+        self.label_map = {label.item() if isinstance(label, np.generic) else label: code
+                          for code, label in enumerate(classes)}
+        self.trained = True
+        print(f"Random Forest model trained out of core ({n_trees} trees).")
+    
+    def add_trees(self, features: List[Dict], n_trees: int = 10, **kwargs):
+        """
+        Grow the trained forest with trees fitted on new data (warm start).
+        
+        Existing trees are kept unchanged; ``n_trees`` new trees are fitted on all
+        of the given features, e.g. from newly arrived recordings. Labels are
+        encoded with the label map of the initial training, so a batch may cover
+        only some of the classes.
+        
+        Args:
+            features: List of feature dictionaries with the training feature layout
+            n_trees: Number of trees to add
+            **kwargs: Additional arguments including report_accuracy (default: False)
+            
+        Raises:
+            ValueError: If the model is untrained or has no label map, n_trees is
+                        not positive, the feature dimension differs or the batch
+                        has unknown labels
+        """
+        if not self.trained:
+            raise ValueError("Model must be trained before adding trees")
+        if n_trees < 1:
+            raise ValueError("n_trees must be at least 1")
+        
+        X, y, batch_map = preprocess_features(features, return_label_map=True)
+        if X.shape[1] != len(self.feature_names):
+            raise ValueError(f"Expected {len(self.feature_names)} features per row, got {X.shape[1]}")
+        
+        # Re-encode the batch's codes with the training label map
+        if not self.label_map:
+            raise ValueError("Model has no label map to encode new labels with; train it with "
+                             "train/train_out_of_core or pass label_map to fit_arrays")
+        unknown = set(batch_map) - set(self.label_map)
+        if unknown:
+            raise ValueError(f"Labels not seen in training: {sorted(unknown, key=str)}")
+        recode = np.empty(len(batch_map), dtype=y.dtype)
+        for label, code in batch_map.items():
+            recode[code] = self.label_map[label]
+        y = recode[y]
+        
+        X, y, sample_weight = self._pad_missing_classes(X, y, self.model.classes_)
+        
+        n_estimators = len(self.model.estimators_) + n_trees
+        self.model.set_params(warm_start=True, n_estimators=n_estimators)
+        self.model.fit(X, y, sample_weight=sample_weight)
+        
+        if kwargs.get('report_accuracy', False):
+            keep = sample_weight > 0
+            print(f"Accuracy on added data: {self.model.score(X[keep], y[keep]):.4f}")
+        print(f"Added {n_trees} trees ({n_estimators} in total).")
+    
     def predict(self, features: List[Dict], **kwargs) -> Union[np.ndarray, Any]:
         """
         Make predictions using the trained Random Forest model.
@@ -138,20 +363,18 @@ class RandomForestModel(BaseClassificationModel):
         y_pred = self.model.predict(X_test)
         
         # Calculate metrics
-        accuracy = accuracy_score(y_test, y_pred)
-        conf_matrix = confusion_matrix(y_test, y_pred)
+        confusion = StreamingConfusionMatrix.from_predictions(y_test, y_pred)
         
         # Basic metrics
         metrics = {
-            'accuracy': accuracy,
-            'confusion_matrix': conf_matrix.tolist()
+            'accuracy': confusion.accuracy(),
+            'confusion_matrix': confusion.matrix.tolist()
         }
         
         # Detailed report if requested
         detailed_report = kwargs.get('detailed_report', False)
         if detailed_report:
-            class_report = classification_report(y_test, y_pred, output_dict=True)
-            metrics['classification_report'] = class_report
+            metrics['classification_report'] = confusion.classification_report()
             
             # Feature importance
             if hasattr(self.model, 'feature_importances_'):
@@ -176,6 +399,7 @@ class RandomForestModel(BaseClassificationModel):
             'config': self.config,
             'feature_names': self.feature_names,
             'class_names': self.class_names,
+            'label_map': self.label_map,
             'trained': self.trained
         }
         
@@ -198,6 +422,7 @@ class RandomForestModel(BaseClassificationModel):
                 self.config = model_data.get('config', self.config)
                 self.feature_names = model_data.get('feature_names', [])
                 self.class_names = model_data.get('class_names', [])
+                self.label_map = model_data.get('label_map')
                 self.trained = model_data.get('trained', True)
             else:
                 # Legacy format - just the model
@@ -245,7 +470,7 @@ class RandomForestModel(BaseClassificationModel):
 
 
 # Legacy function wrapper for backward compatibility
-def create_random_forest_model(n_estimators=100, random_state=42, max_depth=None):
+def create_random_forest_model(n_estimators=100, random_state=42, max_depth=None, max_workers=None):
     """
     Create a Random Forest model with specified parameters.
     
@@ -253,8 +478,10 @@ def create_random_forest_model(n_estimators=100, random_state=42, max_depth=None
         n_estimators: Number of trees in the forest
         random_state: Random state for reproducibility
         max_depth: Maximum depth of the tree
+        max_workers: Number of threads (default: None, all CPU cores)
         
     Returns:
         RandomForestModel instance
     """
-    return RandomForestModel(n_estimators=n_estimators, random_state=random_state, max_depth=max_depth)
+    return RandomForestModel(n_estimators=n_estimators, random_state=random_state, max_depth=max_depth,
+                             max_workers=max_workers)
@@ -0,0 +1,414 @@
+'''
+Shared training, inference and persistence for the PyTorch gait models.
+
+``TorchModelMixin`` implements training (full-batch by default, mini-batches
+from a ``TensorCache`` with ``mini_batch=True``), prediction, evaluation,
+inference modes and saving for ``LSTMModel``, ``BiLSTMModel`` and ``CNNModel``;
+each model only defines its network and how feature rows are shaped for it.
+
+Inference modes:
+
+- 'float32': the trained model in eager float32 (default)
+- 'int8': dynamic int8 quantisation of the ``nn.LSTM`` and ``nn.Linear``
+  layers; weights are stored as int8 and activations are quantised on the fly,
+  so no calibration data is needed. ``nn.Conv1d`` has no dynamic quantised
+  kernel, so CNNs only quantise their classifier head.
+- 'bfloat16': float32 weights run under CPU ``torch.autocast`` with bfloat16
+  matmuls; fastest on CPUs with native bfloat16 support (AVX512-BF16/AMX).
+
+``optimize_for_inference`` checks the optimised model against the float model
+on reference inputs (fraction of identical predictions and the largest
+probability difference) and keeps the float model if agreement is too low.
+
+Maintainer: @aharshit123456
+'''
+
+import contextlib
+import copy
+import warnings
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import torch
+import torch.nn as nn
+import torch.optim as optim
+from sklearn.model_selection import train_test_split
+
+from ..utils.metrics import StreamingConfusionMatrix
+from ..utils.preprocess import preprocess_features
+from ..utils.tensor_cache import TensorCache
+
+
+INFERENCE_MODES = ('float32', 'int8', 'bfloat16')
+
+# Layer types replaced by dynamically quantised versions in 'int8' mode
+QUANTIZABLE_LAYERS = {nn.LSTM, nn.Linear}
+
+
+def quantize_dynamic(module: nn.Module) -> nn.Module:
+    """
+    Dynamically quantise the LSTM and Linear layers of a module to int8.
+
+    Args:
+        module: Float module (left unchanged)
+
+    Returns:
+        Quantised copy of the module in eval mode
+    """
+    module = copy.deepcopy(module).to('cpu').eval()
+    with warnings.catch_warnings():
+        # torch.ao.quantization and quantized tensors are deprecated in favour of torchao,
+        # which is not a dependency
+        warnings.filterwarnings('ignore', message=r'torch\.ao\.quantization is deprecated',
+                                category=DeprecationWarning)
+        warnings.filterwarnings('ignore', message=r'torch\.quantize_per_tensor, .* are deprecated',
+                                category=UserWarning)
+        return torch.ao.quantization.quantize_dynamic(module, QUANTIZABLE_LAYERS, dtype=torch.qint8)
+
+
+def inference_context(mode: str):
+    """
+    Context manager for running a forward pass in an inference mode.
+
+    Args:
+        mode: One of ``INFERENCE_MODES``
+
+    Returns:
+        CPU bfloat16 autocast for 'bfloat16', a no-op context otherwise
+    """
+    if mode == 'bfloat16':
+        return torch.autocast('cpu', dtype=torch.bfloat16)
+    return contextlib.nullcontext()
+
+
+def run_inference(module: nn.Module, X: torch.Tensor, mode: str = 'float32',
+                  batch_size: Optional[int] = None) -> torch.Tensor:
+    """
+    Float32 logits of a module in an inference mode.
+
+    Args:
+        module: Module in eval mode
+        X: Input batch
+        mode: One of ``INFERENCE_MODES``
+        batch_size: Rows per forward pass (default: None, all at once)
+
+    Returns:
+        Logits as a float32 tensor
+    """
+    batch_size = batch_size or max(len(X), 1)
+    outputs = []
+    with torch.no_grad(), inference_context(mode):
+        for start in range(0, len(X), batch_size):
+            outputs.append(module(X[start:start + batch_size]).float())
+    return torch.cat(outputs) if outputs else torch.empty(0)
+
+
+def inference_parity(reference: nn.Module, candidate: nn.Module, X: torch.Tensor,
+                     mode: str = 'float32', batch_size: Optional[int] = None) -> Dict[str, float]:
+    """
+    Compare an optimised module with its float32 reference.
+
+    Args:
+        reference: Float32 module
+        candidate: Optimised module
+        X: Reference inputs
+        mode: Inference mode of the candidate
+        batch_size: Rows per forward pass
+
+    Returns:
+        Dictionary with 'agreement' (fraction of identical predicted classes)
+        and 'max_prob_diff' (largest absolute difference in class probability)
+    """
+    expected = torch.softmax(run_inference(reference, X, 'float32', batch_size), dim=1)
+    actual = torch.softmax(run_inference(candidate, X, mode, batch_size), dim=1)
+    return {
+        'agreement': float((expected.argmax(dim=1) == actual.argmax(dim=1)).float().mean()),
+        'max_prob_diff': float((expected - actual).abs().max()),
+    }
+
+
+def optimize_for_inference(model: Any, mode: str = 'int8', reference: Optional[np.ndarray] = None,
+                           min_agreement: float = 0.99) -> Optional[Dict[str, float]]:
+    """
+    Switch a trained LSTM/BiLSTM/CNN model to an optimised CPU inference mode.
+
+    The float32 network is kept as ``model.float_model`` so the mode can be
+    changed again (or reset with 'float32'); training and saving always use it.
+
+    Args:
+        model: Trained LSTMModel, BiLSTMModel or CNNModel on the CPU
+        mode: One of ``INFERENCE_MODES``
+        reference: Feature matrix (samples, features) for the parity check
+                   (default: None, no check)
+        min_agreement: Minimum fraction of predictions that must match the float
+                       model on ``reference``
+
+    Returns:
+        Parity report ('agreement', 'max_prob_diff'), or None without reference
+
+    Raises:
+        ValueError: If the mode is unknown, the model is untrained or not on the
+                    CPU, or the optimised model disagrees with the float model
+    """
+    if mode not in INFERENCE_MODES:
+        raise ValueError(f"Unsupported inference mode: {mode}. Supported: {list(INFERENCE_MODES)}")
+    if not model.trained:
+        raise ValueError("Model must be trained before optimizing for inference")
+    if torch.device(model.device).type != 'cpu':
+        raise ValueError("Inference optimization targets CPU models; move the model to 'cpu' first")
+
+    float_model = model.float_model if model.float_model is not None else model.model
+    float_model.eval()
+    candidate = quantize_dynamic(float_model) if mode == 'int8' else float_model
+
+    report = None
+    if reference is not None and mode != 'float32':
+        X = model._to_input(torch.from_numpy(np.ascontiguousarray(reference, dtype=np.float32)))
+        report = inference_parity(float_model, candidate, X, mode)
+        if report['agreement'] < min_agreement:
+            raise ValueError(f"{mode} inference agrees with float32 on {report['agreement']:.2%} of the "
+                             f"reference inputs (minimum {min_agreement:.2%}); keeping float32")
+
+    model.model = candidate
+    model.float_model = None if mode == 'float32' else float_model
+    model.inference_mode = mode
+    return report
+
+
+def restore_float(model: Any):
+    """
+    Switch a model back to its float32 network (e.g. before further training).
+
+    Args:
+        model: LSTMModel, BiLSTMModel or CNNModel
+    """
+    if model.float_model is not None:
+        model.model = model.float_model
+    model.float_model = None
+    model.inference_mode = 'float32'
+
+
+class TorchModelMixin:
+    """
+    Training, prediction, inference modes and persistence of the PyTorch models.
+
+    Used as ``class LSTMModel(TorchModelMixin, BaseClassificationModel)``. The
+    model sets ``self.config`` (including 'lr', 'epochs', 'batch_size' and
+    'mini_batch'), calls ``_init_torch`` and implements ``_build_network`` and
+    ``_to_input``; ``display_name`` is used in messages.
+    """
+
+    display_name = 'PyTorch'
+
+    def _build_network(self) -> nn.Module:
+        """Untrained network for ``self.config``."""
+        raise NotImplementedError
+
+    def _to_input(self, X: torch.Tensor) -> torch.Tensor:
+        """Reshape (samples, features) rows to the network input."""
+        raise NotImplementedError
+
+    def _init_torch(self, device: Optional[str] = None):
+        """Build the network on the device and reset the training state."""
+        self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        self.model = self._build_network().to(self.device)
+        self.epochs = self.config['epochs']
+        self.batch_size = self.config['batch_size']
+        self.trained = False
+        self.feature_names = []
+        self.class_names = []
+        self.inference_mode = 'float32'
+        self.float_model = None
+
+    def train(self, features: List[Dict], **kwargs):
+        """
+        Train the network on the given features.
+
+        Args:
+            features: List of feature dictionaries
+            **kwargs: Additional arguments including test_size and validation_split
+        """
+        X, y = preprocess_features(features)
+        # Converted to tensors once; training and evaluation use row indices into the cache
+        cache = TensorCache(X, y)
+        self.feature_names = [f"feature_{i}" for i in range(X.shape[1])]
+        self.class_names = list(set(y))
+        test_size = kwargs.get('test_size', 0.2)
+        validation_split = kwargs.get('validation_split', True)
+        train_rows = None
+        if validation_split:
+            train_rows, test_rows = train_test_split(
+                np.arange(len(X)), test_size=test_size, random_state=42
+            )
+            self.X_test = self._to_input(cache.take(test_rows, self.device)[0])
+            self.y_test = np.asarray(y)[test_rows]
+        self._fit(cache, train_rows)
+        print(f"{self.display_name} model trained successfully.")
+
+    def _fit(self, cache: TensorCache, rows: Optional[np.ndarray] = None):
+        restore_float(self)
+        criterion = nn.CrossEntropyLoss()
+        optimizer = optim.Adam(self.model.parameters(), lr=self.config['lr'])
+        if self.config.get('mini_batch', False):
+            # Shuffled mini-batches of batch_size; the next one is gathered in the background
+            batches = lambda: cache.batches(rows, self.batch_size, shuffle=True, device=self.device)
+        else:
+            # One full-batch step per epoch on the training rows, gathered once
+            full_batch = [cache.take(rows, self.device)]
+            batches = lambda: full_batch
+        for epoch in range(self.epochs):
+            self.model.train()
+            epoch_loss, seen = 0.0, 0
+            for X_batch, y_batch in batches():
+                optimizer.zero_grad()
+                outputs = self.model(self._to_input(X_batch))
+                loss = criterion(outputs, y_batch)
+                loss.backward()
+                optimizer.step()
+                epoch_loss += loss.item() * len(y_batch)
+                seen += len(y_batch)
+            if (epoch+1) % 5 == 0 or epoch == 0:
+                print(f"Epoch [{epoch+1}/{self.epochs}], Loss: {epoch_loss / max(seen, 1):.4f}")
+        self.trained = True
+
+    def fit_arrays(self, X: Union[np.ndarray, TensorCache], y: Optional[np.ndarray] = None, **kwargs):
+        """
+        Train on a feature matrix, or on rows of a shared TensorCache.
+
+        Args:
+            X: Feature matrix, or a TensorCache holding features and label codes
+            y: Zero-based label codes (taken from the cache when X is a TensorCache)
+            **kwargs: ``rows`` selects the training rows of a TensorCache
+        """
+        cache = X if isinstance(X, TensorCache) else TensorCache(X, y)
+        if cache.labels is None:
+            raise ValueError("Training requires label codes")
+        rows = kwargs.get('rows')
+        labels = cache.labels.numpy()
+        self.feature_names = [f"feature_{i}" for i in range(cache.n_features)]
+        self.class_names = list(set(labels if rows is None else labels[rows]))
+        self._fit(cache, rows)
+
+    def _logits(self, X: torch.Tensor) -> torch.Tensor:
+        """Float32 logits of network input in the current inference mode."""
+        self.model.eval()
+        with torch.no_grad(), inference_context(self.inference_mode):
+            return self.model(X).float()
+
+    def predict_arrays(self, X: Union[np.ndarray, TensorCache], **kwargs) -> np.ndarray:
+        """
+        Make predictions for a feature matrix, or for rows of a TensorCache.
+
+        Args:
+            X: Feature matrix in the layout of ``preprocess_features``, or a TensorCache
+            **kwargs: Additional arguments including return_probabilities and
+                      ``rows`` (rows of a TensorCache)
+
+        Returns:
+            Label codes or class probabilities
+        """
+        if not self.trained:
+            raise ValueError("Model must be trained before making predictions")
+        if isinstance(X, TensorCache):
+            X = X.take(kwargs.get('rows'), self.device)[0]
+        else:
+            X = torch.from_numpy(np.ascontiguousarray(X, dtype=np.float32)).to(self.device)
+        outputs = self._logits(self._to_input(X))
+        if kwargs.get('return_probabilities', False):
+            return torch.softmax(outputs, dim=1).cpu().numpy()
+        return outputs.argmax(dim=1).cpu().numpy()
+
+    def optimize_for_inference(self, mode: str = 'int8', reference: Optional[np.ndarray] = None,
+                               min_agreement: float = 0.99) -> Optional[Dict[str, float]]:
+        """
+        Switch to an optimised CPU inference mode ('int8', 'bfloat16' or 'float32').
+
+        Args:
+            mode: Inference mode (see ``INFERENCE_MODES``)
+            reference: Feature matrix for the accuracy-parity check against float32
+            min_agreement: Minimum fraction of matching predictions on ``reference``
+
+        Returns:
+            Parity report, or None without reference
+        """
+        return optimize_for_inference(self, mode, reference=reference, min_agreement=min_agreement)
+
+    def predict(self, features: List[Dict], **kwargs) -> np.ndarray:
+        """
+        Make predictions.
+
+        Args:
+            features: List of feature dictionaries
+
+        Returns:
+            Array of label codes
+        """
+        if not self.trained:
+            raise ValueError("Model must be trained before making predictions")
+        X, _ = preprocess_features(features)
+        return self._logits(self._to_input(torch.from_numpy(X).to(self.device))).argmax(dim=1).cpu().numpy()
+
+    def evaluate(self, features: List[Dict], **kwargs) -> Dict[str, float]:
+        """
+        Evaluate the model on the held-out split of ``train``, or on the given features.
+
+        Args:
+            features: List of feature dictionaries
+            **kwargs: Additional arguments including detailed_report
+
+        Returns:
+            Dictionary containing evaluation metrics
+        """
+        if not self.trained:
+            raise ValueError("Model must be trained before evaluation")
+        if hasattr(self, 'X_test') and hasattr(self, 'y_test'):
+            X_test, y_test = self.X_test, self.y_test
+        else:
+            X_test, y_test = preprocess_features(features)
+            X_test = self._to_input(torch.from_numpy(X_test).to(self.device))
+        y_pred = self._logits(X_test).argmax(dim=1).cpu().numpy()
+        confusion = StreamingConfusionMatrix.from_predictions(np.array(y_test), y_pred)
+        metrics = {
+            'accuracy': confusion.accuracy(),
+            'confusion_matrix': confusion.matrix.tolist()
+        }
+        detailed_report = kwargs.get('detailed_report', False)
+        if detailed_report:
+            metrics['classification_report'] = confusion.classification_report()
+        return metrics
+
+    def save_model(self, filepath: str):
+        """
+        Save the float32 network, configuration and feature/class names.
+
+        Args:
+            filepath: Path to save the model
+        """
+        if not self.trained:
+            raise ValueError("Model must be trained before saving")
+        torch.save({
+            'model_state_dict': (self.model if self.float_model is None else self.float_model).state_dict(),
+            'config': self.config,
+            'feature_names': self.feature_names,
+            'class_names': self.class_names,
+            'trained': self.trained
+        }, filepath)
+        print(f"{self.display_name} model saved to {filepath}")
+
+    def load_model(self, filepath: str):
+        """
+        Load a saved model (in float32 inference mode).
+
+        Args:
+            filepath: Path to the saved model
+        """
+        checkpoint = torch.load(filepath, map_location=self.device, weights_only=False)
+        self.model = self._build_network().to(self.device)
+        self.model.load_state_dict(checkpoint['model_state_dict'])
+        self.inference_mode = 'float32'
+        self.float_model = None
+        self.config = checkpoint.get('config', self.config)
+        self.feature_names = checkpoint.get('feature_names', [])
+        self.class_names = checkpoint.get('class_names', [])
+        self.trained = checkpoint.get('trained', True)
+        print(f"{self.display_name} model loaded from {filepath}")
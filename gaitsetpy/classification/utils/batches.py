@@ -0,0 +1,139 @@
+'''
+Feature mini-batches for out-of-core training.
+
+``iter_batches`` yields (X, labels) batches from a feature source without ever
+materialising the full feature matrix:
+
+- ``(X, y)`` arrays, including ``np.memmap`` / ``np.load(mmap_mode='r')`` views
+- a ``CorpusStore`` (its ``features`` and ``labels``)
+- any iterable of ``(X, y)`` batches, e.g. a generator reading shards from disk
+
+Array and corpus sources are read in equal blocks of at most ``batch_size``
+rows. With ``shuffle=True`` every batch is a random subsample of the whole
+source (row indices sorted within the batch so reads stay mostly sequential);
+without it batches follow storage order, which for a corpus means recording by
+recording.
+
+Labels are raw values; ``encode_batch`` maps them to the zero-based codes of a
+sorted ``classes`` array, matching ``encode_labels`` on the full dataset.
+
+Maintainer: @aharshit123456
+'''
+
+from typing import Any, Iterable, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+
+def _is_array_source(source: Any) -> bool:
+    return isinstance(source, tuple) and len(source) == 2 and all(hasattr(a, 'shape') for a in source)
+
+
+def _arrays(source: Any) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """(X, y) arrays of an array or corpus source, None for batch iterables."""
+    if hasattr(source, 'features') and hasattr(source, 'labels'):
+        if source.features is None or source.labels is None:
+            raise ValueError("Corpus has no features or labels")
+        return source.features, source.labels
+    if _is_array_source(source):
+        X, y = source
+        if len(X) != len(y):
+            raise ValueError(f"X and y must have the same length, got {len(X)} and {len(y)}")
+        return X, y
+    return None
+
+
+def is_reiterable(source: Any) -> bool:
+    """
+    Whether a source can be iterated more than once (arrays, corpora, lists).
+
+    Args:
+        source: Feature source
+
+    Returns:
+        False for one-shot iterators such as generators
+    """
+    return _arrays(source) is not None or iter(source) is not source
+
+
+def source_classes(source: Any) -> np.ndarray:
+    """
+    Sorted distinct labels of an array or corpus source (reads only the labels).
+
+    Args:
+        source: (X, y) arrays or a CorpusStore
+
+    Returns:
+        Sorted array of labels
+
+    Raises:
+        ValueError: For batch iterables, whose classes must be given explicitly
+    """
+    arrays = _arrays(source)
+    if arrays is None:
+        raise ValueError("classes must be given for batch iterables")
+    return np.unique(np.asarray(arrays[1]))
+
+
+def encode_batch(labels: Any, classes: np.ndarray) -> np.ndarray:
+    """
+    Encode a batch's labels as codes into a sorted ``classes`` array.
+
+    Args:
+        labels: Label values
+        classes: Sorted distinct labels of the whole dataset
+
+    Returns:
+        int64 code array
+
+    Raises:
+        ValueError: If a label is not in ``classes``
+    """
+    labels = np.asarray(labels)
+    codes = np.searchsorted(classes, labels)
+    codes = np.minimum(codes, len(classes) - 1)
+    unknown = classes[codes] != labels
+    if unknown.any():
+        raise ValueError(f"Labels not in classes: {np.unique(labels[unknown]).tolist()}")
+    return codes
+
+
+def iter_batches(source: Union[Tuple[np.ndarray, np.ndarray], Any, Iterable[Tuple[np.ndarray, np.ndarray]]],
+                 batch_size: int = 4096, shuffle: bool = False,
+                 random_state: Optional[Union[int, np.random.Generator]] = None
+                 ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Iterate over (X, labels) feature batches of a source.
+
+    Args:
+        source: (X, y) arrays, a CorpusStore, or an iterable of (X, y) batches
+        batch_size: Rows per batch for array and corpus sources
+        shuffle: Draw each batch as a random subsample of the rows (array and
+                 corpus sources; batch iterables are passed through as they come)
+        random_state: Seed or generator for shuffling
+
+    Yields:
+        (X, y) tuples with X as a float32 (rows, features) array
+
+    Raises:
+        ValueError: If batch_size is not positive
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    arrays = _arrays(source)
+    if arrays is None:
+        for X, y in source:
+            yield np.asarray(X, dtype=np.float32), np.asarray(y)
+        return
+
+    X, y = arrays
+    n = len(X)
+    # Equal-sized batches of at most batch_size rows, so no batch is a small remainder
+    bounds = np.linspace(0, n, -(-n // batch_size) + 1).astype(np.int64)
+    order = np.random.default_rng(random_state).permutation(n) if shuffle else None
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        if order is None:
+            yield np.asarray(X[start:stop], dtype=np.float32), np.asarray(y[start:stop])
+        else:
+            rows = np.sort(order[start:stop])
+            yield np.asarray(X[rows], dtype=np.float32), np.asarray(y[rows])
@@ -0,0 +1,371 @@
+'''
+Early-exit cascade for cheap-first inference on sliding windows.
+
+In streaming fall or freeze detection most windows are clear non-events, yet
+the full ``GaitFeatureExtractor`` feature set (spectral features via Welch,
+auto-regression fits) and the full model run on every one of them. The
+cascade puts a screening stage in front:
+
+1. four cheap features (rms, range, energy, zero-crossing rate), computed for
+   all windows of a sensor at once, and a small model score every window;
+2. windows scoring below a threshold are rejected as non-events, and only the
+   rest go through full feature extraction and the full model.
+
+The screening threshold is calibrated on out-of-fold screening scores of the
+training windows to keep a target recall of the event class, so at most
+``1 - target_recall`` of the events the full model would see are dropped.
+``evaluate`` runs both the full pipeline and the cascade on the same windows
+and reports the speedup and the change in event recall.
+
+Rows follow the layout of ``preprocess_features``: all windows of the first
+sensor, then all windows of the next, and so on. List-valued features
+(``step_time``, ``ar_coefficients``) are padded to their widths in the training
+windows, so the columns of any screened subset line up with the full model's.
+
+Example:
+    cascade = CascadeClassifier(RandomForestModel(), fs=64, event_class=2, target_recall=0.99)
+    cascade.fit(train_windows)
+    report = cascade.evaluate(test_windows)
+    print(report['speedup'], report['recall_change'])
+
+Maintainer: @aharshit123456
+'''
+
+import copy
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sklearn.model_selection import StratifiedKFold
+
+from ...core.base_classes import BaseClassificationModel
+from ...core.precision import as_float_array, encode_labels
+from ...features.gait_features import GaitFeatureExtractor
+from ...features.utils import (
+    calculate_energy,
+    calculate_range,
+    calculate_root_mean_square,
+    calculate_zero_crossing_rate,
+)
+from .metrics import StreamingConfusionMatrix
+from .preprocess import feature_widths, preprocess_features
+
+CHEAP_FEATURES = ('rms', 'range', 'energy', 'zero_crossing_rate')
+
+
+def cheap_features(windows: Sequence) -> np.ndarray:
+    """
+    Screening features of every window: rms, range, energy and zero-crossing rate.
+
+    Equal-length windows (the output of the sliding window functions) are
+    stacked and computed in one pass; other windows one at a time.
+
+    Args:
+        windows: Windows of one sensor (arrays or pandas Series)
+
+    Returns:
+        (windows, 4) feature matrix in the order of ``CHEAP_FEATURES``
+    """
+    arrays = [as_float_array(window) for window in windows]
+    if not arrays:
+        return np.empty((0, len(CHEAP_FEATURES)))
+    if len({len(a) for a in arrays}) > 1:
+        return np.array([[calculate_root_mean_square(a), calculate_range(a), calculate_energy(a),
+                          calculate_zero_crossing_rate(a)] for a in arrays], dtype=np.float64)
+    signals = np.stack(arrays)
+    if signals.shape[1] < 2:
+        raise ValueError("Windows need at least two samples")
+    squares = np.square(signals)
+    return np.column_stack([
+        np.sqrt(squares.mean(axis=1)),
+        np.ptp(signals, axis=1),
+        squares.sum(axis=1),
+        0.5 * np.abs(np.diff(np.sign(signals), axis=1)).sum(axis=1) / (signals.shape[1] - 1),
+    ])
+
+
+def recall_threshold(scores: Sequence[float], target_recall: float) -> float:
+    """
+    Highest score threshold that keeps at least ``target_recall`` of the events.
+
+    Args:
+        scores: Screening scores of event windows
+        target_recall: Fraction of events with ``score >= threshold`` (0 < target_recall <= 1)
+
+    Returns:
+        Threshold
+    """
+    if not 0 < target_recall <= 1:
+        raise ValueError("target_recall must be in (0, 1]")
+    scores = np.sort(np.asarray(scores, dtype=np.float64))
+    if not len(scores):
+        raise ValueError("Calibrating a threshold needs at least one event")
+    # Events below the threshold may be dropped; round off float noise in (1 - recall) * n
+    droppable = int(np.floor(round((1 - target_recall) * len(scores), 9)))
+    return float(scores[droppable])
+
+
+class CascadeClassifier:
+    """
+    Two-stage classifier: a cheap screening model rejects clear non-events and
+    the full model only sees the windows that pass.
+
+    The full model is any model supporting ``fit_arrays`` / ``predict_arrays``
+    (all models except the GNN). ``fit`` extracts the full features of the
+    training windows to fix the column width of every feature, and trains the
+    full model on them unless it is already trained.
+    """
+
+    def __init__(self, model: BaseClassificationModel, fs: int, event_class: Any = 1,
+                 target_recall: float = 0.99, screen: Optional[BaseClassificationModel] = None,
+                 calibration_folds: int = 4, random_state: int = 42, **extractor_kwargs):
+        """
+        Initialize the cascade.
+
+        Args:
+            model: Full model
+            fs: Sampling frequency of the windows
+            event_class: Annotation label of the event class (e.g. freeze or fall)
+            target_recall: Fraction of events the screening stage must pass
+            screen: Screening model (default: a random forest of 20 trees of depth 6)
+            calibration_folds: Folds of the out-of-fold scores the threshold is calibrated on
+            random_state: Random state of the calibration folds
+            **extractor_kwargs: Arguments of ``GaitFeatureExtractor.extract_features``
+                                (time_domain, frequency_domain, statistical, ar_order)
+        """
+        if not 0 < target_recall <= 1:
+            raise ValueError("target_recall must be in (0, 1]")
+        if calibration_folds < 2:
+            raise ValueError("calibration_folds must be at least 2")
+        if screen is None:
+            from ..models.random_forest import RandomForestModel
+            screen = RandomForestModel(n_estimators=20, max_depth=6, random_state=random_state, max_workers=1)
+        self.model = model
+        self.screen = screen
+        self.extractor = GaitFeatureExtractor(verbose=False)
+        self.config = {
+            'fs': fs,
+            'event_class': event_class,
+            'target_recall': target_recall,
+            'calibration_folds': calibration_folds,
+            'random_state': random_state,
+            'extractor_kwargs': extractor_kwargs
+        }
+        self.label_map = {}
+        self.negative_code = None
+        self.threshold = None
+        self.n_features = None
+        self.feature_widths = None
+        self.calibration = {}
+        self.timings = {}
+
+    @staticmethod
+    def _split(windows: List[Dict]) -> Tuple[List[Dict], Optional[Dict]]:
+        """Sensor window dictionaries and the annotation window dictionary."""
+        sensors = [w for w in windows if w['name'] != 'annotations']
+        annotations = [w for w in windows if w['name'] == 'annotations']
+        if not sensors:
+            raise ValueError("No sensor windows found")
+        if len({len(s['data']) for s in sensors}) > 1:
+            raise ValueError("All sensors must have the same number of windows")
+        return sensors, annotations[0] if annotations else None
+
+    def _labels(self, windows: List[Dict]) -> np.ndarray:
+        """Label of every row, in the original annotation values."""
+        sensors, annotations = self._split(windows)
+        if annotations is None:
+            raise ValueError("Windows need an 'annotations' entry for training and evaluation")
+        labels = self.extractor.extract_features([annotations], self.config['fs'])[0]['annotations']
+        return np.tile(np.asarray(labels), len(sensors))
+
+    def _codes(self, labels: np.ndarray) -> np.ndarray:
+        unknown = set(np.unique(labels).tolist()) - set(self.label_map)
+        if unknown:
+            raise ValueError(f"Labels not seen in training: {sorted(unknown)}")
+        return np.array([self.label_map[label] for label in labels.tolist()], dtype=np.int64)
+
+    def _cheap_matrix(self, sensors: List[Dict]) -> np.ndarray:
+        return np.vstack([cheap_features(sensor['data']) for sensor in sensors])
+
+    def _extract(self, sensors: List[Dict], keep: Optional[np.ndarray] = None) -> List[Dict]:
+        """Full feature dictionaries of the kept rows (all rows if keep is None)."""
+        n_windows = len(sensors[0]['data'])
+        subset = []
+        for i, sensor in enumerate(sensors):
+            rows = np.arange(n_windows) if keep is None else np.flatnonzero(keep[i * n_windows:(i + 1) * n_windows])
+            if len(rows):
+                subset.append({'name': sensor['name'], 'data': [sensor['data'][r] for r in rows]})
+        if not subset:
+            return []
+        features = self.extractor.extract_features(subset, self.config['fs'], **self.config['extractor_kwargs'])
+        for sensor, window_dict in zip(features, subset):
+            sensor['annotations'] = [0] * len(window_dict['data'])
+        return features
+
+    def _full_matrix(self, sensors: List[Dict], keep: Optional[np.ndarray] = None) -> np.ndarray:
+        """Full feature matrix of the kept rows, in the training column layout."""
+        features = self._extract(sensors, keep)
+        if not features:
+            return np.empty((0, self.n_features), dtype=np.float32)
+        X, _ = preprocess_features(features, widths=self.feature_widths)
+        expected = len(sensors[0]['data']) * len(sensors) if keep is None else int(keep.sum())
+        if len(X) != expected:
+            raise ValueError(f"Feature extraction returned {len(X)} rows, expected {expected}")
+        if X.shape[1] != self.n_features:
+            raise ValueError(f"Feature extraction returned {X.shape[1]} columns, expected {self.n_features}")
+        return X
+
+    def fit(self, windows: List[Dict], **kwargs):
+        """
+        Train the screening stage, calibrate its threshold and, if needed, the full model.
+
+        Args:
+            windows: Sensor window dictionaries and an 'annotations' window dictionary
+            **kwargs: Additional arguments passed to the full model's ``fit_arrays``
+
+        Returns:
+            The fitted cascade
+        """
+        sensors, _ = self._split(windows)
+        labels = self._labels(windows)
+        y, self.label_map = encode_labels(labels)
+        y = y.astype(np.int64)
+        if self.config['event_class'] not in self.label_map:
+            raise ValueError(f"No windows of the event class {self.config['event_class']!r}")
+        event = self.label_map[self.config['event_class']]
+        negatives = np.bincount(y[y != event], minlength=len(self.label_map))
+        self.negative_code = int(negatives.argmax()) if negatives.any() else event
+
+        start = time.perf_counter()
+        # The column width of every feature is fixed by the training windows
+        features = self._extract(sensors)
+        self.feature_widths = feature_widths(features)
+        X_full, _ = preprocess_features(features, widths=self.feature_widths)
+        self.n_features = X_full.shape[1]
+        if not self.model.trained:
+            self.model.fit_arrays(X_full, y, **kwargs)
+        elif len(getattr(self.model, 'feature_names', [])) not in (0, self.n_features):
+            raise ValueError(f"The full model expects {len(self.model.feature_names)} features, "
+                             f"the training windows give {self.n_features}")
+        full_seconds = time.perf_counter() - start
+
+        X_cheap = self._cheap_matrix(sensors)
+        target = (y == event).astype(np.int64)
+        n_folds = min(self.config['calibration_folds'], int(target.sum()))
+        if n_folds < 2:
+            raise ValueError("Calibrating the screen needs at least two event windows")
+        start = time.perf_counter()
+        # Threshold from scores of windows the screen was not fitted on, then the screen is refitted on all
+        scores = np.zeros(len(target))
+        splitter = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=self.config['random_state'])
+        for fit_rows, held_out in splitter.split(X_cheap, target):
+            screen = copy.deepcopy(self.screen)
+            screen.fit_arrays(X_cheap[fit_rows], target[fit_rows])
+            scores[held_out] = self._scores(X_cheap[held_out], screen)
+        self.threshold = recall_threshold(scores[target == 1], self.config['target_recall'])
+        self.screen.fit_arrays(X_cheap, target)
+        passed = scores >= self.threshold
+        self.calibration = {
+            'screen_recall': float(passed[target == 1].mean()),
+            'pass_rate': float(passed.mean()),
+            'events': int(target.sum())
+        }
+        self.timings = {'full_fit_seconds': full_seconds, 'screen_fit_seconds': time.perf_counter() - start}
+        return self
+
+    def _scores(self, X_cheap: np.ndarray, screen: Optional[BaseClassificationModel] = None) -> np.ndarray:
+        """Screening probability of the event class."""
+        screen = self.screen if screen is None else screen
+        return np.asarray(screen.predict_arrays(X_cheap, return_probabilities=True))[:, 1]
+
+    def predict(self, windows: List[Dict], **kwargs) -> np.ndarray:
+        """
+        Predict label codes, running the full stage only on windows that pass the screen.
+
+        Args:
+            windows: Sensor window dictionaries (an 'annotations' entry is ignored)
+            **kwargs: Additional arguments including return_passed (also return
+                      the mask of rows that reached the full model)
+
+        Returns:
+            Label codes of the full model's encoding, rejected rows as the most
+            common non-event class (and the pass mask if return_passed)
+        """
+        if self.threshold is None:
+            raise ValueError("Cascade must be fitted before making predictions")
+        sensors, _ = self._split(windows)
+
+        start = time.perf_counter()
+        passed = self._scores(self._cheap_matrix(sensors)) >= self.threshold
+        screen_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        predictions = np.full(len(passed), self.negative_code, dtype=np.int64)
+        X_full = self._full_matrix(sensors, passed)
+        features_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        if len(X_full):
+            predictions[passed] = self.model.predict_arrays(X_full)
+        self.timings.update({
+            'screen_seconds': screen_seconds,
+            'features_seconds': features_seconds,
+            'model_seconds': time.perf_counter() - start,
+            'pass_rate': float(passed.mean()) if len(passed) else 0.0
+        })
+        if kwargs.get('return_passed', False):
+            return predictions, passed
+        return predictions
+
+    def predict_full(self, windows: List[Dict]) -> np.ndarray:
+        """
+        Predict label codes with the full stage on every window (no screening).
+
+        Args:
+            windows: Sensor window dictionaries
+
+        Returns:
+            Label codes
+        """
+        if self.threshold is None:
+            raise ValueError("Cascade must be fitted before making predictions")
+        sensors, _ = self._split(windows)
+        return np.asarray(self.model.predict_arrays(self._full_matrix(sensors)), dtype=np.int64)
+
+    def evaluate(self, windows: List[Dict]) -> Dict[str, Any]:
+        """
+        Compare the cascade with the full pipeline on the same windows.
+
+        Args:
+            windows: Sensor window dictionaries and an 'annotations' window dictionary
+
+        Returns:
+            Dictionary with 'full' and 'cascade' results (seconds, accuracy,
+            event recall, confusion matrix), the cascade 'pass_rate', 'speedup',
+            'recall_change' and the calibrated 'threshold'
+        """
+        y = self._codes(self._labels(windows))
+        event = self.label_map[self.config['event_class']]
+        n_classes = len(self.label_map)
+
+        start = time.perf_counter()
+        full = self.predict_full(windows)
+        full_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        cascade, passed = self.predict(windows, return_passed=True)
+        cascade_seconds = time.perf_counter() - start
+
+        results = {}
+        for stage, predictions, seconds in (('full', full, full_seconds), ('cascade', cascade, cascade_seconds)):
+            confusion = StreamingConfusionMatrix.from_predictions(y, predictions, n_classes=n_classes)
+            results[stage] = {
+                'seconds': seconds,
+                'accuracy': confusion.accuracy(),
+                'recall': float(confusion.recall()[event]),
+                'confusion_matrix': confusion.matrix.tolist()
+            }
+        results['cascade']['pass_rate'] = float(passed.mean())
+        results['speedup'] = full_seconds / cascade_seconds if cascade_seconds > 0 else float('inf')
+        results['recall_change'] = results['cascade']['recall'] - results['full']['recall']
+        results['threshold'] = self.threshold
+        return results
@@ -0,0 +1,227 @@
+'''
+Subject-grouped cross-validation and hyperparameter search.
+
+Windows of one subject overlap and share the subject's gait, so random
+window-level splits leak subject information into the test set. The folds here
+keep every subject entirely on one side: leave-one-subject-out by default, or
+``n_splits`` subject-grouped folds.
+
+Every (configuration, fold) pair is an independent task run on a joblib
+``loky`` process pool. The feature matrix is computed once by the caller and
+shared read-only: joblib memory-maps large arrays for the workers instead of
+copying them into each task, and arrays that are already memory-mapped (e.g.
+``CorpusStore.features``) are passed by file reference. With ``cache_dir``,
+fold results are cached on disk keyed by model, parameters, fold rows and a
+hash of the data, so repeated or extended searches only run new folds.
+
+Labels are encoded once for the whole dataset, so every fold uses the same
+label codes even when a training fold lacks a class.
+
+Example:
+    X, y = preprocess_features(features)
+    result = grid_search('random_forest', {'n_estimators': [50, 200], 'max_workers': [1]},
+                         X, y, groups=subject_ids, max_workers=4, cache_dir='cv_cache')
+    print(result['best_params'], result['best_score'])
+
+Maintainer: @aharshit123456
+'''
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from joblib import Memory, Parallel, delayed, hash as joblib_hash
+from sklearn.model_selection import GroupKFold, LeaveOneGroupOut, ParameterGrid
+
+from ...core.precision import encode_labels
+from .metrics import StreamingConfusionMatrix
+
+SCORINGS = ('accuracy', 'f1_macro')
+
+
+def subject_folds(groups: Sequence, n_splits: Optional[int] = None) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Train/test row indices with each subject on one side of every split.
+
+    Args:
+        groups: Subject (or recording) ID of every row
+        n_splits: Number of subject-grouped folds (default: None,
+                  leave-one-subject-out)
+
+    Returns:
+        List of (train_rows, test_rows) index arrays
+
+    Raises:
+        ValueError: If there are fewer than two subjects or more folds than subjects
+    """
+    groups = np.asarray(groups)
+    n_groups = len(np.unique(groups))
+    if n_groups < 2:
+        raise ValueError("Cross-validation needs at least two subjects")
+    if n_splits is None:
+        splitter = LeaveOneGroupOut()
+    elif not 2 <= n_splits <= n_groups:
+        raise ValueError(f"n_splits must be between 2 and the number of subjects ({n_groups})")
+    else:
+        splitter = GroupKFold(n_splits=n_splits)
+    dummy = np.empty((len(groups), 0))
+    return list(splitter.split(dummy, groups=groups))
+
+
+def _model_factory(model: Union[str, Callable]) -> Callable:
+    """Model class/factory for a model name or callable."""
+    if isinstance(model, str):
+        from ..models import get_classification_model
+
+        def factory(**params):
+            return get_classification_model(model, **params)
+        factory.__qualname__ = f"get_classification_model[{model}]"
+        return factory
+    if not callable(model):
+        raise ValueError("model must be a model name or a callable returning a model")
+    return model
+
+
+def _run_fold(model: Union[str, Callable], params: Dict[str, Any], X: np.ndarray, y: np.ndarray,
+              train: np.ndarray, test: np.ndarray, data_key: Optional[str] = None) -> Dict[str, Any]:
+    """Fit one configuration on one fold and score it (``data_key`` keys the cache)."""
+    estimator = _model_factory(model)(**params)
+    start = time.perf_counter()
+    estimator.fit_arrays(X[train], y[train])
+    fit_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    y_pred = estimator.predict_arrays(X[test])
+    predict_seconds = time.perf_counter() - start
+    # Sized for every class of the dataset, so the macro F1 covers classes missing from the fold
+    confusion = StreamingConfusionMatrix.from_predictions(y[test], y_pred, n_classes=int(y.max()) + 1)
+    return {
+        'accuracy': confusion.accuracy(),
+        'f1_macro': float(confusion.f1().mean()),
+        'confusion_matrix': confusion.matrix.tolist(),
+        'fit_seconds': fit_seconds,
+        'predict_seconds': predict_seconds,
+        'n_train': int(len(train)),
+        'n_test': int(len(test)),
+    }
+
+
+def _dataset(X, y, groups) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Resolve a CorpusStore or arrays into (X, y, groups)."""
+    if hasattr(X, 'features') and hasattr(X, 'groups'):
+        store = X
+        if store.features is None or store.labels is None:
+            raise ValueError("Corpus has no features or labels")
+        X, y = store.features, store.labels if y is None else y
+        groups = store.groups() if groups is None else groups
+    if y is None or groups is None:
+        raise ValueError("y and groups are required unless X is a CorpusStore")
+    X = np.asarray(X) if not isinstance(X, np.memmap) else X
+    if not (len(X) == len(y) == len(groups)):
+        raise ValueError(f"X, y and groups must have the same length, got {len(X)}, {len(y)}, {len(groups)}")
+    return X, np.asarray(y), np.asarray(groups)
+
+
+def grid_search(model: Union[str, Callable], param_grid: Union[Dict[str, Sequence], List[Dict[str, Sequence]]],
+                X, y: Optional[Sequence] = None, groups: Optional[Sequence] = None,
+                n_splits: Optional[int] = None, scoring: str = 'accuracy',
+                max_workers: Optional[int] = None, cache_dir: Optional[str] = None,
+                verbose: int = 0) -> Dict[str, Any]:
+    """
+    Evaluate every parameter combination with subject-grouped cross-validation.
+
+    Args:
+        model: Model name (see ``get_classification_model``) or a model class or
+               factory taking the parameters as keyword arguments; the model
+               must implement ``fit_arrays`` and ``predict_arrays``
+        param_grid: Dict (or list of dicts) of parameter name -> values to try
+        X: Feature matrix, or a CorpusStore with features and labels
+        y: Labels of the rows (any values; encoded once for all folds)
+        groups: Subject ID of the rows (default for a CorpusStore: its subjects)
+        n_splits: Number of subject-grouped folds (default: None, leave-one-subject-out)
+        scoring: Metric used to rank configurations, 'accuracy' or 'f1_macro'
+        max_workers: Number of worker processes (default: None, all CPU cores)
+        cache_dir: Directory for per-fold result caching (default: None, no cache)
+        verbose: joblib verbosity
+
+    Returns:
+        Dictionary with 'results' (one entry per configuration with 'params',
+        mean/std metrics, the pooled out-of-fold 'confusion_matrix' and
+        per-fold results, in grid order), 'best_params',
+        'best_score', 'scoring', 'n_folds' and 'label_map'
+
+    Raises:
+        ValueError: On invalid scoring, max_workers or inconsistent inputs
+    """
+    if scoring not in SCORINGS:
+        raise ValueError(f"Unsupported scoring: {scoring}. Supported: {list(SCORINGS)}")
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    X, y, groups = _dataset(X, y, groups)
+    y, label_map = encode_labels(y)
+    configs = list(ParameterGrid(param_grid))
+    folds = subject_folds(groups, n_splits)
+
+    run = _run_fold
+    data_key = None
+    if cache_dir is not None:
+        # Hash the data once instead of in every task
+        data_key = joblib_hash((X, y))
+        run = Memory(cache_dir, verbose=0).cache(_run_fold, ignore=['X', 'y'])
+
+    tasks = [(c, f) for c in range(len(configs)) for f in range(len(folds))]
+    outputs = Parallel(n_jobs=-1 if max_workers is None else max_workers, backend='loky', verbose=verbose)(
+        delayed(run)(model, configs[c], X, y, folds[f][0], folds[f][1], data_key) for c, f in tasks
+    )
+
+    results = [{'params': params, 'folds': []} for params in configs]
+    for (c, f), output in zip(tasks, outputs):
+        output['fold'] = f
+        output['test_groups'] = np.unique(groups[folds[f][1]]).tolist()
+        results[c]['folds'].append(output)
+    for result in results:
+        for metric in SCORINGS + ('fit_seconds',):
+            values = [fold[metric] for fold in result['folds']]
+            result[f'mean_{metric}'] = float(np.mean(values))
+            result[f'std_{metric}'] = float(np.std(values))
+        # Folds are disjoint, so their matrices add up to the pooled out-of-fold matrix
+        result['confusion_matrix'] = sum(StreamingConfusionMatrix(matrix=fold['confusion_matrix'])
+                                         for fold in result['folds']).matrix.tolist()
+
+    best = max(results, key=lambda r: r[f'mean_{scoring}'])
+    return {
+        'results': results,
+        'best_params': best['params'],
+        'best_score': best[f'mean_{scoring}'],
+        'scoring': scoring,
+        'n_folds': len(folds),
+        'label_map': label_map,
+    }
+
+
+def cross_validate(model: Union[str, Callable], X, y: Optional[Sequence] = None,
+                   groups: Optional[Sequence] = None, params: Optional[Dict[str, Any]] = None,
+                   n_splits: Optional[int] = None, max_workers: Optional[int] = None,
+                   cache_dir: Optional[str] = None, verbose: int = 0) -> Dict[str, Any]:
+    """
+    Subject-grouped cross-validation of one model configuration.
+
+    Args:
+        model: Model name or model class/factory (see ``grid_search``)
+        X: Feature matrix, or a CorpusStore with features and labels
+        y: Labels of the rows
+        groups: Subject ID of the rows
+        params: Model parameters
+        n_splits: Number of subject-grouped folds (default: None, leave-one-subject-out)
+        max_workers: Number of worker processes (default: None, all CPU cores)
+        cache_dir: Directory for per-fold result caching
+        verbose: joblib verbosity
+
+    Returns:
+        Dictionary with 'params', mean/std metrics, the pooled out-of-fold
+        'confusion_matrix' and per-fold results ('folds')
+    """
+    search = grid_search(model, [{k: [v] for k, v in (params or {}).items()}], X, y, groups,
+                         n_splits=n_splits, max_workers=max_workers, cache_dir=cache_dir, verbose=verbose)
+    result = search['results'][0]
+    result['label_map'] = search['label_map']
+    return result
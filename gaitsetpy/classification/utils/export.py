@@ -0,0 +1,290 @@
+'''
+Compact, inference-only model export.
+
+``export_model`` writes a trained classification model to a directory holding
+an inference artifact and a ``schema.json`` with the feature schema, the label
+map and the input layout:
+
+- Random Forest / MLP (scikit-learn): ``model.joblib`` holding only the fitted
+  estimator, with training-only state (optimiser moments, loss curves, OOB
+  scores) dropped. Uncompressed artifacts are loaded with ``mmap_mode='r'`` so
+  array data is paged in from the OS page cache instead of being read and
+  unpickled; ``compress`` trades load time for a smaller file.
+- LSTM / BiLSTM / CNN (PyTorch): ``model.pt``, a traced TorchScript module that
+  loads without the Python model classes or a training checkpoint. The
+  model's inference mode (``optimize_for_inference``) is kept: int8 models are
+  traced quantised, and bfloat16 models run under CPU autocast after loading.
+
+``load_exported`` returns an ``InferenceModel`` that predicts from feature
+dictionaries or arrays in the layout of ``preprocess_features``.
+
+Note: scikit-learn copies decision tree nodes into its own buffers when a
+forest is unpickled, so a memory-mapped forest loads faster but each process
+still holds its own copy of the trees. To share one forest between workers,
+load it once in the parent process and fork.
+
+Maintainer: @aharshit123456
+'''
+
+import copy
+import json
+import os
+import warnings
+from typing import Any, Dict, List, Optional, Union
+
+import joblib
+import numpy as np
+
+from .preprocess import preprocess_features
+from ..._version import __version__
+
+try:
+    import torch
+    PYTORCH_AVAILABLE = True
+except ImportError:
+    PYTORCH_AVAILABLE = False
+
+
+SCHEMA_FILE = 'schema.json'
+FORMAT_VERSION = 1
+
+# Model name -> (backend, input layout); layouts match the models' own reshaping
+EXPORT_FORMATS = {
+    'random_forest': ('sklearn', 'flat'),
+    'mlp': ('sklearn', 'flat'),
+    'lstm': ('torchscript', 'sequence'),
+    'bilstm': ('torchscript', 'sequence'),
+    'cnn': ('torchscript', 'channels'),
+}
+
+ARTIFACTS = {'sklearn': 'model.joblib', 'torchscript': 'model.pt'}
+
+# Fitted attributes that are only needed to continue training
+_TRAINING_ONLY_ATTRIBUTES = (
+    '_optimizer', 'loss_curve_', 'validation_scores_', 'best_validation_score_',
+    '_best_coefs', '_best_intercepts', 'oob_score_', 'oob_decision_function_',
+)
+
+
+def _to_layout(X: np.ndarray, layout: str) -> np.ndarray:
+    """Reshape a (samples, features) matrix into a model input layout."""
+    if layout == 'sequence':
+        return X.reshape((X.shape[0], 1, X.shape[1]))
+    if layout == 'channels':
+        return X.reshape((X.shape[0], X.shape[1], 1))
+    return X
+
+
+def _inference_estimator(estimator):
+    """Shallow copy of a fitted estimator without training-only attributes."""
+    estimator = copy.copy(estimator)
+    for name in _TRAINING_ONLY_ATTRIBUTES:
+        if name in estimator.__dict__:
+            delattr(estimator, name)
+    return estimator
+
+
+def _class_labels(label_map: Optional[Dict[Any, int]]) -> Optional[List[Any]]:
+    """Original labels in code order."""
+    if not label_map:
+        return None
+    labels = sorted(label_map, key=label_map.get)
+    return [label.item() if isinstance(label, np.generic) else label for label in labels]
+
+
+def export_model(model, directory: str, compress: Union[int, bool] = 0,
+                 label_map: Optional[Dict[Any, int]] = None) -> Dict[str, Any]:
+    """
+    Export a trained classification model for inference.
+
+    Args:
+        model: Trained model ('random_forest', 'mlp', 'lstm', 'bilstm' or 'cnn')
+        directory: Output directory (created if missing)
+        compress: joblib compression level 0-9 for scikit-learn models
+                  (default: 0, uncompressed and memory-mappable)
+        label_map: Original label -> code map, as returned by
+                   ``preprocess_features(..., return_label_map=True)``
+                   (default: the model's own label map, if it keeps one)
+
+    Returns:
+        The schema written to ``schema.json``
+
+    Raises:
+        ValueError: If the model is untrained or has no export format
+        ImportError: If a PyTorch model is exported without PyTorch
+    """
+    if not model.trained:
+        raise ValueError("Model must be trained before exporting")
+    if model.name not in EXPORT_FORMATS:
+        raise ValueError(f"No export format for model '{model.name}'. Supported: {list(EXPORT_FORMATS)}")
+    backend, layout = EXPORT_FORMATS[model.name]
+    n_features = len(model.feature_names)
+    if not n_features:
+        raise ValueError("Model has no feature schema; train it before exporting")
+
+    os.makedirs(directory, exist_ok=True)
+    artifact = os.path.join(directory, ARTIFACTS[backend])
+    if backend == 'sklearn':
+        joblib.dump(_inference_estimator(model.model), artifact, compress=compress)
+    else:
+        if not PYTORCH_AVAILABLE:
+            raise ImportError("PyTorch is required to export this model. Please install PyTorch.")
+        module = copy.deepcopy(model.model).to('cpu').eval()
+        example = torch.zeros(_to_layout(np.zeros((1, n_features)), layout).shape)
+        with torch.no_grad(), warnings.catch_warnings():
+            warnings.simplefilter('ignore', FutureWarning)
+            traced = torch.jit.trace(module, example)
+            torch.jit.save(torch.jit.freeze(traced), artifact)
+
+    schema = {
+        'format_version': FORMAT_VERSION,
+        'gaitsetpy_version': __version__,
+        'model': model.name,
+        'backend': backend,
+        'artifact': ARTIFACTS[backend],
+        'compress': int(compress) if backend == 'sklearn' else 0,
+        'input_layout': layout,
+        'input_dtype': 'float32',
+        'inference_mode': getattr(model, 'inference_mode', 'float32'),
+        'n_features': n_features,
+        'feature_names': list(model.feature_names),
+        'class_codes': sorted(int(c) for c in model.class_names),
+        'class_labels': _class_labels(label_map or getattr(model, 'label_map', None)),
+        'config': model.config,
+    }
+    with open(os.path.join(directory, SCHEMA_FILE), 'w') as f:
+        json.dump(schema, f, indent=2, default=str)
+    return schema
+
+
+class InferenceModel:
+    """
+    Prediction-only model loaded from an exported directory.
+
+    Predictions are label codes, as returned by the models' own ``predict``;
+    ``decode`` maps them back to the original labels when the schema has them.
+    """
+
+    def __init__(self, schema: Dict[str, Any], model):
+        self.schema = schema
+        self.model = model
+        self.name = schema['model']
+        self.n_features = schema['n_features']
+        self.class_labels = schema.get('class_labels')
+
+    def _check(self, X: np.ndarray) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(f"Expected input of shape (n_samples, {self.n_features}), got {X.shape}")
+        return X
+
+    def predict_proba_array(self, X: np.ndarray) -> np.ndarray:
+        """
+        Class probabilities for a (samples, features) matrix.
+
+        Args:
+            X: Feature matrix in the layout of ``preprocess_features``
+
+        Returns:
+            Array of shape (samples, classes)
+        """
+        X = self._check(X)
+        if self.schema['backend'] == 'sklearn':
+            return self.model.predict_proba(X)
+        from ..models.torch_utils import inference_context
+
+        with torch.no_grad(), inference_context(self.schema.get('inference_mode', 'float32')):
+            logits = self.model(torch.from_numpy(_to_layout(X, self.schema['input_layout']))).float()
+        return torch.softmax(logits, dim=1).numpy()
+
+    def predict_array(self, X: np.ndarray) -> np.ndarray:
+        """
+        Label codes for a (samples, features) matrix.
+
+        Args:
+            X: Feature matrix in the layout of ``preprocess_features``
+
+        Returns:
+            Array of label codes
+        """
+        X = self._check(X)
+        if self.schema['backend'] == 'sklearn':
+            return self.model.predict(X)
+        return self.predict_proba_array(X).argmax(axis=1)
+
+    def predict(self, features: List[Dict], return_probabilities: bool = False) -> np.ndarray:
+        """
+        Predict from feature dictionaries.
+
+        Args:
+            features: List of feature dictionaries
+            return_probabilities: Whether to return class probabilities
+
+        Returns:
+            Label codes or class probabilities
+        """
+        X, _ = preprocess_features(features)
+        if return_probabilities:
+            return self.predict_proba_array(X)
+        return self.predict_array(X)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Map label codes back to the original labels.
+
+        Args:
+            codes: Label codes
+
+        Returns:
+            Array of original labels
+
+        Raises:
+            ValueError: If the export has no label map
+        """
+        if self.class_labels is None:
+            raise ValueError("Exported model has no label map")
+        return np.asarray(self.class_labels)[np.asarray(codes)]
+
+    def get_info(self) -> Dict[str, Any]:
+        """
+        Get information about the exported model.
+
+        Returns:
+            The export schema
+        """
+        return dict(self.schema)
+
+
+def load_exported(directory: str, mmap_mode: Optional[str] = 'r') -> InferenceModel:
+    """
+    Load an exported model for inference.
+
+    Args:
+        directory: Directory written by ``export_model``
+        mmap_mode: joblib memory-map mode for uncompressed scikit-learn
+                   artifacts (default: 'r'; None reads the file into memory)
+
+    Returns:
+        InferenceModel
+
+    Raises:
+        ValueError: If the export format version is not supported
+        ImportError: If a TorchScript artifact is loaded without PyTorch
+    """
+    with open(os.path.join(directory, SCHEMA_FILE)) as f:
+        schema = json.load(f)
+    if schema.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"Unsupported export format version: {schema.get('format_version')}")
+
+    artifact = os.path.join(directory, schema['artifact'])
+    if schema['backend'] == 'sklearn':
+        # Compressed artifacts cannot be memory-mapped
+        model = joblib.load(artifact, mmap_mode=None if schema['compress'] else mmap_mode)
+    else:
+        if not PYTORCH_AVAILABLE:
+            raise ImportError("PyTorch is required to load this model. Please install PyTorch.")
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', FutureWarning)
+            model = torch.jit.load(artifact, map_location='cpu')
+        model.eval()
+    return InferenceModel(schema, model)
@@ -0,0 +1,305 @@
+'''
+Graph construction and neighbour sampling for the GNN classifier.
+
+Graphs are scipy CSR matrices over the rows of the feature matrix produced by
+``preprocess_features`` (one node per sensor window), so they cost O(edges)
+memory instead of the O(N^2) of a dense adjacency matrix.
+
+- ``knn_graph``: k-nearest-neighbour feature graph (tree-based neighbour search)
+- ``topology_graph``: sensor-topology graph linking the windows of sensors at
+  neighbouring body locations, plus consecutive windows of the same sensor
+- ``NeighborSampler``: GraphSAGE-style mini-batches of target nodes with their
+  sampled multi-hop neighbourhoods, one bipartite adjacency block per layer
+
+Maintainer: @aharshit123456
+'''
+
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.neighbors import NearestNeighbors
+
+
+GRAPH_TYPES = ('knn', 'topology')
+
+# Canonical body locations and the name fragments that identify them
+BODY_LOCATIONS = {
+    'neck': ('neck', 'helmet', 'head'),
+    'wrist': ('wrist', 'wrst'),
+    'trunk': ('trunk', 'belt', 'waist', 'hip', 'chest'),
+    'thigh': ('thigh', 'pocket', 'pckt'),
+    'shank': ('shank', 'ankle', 'shin'),
+}
+
+# Edges of the body skeleton between canonical locations
+BODY_TOPOLOGY = [('neck', 'trunk'), ('wrist', 'trunk'), ('trunk', 'thigh'), ('thigh', 'shank')]
+
+
+def body_location(sensor_name: str) -> Optional[str]:
+    """
+    Canonical body location of a sensor or channel name.
+
+    Args:
+        sensor_name: Sensor name such as 'shank' or 'BELT_ACC_X'
+
+    Returns:
+        Location name from ``BODY_LOCATIONS``, or None if unknown
+    """
+    name = sensor_name.lower()
+    for location, fragments in BODY_LOCATIONS.items():
+        if any(fragment in name for fragment in fragments):
+            return location
+    return None
+
+
+def normalize_adjacency(adj: sp.spmatrix, self_loops: bool = True) -> sp.csr_matrix:
+    """
+    Symmetrically normalise an adjacency matrix, D^-1/2 (A + I) D^-1/2.
+
+    Args:
+        adj: Sparse (N, N) adjacency matrix
+        self_loops: Whether to add self loops before normalising
+
+    Returns:
+        Normalised CSR matrix (float32)
+    """
+    adj = sp.csr_matrix(adj, dtype=np.float32)
+    if self_loops:
+        adj = adj + sp.identity(adj.shape[0], dtype=np.float32, format='csr')
+    degree = np.asarray(adj.sum(axis=1)).ravel()
+    inv_sqrt = np.zeros_like(degree)
+    np.divide(1.0, np.sqrt(degree), out=inv_sqrt, where=degree > 0)
+    scale = sp.diags(inv_sqrt)
+    return (scale @ adj @ scale).tocsr()
+
+
+def knn_graph(X: np.ndarray, k: int = 10, metric: str = 'euclidean', symmetric: bool = True,
+              normalize: bool = True, algorithm: str = 'auto', n_jobs: Optional[int] = None) -> sp.csr_matrix:
+    """
+    k-nearest-neighbour graph over the rows of a feature matrix.
+
+    The neighbour search uses scikit-learn's NearestNeighbors: a KD-tree,
+    O(N log N), for up to 8 features, and chunked brute force (BLAS distance
+    blocks) above that, where trees degrade to scanning every point anyway.
+    The N x N distance matrix is never formed.
+
+    Args:
+        X: Node features (N, F)
+        k: Neighbours per node (excluding the node itself)
+        metric: Distance metric for NearestNeighbors
+        symmetric: Whether to add the reverse of every edge
+        normalize: Whether to add self loops and normalise symmetrically
+        algorithm: NearestNeighbors algorithm ('auto' picks as described above)
+        n_jobs: Parallel jobs for the neighbour search
+
+    Returns:
+        (N, N) CSR adjacency matrix
+
+    Raises:
+        ValueError: If k is not positive
+    """
+    if k < 1:
+        raise ValueError(f"k must be at least 1. Got: {k}")
+    X = np.asarray(X)
+    n = len(X)
+    k = min(k, n - 1)
+    if k < 1:
+        adj = sp.csr_matrix((n, n), dtype=np.float32)
+    else:
+        if algorithm == 'auto':
+            algorithm = 'kd_tree' if X.shape[1] <= 8 and metric in ('euclidean', 'manhattan', 'chebyshev') else 'brute'
+        search = NearestNeighbors(n_neighbors=k + 1, metric=metric, algorithm=algorithm, n_jobs=n_jobs).fit(X)
+        neighbours = search.kneighbors(X, return_distance=False)
+        rows = np.repeat(np.arange(n), k + 1)
+        cols = neighbours.ravel()
+        keep = rows != cols
+        rows, cols = rows[keep], cols[keep]
+        adj = sp.csr_matrix((np.ones(len(rows), dtype=np.float32), (rows, cols)), shape=(n, n))
+        if symmetric:
+            adj = adj.maximum(adj.T).tocsr()
+    return normalize_adjacency(adj) if normalize else adj
+
+
+def topology_graph(node_sensors: Sequence[str], node_windows: Sequence[int],
+                   topology: Optional[Sequence[Tuple[str, str]]] = None,
+                   temporal: bool = True, normalize: bool = True) -> sp.csr_matrix:
+    """
+    Sensor-topology graph over sensor windows.
+
+    Node i is window ``node_windows[i]`` of sensor ``node_sensors[i]``. Nodes of
+    the same window are connected when their sensors are at the same body
+    location or at locations joined by a ``topology`` edge; with ``temporal``,
+    consecutive windows of the same sensor are connected as well.
+
+    Args:
+        node_sensors: Sensor name of every node
+        node_windows: Window index of every node
+        topology: Edges between body locations (default: ``BODY_TOPOLOGY``).
+                  Names without a known location only get temporal edges.
+        temporal: Whether to link consecutive windows of each sensor
+        normalize: Whether to add self loops and normalise symmetrically
+
+    Returns:
+        (N, N) CSR adjacency matrix
+    """
+    node_sensors = np.asarray(node_sensors)
+    node_windows = np.asarray(node_windows)
+    n = len(node_sensors)
+    sensor_names, sensor_ids = np.unique(node_sensors, return_inverse=True)
+    locations = [body_location(str(name)) for name in sensor_names]
+
+    location_names = sorted({loc for loc in locations if loc is not None})
+    location_index = {loc: i for i, loc in enumerate(location_names)}
+    linked = np.eye(len(location_names), dtype=bool)
+    for a, b in (BODY_TOPOLOGY if topology is None else topology):
+        if a in location_index and b in location_index:
+            linked[location_index[a], location_index[b]] = linked[location_index[b], location_index[a]] = True
+    # Location of every node, -1 for unknown
+    sensor_location = np.array([location_index.get(loc, -1) for loc in locations], dtype=np.intp)
+    node_location = sensor_location[sensor_ids]
+
+    rows, cols = [], []
+    # Spatial edges: pair up nodes of the same window. Windows hold few sensors,
+    # so walking offsets within the window-sorted order is O(N * sensors).
+    order = np.lexsort((sensor_ids, node_windows))
+    sorted_windows = node_windows[order]
+    for offset in range(1, n):
+        same = sorted_windows[offset:] == sorted_windows[:-offset]
+        if not same.any():
+            break
+        a, b = order[:-offset][same], order[offset:][same]
+        la, lb = node_location[a], node_location[b]
+        known = (la >= 0) & (lb >= 0)
+        keep = known.copy()
+        keep[known] = linked[la[known], lb[known]]
+        rows.append(a[keep])
+        cols.append(b[keep])
+
+    if temporal:
+        order = np.lexsort((node_windows, sensor_ids))
+        s, w = sensor_ids[order], node_windows[order]
+        step = (s[1:] == s[:-1]) & (w[1:] - w[:-1] == 1)
+        rows.append(order[:-1][step])
+        cols.append(order[1:][step])
+
+    rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.intp)
+    cols = np.concatenate(cols) if cols else np.empty(0, dtype=np.intp)
+    adj = sp.csr_matrix((np.ones(len(rows), dtype=np.float32), (rows, cols)), shape=(n, n))
+    adj = adj.maximum(adj.T).tocsr()
+    return normalize_adjacency(adj) if normalize else adj
+
+
+def feature_node_layout(features: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sensor name and window index of every row of ``preprocess_features(features)``.
+
+    Args:
+        features: List of per-sensor feature dictionaries
+
+    Returns:
+        Tuple of (node_sensors, node_windows)
+    """
+    sensors, windows = [], []
+    for sensor_dict in features:
+        num_windows = len(sensor_dict["annotations"])
+        # preprocess_features drops sensors without a feature of matching length
+        if not any(len(values) == num_windows for values in sensor_dict["features"].values()):
+            continue
+        sensors.extend([sensor_dict["name"]] * num_windows)
+        windows.extend(range(num_windows))
+    return np.array(sensors), np.array(windows, dtype=np.intp)
+
+
+class NeighborSampler:
+    """
+    Mini-batches of target nodes with sampled multi-hop neighbourhoods.
+
+    For a model with L graph layers, every batch yields the node ids whose
+    features are needed (targets first) and L bipartite adjacency blocks, from
+    the input layer to the output layer. Block l maps the nodes of layer l + 1
+    (rows, a prefix of the node ids) to the nodes of layer l (columns). Sampled
+    edges are scaled by degree / sampled so that aggregations stay unbiased.
+    Memory per batch is bounded by batch_size * prod(num_neighbors).
+
+    Example:
+        sampler = NeighborSampler(adj, num_neighbors=[10, 10], batch_size=256)
+        for node_ids, blocks in sampler:
+            out = model(x[node_ids], blocks)  # predictions for node_ids[:len(batch)]
+    """
+
+    def __init__(self, adj: sp.spmatrix, num_neighbors: Sequence[Optional[int]], batch_size: int = 256,
+                 nodes: Optional[np.ndarray] = None, shuffle: bool = True,
+                 random_state: Optional[int] = None):
+        """
+        Initialize the sampler.
+
+        Args:
+            adj: (N, N) adjacency matrix (row i aggregates over its columns)
+            num_neighbors: Neighbours sampled per node for each layer, from the
+                           output layer inwards; None takes all neighbours
+            batch_size: Target nodes per batch
+            nodes: Target nodes (default: all nodes)
+            shuffle: Whether to shuffle the targets every epoch
+            random_state: Seed for shuffling and sampling
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.adj = sp.csr_matrix(adj, dtype=np.float32)
+        self.num_neighbors = list(num_neighbors)
+        self.batch_size = batch_size
+        self.nodes = np.arange(self.adj.shape[0]) if nodes is None else np.asarray(nodes)
+        self.shuffle = shuffle
+        self.rng = np.random.default_rng(random_state)
+        # Global -> local id buffer, reset after every use
+        self._local = np.full(self.adj.shape[0], -1, dtype=np.intp)
+
+    def __len__(self) -> int:
+        return (len(self.nodes) + self.batch_size - 1) // self.batch_size
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, List[sp.csr_matrix]]]:
+        nodes = self.rng.permutation(self.nodes) if self.shuffle else self.nodes
+        for start in range(0, len(nodes), self.batch_size):
+            yield self.sample(nodes[start:start + self.batch_size])
+
+    def _sample_rows(self, rows: np.ndarray, size: Optional[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Sampled (row position, column, weight) triples for the given rows."""
+        indptr, indices, data = self.adj.indptr, self.adj.indices, self.adj.data
+        starts, degree = indptr[rows], indptr[rows + 1] - indptr[rows]
+        owner = np.repeat(np.arange(len(rows)), degree)
+        entry = np.arange(degree.sum()) - np.repeat(np.cumsum(degree) - degree, degree) + starts[owner]
+        weight = data[entry]
+        if size is not None and len(entry):
+            # Random rank of every entry within its row (owner + U[0, 1) sorts rows
+            # in order and shuffles within them); keep ranks below size
+            order = np.argsort(owner + self.rng.random(len(entry)))
+            rank = np.empty(len(entry), dtype=np.intp)
+            rank[order] = np.arange(len(entry)) - np.repeat(np.cumsum(degree) - degree, degree)
+            keep = rank < size
+            taken = np.minimum(degree, size)
+            scale = np.divide(degree, taken, out=np.ones(len(rows)), where=taken > 0)
+            owner, entry, weight = owner[keep], entry[keep], weight[keep] * scale[owner[keep]]
+        return owner, indices[entry], weight.astype(np.float32, copy=False)
+
+    def sample(self, targets: np.ndarray) -> Tuple[np.ndarray, List[sp.csr_matrix]]:
+        """
+        Sample the neighbourhood of a batch of target nodes.
+
+        Args:
+            targets: Target node ids
+
+        Returns:
+            Tuple of (node ids, blocks ordered from the input layer to the output layer)
+        """
+        node_ids = np.asarray(targets)
+        self._local[node_ids] = np.arange(len(node_ids))
+        blocks = []
+        for size in self.num_neighbors:
+            n_rows = len(node_ids)
+            owner, cols, weight = self._sample_rows(node_ids, size)
+            new = np.unique(cols[self._local[cols] < 0])
+            self._local[new] = np.arange(len(node_ids), len(node_ids) + len(new))
+            node_ids = np.concatenate([node_ids, new])
+            blocks.append(sp.csr_matrix((weight, (owner, self._local[cols])), shape=(n_rows, len(node_ids))))
+        self._local[node_ids] = -1
+        return node_ids, blocks[::-1]
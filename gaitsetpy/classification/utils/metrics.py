@@ -0,0 +1,427 @@
+'''
+Streaming evaluation metrics built on confusion matrices.
+
+``StreamingConfusionMatrix`` accumulates a confusion matrix of zero-based label
+codes incrementally: every ``update`` encodes the (true, predicted) pairs as
+``true * n_classes + predicted`` and counts them with one ``np.bincount``, so
+predictions can be evaluated chunk by chunk without being kept. Partial
+matrices (per fold, per worker, per recording) are merged by addition, and
+accuracy, precision, recall/sensitivity, specificity and F1 are derived from the
+matrix alone. ``confusion_by_group`` computes one matrix per subject (or fold)
+with a single ``bincount`` over (group, true, predicted) triples.
+
+``StreamingEventLatency`` evaluates event detection (falls, freezing of gait)
+on time-ordered predictions: an event is a run of consecutive windows whose
+true label is the event class. It records the delay from the start of each
+event to its first detected window, missed events, and false alarms (runs of
+event predictions that do not overlap any event). Events spanning chunk
+boundaries are tracked across updates.
+
+Example:
+    confusion = StreamingConfusionMatrix(n_classes=3)
+    for X_chunk, y_chunk in stream:
+        confusion.update(y_chunk, model.predict_arrays(X_chunk))
+    print(confusion.accuracy(), confusion.f1())
+
+Maintainer: @aharshit123456
+'''
+
+import copy
+from typing import Any, Dict, Hashable, Optional, Sequence
+
+import numpy as np
+
+
+def _codes(values: Any, name: str) -> np.ndarray:
+    """Label codes as a flat int64 array."""
+    values = np.asarray(values).ravel()
+    if values.dtype.kind == 'f' and np.array_equal(values, np.round(values)):
+        values = values.astype(np.int64)
+    if values.dtype.kind not in 'iub':
+        raise ValueError(f"{name} must be zero-based integer label codes, got dtype {values.dtype}")
+    values = values.astype(np.int64, copy=False)
+    if values.size and values.min() < 0:
+        raise ValueError(f"{name} contains negative label codes")
+    return values
+
+
+def _divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Element-wise ratio that is 0 where the denominator is 0 (sklearn's zero_division=0)."""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator != 0)
+
+
+class StreamingConfusionMatrix:
+    """
+    Confusion matrix accumulated over batches of label codes.
+
+    ``matrix[i, j]`` counts windows of true class ``i`` predicted as class ``j``.
+    The matrix grows when a larger code is seen, so ``n_classes`` is optional.
+
+    Args:
+        n_classes: Initial number of classes
+        matrix: Existing (n_classes, n_classes) count matrix to start from
+    """
+
+    def __init__(self, n_classes: int = 0, matrix: Optional[np.ndarray] = None):
+        if matrix is not None:
+            matrix = np.asarray(matrix, dtype=np.int64)
+            if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+                raise ValueError(f"matrix must be square, got shape {matrix.shape}")
+            n_classes = max(n_classes, len(matrix))
+        self.matrix = np.zeros((n_classes, n_classes), dtype=np.int64)
+        if matrix is not None:
+            self.matrix[:len(matrix), :len(matrix)] = matrix
+
+    @classmethod
+    def from_predictions(cls, y_true: Sequence, y_pred: Sequence, n_classes: int = 0) -> 'StreamingConfusionMatrix':
+        """
+        Confusion matrix of one batch of predictions.
+
+        Args:
+            y_true: True label codes
+            y_pred: Predicted label codes
+            n_classes: Minimum number of classes
+
+        Returns:
+            StreamingConfusionMatrix
+        """
+        return cls(n_classes).update(y_true, y_pred)
+
+    @property
+    def n_classes(self) -> int:
+        return len(self.matrix)
+
+    @property
+    def total(self) -> int:
+        return int(self.matrix.sum())
+
+    def _grow(self, n_classes: int):
+        if n_classes > self.n_classes:
+            pad = n_classes - self.n_classes
+            self.matrix = np.pad(self.matrix, ((0, pad), (0, pad)))
+
+    def update(self, y_true: Sequence, y_pred: Sequence) -> 'StreamingConfusionMatrix':
+        """
+        Add a batch of (true, predicted) label codes.
+
+        Args:
+            y_true: True label codes
+            y_pred: Predicted label codes
+
+        Returns:
+            self
+
+        Raises:
+            ValueError: If the arrays differ in length or are not label codes
+        """
+        y_true, y_pred = _codes(y_true, 'y_true'), _codes(y_pred, 'y_pred')
+        if len(y_true) != len(y_pred):
+            raise ValueError(f"y_true and y_pred must have the same length, got {len(y_true)} and {len(y_pred)}")
+        if not len(y_true):
+            return self
+        self._grow(int(max(y_true.max(), y_pred.max())) + 1)
+        n = self.n_classes
+        self.matrix += np.bincount(y_true * n + y_pred, minlength=n * n).reshape(n, n)
+        return self
+
+    def merge(self, *others: 'StreamingConfusionMatrix') -> 'StreamingConfusionMatrix':
+        """
+        Add the counts of other matrices (e.g. computed in parallel on other data).
+
+        Args:
+            *others: StreamingConfusionMatrix instances
+
+        Returns:
+            self
+        """
+        for other in others:
+            self._grow(other.n_classes)
+            n = other.n_classes
+            self.matrix[:n, :n] += other.matrix
+        return self
+
+    def __add__(self, other: 'StreamingConfusionMatrix') -> 'StreamingConfusionMatrix':
+        return copy.deepcopy(self).merge(other)
+
+    def __radd__(self, other: Any) -> 'StreamingConfusionMatrix':
+        # Allows sum(matrices)
+        if isinstance(other, int) and other == 0:
+            return copy.deepcopy(self)
+        return NotImplemented
+
+    def accuracy(self) -> float:
+        """Fraction of correctly classified windows (0.0 when empty)."""
+        return float(_divide(np.trace(self.matrix), self.total))
+
+    def support(self) -> np.ndarray:
+        """Number of true windows of every class."""
+        return self.matrix.sum(axis=1)
+
+    def precision(self) -> np.ndarray:
+        """Per-class precision, TP / (TP + FP)."""
+        return _divide(np.diag(self.matrix), self.matrix.sum(axis=0))
+
+    def recall(self) -> np.ndarray:
+        """Per-class recall (sensitivity), TP / (TP + FN)."""
+        return _divide(np.diag(self.matrix), self.support())
+
+    sensitivity = recall
+
+    def specificity(self) -> np.ndarray:
+        """Per-class specificity, TN / (TN + FP)."""
+        tp = np.diag(self.matrix)
+        fp = self.matrix.sum(axis=0) - tp
+        tn = self.total - self.support() - fp
+        return _divide(tn, tn + fp)
+
+    def f1(self) -> np.ndarray:
+        """Per-class F1 score."""
+        precision, recall = self.precision(), self.recall()
+        return _divide(2 * precision * recall, precision + recall)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        All derived metrics.
+
+        Returns:
+            Dictionary with 'accuracy', 'balanced_accuracy' (mean recall of the
+            classes with true windows), 'macro_f1',
+            per-class lists 'precision', 'recall', 'sensitivity',
+            'specificity', 'f1', 'support', and 'confusion_matrix'
+        """
+        recall = self.recall()
+        observed = self.support() > 0
+        return {
+            'accuracy': self.accuracy(),
+            'balanced_accuracy': float(recall[observed].mean()) if observed.any() else 0.0,
+            'macro_f1': float(self.f1().mean()) if self.n_classes else 0.0,
+            'precision': self.precision().tolist(),
+            'recall': recall.tolist(),
+            'sensitivity': recall.tolist(),
+            'specificity': self.specificity().tolist(),
+            'f1': self.f1().tolist(),
+            'support': self.support().tolist(),
+            'confusion_matrix': self.matrix.tolist(),
+        }
+
+    def classification_report(self) -> Dict[str, Any]:
+        """
+        Per-class report in the layout of sklearn's ``classification_report(output_dict=True)``.
+
+        Classes that appear neither as true nor as predicted labels are left out,
+        as in sklearn.
+
+        Returns:
+            Dictionary keyed by class code (as a string), 'accuracy', 'macro avg'
+            and 'weighted avg'
+        """
+        present = np.flatnonzero(self.matrix.sum(axis=0) + self.matrix.sum(axis=1))
+        precision, recall, f1 = self.precision()[present], self.recall()[present], self.f1()[present]
+        support = self.support()[present]
+        report = {
+            str(code): {'precision': float(p), 'recall': float(r), 'f1-score': float(f), 'support': float(s)}
+            for code, p, r, f, s in zip(present, precision, recall, f1, support)
+        }
+        report['accuracy'] = self.accuracy()
+        total = float(support.sum())
+        for name, weights in (('macro avg', np.ones(len(present))), ('weighted avg', support)):
+            norm = float(weights.sum())
+            report[name] = {
+                'precision': float(precision @ weights / norm) if norm else 0.0,
+                'recall': float(recall @ weights / norm) if norm else 0.0,
+                'f1-score': float(f1 @ weights / norm) if norm else 0.0,
+                'support': total,
+            }
+        return report
+
+
+def confusion_by_group(y_true: Sequence, y_pred: Sequence, groups: Sequence,
+                       n_classes: int = 0) -> Dict[Hashable, StreamingConfusionMatrix]:
+    """
+    One confusion matrix per group (subject, recording, fold) in a single pass.
+
+    Args:
+        y_true: True label codes
+        y_pred: Predicted label codes
+        groups: Group of every window
+        n_classes: Minimum number of classes (all matrices have the same size)
+
+    Returns:
+        Dictionary of group -> StreamingConfusionMatrix, in sorted group order
+    """
+    y_true, y_pred = _codes(y_true, 'y_true'), _codes(y_pred, 'y_pred')
+    names, group_codes = np.unique(np.asarray(groups), return_inverse=True)
+    if not (len(y_true) == len(y_pred) == len(group_codes)):
+        raise ValueError("y_true, y_pred and groups must have the same length")
+    n = max(n_classes, int(max(y_true.max(), y_pred.max())) + 1 if len(y_true) else 0)
+    counts = np.bincount((group_codes * n + y_true) * n + y_pred,
+                         minlength=len(names) * n * n).reshape(len(names), n, n)
+    return {name.item() if hasattr(name, 'item') else name: StreamingConfusionMatrix(matrix=matrix)
+            for name, matrix in zip(names, counts)}
+
+
+def _runs(mask: np.ndarray):
+    """Start and end (exclusive) indices of the runs of True in a boolean array."""
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+class StreamingEventLatency:
+    """
+    Event-level detection metrics over time-ordered predictions.
+
+    Args:
+        event_class: Label code of the event (e.g. fall or freeze)
+        sample_rate: Windows per second; latencies are reported in seconds when
+                     given, in windows otherwise
+
+    Example:
+        events = StreamingEventLatency(event_class=1, sample_rate=2.0)
+        for y_chunk, pred_chunk in stream:
+            events.update(y_chunk, pred_chunk)
+        events.result()['median_latency']
+    """
+
+    def __init__(self, event_class: int = 1, sample_rate: Optional[float] = None):
+        self.event_class = event_class
+        self.sample_rate = sample_rate
+        self.latencies = []
+        self.n_missed = 0
+        self.false_alarms = 0
+        self._seen = 0
+        # Event / alarm runs still open at the end of the last chunk
+        self._open_event = None   # [start, first detection or -1]
+        self._open_alarm = None   # overlaps an event so far
+
+    def update(self, y_true: Sequence, y_pred: Sequence) -> 'StreamingEventLatency':
+        """
+        Add the next chunk of the stream.
+
+        Args:
+            y_true: True label codes, in time order
+            y_pred: Predicted label codes
+
+        Returns:
+            self
+        """
+        y_true, y_pred = np.asarray(y_true).ravel(), np.asarray(y_pred).ravel()
+        if len(y_true) != len(y_pred):
+            raise ValueError(f"y_true and y_pred must have the same length, got {len(y_true)} and {len(y_pred)}")
+        n = len(y_true)
+        if not n:
+            return self
+        is_event, is_alarm = y_true == self.event_class, y_pred == self.event_class
+
+        # Events: first detected window of every run of true event windows
+        starts, ends = _runs(is_event)
+        hits = np.flatnonzero(is_event & is_alarm)
+        k = np.searchsorted(hits, starts)
+        first = np.full(len(starts), n)
+        found = k < len(hits)
+        first[found] = hits[k[found]]
+        detected = np.where(first < ends, first + self._seen, -1)
+        starts = starts + self._seen
+        if self._open_event is not None:
+            if len(starts) and starts[0] == self._seen:
+                starts[0] = self._open_event[0]
+                if self._open_event[1] >= 0:
+                    detected[0] = self._open_event[1]
+            else:
+                self._finish_event(*self._open_event)
+            self._open_event = None
+        if len(ends) and ends[-1] == n:
+            self._open_event = [int(starts[-1]), int(detected[-1])]
+            starts, detected = starts[:-1], detected[:-1]
+        self.latencies.extend((detected[detected >= 0] - starts[detected >= 0]).tolist())
+        self.n_missed += int((detected < 0).sum())
+
+        # Alarms: runs of event predictions that overlap no event window
+        alarm_starts, alarm_ends = _runs(is_alarm)
+        cumulative = np.concatenate(([0], np.cumsum(is_event)))
+        overlaps = cumulative[alarm_ends] > cumulative[alarm_starts]
+        if self._open_alarm is not None:
+            if len(alarm_starts) and alarm_starts[0] == 0:
+                overlaps[0] |= self._open_alarm
+            else:
+                self.false_alarms += int(not self._open_alarm)
+            self._open_alarm = None
+        if len(alarm_ends) and alarm_ends[-1] == n:
+            self._open_alarm = bool(overlaps[-1])
+            overlaps = overlaps[:-1]
+        self.false_alarms += int((~overlaps).sum())
+
+        self._seen += n
+        return self
+
+    def _finish_event(self, start: int, detection: int):
+        if detection >= 0:
+            self.latencies.append(detection - start)
+        else:
+            self.n_missed += 1
+
+    def close(self) -> 'StreamingEventLatency':
+        """
+        End the stream: events and alarms still open are counted as finished.
+
+        Returns:
+            self
+        """
+        if self._open_event is not None:
+            self._finish_event(*self._open_event)
+            self._open_event = None
+        if self._open_alarm is not None:
+            self.false_alarms += int(not self._open_alarm)
+            self._open_alarm = None
+        return self
+
+    def merge(self, *others: 'StreamingEventLatency') -> 'StreamingEventLatency':
+        """
+        Add the events of other streams (e.g. other recordings evaluated in parallel).
+
+        All streams are closed first.
+
+        Args:
+            *others: StreamingEventLatency instances for the same event class
+
+        Returns:
+            self
+        """
+        self.close()
+        for other in others:
+            other = copy.deepcopy(other).close()
+            self.latencies.extend(other.latencies)
+            self.n_missed += other.n_missed
+            self.false_alarms += other.false_alarms
+            self._seen += other._seen
+        return self
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Event detection metrics, counting open events and alarms as finished.
+
+        Returns:
+            Dictionary with 'n_events', 'n_detected', 'n_missed',
+            'detection_rate', 'false_alarms', 'false_alarms_per_hour' (only with
+            a sample rate) and 'mean_latency', 'median_latency', 'max_latency'
+            (None without detected events)
+        """
+        closed = copy.deepcopy(self).close()
+        latencies = np.asarray(closed.latencies, dtype=np.float64)
+        if self.sample_rate:
+            latencies = latencies / self.sample_rate
+        n_events = len(latencies) + closed.n_missed
+        result = {
+            'n_events': n_events,
+            'n_detected': len(latencies),
+            'n_missed': closed.n_missed,
+            'detection_rate': len(latencies) / n_events if n_events else 0.0,
+            'false_alarms': closed.false_alarms,
+            'mean_latency': float(latencies.mean()) if len(latencies) else None,
+            'median_latency': float(np.median(latencies)) if len(latencies) else None,
+            'max_latency': float(latencies.max()) if len(latencies) else None,
+        }
+        if self.sample_rate and closed._seen:
+            result['false_alarms_per_hour'] = closed.false_alarms / (closed._seen / self.sample_rate / 3600)
+        return result
@@ -8,12 +8,56 @@ import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, confusion_matrix
+from ...core.precision import encode_labels
 
 
-def preprocess_features(features):
+def _is_vector_feature(feature_array):
+    """Whether a feature holds one list/array per window (e.g. step_time, ar_coefficients)."""
+    return bool(len(feature_array)) and isinstance(feature_array[0], (list, np.ndarray))
+
+
+def feature_widths(features):
+    """
+    Column width of every feature in the matrix built by ``preprocess_features``.
+
+    List-valued features are as wide as their longest value in any window of any
+    sensor; scalar features are one column wide. Passing the widths of the
+    training features to ``preprocess_features`` keeps the columns of later
+    calls (e.g. a few windows at a time) aligned with the training matrix.
+
+    Args:
+        features: List of per-sensor feature dictionaries
+
+    Returns:
+        Dictionary of feature name -> number of columns
+    """
+    widths = {}
+    for sensor_dict in features:
+        for key, feature_array in sensor_dict["features"].items():
+            if _is_vector_feature(feature_array):
+                width = max(len(f) if isinstance(f, (list, np.ndarray)) else 1 for f in feature_array)
+            else:
+                width = 1
+            widths[key] = max(widths.get(key, 0), width)
+    return widths
+
+
+def preprocess_features(features, dtype=np.float32, return_label_map=False, widths=None):
     """
     Convert the features dictionary into X (feature matrix) and y (labels),
     ensuring all feature vectors have a consistent length.
+
+    Args:
+        features: List of per-sensor feature dictionaries
+        dtype: dtype of X (default float32, the precision the models train in)
+        return_label_map: Whether to also return the original label -> code map
+        widths: Column width of each list-valued feature (see ``feature_widths``).
+                Values are zero-padded or truncated to it; by default each feature
+                is padded to its longest value in this call
+
+    Returns:
+        Tuple of (X, y) or (X, y, label_map). y holds zero-based contiguous label
+        codes in the smallest integer dtype that fits them (int8 for <= 127 classes).
     """
     X = []
     y = []
@@ -29,22 +73,29 @@ def preprocess_features(features):
 
         for key in sensor_features:
             feature_array = sensor_features[key]  # Extract the feature list
-            feature_array = np.array(feature_array, dtype=object)  # Convert to NumPy object array
 
             # Ensure it's a list of equal-length vectors
-            if isinstance(feature_array[0], (list, np.ndarray)):
+            if _is_vector_feature(feature_array):
+                feature_array = np.array(feature_array, dtype=object)  # Convert to NumPy object array
                 print(f"Fixing inconsistent feature '{key}' in sensor '{sensor_name}'.")
 
-                # Find max length for this feature across all windows
-                max_length = max(len(f) if isinstance(f, (list, np.ndarray)) else 1 for f in feature_array)
+                # Find max length for this feature across all windows, unless fixed by the caller
+                if widths is not None and key in widths:
+                    max_length = widths[key]
+                else:
+                    max_length = max(len(f) if isinstance(f, (list, np.ndarray)) else 1 for f in feature_array)
                 feature_lengths.append(max_length)  # Store max feature length for later
 
                 # Pad/truncate each feature to be the same length
                 feature_array = np.array([
-                    np.pad(np.ravel(f), (0, max_length - len(f)), 'constant', constant_values=0)
-                    if isinstance(f, (list, np.ndarray)) else np.array([f] + [0] * (max_length - 1))
+                    np.pad(np.ravel(f)[:max_length], (0, max(max_length - len(np.ravel(f)), 0)),
+                           'constant', constant_values=0)
+                    if isinstance(f, (list, np.ndarray)) else np.array([f] + [0] * (max_length - 1))[:max_length]
                     for f in feature_array
-                ])
+                ]).reshape(len(feature_array), max_length)
+            else:
+                # Scalar features go straight to the output dtype
+                feature_array = np.asarray(feature_array, dtype=dtype)
 
             # Ensure consistency in number of windows
             if len(feature_array) != num_windows:
@@ -77,16 +128,12 @@ def preprocess_features(features):
     X = [np.pad(x, ((0, 0), (0, max_feature_dim - x.shape[1])), 'constant', constant_values=0) if x.shape[1] < max_feature_dim else x[:, :max_feature_dim] for x in X]
 
     # Stack all feature matrices
-    X = np.vstack(X).astype(np.float32)
+    X = np.vstack(X).astype(dtype, copy=False)
     y = np.concatenate(y)
 
-    # Remap labels to zero-based contiguous integers
-    unique_labels = np.unique(y)
-    label_map = {label: idx for idx, label in enumerate(unique_labels)}
-    y_remapped = np.array([label_map[label] for label in y])
-
-    # Also update annotations in feature_dicts
-    # This part of the code was not provided in the original file,
-    # so I'm not adding it as per instruction 1.
+    # Remap labels to zero-based contiguous integer codes
+    y_remapped, label_map = encode_labels(y)
 
+    if return_label_map:
+        return X, y_remapped, label_map
     return X, y_remapped
\ No newline at end of file
@@ -0,0 +1,209 @@
+'''
+Shared tensor cache and background batch prefetching for the PyTorch models.
+
+A ``TensorCache`` holds a feature matrix (and optionally its label codes) once
+as CPU tensors built with ``torch.from_numpy``: a float32, C-contiguous array
+(including an ``np.memmap`` or a ``CorpusStore`` feature block) is wrapped
+without a copy, so many training configurations can share one cache instead of
+each re-creating tensors with ``torch.tensor``. Models train from row indices
+into the cache (``fit_arrays(cache, rows=train_rows)``); contiguous batches are
+tensor views and shuffled batches are gathered with ``index_select``.
+
+``prefetch`` runs an iterator one or more items ahead in a background thread,
+so the next batch is gathered (and copied to the device) while the current one
+is being trained on. PyTorch releases the GIL inside ``index_select`` and
+device copies, so the two overlap when more than one CPU core is available;
+on a single core the extra thread only adds overhead and batches are gathered
+in the training thread.
+
+Options:
+
+- ``pin_memory``: copy the cache once into page-locked memory, so batches are
+  copied to a CUDA device asynchronously (ignored without CUDA)
+- ``share_memory``: copy the cache once into shared memory, so it can be
+  passed to ``torch.multiprocessing`` workers without further copies
+
+Cached arrays are treated as read-only.
+
+Maintainer: @aharshit123456
+'''
+
+import collections
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional, Tuple, TypeVar, Union
+
+import numpy as np
+import torch
+
+T = TypeVar('T')
+
+_END = object()
+
+
+def prefetch(iterable: Iterable[T], depth: int = 2) -> Iterator[T]:
+    """
+    Iterate over an iterable while producing up to ``depth`` items ahead in a background thread.
+
+    Items are produced by a single worker thread, so the source iterator is
+    never advanced concurrently.
+
+    Args:
+        iterable: Source of items
+        depth: Items produced ahead (0 iterates in the calling thread)
+
+    Yields:
+        The items of ``iterable`` in order
+    """
+    if depth < 1:
+        yield from iterable
+        return
+    iterator = iter(iterable)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = collections.deque(executor.submit(next, iterator, _END) for _ in range(depth))
+        while True:
+            item = pending.popleft().result()
+            if item is _END:
+                return
+            pending.append(executor.submit(next, iterator, _END))
+            yield item
+
+
+def _row_tensor(rows) -> torch.Tensor:
+    """Row indices (or a boolean mask) as an int64 tensor."""
+    if torch.is_tensor(rows):
+        return rows.to(torch.int64)
+    rows = np.asarray(rows)
+    if rows.dtype == bool:
+        rows = np.flatnonzero(rows)
+    return torch.from_numpy(rows.astype(np.int64, copy=False))
+
+
+class TensorCache:
+    """
+    Feature matrix and label codes held once as CPU tensors.
+
+    Args:
+        X: Feature matrix (samples, features); float32 C-contiguous arrays are
+           wrapped without a copy, other arrays are converted once
+        y: Zero-based label codes (default: None, features only)
+        pin_memory: Copy the cache into page-locked memory for asynchronous
+                    CUDA transfers (ignored without CUDA)
+        share_memory: Copy the cache into shared memory for multiprocessing workers
+
+    Raises:
+        ValueError: If X is not 2-D or y has a different length
+
+    Example:
+        cache = TensorCache(X, y)
+        for params in configurations:
+            model = LSTMModel(input_size=X.shape[1], **params)
+            model.fit_arrays(cache, rows=train_rows)
+            scores.append((model.predict_arrays(cache, rows=test_rows) == y[test_rows]).mean())
+    """
+
+    def __init__(self, X, y: Optional[np.ndarray] = None, pin_memory: bool = False,
+                 share_memory: bool = False):
+        if hasattr(X, 'features') and hasattr(X, 'labels'):
+            X, y = X.features, X.labels if y is None else y
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim != 2:
+            raise ValueError(f"X must be a 2-D feature matrix, got shape {X.shape}")
+        if y is not None and len(y) != len(X):
+            raise ValueError(f"X and y must have the same length, got {len(X)} and {len(y)}")
+
+        with warnings.catch_warnings():
+            # Read-only arrays (e.g. memory-mapped corpora) are wrapped as they are; the cache never writes
+            warnings.simplefilter('ignore', UserWarning)
+            self.features = torch.from_numpy(X)
+            self.labels = None if y is None else torch.from_numpy(np.asarray(y).astype(np.int64, copy=False))
+
+        self.pinned = bool(pin_memory and torch.cuda.is_available())
+        if share_memory:
+            self.features.share_memory_()
+            if self.labels is not None:
+                self.labels.share_memory_()
+        if self.pinned:
+            self.features = self.features.pin_memory()
+            if self.labels is not None:
+                self.labels = self.labels.pin_memory()
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    @property
+    def n_features(self) -> int:
+        return self.features.shape[1]
+
+    def take(self, rows=None, device: Optional[Union[str, torch.device]] = None
+             ) -> Tuple[torch.Tensor, Optional[torch.Tensor]]:
+        """
+        Features and labels of a set of rows.
+
+        Args:
+            rows: Row indices or boolean mask (default: None, all rows as views)
+            device: Device to copy the rows to (default: None, stay on the CPU)
+
+        Returns:
+            (X, y) tensors; y is None for a cache without labels
+        """
+        if rows is None:
+            X, y = self.features, self.labels
+        else:
+            index = _row_tensor(rows)
+            X = self.features.index_select(0, index)
+            y = None if self.labels is None else self.labels.index_select(0, index)
+        if device is not None:
+            X = X.to(device, non_blocking=self.pinned)
+            y = None if y is None else y.to(device, non_blocking=self.pinned)
+        return X, y
+
+    def batches(self, rows=None, batch_size: int = 32, shuffle: bool = False,
+                generator: Optional[torch.Generator] = None,
+                device: Optional[Union[str, torch.device]] = None,
+                prefetch_depth: Optional[int] = None) -> Iterator[Tuple[torch.Tensor, Optional[torch.Tensor]]]:
+        """
+        Iterate over (X, y) mini-batches, gathered ahead of use in a background thread.
+
+        Batches have equal sizes of at most ``batch_size`` rows, like ``iter_batches``.
+
+        Args:
+            rows: Row indices or boolean mask to draw from (default: None, all rows)
+            batch_size: Rows per batch
+            shuffle: Draw rows in random order (``torch.randperm``, so
+                     ``torch.manual_seed`` makes it reproducible)
+            generator: Random generator for shuffling
+            device: Device to copy batches to
+            prefetch_depth: Batches gathered ahead (0 disables the background
+                            thread; default: 2 with more than one CPU core, else 0)
+
+        Yields:
+            (X, y) tensor tuples
+
+        Raises:
+            ValueError: If batch_size is not positive
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if prefetch_depth is None:
+            prefetch_depth = 2 if (os.cpu_count() or 1) > 1 else 0
+        index = None if rows is None else _row_tensor(rows)
+        n = len(self) if index is None else len(index)
+        if shuffle:
+            order = torch.randperm(n, generator=generator)
+            index = order if index is None else index[order]
+        bounds = np.linspace(0, n, -(-n // batch_size) + 1).astype(np.int64) if n else np.zeros(1, np.int64)
+
+        def gather(bound):
+            start, stop = int(bound[0]), int(bound[1])
+            if index is None:
+                X, y = self.features[start:stop], None if self.labels is None else self.labels[start:stop]
+                if device is not None:
+                    X = X.to(device, non_blocking=self.pinned)
+                    y = None if y is None else y.to(device, non_blocking=self.pinned)
+                return X, y
+            # Sorted indices keep the gather close to sequential
+            return self.take(index[start:stop].sort().values if shuffle else index[start:stop], device)
+
+        return prefetch(map(gather, zip(bounds[:-1], bounds[1:])), prefetch_depth)
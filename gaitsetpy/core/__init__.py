@@ -5,6 +5,8 @@ This module provides:
 - Base classes for different components (DatasetLoader, FeatureExtractor, etc.)
 - Singleton managers for plugin-based architecture
 - Registry system for easy extension
+- Shared resumable download engine and thread-safe download telemetry
+- Global floating point precision policy and compact label codes
 
 Maintainer: @aharshit123456
 """
@@ -25,6 +27,23 @@ from .managers import (
     ClassificationManager
 )
 
+from .downloads import (
+    DownloadResult,
+    download_file,
+    load_manifest,
+    verify_file
+)
+
+from .telemetry import DownloadTelemetry
+
+from .precision import (
+    set_precision,
+    get_precision,
+    precision,
+    float_dtype,
+    encode_labels
+)
+
 __all__ = [
     'BaseDatasetLoader',
     'BaseFeatureExtractor',
@@ -35,5 +54,15 @@ __all__ = [
     'FeatureManager',
     'PreprocessingManager',
     'EDAManager',
-    'ClassificationManager'
+    'ClassificationManager',
+    'DownloadResult',
+    'download_file',
+    'load_manifest',
+    'verify_file',
+    'DownloadTelemetry',
+    'set_precision',
+    'get_precision',
+    'precision',
+    'float_dtype',
+    'encode_labels'
 ] 
\ No newline at end of file
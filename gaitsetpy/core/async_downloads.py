@@ -0,0 +1,230 @@
+"""
+Asyncio download backend for datasets made of many small files.
+
+Thread-per-request downloading is bounded by the number of worker threads; for
+datasets such as PhysioNet (hundreds of small text files) or the UrFall sequence
+files, a single event loop can keep many more requests in flight. This backend
+uses aiohttp (optional dependency, ``pip install gaitsetpy[async]``) and follows
+the same rules as ``gaitsetpy.core.downloads``: ``.part`` files resumed with HTTP
+Range requests, atomic rename, size/SHA-256 verification and retries with
+exponential backoff.
+
+Concurrency is bounded twice:
+- a semaphore limits the number of files in progress
+- the connector limits open connections in total and per host
+
+``download_files`` is a blocking wrapper that can be called from synchronous code
+and from inside a running event loop (e.g. a Jupyter notebook); async callers can
+await ``download_files_async`` directly.
+
+Maintainer: @aharshit123456
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Dict, List, Optional
+
+from .downloads import (
+    PART_SUFFIX,
+    DownloadResult,
+    _check_status,
+    _content_range_total,
+    _finalize,
+    _header_int,
+    _PermanentError,
+    _prepare_destination,
+    _RetryableError,
+)
+from .telemetry import DownloadTelemetry
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+
+def _require_aiohttp():
+    if not AIOHTTP_AVAILABLE:
+        raise ImportError("The async download backend requires aiohttp. "
+                          "Please install it with 'pip install gaitsetpy[async]'.")
+
+
+async def _fetch_async(session, url: str, part_path: str, resume: bool, chunk_size: int,
+                       progress: Optional[Callable[[int], None]]):
+    """Download (the rest of) ``url`` into ``part_path``; return (bytes written, resumed)."""
+    offset = os.path.getsize(part_path) if resume and os.path.exists(part_path) else 0
+    headers = {"Range": f"bytes={offset}-"} if offset else {}
+    async with session.get(url, headers=headers) as response:
+        status = response.status
+        if _check_status(status, offset, _content_range_total(response), part_path, url):
+            return 0, True
+        if status == 200:
+            # The server ignored the Range header and sent the whole file.
+            offset = 0
+
+        length = _header_int(response, "Content-Length")
+        expected_total = offset + length if length is not None else None
+        written = 0
+        # Chunks are small, so plain blocking writes cost less than handing
+        # every chunk to an executor.
+        with open(part_path, "ab" if offset else "wb") as f:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                f.write(chunk)
+                written += len(chunk)
+                if progress is not None:
+                    progress(len(chunk))
+        if expected_total is not None and offset + written < expected_total:
+            raise _RetryableError(f"Incomplete download ({offset + written}/{expected_total} bytes): {url}")
+        return written, offset > 0
+
+
+async def download_file_async(session, url: str, dest_path: str,
+                              expected_size: Optional[int] = None, sha256: Optional[str] = None,
+                              chunk_size: int = 1 << 16, retries: int = 3, backoff: float = 0.5,
+                              resume: bool = True,
+                              progress: Optional[Callable[[int], None]] = None) -> DownloadResult:
+    """
+    Download a file with resume, verification and retries on an aiohttp session.
+
+    Args:
+        session: aiohttp.ClientSession (its timeout settings apply)
+        url: URL to download from
+        dest_path: Destination file path
+        expected_size: Expected size in bytes (optional)
+        sha256: Expected SHA-256 hex digest (optional)
+        chunk_size: Size of chunks to stream (default: 64 KiB)
+        retries: Number of retries after the first attempt
+        backoff: Base delay in seconds; attempt ``k`` waits ``backoff * 2 ** (k - 1)``
+        resume: Whether to resume from an existing ``.part`` file
+        progress: Optional callback receiving the size of every written chunk
+
+    Returns:
+        DownloadResult
+    """
+    _require_aiohttp()
+    loop = asyncio.get_running_loop()
+    part_path = dest_path + PART_SUFFIX
+    try:
+        skipped = _prepare_destination(dest_path, part_path, expected_size, sha256, resume)
+        if skipped is not None:
+            return skipped
+    except OSError as e:
+        return DownloadResult(False, "failed", f"IO error for {dest_path}: {str(e)}")
+
+    total_written = 0
+    message = f"Download failed: {url}"
+    for attempt in range(retries + 1):
+        if attempt:
+            await asyncio.sleep(backoff * 2 ** (attempt - 1))
+        try:
+            written, resumed = await _fetch_async(session, url, part_path, resume, chunk_size, progress)
+            total_written += written
+            if sha256 is not None:
+                # Hashing a large file would stall every other download on the loop.
+                await loop.run_in_executor(None, _finalize, part_path, dest_path, expected_size, sha256)
+            else:
+                _finalize(part_path, dest_path, expected_size, sha256)
+            return DownloadResult(True, "resumed" if resumed else "downloaded",
+                                  f"Successfully downloaded: {dest_path}", total_written)
+        except _PermanentError as e:
+            return DownloadResult(False, "failed", str(e), total_written)
+        except _RetryableError as e:
+            message = str(e)
+        except asyncio.TimeoutError:
+            message = f"Timeout downloading: {url}"
+        except aiohttp.ClientError as e:
+            message = f"Request error for {url}: {str(e)}"
+        except OSError as e:
+            return DownloadResult(False, "failed", f"IO error for {dest_path}: {str(e)}", total_written)
+        except Exception as e:
+            return DownloadResult(False, "failed", f"Unexpected error for {url}: {str(e)}", total_written)
+    return DownloadResult(False, "failed", f"{message} (after {retries + 1} attempts)", total_written)
+
+
+async def download_files_async(download_tasks: List[Dict[str, Any]], max_concurrency: int = 64,
+                               limit_per_host: int = 16, timeout: float = 30, retries: int = 3,
+                               backoff: float = 0.5, chunk_size: int = 1 << 16,
+                               telemetry: Optional[DownloadTelemetry] = None) -> List[DownloadResult]:
+    """
+    Download many files concurrently on the running event loop.
+
+    Args:
+        download_tasks: List of dicts with 'url' and 'dest_path' keys, and optionally
+            'size' and 'sha256' keys used to verify the downloaded file
+        max_concurrency: Maximum number of files in progress (and open connections)
+        limit_per_host: Maximum number of open connections per host
+        timeout: Connect/read timeout in seconds
+        retries: Number of retries after the first attempt of every file
+        backoff: Base delay of the exponential backoff in seconds
+        chunk_size: Size of chunks to stream
+        telemetry: Optional DownloadTelemetry receiving bytes, counts and timings
+
+    Returns:
+        List of DownloadResult in the order of ``download_tasks``
+    """
+    _require_aiohttp()
+    if max_concurrency < 1 or limit_per_host < 1:
+        raise ValueError("max_concurrency and limit_per_host must be at least 1")
+    semaphore = asyncio.Semaphore(max_concurrency)
+    connector = aiohttp.TCPConnector(limit=max_concurrency, limit_per_host=limit_per_host)
+    client_timeout = aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+
+    async def run(session, task):
+        url, dest_path = task['url'], task['dest_path']
+        async with semaphore:
+            progress = None
+            if telemetry is not None:
+                telemetry.start_file(url, dest_path, task.get('size'))
+                progress = telemetry.progress_callback(dest_path)
+            result = await download_file_async(
+                session, url, dest_path,
+                expected_size=task.get('size'), sha256=task.get('sha256'),
+                chunk_size=chunk_size, retries=retries, backoff=backoff, progress=progress
+            )
+            if telemetry is not None:
+                telemetry.finish_file(dest_path, result.status, result.message)
+            return result
+
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+        return list(await asyncio.gather(*(run(session, task) for task in download_tasks)))
+
+
+def run_sync(coro: Coroutine) -> Any:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Without a running event loop the coroutine runs on a new loop in the calling
+    thread. Inside a running loop (e.g. Jupyter) it runs on a new loop in a worker
+    thread, and the calling thread blocks until it is done.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        Result of the coroutine
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def download_files(download_tasks: List[Dict[str, Any]], **kwargs) -> List[DownloadResult]:
+    """
+    Blocking wrapper around ``download_files_async``.
+
+    Args:
+        download_tasks: List of dicts with 'url' and 'dest_path' keys (see
+            ``download_files_async``)
+        **kwargs: Options passed to ``download_files_async``
+
+    Returns:
+        List of DownloadResult in the order of ``download_tasks``
+    """
+    _require_aiohttp()
+    return run_sync(download_files_async(download_tasks, **kwargs))
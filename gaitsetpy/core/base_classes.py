@@ -12,9 +12,12 @@ from typing import Any, Dict, List, Optional, Tuple, Union, Callable
 import pandas as pd
 import numpy as np
 import os
-import requests
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from tqdm import tqdm
+from .downloads import download_file, load_manifest
+from .telemetry import DownloadTelemetry
+
+
+DOWNLOAD_BACKENDS = ('thread', 'async')
 
 
 class BaseDatasetLoader(ABC):
@@ -39,7 +42,16 @@ class BaseDatasetLoader(ABC):
         self.data = None
         self.metadata = {}
         self.max_workers = max_workers
-        self._download_stats = {'success': 0, 'failed': 0, 'skipped': 0}
+        self.download_retries = 3
+        self.retry_backoff = 0.5
+        self.download_backend = 'thread'
+        self.async_concurrency = 64
+        self.async_limit_per_host = 16
+        self._telemetry = DownloadTelemetry()
+    
+    @property
+    def _download_stats(self) -> Dict[str, int]:
+        return self._telemetry.counts()
     
     @abstractmethod
     def load_data(self, data_dir: str, **kwargs) -> Tuple[List[pd.DataFrame], List[str]]:
@@ -83,73 +95,71 @@ class BaseDatasetLoader(ABC):
         pass
     
     def _download_file(self, url: str, dest_path: str, 
-                      chunk_size: int = 8192, timeout: int = 30) -> Tuple[bool, str]:
+                      chunk_size: int = 8192, timeout: int = 30,
+                      expected_size: Optional[int] = None,
+                      sha256: Optional[str] = None) -> Tuple[bool, str]:
         """
         Download a single file from URL to destination path.
         
-        This method is thread-safe and can be called concurrently.
+        This method is thread-safe and can be called concurrently. Downloads use the
+        pooled session of the calling thread, are resumed from ``.part`` files and are
+        retried with exponential backoff (see ``gaitsetpy.core.downloads``). Counts,
+        bytes and timings are recorded in the loader's DownloadTelemetry.
         
         Args:
             url: URL to download from
             dest_path: Destination file path
             chunk_size: Size of chunks to download (default: 8192 bytes)
             timeout: Request timeout in seconds (default: 30)
+            expected_size: Expected file size in bytes (optional)
+            sha256: Expected SHA-256 hex digest (optional)
             
         Returns:
             Tuple of (success: bool, message: str)
         """
-        try:
-            # Check if file already exists
-            if os.path.exists(dest_path):
-                self._download_stats['skipped'] += 1
-                return True, f"File already exists: {dest_path}"
-            
-            # Make the request
-            response = requests.get(url, stream=True, timeout=timeout)
-            
-            if response.status_code == 200:
-                # Ensure parent directory exists
-                os.makedirs(os.path.dirname(dest_path) if os.path.dirname(dest_path) else '.', exist_ok=True)
-                
-                # Write file in chunks
-                with open(dest_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=chunk_size):
-                        if chunk:
-                            f.write(chunk)
-                
-                self._download_stats['success'] += 1
-                return True, f"Successfully downloaded: {dest_path}"
-            else:
-                self._download_stats['failed'] += 1
-                return False, f"HTTP {response.status_code}: {url}"
-                
-        except requests.exceptions.Timeout:
-            self._download_stats['failed'] += 1
-            return False, f"Timeout downloading: {url}"
-        except requests.exceptions.RequestException as e:
-            self._download_stats['failed'] += 1
-            return False, f"Request error for {url}: {str(e)}"
-        except IOError as e:
-            self._download_stats['failed'] += 1
-            return False, f"IO error for {dest_path}: {str(e)}"
-        except Exception as e:
-            self._download_stats['failed'] += 1
-            return False, f"Unexpected error for {url}: {str(e)}"
+        telemetry = self._telemetry
+        telemetry.start_file(url, dest_path, expected_size)
+        result = download_file(
+            url, dest_path,
+            expected_size=expected_size,
+            sha256=sha256,
+            chunk_size=chunk_size,
+            timeout=timeout,
+            retries=self.download_retries,
+            backoff=self.retry_backoff,
+            progress=telemetry.progress_callback(dest_path)
+        )
+        telemetry.finish_file(dest_path, result.status, result.message)
+        return result.success, result.message
     
     def download_files_concurrent(self, 
-                                  download_tasks: List[Dict[str, str]], 
+                                  download_tasks: List[Dict[str, Any]], 
                                   show_progress: bool = True,
-                                  desc: str = "Downloading files") -> Dict[str, Any]:
+                                  desc: str = "Downloading files",
+                                  manifest: Optional[Union[str, Dict[str, Any]]] = None,
+                                  backend: Optional[str] = None) -> Dict[str, Any]:
         """
-        Download multiple files concurrently using a thread pool.
+        Download multiple files concurrently using a thread pool or an asyncio event loop.
+        
+        The 'thread' backend runs up to ``max_workers`` downloads at once. The 'async'
+        backend (requires aiohttp) runs up to ``async_concurrency`` downloads on one
+        event loop with at most ``async_limit_per_host`` connections per host, which
+        suits datasets made of many small files.
         
         Args:
-            download_tasks: List of dicts with 'url' and 'dest_path' keys
-            show_progress: Whether to show progress bar (default: True)
+            download_tasks: List of dicts with 'url' and 'dest_path' keys, and optionally
+                'size' and 'sha256' keys used to verify the downloaded file
+            show_progress: Whether to show one aggregate progress bar (bytes and
+                completed files across all workers) (default: True)
             desc: Description for progress bar
+            manifest: Optional manifest (dict or JSON path) mapping file names to
+                expected 'size'/'sha256'; used for tasks that do not set them
+            backend: 'thread' or 'async' (default: ``self.download_backend``)
             
         Returns:
-            Dictionary with download statistics and results
+            Dictionary with download statistics and results, including aggregate
+            'bytes_downloaded', 'elapsed' and 'bytes_per_second'; per-file bytes and
+            throughput are available from ``get_download_telemetry()``
             
         Example:
             tasks = [
@@ -158,28 +168,65 @@ class BaseDatasetLoader(ABC):
             ]
             results = loader.download_files_concurrent(tasks)
         """
-        # Reset stats
-        self._download_stats = {'success': 0, 'failed': 0, 'skipped': 0}
+        backend = backend or self.download_backend
+        if backend not in DOWNLOAD_BACKENDS:
+            raise ValueError(f"Unknown download backend '{backend}'. Available: {list(DOWNLOAD_BACKENDS)}")
         
         results = []
         failed_downloads = []
+        expected = load_manifest(manifest) if manifest is not None else {}
+        sizes = []
+        for task in download_tasks:
+            entry = expected.get(os.path.basename(task['dest_path']), {})
+            sizes.append((task.get('size', entry.get('size')), task.get('sha256', entry.get('sha256'))))
+        known = [size for size, _ in sizes if size is not None]
+        total_bytes = sum(int(size) for size in known) if len(known) == len(sizes) and sizes else None
+        
+        # Fresh telemetry for this batch
+        self._telemetry = DownloadTelemetry(
+            total_files=len(download_tasks), total_bytes=total_bytes,
+            show_progress=show_progress, desc=desc
+        )
+        
+        if backend == 'async':
+            from .async_downloads import download_files
+            
+            resolved = [dict(task, size=size, sha256=sha256) for task, (size, sha256) in zip(download_tasks, sizes)]
+            with self._telemetry:
+                outcomes = download_files(
+                    resolved,
+                    max_concurrency=self.async_concurrency,
+                    limit_per_host=self.async_limit_per_host,
+                    retries=self.download_retries,
+                    backoff=self.retry_backoff,
+                    telemetry=self._telemetry
+                )
+            for task, outcome in zip(download_tasks, outcomes):
+                results.append({
+                    'url': task['url'],
+                    'dest_path': task['dest_path'],
+                    'success': outcome.success,
+                    'message': outcome.message
+                })
+                if not outcome.success:
+                    failed_downloads.append({
+                        'url': task['url'],
+                        'dest_path': task['dest_path'],
+                        'error': outcome.message
+                    })
+            return self._download_summary(download_tasks, failed_downloads, results)
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        with self._telemetry, ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # Submit all download tasks
-            future_to_task = {
-                executor.submit(self._download_file, task['url'], task['dest_path']): task
-                for task in download_tasks
-            }
-            
-            # Process completed tasks with optional progress bar
-            if show_progress:
-                futures = tqdm(as_completed(future_to_task), 
-                             total=len(download_tasks), 
-                             desc=desc)
-            else:
-                futures = as_completed(future_to_task)
+            future_to_task = {}
+            for task, (size, sha256) in zip(download_tasks, sizes):
+                future = executor.submit(
+                    self._download_file, task['url'], task['dest_path'],
+                    expected_size=size, sha256=sha256
+                )
+                future_to_task[future] = task
             
-            for future in futures:
+            for future in as_completed(future_to_task):
                 task = future_to_task[future]
                 try:
                     success, message = future.result()
@@ -211,12 +258,20 @@ class BaseDatasetLoader(ABC):
                         'error': error_msg
                     })
         
+        return self._download_summary(download_tasks, failed_downloads, results)
+    
+    def _download_summary(self, download_tasks: List[Dict[str, Any]], failed_downloads: List[Dict[str, Any]],
+                          results: List[Dict[str, Any]]) -> Dict[str, Any]:
         # Return comprehensive results
+        stats = self._telemetry.to_dict()
         return {
             'total': len(download_tasks),
-            'success': self._download_stats['success'],
-            'failed': self._download_stats['failed'],
-            'skipped': self._download_stats['skipped'],
+            'success': stats['success'],
+            'failed': stats['failed'],
+            'skipped': stats['skipped'],
+            'bytes_downloaded': stats['bytes_downloaded'],
+            'elapsed': stats['elapsed'],
+            'bytes_per_second': stats['bytes_per_second'],
             'failed_downloads': failed_downloads,
             'all_results': results
         }
@@ -239,7 +294,17 @@ class BaseDatasetLoader(ABC):
         Returns:
             Dictionary with success, failed, and skipped counts
         """
-        return self._download_stats.copy()
+        return self._telemetry.counts()
+    
+    def get_download_telemetry(self) -> Dict[str, Any]:
+        """
+        Get structured telemetry from the last download operation.
+        
+        Returns:
+            Dictionary with counts, aggregate bytes and bytes/s, and per-file bytes,
+            timings and throughput under 'files' (see ``DownloadTelemetry.to_dict``)
+        """
+        return self._telemetry.to_dict()
     
     def get_info(self) -> Dict[str, Any]:
         """
@@ -383,7 +448,50 @@ class BasePreprocessor(ABC):
         """
         self.fit(data, **kwargs)
         return self.transform(data, **kwargs)
-    
+
+    def partial_fit(self, data: Union[pd.DataFrame, np.ndarray], **kwargs):
+        """
+        Update the preprocessor with one chunk of a stream.
+
+        Streaming preprocessors keep bounded per-channel state (running statistics,
+        filter memory, short tail buffers), so chunks of any length can be fed in turn.
+
+        Args:
+            data: Chunk of samples (samples along axis 0)
+            **kwargs: Additional arguments
+
+        Raises:
+            NotImplementedError: If the preprocessor does not support streaming
+        """
+        raise NotImplementedError(f"Preprocessor '{self.name}' does not support streaming")
+
+    def transform_chunk(self, data: Union[pd.DataFrame, np.ndarray], update: bool = True,
+                        **kwargs) -> Union[pd.DataFrame, np.ndarray]:
+        """
+        Causally transform one chunk of a stream.
+
+        Feeding a signal chunk by chunk gives the same output as the causal batch
+        equivalent of the preprocessor applied to the whole signal.
+
+        Args:
+            data: Chunk of samples (samples along axis 0)
+            update: Whether to advance the stream state with this chunk
+            **kwargs: Additional arguments
+
+        Returns:
+            Transformed chunk
+
+        Raises:
+            NotImplementedError: If the preprocessor does not support streaming
+        """
+        raise NotImplementedError(f"Preprocessor '{self.name}' does not support streaming")
+
+    def reset_stream(self):
+        """
+        Reset the streaming state so that the next chunk starts a new stream.
+        """
+        pass
+
     def configure(self, config: Dict[str, Any]):
         """
         Configure the preprocessor.
@@ -535,6 +643,33 @@ class BaseClassificationModel(ABC):
         """
         pass
     
+    def fit_arrays(self, X: np.ndarray, y: np.ndarray, **kwargs):
+        """
+        Train on a feature matrix and label codes, without an internal split.
+        
+        Used by cross-validation, where the caller chooses the training rows and
+        label codes are shared by all folds.
+        
+        Args:
+            X: Feature matrix in the layout of ``preprocess_features``
+            y: Zero-based label codes
+            **kwargs: Additional arguments for training
+        """
+        raise NotImplementedError(f"Model '{self.name}' does not support training from arrays")
+    
+    def predict_arrays(self, X: np.ndarray, **kwargs) -> np.ndarray:
+        """
+        Make predictions for a feature matrix.
+        
+        Args:
+            X: Feature matrix in the layout of ``preprocess_features``
+            **kwargs: Additional arguments for prediction
+            
+        Returns:
+            Array of label codes
+        """
+        raise NotImplementedError(f"Model '{self.name}' does not support prediction from arrays")
+    
     @abstractmethod
     def save_model(self, filepath: str):
         """
@@ -0,0 +1,286 @@
+"""
+Shared download engine for dataset loaders.
+
+This module provides resumable, integrity-checked file downloads used by
+BaseDatasetLoader and the dataset utility functions:
+
+- One pooled requests.Session per worker thread, so consecutive files from the
+  same host reuse their TCP/TLS connection
+- Downloads go to a ``.part`` file that is resumed with an HTTP Range request and
+  atomically renamed into place once complete, so a file at the destination path
+  is always complete
+- Optional size and SHA-256 verification against a manifest
+- Retries with exponential backoff for timeouts, dropped connections and
+  transient HTTP errors
+
+Maintainer: @aharshit123456
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+PART_SUFFIX = ".part"
+
+_thread_local = threading.local()
+
+
+class DownloadResult(NamedTuple):
+    """Outcome of a single download."""
+    success: bool
+    status: str  # 'downloaded', 'resumed', 'skipped' or 'failed'
+    message: str
+    bytes_downloaded: int = 0
+
+
+class _RetryableError(Exception):
+    """Transient failure; the download is retried after a backoff."""
+
+
+class _PermanentError(Exception):
+    """Failure that retrying cannot fix (e.g. HTTP 404)."""
+
+
+def get_session(pool_size: int = 4) -> requests.Session:
+    """
+    Get the pooled session of the calling thread.
+
+    Each worker thread keeps its own session (sessions are not guaranteed to be
+    thread-safe), and each session keeps its connections alive between files.
+
+    Args:
+        pool_size: Number of connections kept per host
+
+    Returns:
+        Session of the calling thread
+    """
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _thread_local.session = session
+    return session
+
+
+def sha256_file(path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Compute the SHA-256 hex digest of a file.
+
+    Args:
+        path: File path
+        chunk_size: Read size in bytes
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def verify_file(path: str, expected_size: Optional[int] = None,
+                sha256: Optional[str] = None) -> Tuple[bool, str]:
+    """
+    Check a file against an expected size and SHA-256 digest.
+
+    Args:
+        path: File path
+        expected_size: Expected size in bytes, or None to skip the check
+        sha256: Expected hex digest, or None to skip the check
+
+    Returns:
+        Tuple of (ok: bool, reason: str)
+    """
+    if not os.path.exists(path):
+        return False, "missing"
+    size = os.path.getsize(path)
+    if expected_size is not None and size != int(expected_size):
+        return False, f"size {size} != expected {expected_size}"
+    if sha256 is not None and sha256_file(path).lower() != sha256.lower():
+        return False, "SHA-256 mismatch"
+    return True, "ok"
+
+
+def load_manifest(manifest: Union[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Load a download manifest.
+
+    A manifest maps file names to ``{'size': int, 'sha256': str}`` (either key may be
+    omitted). It can be given as a dict or as the path of a JSON file; a top-level
+    ``'files'`` key is accepted too.
+
+    Args:
+        manifest: Manifest dict or path to a JSON manifest
+
+    Returns:
+        Mapping of file name to expected attributes
+    """
+    if isinstance(manifest, str):
+        with open(manifest, "r") as f:
+            manifest = json.load(f)
+    return dict(manifest.get("files", manifest))
+
+
+def _header_int(response, name: str) -> Optional[int]:
+    try:
+        return int(response.headers.get(name))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _content_range_total(response) -> Optional[int]:
+    try:
+        return int(str(response.headers.get("Content-Range")).rsplit("/", 1)[1])
+    except (AttributeError, IndexError, TypeError, ValueError):
+        return None
+
+
+def _prepare_destination(dest_path: str, part_path: str, expected_size: Optional[int],
+                         sha256: Optional[str], resume: bool) -> Optional[DownloadResult]:
+    """Skip a complete destination file, or move an incomplete one out of the way."""
+    if os.path.exists(dest_path):
+        if expected_size is None and sha256 is None:
+            if os.path.getsize(dest_path) > 0:
+                return DownloadResult(True, "skipped", f"File already exists: {dest_path}")
+        elif verify_file(dest_path, expected_size, sha256)[0]:
+            return DownloadResult(True, "skipped", f"File already exists: {dest_path}")
+        if resume and expected_size is not None and os.path.getsize(dest_path) < int(expected_size):
+            os.replace(dest_path, part_path)
+        else:
+            os.remove(dest_path)
+
+    parent = os.path.dirname(dest_path)
+    os.makedirs(parent if parent else ".", exist_ok=True)
+    return None
+
+
+def _finalize(part_path: str, dest_path: str, expected_size: Optional[int], sha256: Optional[str]):
+    """Verify a finished part file and rename it into place."""
+    ok, reason = verify_file(part_path, expected_size, sha256)
+    if not ok:
+        os.remove(part_path)
+        raise _RetryableError(f"Verification failed for {dest_path}: {reason}")
+    os.replace(part_path, dest_path)
+
+
+def _check_status(status: int, offset: int, range_total: Optional[int], part_path: str, url: str) -> bool:
+    """Raise for error responses; return True if the part file already holds the whole file."""
+    if status == 416 and offset:
+        # Nothing left to fetch if the part file already holds the whole file.
+        if range_total == offset:
+            return True
+        os.remove(part_path)
+        raise _RetryableError(f"Range not satisfiable, restarting: {url}")
+    if status in RETRYABLE_STATUS:
+        raise _RetryableError(f"HTTP {status}: {url}")
+    if status not in (200, 206):
+        raise _PermanentError(f"HTTP {status}: {url}")
+    return False
+
+
+def _fetch(session: requests.Session, url: str, part_path: str, resume: bool,
+           chunk_size: int, timeout: float,
+           progress: Optional[Callable[[int], None]]) -> Tuple[int, bool]:
+    """Download (the rest of) ``url`` into ``part_path``; return (bytes written, resumed)."""
+    offset = os.path.getsize(part_path) if resume and os.path.exists(part_path) else 0
+    headers = {"Range": f"bytes={offset}-"} if offset else {}
+    response = session.get(url, stream=True, timeout=timeout, headers=headers)
+    try:
+        status = response.status_code
+        if _check_status(status, offset, _content_range_total(response), part_path, url):
+            return 0, True
+        if status == 200:
+            # The server ignored the Range header and sent the whole file.
+            offset = 0
+
+        length = _header_int(response, "Content-Length")
+        expected_total = offset + length if length is not None else None
+        written = 0
+        with open(part_path, "ab" if offset else "wb") as f:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    f.write(chunk)
+                    written += len(chunk)
+                    if progress is not None:
+                        progress(len(chunk))
+        if expected_total is not None and offset + written < expected_total:
+            raise _RetryableError(f"Incomplete download ({offset + written}/{expected_total} bytes): {url}")
+        return written, offset > 0
+    finally:
+        response.close()
+
+
+def download_file(url: str, dest_path: str, expected_size: Optional[int] = None,
+                  sha256: Optional[str] = None, chunk_size: int = 1 << 16, timeout: float = 30,
+                  retries: int = 3, backoff: float = 0.5, resume: bool = True,
+                  session: Optional[requests.Session] = None,
+                  progress: Optional[Callable[[int], None]] = None) -> DownloadResult:
+    """
+    Download a file with resume, verification and retries.
+
+    An existing destination file is skipped if it matches the expected size/digest
+    (or, without them, if it is non-empty: the engine only ever renames complete
+    files into place). A destination file that fails verification but is shorter
+    than expected is resumed from where it stops.
+
+    Args:
+        url: URL to download from
+        dest_path: Destination file path
+        expected_size: Expected size in bytes (optional)
+        sha256: Expected SHA-256 hex digest (optional)
+        chunk_size: Size of chunks to stream (default: 64 KiB)
+        timeout: Connect/read timeout in seconds
+        retries: Number of retries after the first attempt
+        backoff: Base delay in seconds; attempt ``k`` waits ``backoff * 2 ** (k - 1)``
+        resume: Whether to resume from an existing ``.part`` file
+        session: Session to use (default: the pooled session of the calling thread)
+        progress: Optional callback receiving the size of every written chunk
+
+    Returns:
+        DownloadResult
+    """
+    part_path = dest_path + PART_SUFFIX
+    try:
+        skipped = _prepare_destination(dest_path, part_path, expected_size, sha256, resume)
+        if skipped is not None:
+            return skipped
+    except OSError as e:
+        return DownloadResult(False, "failed", f"IO error for {dest_path}: {str(e)}")
+
+    session = session if session is not None else get_session()
+    total_written = 0
+    message = f"Download failed: {url}"
+    for attempt in range(retries + 1):
+        if attempt:
+            time.sleep(backoff * 2 ** (attempt - 1))
+        try:
+            written, resumed = _fetch(session, url, part_path, resume, chunk_size, timeout, progress)
+            total_written += written
+            _finalize(part_path, dest_path, expected_size, sha256)
+            return DownloadResult(True, "resumed" if resumed else "downloaded",
+                                  f"Successfully downloaded: {dest_path}", total_written)
+        except _PermanentError as e:
+            return DownloadResult(False, "failed", str(e), total_written)
+        except _RetryableError as e:
+            message = str(e)
+        except requests.exceptions.Timeout:
+            message = f"Timeout downloading: {url}"
+        except requests.exceptions.RequestException as e:
+            message = f"Request error for {url}: {str(e)}"
+        except OSError as e:
+            return DownloadResult(False, "failed", f"IO error for {dest_path}: {str(e)}", total_written)
+        except Exception as e:
+            return DownloadResult(False, "failed", f"Unexpected error for {url}: {str(e)}", total_written)
+    return DownloadResult(False, "failed", f"{message} (after {retries + 1} attempts)", total_written)
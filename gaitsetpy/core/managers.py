@@ -341,4 +341,42 @@ class ClassificationManager(BaseManager):
             Evaluation metrics dictionary
         """
         model = self.get_cached_instance(model_name, model_name, f"{model_name} classification model")
-        return model.evaluate(features, **kwargs) 
\ No newline at end of file
+        return model.evaluate(features, **kwargs)
+
+    def cross_validate(self, model_name: str, X: Any, y: Any = None, groups: Any = None, **kwargs) -> Dict[str, Any]:
+        """
+        Subject-grouped cross-validation of a model.
+        
+        Args:
+            model_name: Name of the classification model
+            X: Feature matrix, or a CorpusStore with features and labels
+            y: Labels of the rows
+            groups: Subject ID of the rows
+            **kwargs: Arguments for ``classification.utils.cv.cross_validate``
+                      (params, n_splits, max_workers, cache_dir)
+            
+        Returns:
+            Cross-validation results dictionary
+        """
+        from ..classification.utils.cv import cross_validate
+        return cross_validate(self._registry.get(model_name, model_name), X, y, groups, **kwargs)
+    
+    def grid_search(self, model_name: str, param_grid: Any, X: Any, y: Any = None, groups: Any = None,
+                    **kwargs) -> Dict[str, Any]:
+        """
+        Hyperparameter search with subject-grouped cross-validation.
+        
+        Args:
+            model_name: Name of the classification model
+            param_grid: Dict (or list of dicts) of parameter name -> values
+            X: Feature matrix, or a CorpusStore with features and labels
+            y: Labels of the rows
+            groups: Subject ID of the rows
+            **kwargs: Arguments for ``classification.utils.cv.grid_search``
+                      (n_splits, scoring, max_workers, cache_dir)
+            
+        Returns:
+            Search results dictionary
+        """
+        from ..classification.utils.cv import grid_search
+        return grid_search(self._registry.get(model_name, model_name), param_grid, X, y, groups, **kwargs)
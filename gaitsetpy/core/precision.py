@@ -0,0 +1,179 @@
+"""
+Global floating point precision policy and compact label codes.
+
+The policy ('float64' by default, or 'float32') decides the dtype that loaders
+parse sensor columns into, that preprocessing falls back to for integer input
+and that feature extractors compute in. float32 halves the memory of every
+signal and feature array; float64 keeps the previous behaviour. Model inputs
+from ``preprocess_features`` are float32 either way.
+
+The policy is process-wide state, shared by every thread (so worker threads of
+the parallel extractors follow it). ``set_precision`` and the ``precision``
+context manager are therefore not thread-safe: switching precision in one
+thread changes it for all threads running at the same time. Set it once at
+start-up, or only switch it while no other thread is loading or processing data.
+
+Labels are stored as the smallest signed integer type that holds their codes
+(int8 for up to 127 classes).
+
+Example:
+    import gaitsetpy as gsp
+    gsp.set_precision('float32')
+    with gsp.precision('float64'):
+        ...  # temporarily back to double precision
+
+Maintainer: @aharshit123456
+"""
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+PRECISIONS = ('float64', 'float32')
+
+_precision = 'float64'
+
+
+def set_precision(name: str):
+    """
+    Set the global floating point precision for all threads.
+
+    Args:
+        name: 'float64' or 'float32' (or the corresponding NumPy dtype)
+
+    Raises:
+        ValueError: If the precision is not supported
+    """
+    global _precision
+    try:
+        resolved = np.dtype(name).name
+    except TypeError:
+        resolved = None
+    if resolved not in PRECISIONS:
+        raise ValueError(f"Unsupported precision: {name}. Supported: {list(PRECISIONS)}")
+    _precision = resolved
+
+
+def get_precision() -> str:
+    """
+    Get the global floating point precision.
+
+    Returns:
+        'float64' or 'float32'
+    """
+    return _precision
+
+
+def float_dtype() -> np.dtype:
+    """
+    NumPy dtype of the current precision policy.
+
+    Returns:
+        np.dtype('float64') or np.dtype('float32')
+    """
+    return np.dtype(_precision)
+
+
+@contextmanager
+def precision(name: str) -> Iterator[None]:
+    """
+    Temporarily switch the global precision.
+
+    The switch is process-wide, not local to the calling thread: other threads
+    see the temporary precision until the block exits.
+
+    Args:
+        name: 'float64' or 'float32'
+    """
+    previous = get_precision()
+    set_precision(name)
+    try:
+        yield
+    finally:
+        set_precision(previous)
+
+
+def as_float_array(values, dtype: Optional[np.dtype] = None) -> np.ndarray:
+    """
+    Convert to a floating point array without copying float input.
+
+    Args:
+        values: Array-like
+        dtype: Target dtype for non-float input (default: the policy dtype)
+
+    Returns:
+        Floating point array
+    """
+    values = np.asarray(values)
+    if not np.issubdtype(values.dtype, np.floating):
+        values = values.astype(dtype or float_dtype())
+    return values
+
+
+def _int_dtype(low: int, high: int) -> np.dtype:
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def label_dtype(n_classes: int) -> np.dtype:
+    """
+    Smallest signed integer dtype holding label codes 0 .. n_classes - 1.
+
+    Args:
+        n_classes: Number of classes
+
+    Returns:
+        int8, int16, int32 or int64 dtype
+    """
+    return _int_dtype(0, max(n_classes - 1, 0))
+
+
+def encode_labels(labels: Sequence) -> Tuple[np.ndarray, Dict[Any, int]]:
+    """
+    Encode labels as compact, zero-based contiguous integer codes.
+
+    Args:
+        labels: Label values (any sortable type)
+
+    Returns:
+        Tuple of (codes, label_map) where label_map maps each original label to
+        its code, in sorted label order
+    """
+    classes, codes = np.unique(np.asarray(labels), return_inverse=True)
+    label_map = {label.item() if isinstance(label, np.generic) else label: idx
+                 for idx, label in enumerate(classes)}
+    return codes.astype(label_dtype(len(classes))), label_map
+
+
+def cast_frame(df: pd.DataFrame, int_columns: Sequence[str] = ()) -> pd.DataFrame:
+    """
+    Cast a DataFrame's float columns to the policy dtype, and integer-valued
+    columns to compact integers.
+
+    Args:
+        df: DataFrame (modified in place and returned)
+        int_columns: Columns holding integer codes (e.g. annotations), cast to the
+                     smallest integer dtype for their range when all values are
+                     whole numbers
+
+    Returns:
+        The DataFrame
+    """
+    dtype = float_dtype()
+    for col in df.columns:
+        series = df[col]
+        if col in int_columns:
+            values = series.to_numpy()
+            if len(values) and pd.api.types.is_numeric_dtype(series) and not np.isnan(values.astype(float)).any() \
+                    and np.array_equal(values, np.round(values)):
+                df[col] = values.astype(_int_dtype(int(values.min()), int(values.max())))
+            continue
+        if pd.api.types.is_float_dtype(series) and series.dtype != dtype:
+            df[col] = series.astype(dtype)
+    return df
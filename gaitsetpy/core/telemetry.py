@@ -0,0 +1,216 @@
+"""
+Download telemetry shared by concurrent download workers.
+
+DownloadTelemetry collects, under one lock:
+- success/failed/skipped counts
+- bytes and throughput of every file
+- aggregate bytes and bytes/s across all workers
+
+It drives a single aggregate progress bar for a whole batch of downloads and
+exports its state as plain dicts (``to_dict``) that can be logged as JSON or
+forwarded to a metrics backend.
+
+Maintainer: @aharshit123456
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from tqdm import tqdm
+
+
+STATUS_COUNTERS = {'downloaded': 'success', 'resumed': 'success', 'skipped': 'skipped', 'failed': 'failed'}
+
+
+class DownloadTelemetry:
+    """
+    Thread-safe statistics and progress for a batch of downloads.
+
+    Workers call ``start_file`` before a download, feed the callback returned by
+    ``progress_callback`` to the download engine and call ``finish_file`` with the
+    result. All methods may be called concurrently.
+    """
+
+    def __init__(self, total_files: Optional[int] = None, total_bytes: Optional[int] = None,
+                 show_progress: bool = False, desc: str = "Downloading files"):
+        """
+        Initialize the telemetry.
+
+        Args:
+            total_files: Number of files in the batch (optional, shown in the progress bar)
+            total_bytes: Total size of the batch in bytes (optional, progress bar total)
+            show_progress: Whether to show an aggregate progress bar
+            desc: Description of the progress bar
+        """
+        self.total_files = total_files
+        self.total_bytes = total_bytes
+        self._lock = threading.Lock()
+        self._counts = {'success': 0, 'failed': 0, 'skipped': 0}
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._bytes = 0
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+        self._bar = None
+        if show_progress:
+            self._bar = tqdm(total=total_bytes, unit='iB', unit_scale=True, unit_divisor=1024, desc=desc)
+
+    def start_file(self, url: str, dest_path: str, expected_size: Optional[int] = None):
+        """
+        Register the start of a download.
+
+        Args:
+            url: Source URL
+            dest_path: Destination path (identifies the file in the telemetry)
+            expected_size: Expected size in bytes, if known
+        """
+        now = time.perf_counter()
+        with self._lock:
+            if self._started is None:
+                self._started = now
+            self._files[dest_path] = {
+                'url': url,
+                'dest_path': dest_path,
+                'expected_size': expected_size,
+                'status': 'running',
+                'bytes': 0,
+                'started': now,
+                'elapsed': None,
+                'message': '',
+            }
+
+    def add_bytes(self, dest_path: str, n_bytes: int):
+        """
+        Account for ``n_bytes`` written for a file.
+
+        Args:
+            dest_path: Destination path passed to ``start_file``
+            n_bytes: Number of bytes written
+        """
+        with self._lock:
+            self._files[dest_path]['bytes'] += n_bytes
+            self._bytes += n_bytes
+            if self._bar is not None:
+                self._bar.update(n_bytes)
+
+    def progress_callback(self, dest_path: str) -> Callable[[int], None]:
+        """
+        Get a progress callback for the download engine.
+
+        Args:
+            dest_path: Destination path passed to ``start_file``
+
+        Returns:
+            Callable receiving the size of every written chunk
+        """
+        return lambda n_bytes: self.add_bytes(dest_path, n_bytes)
+
+    def finish_file(self, dest_path: str, status: str, message: str = ""):
+        """
+        Register the end of a download.
+
+        Args:
+            dest_path: Destination path passed to ``start_file``
+            status: One of 'downloaded', 'resumed', 'skipped' or 'failed'
+            message: Result message
+        """
+        if status not in STATUS_COUNTERS:
+            raise ValueError(f"Unknown download status '{status}'. Available: {list(STATUS_COUNTERS)}")
+        now = time.perf_counter()
+        with self._lock:
+            entry = self._files.get(dest_path)
+            if entry is None:
+                entry = self._files[dest_path] = {
+                    'url': None, 'dest_path': dest_path, 'expected_size': None,
+                    'bytes': 0, 'started': now,
+                }
+            entry['status'] = status
+            entry['message'] = message
+            entry['elapsed'] = now - entry['started']
+            self._counts[STATUS_COUNTERS[status]] += 1
+            self._finished = now
+            if self._bar is not None:
+                done = sum(self._counts.values())
+                total = f"/{self.total_files}" if self.total_files is not None else ""
+                self._bar.set_postfix(files=f"{done}{total}", failed=self._counts['failed'], refresh=False)
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Get the success, failed and skipped counts.
+
+        Returns:
+            Copy of the counters
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    @property
+    def bytes_downloaded(self) -> int:
+        """Total bytes written across all files."""
+        with self._lock:
+            return self._bytes
+
+    def _elapsed(self) -> float:
+        if self._started is None:
+            return 0.0
+        end = self._finished if self._finished is not None else time.perf_counter()
+        return max(end - self._started, 0.0)
+
+    def file_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get per-file statistics.
+
+        Returns:
+            List of dicts with url, dest_path, status, bytes, elapsed (s),
+            bytes_per_second and message, in start order
+        """
+        with self._lock:
+            stats = []
+            for entry in self._files.values():
+                elapsed = entry['elapsed']
+                if elapsed is None:
+                    elapsed = time.perf_counter() - entry['started']
+                stats.append({
+                    'url': entry['url'],
+                    'dest_path': entry['dest_path'],
+                    'status': entry['status'],
+                    'bytes': entry['bytes'],
+                    'elapsed': elapsed,
+                    'bytes_per_second': entry['bytes'] / elapsed if elapsed > 0 else 0.0,
+                    'message': entry['message'],
+                })
+            return stats
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Export the telemetry as a JSON-serialisable dict.
+
+        Returns:
+            Dictionary with the counters, aggregate bytes and throughput, and the
+            per-file statistics under 'files'
+        """
+        files = self.file_stats()
+        with self._lock:
+            elapsed = self._elapsed()
+            return {
+                'total': self.total_files if self.total_files is not None else len(files),
+                **self._counts,
+                'bytes_downloaded': self._bytes,
+                'elapsed': elapsed,
+                'bytes_per_second': self._bytes / elapsed if elapsed > 0 else 0.0,
+                'files': files,
+            }
+
+    def close(self):
+        """Close the progress bar."""
+        with self._lock:
+            if self._bar is not None:
+                self._bar.close()
+                self._bar = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
@@ -30,6 +30,10 @@ from .physionet import load_physionet_data, create_physionet_windows
 from .harup import load_harup_data, create_harup_windows, extract_harup_features
 from .urfall import load_urfall_data, create_urfall_windows
 from .utils import download_dataset, extract_dataset, sliding_window
+from .archives import list_members, iter_members, extract_members
+from .media import FrameReader
+from .alignment import AlignedStreams, align_streams, align_frames
+from .corpus import CorpusStore, CorpusWriter, write_corpus, open_corpus
 
 # Import managers
 from ..core.managers import DatasetManager
@@ -96,6 +100,21 @@ __all__ = [
     'download_dataset',
     'extract_dataset',
     'sliding_window',
+    # Archive access
+    'list_members',
+    'iter_members',
+    'extract_members',
+    # Media
+    'FrameReader',
+    # Multimodal alignment
+    'AlignedStreams',
+    'align_streams',
+    'align_frames',
+    # Corpus store
+    'CorpusStore',
+    'CorpusWriter',
+    'write_corpus',
+    'open_corpus',
     # Manager functions
     'get_dataset_manager',
     'get_available_datasets',
@@ -0,0 +1,293 @@
+'''
+Time alignment of multimodal streams.
+
+Streams recorded by different sensors (accelerometers, camera frame clocks,
+depth-feature tables, ...) have their own timestamps. ``align_streams`` puts
+any number of them on one common timeline with binary searches over sorted
+timestamp arrays, so aligning a sequence costs O((N + M) log N) for N source
+and M target samples instead of a pandas ``merge_asof`` per stream pair.
+
+The result is one (T, C) array per sequence plus a boolean validity mask per
+stream, telling which timeline samples had a source sample close enough
+(``tolerance``) or were bracketed by two samples close enough (``max_gap``).
+
+Maintainer: @aharshit123456
+'''
+
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+ALIGN_METHODS = ('nearest', 'previous', 'linear')
+
+
+class AlignedStreams(NamedTuple):
+    """Streams aligned on a common timeline."""
+    times: np.ndarray  # (T,) timeline in seconds
+    data: np.ndarray  # (T, C) aligned values, NaN where a stream is invalid
+    channels: List[str]  # column names of ``data`` ('<stream>.<channel>')
+    masks: Dict[str, np.ndarray]  # stream name -> (T,) validity mask
+    slices: Dict[str, slice]  # stream name -> its columns in ``data``
+
+    def stream(self, name: str) -> np.ndarray:
+        """Columns of one stream, shape (T, C_stream)."""
+        return self.data[:, self.slices[name]]
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Mask of timeline samples where every stream is valid."""
+        return np.logical_and.reduce(list(self.masks.values()))
+
+
+def to_seconds(timestamps, unit: str = 's') -> np.ndarray:
+    """
+    Convert timestamps to float64 seconds.
+
+    Args:
+        timestamps: Numbers in ``unit``, datetime64 values, or date strings
+                    (e.g. HAR-UP's ISO timestamps)
+        unit: Unit of numeric timestamps ('s', 'ms', 'us' or 'ns')
+
+    Returns:
+        Float64 array of seconds (datetimes relative to the Unix epoch)
+    """
+    scales = {'s': 1.0, 'ms': 1e-3, 'us': 1e-6, 'ns': 1e-9}
+    if unit not in scales:
+        raise ValueError(f"unit must be one of {list(scales)}. Got: {unit}")
+    values = np.asarray(timestamps)
+    if values.dtype.kind in 'OUS':
+        values = pd.to_datetime(values).to_numpy()
+    if values.dtype.kind == 'M':
+        return values.astype('datetime64[ns]').astype(np.int64) * 1e-9
+    return values.astype(np.float64) * scales[unit]
+
+
+def _sorted(times: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sort a stream by time (stable) unless it already is."""
+    if len(times) > 1 and np.any(times[1:] < times[:-1]):
+        order = np.argsort(times, kind='stable')
+        return times[order], values[order]
+    return times, values
+
+
+def nearest_indices(source_times: np.ndarray, target_times: np.ndarray,
+                    tolerance: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Index of the nearest source sample for every target time.
+
+    Args:
+        source_times: Sorted source timestamps (N,)
+        target_times: Target timestamps (M,)
+        tolerance: Largest allowed distance; farther matches are marked invalid
+
+    Returns:
+        Tuple of (indices (M,), validity mask (M,))
+    """
+    n = len(source_times)
+    if n == 0:
+        return np.zeros(len(target_times), dtype=np.intp), np.zeros(len(target_times), dtype=bool)
+    right = np.searchsorted(source_times, target_times, side='left').clip(0, n - 1)
+    left = (right - 1).clip(0, n - 1)
+    take_left = np.abs(target_times - source_times[left]) <= np.abs(source_times[right] - target_times)
+    index = np.where(take_left, left, right)
+    valid = np.ones(len(target_times), dtype=bool)
+    if tolerance is not None:
+        valid = np.abs(source_times[index] - target_times) <= tolerance
+    return index, valid
+
+
+def previous_indices(source_times: np.ndarray, target_times: np.ndarray,
+                     tolerance: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Index of the last source sample at or before every target time (sample-and-hold).
+
+    Args:
+        source_times: Sorted source timestamps (N,)
+        target_times: Target timestamps (M,)
+        tolerance: Largest allowed age of the held sample
+
+    Returns:
+        Tuple of (indices (M,), validity mask (M,))
+    """
+    index = np.searchsorted(source_times, target_times, side='right') - 1
+    valid = index >= 0
+    index = index.clip(0, None)
+    if tolerance is not None and len(source_times):
+        valid &= (target_times - source_times[index]) <= tolerance
+    return index, valid
+
+
+def interpolate(source_times: np.ndarray, values: np.ndarray, target_times: np.ndarray,
+                max_gap: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Linearly interpolate a stream at target times.
+
+    Args:
+        source_times: Sorted source timestamps (N,)
+        values: Source values (N,) or (N, C)
+        target_times: Target timestamps (M,)
+        max_gap: Largest gap between the two bracketing samples; targets in wider
+                 gaps are marked invalid
+
+    Returns:
+        Tuple of (values (M, C) float64, validity mask (M,))
+    """
+    values = np.asarray(values, dtype=np.float64).reshape(len(source_times), -1)
+    n = len(source_times)
+    out = np.full((len(target_times), values.shape[1]), np.nan)
+    if n == 0:
+        return out, np.zeros(len(target_times), dtype=bool)
+    right = np.searchsorted(source_times, target_times, side='left')
+    valid = (right < n) & ((right > 0) | (target_times == source_times[0]))
+    right = right.clip(0, n - 1)
+    left = (right - 1).clip(0, n - 1)
+    span = source_times[right] - source_times[left]
+    if max_gap is not None:
+        valid &= span <= max_gap
+    exact = source_times[right] == target_times
+    weight = np.divide(target_times - source_times[left], span, out=np.ones_like(span), where=span > 0)
+    weight[exact] = 1.0
+    blended = values[left] + weight[:, None] * (values[right] - values[left])
+    out[valid] = blended[valid]
+    return out, valid
+
+
+def make_timeline(start: float, stop: float, rate: float) -> np.ndarray:
+    """
+    Evenly spaced timeline from ``start`` up to and including ``stop``.
+
+    Args:
+        start: First time in seconds
+        stop: Last time in seconds
+        rate: Samples per second
+
+    Returns:
+        Float64 array of times
+    """
+    if rate <= 0:
+        raise ValueError("rate must be positive")
+    n = int(np.floor((stop - start) * rate + 1e-9)) + 1
+    return start + np.arange(max(n, 0)) / rate
+
+
+def align_streams(streams: Dict[str, Tuple[Sequence, Sequence]],
+                  timeline: Optional[Sequence[float]] = None,
+                  rate: Optional[float] = None,
+                  reference: Optional[str] = None,
+                  method: Union[str, Dict[str, str]] = 'nearest',
+                  tolerance: Optional[Union[float, Dict[str, float]]] = None,
+                  span: str = 'overlap',
+                  channel_names: Optional[Dict[str, List[str]]] = None) -> AlignedStreams:
+    """
+    Align streams onto one timeline.
+
+    The timeline is, in order of precedence: ``timeline``; the timestamps of the
+    ``reference`` stream; or an evenly spaced grid at ``rate`` Hz over the streams'
+    overlap (``span='overlap'``) or union (``span='union'``).
+
+    Args:
+        streams: Stream name -> (timestamps in seconds, values (N,) or (N, C))
+        timeline: Explicit target times in seconds
+        rate: Resampling rate in Hz for a generated timeline
+        reference: Name of the stream whose timestamps form the timeline
+        method: 'nearest', 'previous' (sample-and-hold) or 'linear', either for all
+                streams or per stream name
+        tolerance: Largest distance to a matched sample ('nearest'/'previous') or
+                   largest bracketing gap ('linear'), for all streams or per stream
+        span: 'overlap' or 'union' of the stream time ranges, for generated timelines
+        channel_names: Optional stream name -> channel names
+
+    Returns:
+        AlignedStreams with the (T, C) data and a validity mask per stream
+
+    Raises:
+        ValueError: If no timeline can be determined or an option is unknown
+    """
+    if not streams:
+        raise ValueError("At least one stream is required")
+    prepared = {}
+    for name, (times, values) in streams.items():
+        times = np.asarray(times, dtype=np.float64)
+        values = np.asarray(values)
+        if values.ndim == 1:
+            values = values[:, None]
+        if len(values) != len(times):
+            raise ValueError(f"Stream '{name}' has {len(times)} timestamps but {len(values)} samples")
+        prepared[name] = _sorted(times, values)
+
+    if timeline is not None:
+        target = np.asarray(timeline, dtype=np.float64)
+    elif reference is not None:
+        if reference not in prepared:
+            raise ValueError(f"Unknown reference stream: {reference}")
+        target = prepared[reference][0]
+    elif rate is not None:
+        ranges = [(t[0], t[-1]) for t, _ in prepared.values() if len(t)]
+        if not ranges:
+            target = np.empty(0)
+        elif span == 'overlap':
+            target = make_timeline(max(r[0] for r in ranges), min(r[1] for r in ranges), rate)
+        elif span == 'union':
+            target = make_timeline(min(r[0] for r in ranges), max(r[1] for r in ranges), rate)
+        else:
+            raise ValueError("span must be 'overlap' or 'union'")
+    else:
+        raise ValueError("Provide a timeline, a reference stream or a rate")
+
+    blocks, channels, masks, slices = [], [], {}, {}
+    column = 0
+    for name, (times, values) in prepared.items():
+        stream_method = method.get(name, 'nearest') if isinstance(method, dict) else method
+        stream_tolerance = tolerance.get(name) if isinstance(tolerance, dict) else tolerance
+        if stream_method == 'linear':
+            block, mask = interpolate(times, values, target, max_gap=stream_tolerance)
+        elif stream_method in ('nearest', 'previous'):
+            pick = nearest_indices if stream_method == 'nearest' else previous_indices
+            index, mask = pick(times, target, stream_tolerance)
+            block = np.full((len(target), values.shape[1]), np.nan)
+            if len(times):
+                block[mask] = values[index[mask]]
+        else:
+            raise ValueError(f"method must be one of {ALIGN_METHODS}. Got: {stream_method}")
+        names = (channel_names or {}).get(name) or [str(i) for i in range(values.shape[1])]
+        if len(names) != values.shape[1]:
+            raise ValueError(f"Stream '{name}' has {values.shape[1]} channels but {len(names)} names")
+        blocks.append(block)
+        channels.extend(f"{name}.{channel}" for channel in names)
+        masks[name] = mask
+        slices[name] = slice(column, column + values.shape[1])
+        column += values.shape[1]
+
+    data = np.hstack(blocks) if blocks else np.empty((len(target), 0))
+    return AlignedStreams(times=target, data=data, channels=channels, masks=masks, slices=slices)
+
+
+def align_frames(frames: Dict[str, pd.DataFrame], time_column: Union[str, Dict[str, str]],
+                 columns: Optional[Dict[str, List[str]]] = None, unit: str = 's',
+                 **kwargs) -> AlignedStreams:
+    """
+    Align DataFrame streams that carry their own time column.
+
+    Args:
+        frames: Stream name -> DataFrame
+        time_column: Name of the time column, for all frames or per stream
+        columns: Optional stream name -> value columns (default: all numeric
+                 columns except the time column)
+        unit: Unit of numeric time columns (see ``to_seconds``)
+        **kwargs: Options of ``align_streams`` (timeline, rate, reference, method,
+                  tolerance, span)
+
+    Returns:
+        AlignedStreams with channels named '<stream>.<column>'
+    """
+    streams, names = {}, {}
+    for name, df in frames.items():
+        tcol = time_column[name] if isinstance(time_column, dict) else time_column
+        cols = (columns or {}).get(name)
+        if cols is None:
+            cols = [c for c in df.columns if c != tcol and pd.api.types.is_numeric_dtype(df[c])]
+        streams[name] = (to_seconds(df[tcol].to_numpy(), unit), df[cols].to_numpy(dtype=np.float64))
+        names[name] = [str(c) for c in cols]
+    return align_streams(streams, channel_names=names, **kwargs)
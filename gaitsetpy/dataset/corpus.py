@@ -0,0 +1,433 @@
+'''
+Memory-mapped corpus store for windowed and featurized datasets.
+
+A corpus is a directory holding one ``.npy`` file per array and a JSON manifest:
+
+    corpus/
+        manifest.json   recordings (name, subject, row range), array dtypes/shapes,
+                        channel and feature names, free-form metadata
+        windows.npy     raw windows, (N, window_size[, channels])
+        features.npy    feature matrix, (N, n_features)
+        labels.npy      window labels, (N,)
+        offsets.npy     start sample of each window within its recording, (N,)
+
+Rows of all arrays are windows, and the windows of a recording are contiguous.
+Stores open with ``np.load(mmap_mode='r')``, so processes reading the same corpus
+share the page cache, and selecting a recording or subject only touches the rows
+of that selection. ``CorpusWriter`` streams recordings to disk one at a time,
+so writing a corpus never needs it all in memory.
+
+Maintainer: @aharshit123456
+'''
+
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+
+MANIFEST_NAME = "manifest.json"
+CORPUS_ARRAYS = ('windows', 'features', 'labels', 'offsets')
+LABEL_WINDOW_NAMES = ('labels', 'annotations', 'activity_id')
+# Bytes reserved for .npy headers (a multiple of numpy's 64-byte alignment), so the
+# final shape can be written in place once all rows are known.
+_HEADER_SIZE = 256
+
+
+def _npy_header(dtype: np.dtype, shape: tuple) -> bytes:
+    header = repr({'descr': np.lib.format.dtype_to_descr(dtype), 'fortran_order': False, 'shape': shape})
+    prefix = np.lib.format.MAGIC_PREFIX + b'\x01\x00'
+    body_size = _HEADER_SIZE - len(prefix) - 2
+    if len(header) + 1 > body_size:
+        raise ValueError(f"Array header too long for shape {shape}")
+    return prefix + body_size.to_bytes(2, 'little') + header.ljust(body_size - 1).encode('latin1') + b'\n'
+
+
+class _ArrayFile:
+    """Append-only .npy file whose header is rewritten with the final row count."""
+
+    def __init__(self, path: str, dtype: np.dtype, row_shape: tuple):
+        self.path = path
+        self.dtype = dtype
+        self.row_shape = row_shape
+        self.rows = 0
+        self._file = open(path, 'wb')
+        self._file.write(_npy_header(dtype, (0,) + row_shape))
+
+    def append(self, array: np.ndarray):
+        self._file.write(np.ascontiguousarray(array, dtype=self.dtype).tobytes())
+        self.rows += len(array)
+
+    def close(self):
+        self._file.seek(0)
+        self._file.write(_npy_header(self.dtype, (self.rows,) + self.row_shape))
+        self._file.close()
+
+
+def _majority(window: np.ndarray):
+    """Most common label of a window (the smallest one on ties)."""
+    unique, counts = np.unique(window, return_counts=True)
+    return unique[np.argmax(counts)]
+
+
+def windows_to_arrays(windows: List[Dict]) -> Dict[str, Any]:
+    """
+    Stack one recording's sliding-window dictionaries into corpus arrays.
+
+    Args:
+        windows: The 'windows' list of a loader's ``create_sliding_windows`` entry,
+                 i.e. dictionaries with 'name' and 'data' of shape (n, window_size)
+
+    Returns:
+        Dictionary with 'windows' (n, window_size, channels), 'labels' (n,) when a
+        label channel ('labels', 'annotations' or 'activity_id') is present (the
+        majority label of each window), and 'channel_names'
+    """
+    channels, names, labels = [], [], None
+    for window in windows:
+        data = np.asarray(window['data'])
+        if window['name'] in LABEL_WINDOW_NAMES:
+            if labels is None:
+                labels = data if data.ndim == 1 else np.array([_majority(row) for row in data])
+            continue
+        channels.append(data)
+        names.append(window['name'])
+    result = {'windows': np.stack(channels, axis=-1) if channels else None, 'channel_names': names}
+    if labels is not None:
+        result['labels'] = labels
+    return result
+
+
+class CorpusWriter:
+    """
+    Stream recordings into a corpus directory.
+
+    Example:
+        with CorpusWriter('corpus', feature_names=names) as writer:
+            for name, subject, windows, features, labels in recordings:
+                writer.add_recording(name, windows=windows, features=features,
+                                     labels=labels, subject=subject)
+        store = writer.store
+    """
+
+    def __init__(self, path: str, feature_names: Optional[List[str]] = None,
+                 channel_names: Optional[List[str]] = None,
+                 metadata: Optional[Dict[str, Any]] = None, overwrite: bool = False):
+        """
+        Initialize the writer.
+
+        Args:
+            path: Corpus directory
+            feature_names: Names of the feature matrix columns
+            channel_names: Names of the window channels
+            metadata: JSON-serialisable metadata stored in the manifest
+            overwrite: Replace an existing corpus at ``path``
+
+        Raises:
+            FileExistsError: If a corpus exists at ``path`` and overwrite is False
+        """
+        manifest_path = os.path.join(path, MANIFEST_NAME)
+        if os.path.exists(manifest_path):
+            if not overwrite:
+                raise FileExistsError(f"A corpus already exists at {path}")
+            os.remove(manifest_path)
+        os.makedirs(path, exist_ok=True)
+        for name in CORPUS_ARRAYS:
+            if os.path.exists(os.path.join(path, f"{name}.npy")):
+                os.remove(os.path.join(path, f"{name}.npy"))
+        self.path = path
+        self.feature_names = feature_names
+        self.channel_names = channel_names
+        self.metadata = metadata or {}
+        self.recordings: List[Dict[str, Any]] = []
+        self.store: Optional['CorpusStore'] = None
+        self._files: Dict[str, _ArrayFile] = {}
+        self._rows = 0
+
+    def add_recording(self, name: str, windows: Optional[np.ndarray] = None,
+                      features: Optional[np.ndarray] = None, labels: Optional[Sequence] = None,
+                      subject: Any = None, offsets: Optional[Sequence[int]] = None):
+        """
+        Append the windows of one recording.
+
+        Every recording must provide the same arrays, with the same trailing shape
+        as the first one and a dtype that casts safely to its dtype (string labels
+        must fit the first recording's width; prefer integer label codes).
+
+        Args:
+            name: Unique recording name
+            windows: Raw windows, (n, window_size[, channels])
+            features: Feature matrix, (n, n_features)
+            labels: Window labels, (n,)
+            subject: Subject ID (JSON-serialisable)
+            offsets: Start sample of each window within the recording, (n,)
+
+        Raises:
+            ValueError: On inconsistent lengths, shapes, dtypes or a duplicate name
+        """
+        if self.store is not None:
+            raise ValueError("Writer is closed")
+        if any(rec['name'] == name for rec in self.recordings):
+            raise ValueError(f"Duplicate recording name: {name}")
+        arrays = {key: np.asarray(value) for key, value in
+                  (('windows', windows), ('features', features), ('labels', labels), ('offsets', offsets))
+                  if value is not None}
+        if not arrays:
+            raise ValueError("A recording needs at least one array")
+        lengths = {len(a) for a in arrays.values()}
+        if len(lengths) != 1:
+            raise ValueError(f"Arrays of recording {name} have different numbers of windows: {sorted(lengths)}")
+        if self.recordings and set(arrays) != set(self._files):
+            raise ValueError(f"Recording {name} has arrays {sorted(arrays)}, expected {sorted(self._files)}")
+
+        # Validate everything first so a rejected recording leaves the files untouched.
+        for key, array in arrays.items():
+            if array.dtype == object:
+                raise ValueError(f"Array '{key}' of recording {name} has object dtype")
+            handle = self._files.get(key)
+            if handle is None:
+                continue
+            if array.shape[1:] != handle.row_shape:
+                raise ValueError(f"Array '{key}' of recording {name} has row shape {array.shape[1:]}, "
+                                 f"expected {handle.row_shape}")
+            if np.result_type(array.dtype, handle.dtype) != handle.dtype:
+                raise ValueError(f"Array '{key}' of recording {name} has dtype {array.dtype}, expected {handle.dtype}")
+        for key, array in arrays.items():
+            if key not in self._files:
+                self._files[key] = _ArrayFile(os.path.join(self.path, f"{key}.npy"), array.dtype, array.shape[1:])
+            self._files[key].append(array)
+
+        n = lengths.pop()
+        if isinstance(subject, np.generic):
+            subject = subject.item()
+        self.recordings.append({'name': name, 'subject': subject, 'start': self._rows, 'stop': self._rows + n})
+        self._rows += n
+
+    def add_windows(self, entry: Dict, subject: Any = None, features: Optional[np.ndarray] = None,
+                    offsets: Optional[Sequence[int]] = None):
+        """
+        Append a recording given as a ``create_sliding_windows`` entry.
+
+        Args:
+            entry: Dictionary with 'name' and 'windows' (see ``windows_to_arrays``)
+            subject: Subject ID
+            features: Optional feature matrix for the windows
+            offsets: Optional window start samples
+        """
+        arrays = windows_to_arrays(entry['windows'])
+        if self.channel_names is None:
+            self.channel_names = arrays['channel_names']
+        self.add_recording(entry['name'], windows=arrays['windows'], features=features,
+                           labels=arrays.get('labels'), subject=subject, offsets=offsets)
+
+    def close(self) -> 'CorpusStore':
+        """
+        Finalise the array headers, write the manifest and open the store.
+
+        Returns:
+            CorpusStore opened read-only
+        """
+        if self.store is not None:
+            return self.store
+        for handle in self._files.values():
+            handle.close()
+        manifest = {
+            'version': 1,
+            'n_windows': self._rows,
+            'arrays': {key: {'dtype': np.lib.format.dtype_to_descr(h.dtype), 'row_shape': list(h.row_shape)}
+                       for key, h in self._files.items()},
+            'feature_names': self.feature_names,
+            'channel_names': self.channel_names,
+            'recordings': self.recordings,
+            'metadata': self.metadata,
+        }
+        tmp_path = os.path.join(self.path, MANIFEST_NAME + ".part")
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f, indent=1, default=str)
+        # The manifest is written last: a corpus without one is incomplete.
+        os.replace(tmp_path, os.path.join(self.path, MANIFEST_NAME))
+        self.store = CorpusStore(self.path)
+        return self.store
+
+    def __enter__(self) -> 'CorpusWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            for handle in self._files.values():
+                handle.close()
+
+
+class CorpusStore:
+    """
+    Read-only, memory-mapped view of a corpus directory.
+
+    Arrays are exposed as attributes (``windows``, ``features``, ``labels``,
+    ``offsets``; None when the corpus has no such array). ``recording`` and
+    ``subject`` return the rows of one selection without reading the others.
+    """
+
+    def __init__(self, path: str, mmap_mode: Optional[str] = 'r'):
+        """
+        Open a corpus.
+
+        Args:
+            path: Corpus directory
+            mmap_mode: ``np.load`` memory-map mode ('r' to share pages read-only,
+                       None to load the arrays into memory)
+
+        Raises:
+            FileNotFoundError: If ``path`` holds no complete corpus
+        """
+        manifest_path = os.path.join(path, MANIFEST_NAME)
+        if not os.path.exists(manifest_path):
+            raise FileNotFoundError(f"No corpus manifest at {manifest_path}")
+        with open(manifest_path) as f:
+            self.manifest = json.load(f)
+        self.path = path
+        self.recordings: List[Dict[str, Any]] = self.manifest['recordings']
+        self.feature_names: Optional[List[str]] = self.manifest.get('feature_names')
+        self.channel_names: Optional[List[str]] = self.manifest.get('channel_names')
+        self.metadata: Dict[str, Any] = self.manifest.get('metadata', {})
+        self._by_name = {rec['name']: rec for rec in self.recordings}
+        for key in CORPUS_ARRAYS:
+            array = None
+            if key in self.manifest['arrays']:
+                array = np.load(os.path.join(path, f"{key}.npy"), mmap_mode=mmap_mode)
+            setattr(self, key, array)
+
+    def __len__(self) -> int:
+        return self.manifest['n_windows']
+
+    @property
+    def subjects(self) -> List[Any]:
+        """Distinct subject IDs, in order of first appearance."""
+        return list(dict.fromkeys(rec['subject'] for rec in self.recordings))
+
+    def groups(self, by: str = 'subject') -> np.ndarray:
+        """
+        Group label of every window, e.g. for grouped cross-validation.
+
+        Args:
+            by: 'subject' or 'recording'
+
+        Returns:
+            Array of length N with the subject ID or recording index per window
+        """
+        if by not in ('subject', 'recording'):
+            raise ValueError("by must be 'subject' or 'recording'")
+        keys = [rec['subject'] for rec in self.recordings] if by == 'subject' else list(range(len(self.recordings)))
+        counts = [rec['stop'] - rec['start'] for rec in self.recordings]
+        return np.repeat(np.asarray(keys), counts)
+
+    def rows(self, recordings: Optional[Iterable[str]] = None,
+             subjects: Optional[Iterable[Any]] = None) -> np.ndarray:
+        """
+        Row indices of the selected recordings and/or subjects, in corpus order.
+
+        Args:
+            recordings: Recording names
+            subjects: Subject IDs
+
+        Returns:
+            Sorted int64 array of row indices
+
+        Raises:
+            KeyError: If a recording name is unknown
+        """
+        names = set()
+        if recordings is not None:
+            names.update(self._by_name[name]['name'] for name in recordings)
+        if subjects is not None:
+            wanted = set(subjects)
+            names.update(rec['name'] for rec in self.recordings if rec['subject'] in wanted)
+        ranges = [np.arange(rec['start'], rec['stop']) for rec in self.recordings if rec['name'] in names]
+        return np.concatenate(ranges) if ranges else np.empty(0, dtype=np.int64)
+
+    def take(self, rows: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Gather rows of every array (reads only those rows).
+
+        Args:
+            rows: Row indices
+
+        Returns:
+            Dictionary of arrays keyed by array name (memory-mapped views when the
+            rows are one contiguous range, in-memory copies otherwise)
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        if len(rows) and np.all(np.diff(rows) == 1):
+            return self._slice(int(rows[0]), int(rows[-1]) + 1)
+        return {key: np.asarray(getattr(self, key)[rows]) for key in CORPUS_ARRAYS
+                if getattr(self, key) is not None}
+
+    def _slice(self, start: int, stop: int) -> Dict[str, np.ndarray]:
+        return {key: getattr(self, key)[start:stop] for key in CORPUS_ARRAYS if getattr(self, key) is not None}
+
+    def recording(self, name: str) -> Dict[str, np.ndarray]:
+        """
+        Arrays of one recording as memory-mapped views.
+
+        Args:
+            name: Recording name
+
+        Returns:
+            Dictionary of arrays keyed by array name
+
+        Raises:
+            KeyError: If the recording is unknown
+        """
+        rec = self._by_name[name]
+        return self._slice(rec['start'], rec['stop'])
+
+    def subject(self, subject: Any) -> Dict[str, np.ndarray]:
+        """
+        Arrays of all recordings of one subject.
+
+        Args:
+            subject: Subject ID
+
+        Returns:
+            Dictionary of arrays keyed by array name (views when the subject's
+            recordings are contiguous)
+        """
+        return self.take(self.rows(subjects=[subject]))
+
+
+def write_corpus(path: str, recordings: Iterable[Dict[str, Any]], **kwargs) -> CorpusStore:
+    """
+    Write recordings to a corpus directory.
+
+    Args:
+        path: Corpus directory
+        recordings: Dictionaries with 'name' and any of 'windows', 'features',
+                    'labels', 'subject', 'offsets'
+        **kwargs: CorpusWriter options (feature_names, channel_names, metadata,
+                  overwrite)
+
+    Returns:
+        CorpusStore opened read-only
+    """
+    with CorpusWriter(path, **kwargs) as writer:
+        for rec in recordings:
+            writer.add_recording(rec['name'], windows=rec.get('windows'), features=rec.get('features'),
+                                 labels=rec.get('labels'), subject=rec.get('subject'),
+                                 offsets=rec.get('offsets'))
+    return writer.store
+
+
+def open_corpus(path: str, mmap_mode: Optional[str] = 'r') -> CorpusStore:
+    """
+    Open a corpus directory.
+
+    Args:
+        path: Corpus directory
+        mmap_mode: ``np.load`` memory-map mode (None loads into memory)
+
+    Returns:
+        CorpusStore
+    """
+    return CorpusStore(path, mmap_mode=mmap_mode)
@@ -11,7 +11,40 @@ import numpy as np
 from typing import List, Dict, Tuple
 from glob import glob
 from ..core.base_classes import BaseDatasetLoader
+from ..core.precision import cast_frame, float_dtype
 from .utils import download_dataset, extract_dataset, sliding_window
+from .archives import iter_members
+
+
+COLUMN_NAMES = [
+    "time", "shank_h_fd", "shank_v", "shank_h_l", 
+    "thigh_h_fd", "thigh_v", "thigh_h_l", 
+    "trunk_h_fd", "trunk_v", "trunk_h_l", "annotations"
+]
+
+# Subject recordings inside daphnet.zip (dataset_fog_release/dataset/S*.txt)
+ARCHIVE_PATTERN = "*dataset/S*.txt"
+
+
+def _read_subject(source) -> pd.DataFrame:
+    """Parse one subject recording from a path or a binary stream."""
+    # Sensor columns are parsed straight into the precision policy dtype and the
+    # annotation codes (0, 1, 2) are kept as int8
+    dtype = {name: float_dtype() for name in COLUMN_NAMES[1:-1]}
+    df = cast_frame(pd.read_csv(source, sep=" ", names=COLUMN_NAMES, dtype=dtype), int_columns=["annotations"])
+    
+    # Set time as index
+    df = df.set_index("time")
+    
+    # Calculate magnitude for each sensor
+    df["thigh"] = np.sqrt(df["thigh_h_l"]**2 + df["thigh_v"]**2 + df["thigh_h_fd"]**2)
+    df["shank"] = np.sqrt(df["shank_h_l"]**2 + df["shank_v"]**2 + df["shank_h_fd"]**2)
+    df["trunk"] = np.sqrt(df["trunk_h_l"]**2 + df["trunk_v"]**2 + df["trunk_h_fd"]**2)
+    
+    # Reorder columns for consistency
+    return df[["shank", "shank_h_fd", "shank_v", "shank_h_l", 
+               "thigh", "thigh_h_fd", "thigh_v", "thigh_h_l", 
+               "trunk", "trunk_h_fd", "trunk_v", "trunk_h_l", "annotations"]]
 
 
 class DaphnetLoader(BaseDatasetLoader):
@@ -44,54 +77,39 @@ class DaphnetLoader(BaseDatasetLoader):
             }
         }
     
-    def load_data(self, data_dir: str, **kwargs) -> Tuple[List[pd.DataFrame], List[str]]:
+    def load_data(self, data_dir: str, from_archive: bool = True, **kwargs) -> Tuple[List[pd.DataFrame], List[str]]:
         """
         Load Daphnet dataset from the specified directory.
         
         Args:
             data_dir: Directory to store/find the dataset
+            from_archive: Parse the subject files straight from daphnet.zip instead of
+                extracting it first (default: True); falls back to extracting when the
+                archive is missing
             **kwargs: Additional arguments (unused for Daphnet)
             
         Returns:
             Tuple of (data_list, names_list)
         """
-        # Download and extract if needed
+        # Download if needed
         download_dataset("daphnet", data_dir)
-        extract_dataset("daphnet", data_dir)
         
-        file_path = os.path.join(data_dir, "dataset_fog_release/dataset")
         daphnet_data = []
         daphnet_names = []
         
-        # Load all subject files
-        for file in sorted(glob(os.path.join(file_path, "S*.txt"))):
-            # Extract filename from path
-            filename = os.path.basename(file)
-            daphnet_names.append(filename)
-            
-            # Load CSV with proper column names
-            column_names = [
-                "time", "shank_h_fd", "shank_v", "shank_h_l", 
-                "thigh_h_fd", "thigh_v", "thigh_h_l", 
-                "trunk_h_fd", "trunk_v", "trunk_h_l", "annotations"
-            ]
-            
-            df = pd.read_csv(file, sep=" ", names=column_names)
-            
-            # Set time as index
-            df = df.set_index("time")
-            
-            # Calculate magnitude for each sensor
-            df["thigh"] = np.sqrt(df["thigh_h_l"]**2 + df["thigh_v"]**2 + df["thigh_h_fd"]**2)
-            df["shank"] = np.sqrt(df["shank_h_l"]**2 + df["shank_v"]**2 + df["shank_h_fd"]**2)
-            df["trunk"] = np.sqrt(df["trunk_h_l"]**2 + df["trunk_v"]**2 + df["trunk_h_fd"]**2)
-            
-            # Reorder columns for consistency
-            df = df[["shank", "shank_h_fd", "shank_v", "shank_h_l", 
-                    "thigh", "thigh_h_fd", "thigh_v", "thigh_h_l", 
-                    "trunk", "trunk_h_fd", "trunk_v", "trunk_h_l", "annotations"]]
+        zip_path = os.path.join(data_dir, "daphnet.zip")
+        if from_archive and os.path.exists(zip_path):
+            for member, stream in iter_members(zip_path, ARCHIVE_PATTERN):
+                daphnet_names.append(os.path.basename(member))
+                daphnet_data.append(_read_subject(stream))
+        else:
+            extract_dataset("daphnet", data_dir)
+            file_path = os.path.join(data_dir, "dataset_fog_release/dataset")
             
-            daphnet_data.append(df)
+            # Load all subject files
+            for file in sorted(glob(os.path.join(file_path, "S*.txt"))):
+                daphnet_names.append(os.path.basename(file))
+                daphnet_data.append(_read_subject(file))
         
         # Store loaded data
         self.data = daphnet_data
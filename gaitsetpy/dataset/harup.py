@@ -18,10 +18,24 @@ from glob import glob
 import datetime
 from tqdm import tqdm
 from ..core.base_classes import BaseDatasetLoader
+from ..core.precision import cast_frame
 from .utils import download_dataset, extract_dataset, sliding_window
+from .alignment import AlignedStreams, align_streams, to_seconds
 from ..features.harup_features import HARUPFeatureExtractor
 
 
+# Column prefixes of the sensor streams sharing a HAR-UP CSV; each stream is only
+# valid on the rows where all of its columns are present.
+STREAM_PREFIXES = {
+    'eeg': 'EEG_',
+    'belt': 'Belt_',
+    'neck': 'Neck_',
+    'pocket': 'Pocket_',
+    'wrist': 'Wrist_',
+    'infrared': 'Infrared_',
+}
+
+
 class HARUPLoader(BaseDatasetLoader):
     """
     HAR-UP dataset loader class.
@@ -198,11 +212,11 @@ class HARUPLoader(BaseDatasetLoader):
                     name = f"{subject_folder}_{activity_folder}_T{trial_id:02d}"
                     
                     try:
-                        df = pd.read_csv(file_path, header=0)
+                        df = cast_frame(pd.read_csv(file_path, header=0))
                         print(f"[HARUP] Loaded columns for {file_name}: {list(df.columns)}")
-                        df['subject_id'] = subject_id
-                        df['activity_id'] = activity_id 
-                        df['trial_id'] = trial_id
+                        df['subject_id'] = np.int8(subject_id)
+                        df['activity_id'] = np.int8(activity_id)
+                        df['trial_id'] = np.int8(trial_id)
                         df['activity_label'] = self.metadata['activities'].get(activity_id, f"A{activity_id:02d}")
                         
                         # Concatenate to subject's DataFrame
@@ -254,12 +268,12 @@ class HARUPLoader(BaseDatasetLoader):
             for col in sensor_columns:
                 if col not in processed_columns:
                     
-                    window_data = sliding_window(df[col], window_size, step_size)
+                    window_data = sliding_window(df[col].to_numpy(), window_size, step_size)
                     windows.append({"name": col, "data": window_data})
                     processed_columns.add(col)
             
             # Include activity ID for each window
-            activity_windows = sliding_window(df["activity_id"], window_size, step_size)
+            activity_windows = sliding_window(df["activity_id"].to_numpy(), window_size, step_size)
             windows.append({"name": "activity_id", "data": activity_windows})
             
             # For each window, take the most common activity ID as the label
@@ -362,6 +376,51 @@ class HARUPLoader(BaseDatasetLoader):
             all_features.append({"name": name, "features": features})
         return all_features
     
+    def align_trial(self, df: pd.DataFrame, activity_id: Optional[int] = None,
+                    trial_id: Optional[int] = None, rate: Optional[float] = None,
+                    method: str = 'nearest', tolerance: Optional[float] = None,
+                    time_column: str = "Timestamp",
+                    stream_prefixes: Optional[Dict[str, str]] = None) -> AlignedStreams:
+        """
+        Align the sensor streams of one HAR-UP trial on a common timeline.
+        
+        Args:
+            df: Loaded HAR-UP DataFrame (a subject's DataFrame can be narrowed to one
+                trial with ``activity_id`` and ``trial_id``)
+            activity_id: Activity to select, if ``df`` holds several
+            trial_id: Trial to select, if ``df`` holds several
+            rate: Resampling rate in Hz (default: the trial's own timestamps)
+            method: 'nearest', 'previous' or 'linear'
+            tolerance: Largest distance to a matched sample in seconds (or largest
+                       bracketing gap for 'linear')
+            time_column: Name of the timestamp column
+            stream_prefixes: Stream name -> column prefix (default: STREAM_PREFIXES)
+            
+        Returns:
+            AlignedStreams with one validity mask per sensor stream
+        """
+        if activity_id is not None:
+            df = df[df['activity_id'] == activity_id]
+        if trial_id is not None:
+            df = df[df['trial_id'] == trial_id]
+        times = to_seconds(df[time_column].to_numpy())
+        
+        streams, names = {}, {}
+        for stream, prefix in (stream_prefixes or STREAM_PREFIXES).items():
+            cols = [c for c in df.columns if str(c).startswith(prefix)]
+            if not cols:
+                continue
+            values = df[cols].to_numpy(dtype=np.float64)
+            present = ~np.isnan(values).any(axis=1)
+            streams[stream] = (times[present], values[present])
+            names[stream] = [str(c)[len(prefix):] for c in cols]
+        if not streams:
+            raise ValueError("No sensor columns found in the HAR-UP data")
+        
+        timeline = None if rate is not None else np.unique(times)
+        return align_streams(streams, timeline=timeline, rate=rate, method=method,
+                             tolerance=tolerance, span='union', channel_names=names)
+    
     def get_supported_formats(self) -> List[str]:
         """
         Get list of supported file formats for HAR-UP dataset.
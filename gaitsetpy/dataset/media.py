@@ -0,0 +1,259 @@
+'''
+Lazy frame reader for image and video modalities.
+
+FrameReader yields the frames of one recording one at a time instead of decoding
+the whole sequence up front. Sources:
+- zip archive of PNG frames (UrFall depth PNG16 / RGB sequences), read member by
+  member without extracting
+- directory of PNG frames (extracted archives)
+- video file (UrFall MP4), when OpenCV is installed
+
+Frames can be subsampled (``stride``, skipped frames are never decompressed;
+for video they are grabbed without being converted), cropped to a region of
+interest and decoded ahead in a background thread with a bounded queue.
+
+Maintainer: @aharshit123456
+'''
+
+import io
+import os
+import queue
+import threading
+import zipfile
+from glob import glob
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .archives import list_members
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    Image = None
+    PIL_AVAILABLE = False
+
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    cv2 = None
+    CV2_AVAILABLE = False
+
+
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov')
+
+_END = object()
+
+
+def _decode_png(data, roi: Optional[Tuple[int, int, int, int]], grayscale: bool) -> np.ndarray:
+    """Decode one PNG (path or bytes) to uint16 (depth) or uint8 (RGB/gray) array."""
+    if not PIL_AVAILABLE:
+        raise ImportError("Reading PNG frames requires Pillow. Please install Pillow to use this reader.")
+    with Image.open(io.BytesIO(data) if isinstance(data, bytes) else data) as img:
+        if roi is not None:
+            top, bottom, left, right = roi
+            img = img.crop((left, top, right, bottom))
+        if img.mode in ('I;16', 'I;16B', 'I;16L'):
+            return np.asarray(img, dtype=np.uint16)
+        if img.mode == 'I':
+            # 16-bit PNGs are sometimes opened as 32-bit integer images.
+            return np.asarray(img).astype(np.uint16)
+        if grayscale and img.mode != 'L':
+            img = img.convert('L')
+        elif not grayscale and img.mode not in ('L', 'RGB'):
+            img = img.convert('RGB')
+        return np.asarray(img)
+
+
+class FrameReader:
+    """
+    Lazy, iterable frame source for a single recording.
+
+    Each iteration decodes the frames again from the source, so a reader can be
+    passed around (e.g. as the 'data' of a media window) without holding frames in
+    memory.
+
+    Example:
+        reader = FrameReader('fall-01-cam0-d.zip', stride=2, roi=(100, 400, 0, 640), prefetch=8)
+        for frame in reader:
+            ...
+    """
+
+    def __init__(self, source: str, stride: int = 1, start: int = 0, stop: Optional[int] = None,
+                 roi: Optional[Tuple[int, int, int, int]] = None, grayscale: bool = False,
+                 prefetch: int = 0, pattern: str = '*.png'):
+        """
+        Initialize the reader.
+
+        Args:
+            source: Zip archive of frames, directory of frames, or video file
+            stride: Keep every ``stride``-th frame
+            start: Index of the first frame (before striding)
+            stop: Index after the last frame, or None for the end of the recording
+            roi: Region of interest ``(top, bottom, left, right)`` in pixels
+            grayscale: Convert colour frames to 8-bit grayscale while decoding
+            prefetch: Number of frames decoded ahead in a background thread
+                      (0 decodes in the calling thread)
+            pattern: Shell-style pattern selecting the frame files of archives and
+                     directories
+        """
+        if stride < 1:
+            raise ValueError("stride must be at least 1")
+        if prefetch < 0:
+            raise ValueError("prefetch must be non-negative")
+        if roi is not None:
+            top, bottom, left, right = roi
+            if not (0 <= top < bottom and 0 <= left < right):
+                raise ValueError("roi must be (top, bottom, left, right) with top < bottom and left < right")
+        if not os.path.exists(source):
+            raise FileNotFoundError(f"Frame source not found: {source}")
+        self.source = source
+        self.stride = stride
+        self.start = start
+        self.stop = stop
+        self.roi = roi
+        self.grayscale = grayscale
+        self.prefetch = prefetch
+        self.pattern = pattern
+
+        if os.path.isdir(source):
+            self.kind = 'directory'
+        elif zipfile.is_zipfile(source):
+            self.kind = 'zip'
+        elif source.lower().endswith(VIDEO_EXTENSIONS):
+            self.kind = 'video'
+        else:
+            raise ValueError(f"Unsupported frame source: {source}")
+        self._names: Optional[List[str]] = None
+
+    @property
+    def frame_names(self) -> List[str]:
+        """Names of the selected frames (archive members or file paths)."""
+        if self.kind == 'video':
+            raise TypeError("Video frames have no names")
+        if self._names is None:
+            if self.kind == 'zip':
+                names = [info.filename for info in list_members(self.source, self.pattern)]
+            else:
+                names = sorted(glob(os.path.join(self.source, self.pattern), recursive=True))
+            self._names = names[self.start:self.stop:self.stride]
+        return self._names
+
+    def __len__(self) -> int:
+        if self.kind != 'video':
+            return len(self.frame_names)
+        if not CV2_AVAILABLE:
+            raise ImportError("Reading video frames requires OpenCV. Please install opencv-python to use this reader.")
+        capture = cv2.VideoCapture(self.source)
+        try:
+            total = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        finally:
+            capture.release()
+        return len(range(total)[self.start:self.stop:self.stride])
+
+    def _iter_images(self) -> Iterator[np.ndarray]:
+        if self.kind == 'zip':
+            with zipfile.ZipFile(self.source, 'r') as zf:
+                for name in self.frame_names:
+                    yield _decode_png(zf.read(name), self.roi, self.grayscale)
+        else:
+            for path in self.frame_names:
+                yield _decode_png(path, self.roi, self.grayscale)
+
+    def _iter_video(self) -> Iterator[np.ndarray]:
+        if not CV2_AVAILABLE:
+            raise ImportError("Reading video frames requires OpenCV. Please install opencv-python to use this reader.")
+        capture = cv2.VideoCapture(self.source)
+        if not capture.isOpened():
+            raise IOError(f"Could not open video: {self.source}")
+        try:
+            index = 0
+            while self.stop is None or index < self.stop:
+                keep = index >= self.start and (index - self.start) % self.stride == 0
+                if not keep:
+                    # grab() demuxes and decodes without the colour conversion of retrieve().
+                    if not capture.grab():
+                        break
+                    index += 1
+                    continue
+                ok, frame = capture.read()
+                if not ok:
+                    break
+                if self.roi is not None:
+                    top, bottom, left, right = self.roi
+                    frame = frame[top:bottom, left:right]
+                if self.grayscale:
+                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                else:
+                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                yield frame
+                index += 1
+        finally:
+            capture.release()
+
+    def _decode(self) -> Iterator[np.ndarray]:
+        return self._iter_video() if self.kind == 'video' else self._iter_images()
+
+    def _prefetched(self) -> Iterator[np.ndarray]:
+        """Decode in a background thread, at most ``prefetch`` frames ahead."""
+        frames: queue.Queue = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    frames.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def producer():
+            try:
+                for frame in self._decode():
+                    if not put(frame):
+                        return
+                put(_END)
+            except BaseException as e:  # re-raised in the consumer
+                put(e)
+
+        thread = threading.Thread(target=producer, daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = frames.get()
+                if item is _END:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # Also runs when the consumer stops early: release the producer.
+            stop.set()
+            thread.join()
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return self._prefetched() if self.prefetch else self._decode()
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[np.ndarray]:
+        """
+        Iterate over consecutive frames stacked into ``(T, H, W[, C])`` arrays.
+
+        Args:
+            chunk_size: Number of frames per chunk (the last chunk may be shorter)
+
+        Yields:
+            Stacked frame arrays
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        chunk = []
+        for frame in self:
+            chunk.append(frame)
+            if len(chunk) == chunk_size:
+                yield np.stack(chunk)
+                chunk = []
+        if chunk:
+            yield np.stack(chunk)
@@ -18,6 +18,7 @@ import requests
 from tqdm import tqdm
 import zipfile
 from ..core.base_classes import BaseDatasetLoader
+from ..core.precision import cast_frame
 from .utils import sliding_window
 
 
@@ -194,8 +195,8 @@ class PhysioNetLoader(BaseDatasetLoader):
                 
                 df.columns = col_names
                 
-                # Set time as index
-                df = df.set_index('time')
+                # Set time as index; sensor columns follow the precision policy
+                df = cast_frame(df.set_index('time'))
                 
                 # Add subject metadata
                 df['subject_type'] = subject_type
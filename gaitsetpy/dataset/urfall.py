@@ -11,13 +11,78 @@ Reference:
 - Dataset: University of Rzeszow Fall Detection Dataset
 '''
 
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Tuple, Optional, Set
+from typing import List, Dict, Iterator, Tuple, Optional, Set
 from glob import glob
 from ..core.base_classes import BaseDatasetLoader
 from .utils import download_dataset, extract_dataset, sliding_window
+from .archives import iter_members
+from .media import FrameReader
+from .alignment import AlignedStreams, align_streams
+
+
+FEATURE_DTYPES = {
+    'sequence_name': str,
+    'frame_number': 'int32',
+    'label': 'int8',
+    'HeightWidthRatio': 'float64',
+    'MajorMinorRatio': 'float64',
+    'BoundingBoxOccupancy': 'float64',
+    'MaxStdXZ': 'float64',
+    'HHmaxRatio': 'float64',
+    'H': 'float64',
+    'D': 'float64',
+    'P40': 'float64',
+}
+
+FEATURE_FILES = {
+    'fall': "urfall-cam0-falls.csv",
+    'adl': "urfall-cam0-adls.csv",
+}
+
+INDEX_CACHE_DIR = ".gaitsetpy_cache"
+
+
+def build_sequence_index(sequence_names) -> Dict[str, List[List[int]]]:
+    """
+    Map each sequence name to the row ranges it occupies.
+
+    Args:
+        sequence_names: Sequence name of every row, in file order
+
+    Returns:
+        Dictionary mapping sequence names to lists of [start, stop) row ranges
+        (one range when the sequence's rows are contiguous)
+    """
+    values = np.asarray(sequence_names, dtype=object)
+    if len(values) == 0:
+        return {}
+    bounds = np.flatnonzero(values[1:] != values[:-1]) + 1
+    starts = np.concatenate([[0], bounds])
+    stops = np.concatenate([bounds, [len(values)]])
+    index: Dict[str, List[List[int]]] = {}
+    for start, stop in zip(starts.tolist(), stops.tolist()):
+        index.setdefault(str(values[start]), []).append([start, stop])
+    return index
+
+
+def _file_signature(path: str) -> Dict[str, int]:
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _rows_are_lines(path: str, n_rows: int) -> bool:
+    """Whether row i of the parsed CSV is line i of the file (no blank lines)."""
+    n_lines, last = 0, b'\n'
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            n_lines += block.count(b'\n')
+            last = block[-1:]
+    return n_lines + (last != b'\n') == n_rows
 
 
 class UrFallLoader(BaseDatasetLoader):
@@ -77,6 +142,9 @@ class UrFallLoader(BaseDatasetLoader):
                 'P40': 'Ratio of point clouds in 40cm cuboid to full height cuboid'
             }
         }
+        # Parsed feature CSVs with their sequence index, keyed by path and
+        # invalidated when the file's size or modification time changes.
+        self._feature_cache: Dict[str, Dict] = {}
     
     def load_data(self, data_dir: str, 
                   data_types: Optional[List[str]] = None,
@@ -145,11 +213,130 @@ class UrFallLoader(BaseDatasetLoader):
         self.data = data_list
         return data_list, names_list
     
+    def _sequence_list(self, sequences: Optional[List[str]], use_falls: bool,
+                       use_adls: bool) -> List[str]:
+        """Sequences to load: the explicit list, or all falls and/or ADLs."""
+        if sequences is not None:
+            return list(sequences)
+        seq_list = []
+        if use_falls:
+            seq_list.extend([f"fall-{i:02d}" for i in self.metadata['fall_sequences']])
+        if use_adls:
+            seq_list.extend([f"adl-{i:02d}" for i in self.metadata['adl_sequences']])
+        return seq_list
+    
+    def _index_path(self, csv_path: str) -> str:
+        data_dir, name = os.path.split(csv_path)
+        return os.path.join(data_dir, INDEX_CACHE_DIR, f"{os.path.splitext(name)[0]}.index.json")
+    
+    def _read_feature_csv(self, csv_path: str) -> Dict:
+        """
+        Parse a features CSV with typed columns, once per file version.
+        
+        The parsed frame and its sequence index are kept in the loader cache, and the
+        index is also written next to the data so later processes can read single
+        sequences without parsing the whole file.
+        """
+        key = os.path.abspath(csv_path)
+        signature = _file_signature(csv_path)
+        entry = self._feature_cache.get(key)
+        if entry is not None and entry['signature'] == signature:
+            return entry
+        
+        df = pd.read_csv(csv_path, header=None, names=self.metadata['feature_columns'],
+                         dtype=FEATURE_DTYPES, engine='c')
+        entry = {
+            'signature': signature,
+            'frame': df,
+            'index': build_sequence_index(df['sequence_name']),
+            'rows_are_lines': _rows_are_lines(csv_path, len(df)),
+        }
+        self._feature_cache[key] = entry
+        self._write_index(csv_path, entry)
+        return entry
+    
+    def _write_index(self, csv_path: str, entry: Dict):
+        index_path = self._index_path(csv_path)
+        payload = {key: entry[key] for key in ('signature', 'index', 'rows_are_lines')}
+        try:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            tmp_path = index_path + ".part"
+            with open(tmp_path, 'w') as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            print(f"Warning: Could not write sequence index {index_path}: {e}")
+    
+    def _read_persisted_index(self, csv_path: str) -> Optional[Dict]:
+        """Persisted index of a features CSV, or None if missing or stale."""
+        try:
+            with open(self._index_path(csv_path)) as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if payload.get('signature') != _file_signature(csv_path):
+            return None
+        return payload
+    
+    def get_sequence_index(self, data_dir: str, activity_type: str = 'fall') -> Dict[str, List[List[int]]]:
+        """
+        Get the sequence -> row-range index of a features CSV.
+        
+        Args:
+            data_dir: Directory containing the dataset
+            activity_type: 'fall' or 'adl'
+            
+        Returns:
+            Dictionary mapping sequence names to lists of [start, stop) row ranges
+        """
+        if activity_type not in FEATURE_FILES:
+            raise ValueError(f"activity_type must be one of: {list(FEATURE_FILES)}. Got: {activity_type}")
+        csv_path = os.path.join(data_dir, FEATURE_FILES[activity_type])
+        persisted = self._read_persisted_index(csv_path)
+        if persisted is not None:
+            return persisted['index']
+        return self._read_feature_csv(csv_path)['index']
+    
+    def _select_feature_rows(self, csv_path: str, wanted: Optional[List[str]]) -> pd.DataFrame:
+        """
+        Rows of a features CSV, restricted to the wanted sequences (in file order).
+        
+        With a warm loader cache the selection is an index lookup; in a fresh loader
+        with a persisted index, only the selected line ranges are parsed.
+        """
+        cached = self._feature_cache.get(os.path.abspath(csv_path))
+        if wanted is not None and (cached is None or cached['signature'] != _file_signature(csv_path)):
+            persisted = self._read_persisted_index(csv_path)
+            if persisted is not None and persisted['rows_are_lines']:
+                ranges = sorted(r for seq in wanted for r in persisted['index'].get(seq, []))
+                parts = [pd.read_csv(csv_path, header=None, names=self.metadata['feature_columns'],
+                                     dtype=FEATURE_DTYPES, skiprows=start, nrows=stop - start)
+                         for start, stop in ranges]
+                if not parts:
+                    return pd.read_csv(csv_path, header=None, names=self.metadata['feature_columns'],
+                                       dtype=FEATURE_DTYPES, nrows=0)
+                df = pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+                # Same row labels as filtering the full frame would give.
+                df.index = np.concatenate([np.arange(start, stop) for start, stop in ranges])
+                return df
+        
+        entry = self._read_feature_csv(csv_path)
+        df = entry['frame']
+        if wanted is None:
+            return df.copy()
+        ranges = sorted(r for seq in wanted for r in entry['index'].get(seq, []))
+        rows = np.concatenate([np.arange(start, stop) for start, stop in ranges]) if ranges \
+            else np.empty(0, dtype=np.intp)
+        return df.iloc[rows].copy()
+    
     def _load_features(self, data_dir: str, sequences: Optional[List[str]], 
                        use_falls: bool, use_adls: bool) -> Tuple[List[pd.DataFrame], List[str]]:
         """
         Load pre-extracted features from CSV files.
         
+        Each CSV is parsed once per loader (with typed columns) and filtered by
+        sequence through its sequence -> row-range index.
+        
         Args:
             data_dir: Directory containing the dataset
             sequences: Specific sequences to load
@@ -162,48 +349,72 @@ class UrFallLoader(BaseDatasetLoader):
         data_list = []
         names_list = []
         
-        # Load falls features
-        if use_falls:
-            falls_csv = os.path.join(data_dir, "urfall-cam0-falls.csv")
-            if os.path.exists(falls_csv):
-                df = pd.read_csv(falls_csv, header=None, names=self.metadata['feature_columns'])
-                
-                # Filter by specific sequences if provided
-                if sequences is not None:
-                    fall_sequences = [s for s in sequences if s.startswith('fall-')]
-                    if fall_sequences:
-                        df = df[df['sequence_name'].isin(fall_sequences)]
-                
-                # Add metadata columns
-                df['activity_type'] = 'fall'
-                df['activity_id'] = 1  # Falls are labeled as 1
-                
-                data_list.append(df)
-                names_list.append("urfall-cam0-falls")
-            else:
-                print(f"Warning: Falls features file not found at {falls_csv}")
+        for activity_type, use, activity_id in (('fall', use_falls, 1), ('adl', use_adls, 0)):
+            if not use:
+                continue
+            csv_path = os.path.join(data_dir, FEATURE_FILES[activity_type])
+            if not os.path.exists(csv_path):
+                label = 'Falls' if activity_type == 'fall' else 'ADLs'
+                print(f"Warning: {label} features file not found at {csv_path}")
+                continue
+            
+            # Filter by specific sequences if provided
+            wanted = None
+            if sequences is not None:
+                wanted = [s for s in sequences if s.startswith(f'{activity_type}-')] or None
+            df = self._select_feature_rows(csv_path, wanted)
+            
+            # Add metadata columns
+            df['activity_type'] = activity_type
+            df['activity_id'] = activity_id  # Falls are labeled as 1, ADLs as 0
+            
+            data_list.append(df)
+            names_list.append(os.path.splitext(FEATURE_FILES[activity_type])[0])
         
-        # Load ADLs features
-        if use_adls:
-            adls_csv = os.path.join(data_dir, "urfall-cam0-adls.csv")
-            if os.path.exists(adls_csv):
-                df = pd.read_csv(adls_csv, header=None, names=self.metadata['feature_columns'])
-                
-                # Filter by specific sequences if provided
-                if sequences is not None:
-                    adl_sequences = [s for s in sequences if s.startswith('adl-')]
-                    if adl_sequences:
-                        df = df[df['sequence_name'].isin(adl_sequences)]
-                
-                # Add metadata columns
-                df['activity_type'] = 'adl'
-                df['activity_id'] = 0  # ADLs are labeled as 0
-                
-                data_list.append(df)
-                names_list.append("urfall-cam0-adls")
-            else:
-                print(f"Warning: ADLs features file not found at {adls_csv}")
+        return data_list, names_list
+    
+    def _load_sequence_files(self, data_dir: str, seq_list: List[str], suffix: str,
+                             kind: str) -> Tuple[List[pd.DataFrame], List[str]]:
+        """
+        Parse per-sequence CSV files on a thread pool, keeping the sequence order.
         
+        Args:
+            data_dir: Directory containing the dataset
+            seq_list: Sequence names
+            suffix: File name suffix after the sequence name (e.g. '-acc.csv')
+            kind: Data kind used in names and warnings (e.g. 'accelerometer')
+            
+        Returns:
+            Tuple of (data_list, names_list)
+        """
+        paths = [(seq, os.path.join(data_dir, f"{seq}{suffix}")) for seq in seq_list]
+        paths = [(seq, path) for seq, path in paths if os.path.exists(path)]
+        
+        def read(item):
+            seq, path = item
+            try:
+                df = pd.read_csv(path)
+            except Exception as e:
+                print(f"Warning: Could not load {kind} data from {path}: {e}")
+                return None
+            df['sequence_name'] = seq
+            df['activity_type'] = 'fall' if seq.startswith('fall-') else 'adl'
+            df['activity_id'] = 1 if seq.startswith('fall-') else 0
+            return df
+        
+        if len(paths) > 1 and self.max_workers > 1:
+            # The C parser releases the GIL while tokenizing, so files parse concurrently.
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(paths))) as executor:
+                frames = list(executor.map(read, paths))
+        else:
+            frames = [read(item) for item in paths]
+        
+        data_list = []
+        names_list = []
+        for (seq, _), df in zip(paths, frames):
+            if df is not None:
+                data_list.append(df)
+                names_list.append(f"{seq}-{kind}")
         return data_list, names_list
     
     def _load_accelerometer(self, data_dir: str, sequences: Optional[List[str]],
@@ -220,34 +431,8 @@ class UrFallLoader(BaseDatasetLoader):
         Returns:
             Tuple of (data_list, names_list)
         """
-        data_list = []
-        names_list = []
-        
-        # Determine which sequences to load
-        seq_list = []
-        if sequences is not None:
-            seq_list = sequences
-        else:
-            if use_falls:
-                seq_list.extend([f"fall-{i:02d}" for i in range(1, 31)])
-            if use_adls:
-                seq_list.extend([f"adl-{i:02d}" for i in range(1, 21)])
-        
-        # Load accelerometer data for each sequence
-        for seq in seq_list:
-            accel_file = os.path.join(data_dir, f"{seq}-acc.csv")
-            if os.path.exists(accel_file):
-                try:
-                    df = pd.read_csv(accel_file)
-                    df['sequence_name'] = seq
-                    df['activity_type'] = 'fall' if seq.startswith('fall-') else 'adl'
-                    df['activity_id'] = 1 if seq.startswith('fall-') else 0
-                    data_list.append(df)
-                    names_list.append(f"{seq}-accelerometer")
-                except Exception as e:
-                    print(f"Warning: Could not load accelerometer data from {accel_file}: {e}")
-        
-        return data_list, names_list
+        seq_list = self._sequence_list(sequences, use_falls, use_adls)
+        return self._load_sequence_files(data_dir, seq_list, "-acc.csv", "accelerometer")
     
     def _load_synchronization(self, data_dir: str, sequences: Optional[List[str]],
                               use_falls: bool, use_adls: bool) -> Tuple[List[pd.DataFrame], List[str]]:
@@ -263,34 +448,81 @@ class UrFallLoader(BaseDatasetLoader):
         Returns:
             Tuple of (data_list, names_list)
         """
-        data_list = []
-        names_list = []
+        seq_list = self._sequence_list(sequences, use_falls, use_adls)
+        return self._load_sequence_files(data_dir, seq_list, "-data.csv", "synchronization")
+    
+    @staticmethod
+    def _read_numeric_csv(path: str) -> np.ndarray:
+        """Numeric rows of a headerless (or headed) CSV as a float64 array."""
+        df = pd.read_csv(path, header=None).apply(pd.to_numeric, errors='coerce')
+        return df.dropna(how='all').to_numpy(dtype=np.float64)
+    
+    def align_sequence(self, data_dir: str, sequence: str, rate: Optional[float] = None,
+                       method: Optional[Dict[str, str]] = None,
+                       tolerance: Optional[Dict[str, float]] = None) -> AlignedStreams:
+        """
+        Align the accelerometer, synchronization and depth-feature streams of a sequence.
         
-        # Determine which sequences to load
-        seq_list = []
-        if sequences is not None:
-            seq_list = sequences
-        else:
-            if use_falls:
-                seq_list.extend([f"fall-{i:02d}" for i in range(1, 31)])
-            if use_adls:
-                seq_list.extend([f"adl-{i:02d}" for i in range(1, 21)])
+        Streams (times in seconds from the recording start):
+        - 'accelerometer': ``{seq}-acc.csv``, time in ms followed by the SV and
+          x/y/z acceleration columns
+        - 'sync': ``{seq}-data.csv``, camera frame number, time in ms and the
+          synchronized accelerometer value(s)
+        - 'features': the sequence's rows of the depth-feature CSV, timed through
+          the frame numbers of the sync stream
         
-        # Load synchronization data for each sequence
-        for seq in seq_list:
-            sync_file = os.path.join(data_dir, f"{seq}-data.csv")
-            if os.path.exists(sync_file):
-                try:
-                    df = pd.read_csv(sync_file)
-                    df['sequence_name'] = seq
-                    df['activity_type'] = 'fall' if seq.startswith('fall-') else 'adl'
-                    df['activity_id'] = 1 if seq.startswith('fall-') else 0
-                    data_list.append(df)
-                    names_list.append(f"{seq}-synchronization")
-                except Exception as e:
-                    print(f"Warning: Could not load synchronization data from {sync_file}: {e}")
-        
-        return data_list, names_list
+        Args:
+            data_dir: Directory containing the dataset
+            sequence: Sequence name (e.g. 'fall-01')
+            rate: Resampling rate in Hz (default: the camera frame times)
+            method: Per-stream method (default: linear for the accelerometer,
+                    nearest for the camera streams)
+            tolerance: Per-stream tolerance in seconds (default: 0.05 s for the
+                       accelerometer, half a camera frame for the others)
+            
+        Returns:
+            AlignedStreams with one validity mask per stream
+        """
+        sync_path = os.path.join(data_dir, f"{sequence}-data.csv")
+        if not os.path.exists(sync_path):
+            raise FileNotFoundError(f"No synchronization data for sequence {sequence} in {data_dir}")
+        sync = self._read_numeric_csv(sync_path)
+        sync_frames, sync_times = sync[:, 0], sync[:, 1] / 1000.0
+        streams = {'sync': (sync_times, sync[:, 2:])}
+        names = {'sync': [f"value{i}" for i in range(sync.shape[1] - 2)]}
+        
+        acc_path = os.path.join(data_dir, f"{sequence}-acc.csv")
+        if os.path.exists(acc_path):
+            acc = self._read_numeric_csv(acc_path)
+            streams['accelerometer'] = (acc[:, 0] / 1000.0, acc[:, 1:])
+            names['accelerometer'] = ['SV', 'x', 'y', 'z'][:acc.shape[1] - 1] + \
+                [f"value{i}" for i in range(4, acc.shape[1] - 1)]
+        
+        activity_type = 'fall' if sequence.startswith('fall-') else 'adl'
+        csv_path = os.path.join(data_dir, FEATURE_FILES[activity_type])
+        if os.path.exists(csv_path):
+            rows = self._select_feature_rows(csv_path, [sequence])
+            cols = [c for c in self.metadata['feature_columns'] if c not in ('sequence_name', 'frame_number')]
+            frame_numbers = rows['frame_number'].to_numpy(dtype=np.float64)
+            # Frame number -> camera time; feature rows without a synced frame are dropped.
+            order = np.argsort(sync_frames, kind='stable')
+            pos = np.searchsorted(sync_frames[order], frame_numbers).clip(0, max(len(order) - 1, 0))
+            matched = sync_frames[order][pos] == frame_numbers if len(order) \
+                else np.zeros(len(frame_numbers), dtype=bool)
+            streams['features'] = (sync_times[order][pos][matched] if len(order) else np.empty(0),
+                                   rows[cols].to_numpy(dtype=np.float64)[matched])
+            names['features'] = cols
+        
+        frame_period = float(np.median(np.diff(np.sort(sync_times)))) if len(sync_times) > 1 \
+            else 1.0 / self.metadata['sampling_frequency']
+        stream_method = {'accelerometer': 'linear', 'sync': 'nearest', 'features': 'nearest'}
+        stream_method.update(method or {})
+        stream_tolerance = {'accelerometer': 0.05, 'sync': frame_period / 2, 'features': frame_period / 2}
+        stream_tolerance.update(tolerance or {})
+        
+        return align_streams(streams, rate=rate, reference=None if rate else 'sync',
+                             method=stream_method, tolerance=stream_tolerance,
+                             channel_names=names)
     
     def get_file_paths(self, data_dir: str, data_type: str, 
                        sequences: Optional[List[str]] = None,
@@ -314,14 +546,7 @@ class UrFallLoader(BaseDatasetLoader):
         file_paths = {}
         
         # Determine which sequences to include
-        seq_list = []
-        if sequences is not None:
-            seq_list = sequences
-        else:
-            if use_falls:
-                seq_list.extend([f"fall-{i:02d}" for i in range(1, 31)])
-            if use_adls:
-                seq_list.extend([f"adl-{i:02d}" for i in range(1, 21)])
+        seq_list = self._sequence_list(sequences, use_falls, use_adls)
         
         # Map data type to file extension
         extension_map = {
@@ -339,6 +564,56 @@ class UrFallLoader(BaseDatasetLoader):
         
         return file_paths
     
+    def iter_frame_files(self, data_dir: str, sequence: str,
+                         data_type: str = 'depth') -> Iterator[Tuple[str, bytes]]:
+        """
+        Stream the encoded frames of one sequence straight from its zip archive.
+        
+        Frames are read in name (i.e. frame) order without extracting the archive.
+        
+        Args:
+            data_dir: Directory containing the dataset
+            sequence: Sequence name (e.g. 'fall-01')
+            data_type: 'depth' or 'rgb'
+            
+        Yields:
+            Tuples of (member name, encoded PNG bytes)
+        """
+        if data_type not in ['depth', 'rgb']:
+            raise ValueError(f"data_type must be one of: 'depth', 'rgb'. Got: {data_type}")
+        zip_path = self.get_file_paths(data_dir, data_type, sequences=[sequence]).get(sequence)
+        if zip_path is None:
+            raise FileNotFoundError(f"No {data_type} archive for sequence {sequence} in {data_dir}")
+        for name, stream in iter_members(zip_path, "*.png"):
+            yield name, stream.read()
+    
+    def get_frame_reader(self, data_dir: str, sequence: str, data_type: str = 'depth',
+                         **kwargs) -> FrameReader:
+        """
+        Get a lazy frame reader for one sequence.
+        
+        Depth and RGB frames are read from the sequence zip (or from its extracted
+        directory if the zip is gone); video frames from the MP4 (requires OpenCV).
+        
+        Args:
+            data_dir: Directory containing the dataset
+            sequence: Sequence name (e.g. 'fall-01')
+            data_type: 'depth', 'rgb' or 'video'
+            **kwargs: FrameReader options (stride, start, stop, roi, grayscale, prefetch)
+            
+        Returns:
+            FrameReader over the frames of the sequence
+        """
+        path = self.get_file_paths(data_dir, data_type, sequences=[sequence]).get(sequence)
+        if path is None and data_type in ['depth', 'rgb']:
+            extracted = os.path.join(data_dir, f"{sequence}-cam0-{data_type[0]}")
+            if os.path.isdir(extracted):
+                path = extracted
+                kwargs.setdefault('pattern', os.path.join('**', '*.png'))
+        if path is None:
+            raise FileNotFoundError(f"No {data_type} data for sequence {sequence} in {data_dir}")
+        return FrameReader(path, **kwargs)
+    
     def create_sliding_windows(self, data: List[pd.DataFrame], names: List[str],
                                window_size: int = 30, step_size: int = 15) -> List[Dict]:
         """
@@ -9,13 +9,15 @@ Maintainer: @aharshit123456
 ## imports
 import os
 import requests
-import zipfile
 import tarfile
 import json
 import pandas as pd
 import numpy as np
 from glob import glob
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from ..core.downloads import download_file
+from ..core.telemetry import DownloadTelemetry
+from .archives import extract_members
 
 #################################################################################
 ############################## DATASET DOWNLOAD #################################
@@ -133,7 +135,8 @@ def download_arduous_data(data_dir):
     """Download the Arduous dataset."""
     pass
 
-def download_urfall_data(data_dir, sequences=None, data_types=None, use_falls=True, use_adls=True, max_workers: int = 8):
+def download_urfall_data(data_dir, sequences=None, data_types=None, use_falls=True, use_adls=True, max_workers: int = 8,
+                         backend: str = 'thread'):
     """
     Download the UrFall dataset files.
     
@@ -145,11 +148,16 @@ def download_urfall_data(data_dir, sequences=None, data_types=None, use_falls=Tr
                    'synchronization', 'video', 'features' (default: ['features'])
         use_falls: Whether to download fall sequences (default: True)
         use_adls: Whether to download ADL sequences (default: True)
-        max_workers: Max concurrent download workers (default: 8)
+        max_workers: Max concurrent downloads: worker threads, or requests in flight
+                     for the async backend (default: 8)
+        backend: 'thread' (thread pool) or 'async' (one asyncio event loop, requires
+                 aiohttp; cheaper per request for many small sequence files)
         
     Returns:
         str: Path to the data directory
     """
+    if backend not in ('thread', 'async'):
+        raise ValueError(f"Unknown download backend '{backend}'. Available: ['thread', 'async']")
     from tqdm import tqdm
     
     base_url = "http://fenix.univ.rzeszow.pl/~mkepski/ds/data/"
@@ -214,18 +222,35 @@ def download_urfall_data(data_dir, sequences=None, data_types=None, use_falls=Tr
     print(f"Starting concurrent downloads: {len(download_jobs)} file(s) with up to {max_workers} workers...")
     successes = 0
     failures = []
+    telemetry = DownloadTelemetry(total_files=len(download_jobs), show_progress=True, desc="UrFall")
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_job = {executor.submit(_download_file, url, dest, desc): (url, dest) for url, dest, desc in download_jobs}
-        for future in as_completed(future_to_job):
-            (url, dest) = future_to_job[future]
-            ok, info = future.result()
-            if ok:
+    if backend == 'async':
+        from ..core.async_downloads import download_files
+        
+        tasks = [{'url': url, 'dest_path': dest} for url, dest, _ in download_jobs]
+        with telemetry:
+            outcomes = download_files(tasks, max_concurrency=max_workers, limit_per_host=max_workers,
+                                      timeout=60, telemetry=telemetry)
+        for (url, dest, _), outcome in zip(download_jobs, outcomes):
+            if outcome.success:
                 successes += 1
             else:
-                failures.append((url, info))
+                failures.append((url, f"{dest}: {outcome.message}"))
+    else:
+        with telemetry, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_job = {executor.submit(_download_file, url, dest, desc, telemetry=telemetry): (url, dest)
+                             for url, dest, desc in download_jobs}
+            for future in as_completed(future_to_job):
+                (url, dest) = future_to_job[future]
+                ok, info = future.result()
+                if ok:
+                    successes += 1
+                else:
+                    failures.append((url, info))
     
-    print(f"Completed downloads: {successes} succeeded, {len(failures)} failed.")
+    stats = telemetry.to_dict()
+    print(f"Completed downloads: {successes} succeeded, {len(failures)} failed "
+          f"({stats['bytes_downloaded'] / 1e6:.1f} MB at {stats['bytes_per_second'] / 1e6:.2f} MB/s).")
     if failures:
         for url, err in failures[:10]:
             print(f" - Failed: {url} -> {err}")
@@ -258,11 +283,10 @@ def extract_dataset(dataset_name, data_dir):
         raise ValueError(f"Dataset {dataset_name} not supported.")
     
 
-def extract_daphnet_data(data_dir):
-    """Extract the Daphnet dataset."""
+def extract_daphnet_data(data_dir, max_workers: int = 4):
+    """Extract the Daphnet dataset, skipping files that are already extracted."""
     file_path = os.path.join(data_dir, "daphnet.zip")
-    with zipfile.ZipFile(file_path, "r") as zip_ref:
-        zip_ref.extractall(data_dir)
+    return extract_members(file_path, data_dir, max_workers=max_workers)
 
 def extract_mobifall_data(data_dir):
     """Extract the MobiFall dataset."""
@@ -272,15 +296,20 @@ def extract_arduous_data(data_dir):
     """Extract the Arduous dataset."""
     pass
 
-def extract_urfall_data(data_dir, sequences=None, use_falls=True, use_adls=True):
+def extract_urfall_data(data_dir, sequences=None, use_falls=True, use_adls=True, max_workers: int = 4):
     """
     Extract the UrFall dataset zip files (depth and RGB data).
     
+    Frames already extracted with matching size and CRC are skipped, so an
+    interrupted extraction resumes. Loaders can also read the frames straight
+    from the zip files (see ``gaitsetpy.dataset.archives``) without extracting.
+    
     Args:
         data_dir: Directory containing the dataset
         sequences: List of specific sequences to extract
         use_falls: Whether to extract fall sequences
         use_adls: Whether to extract ADL sequences
+        max_workers: Number of extraction threads per archive
     """
     # Determine which sequences to extract
     seq_list = []
@@ -298,15 +327,12 @@ def extract_urfall_data(data_dir, sequences=None, use_falls=True, use_adls=True)
             zip_file = os.path.join(data_dir, seq + ext)
             if os.path.exists(zip_file):
                 extract_dir = os.path.join(data_dir, seq + f"-cam0-{data_type[0]}")
-                if os.path.exists(extract_dir):
-                    print(f"Already extracted: {extract_dir}")
-                    continue
-                
                 try:
-                    print(f"Extracting {zip_file}...")
-                    with zipfile.ZipFile(zip_file, 'r') as zip_ref:
-                        zip_ref.extractall(extract_dir)
-                    print(f"Extracted to: {extract_dir}")
+                    stats = extract_members(zip_file, extract_dir, max_workers=max_workers)
+                    if stats['extracted']:
+                        print(f"Extracted {stats['extracted']} file(s) to: {extract_dir}")
+                    else:
+                        print(f"Already extracted: {extract_dir}")
                 except Exception as e:
                     print(f"Failed to extract {zip_file}: {e}")
 
@@ -329,30 +355,33 @@ def sliding_window(data, window_size, step_size):
         windows.append(data[start:end])
     return windows
 
-def _download_file(url: str, dest_path: str, desc: str = None):
-    """Download a single file to dest_path with a simple progress indicator."""
-    from tqdm import tqdm
-    try:
-        response = requests.get(url, stream=True, timeout=60)
-        response.raise_for_status()
-        total_size = int(response.headers.get('content-length', 0))
-        progress_bar = tqdm(total=total_size, unit='iB', unit_scale=True, desc=desc or os.path.basename(dest_path))
-        with open(dest_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    written = f.write(chunk)
-                    progress_bar.update(written)
-        progress_bar.close()
-        if total_size != 0 and os.path.getsize(dest_path) < total_size:
-            raise IOError(f"Incomplete download for {dest_path}")
-        return True, dest_path
-    except Exception as e:
+def _download_file(url: str, dest_path: str, desc: str = None, expected_size: int = None, sha256: str = None,
+                   telemetry: DownloadTelemetry = None):
+    """
+    Download a single file to dest_path with a simple progress indicator.
+
+    Uses the shared download engine: pooled per-thread session, resume from a
+    ``.part`` file, optional size/SHA-256 verification and retries with backoff.
+    When ``telemetry`` is given, progress and statistics go to it (and its single
+    aggregate progress bar) instead of a per-file progress bar.
+    """
+    if telemetry is not None:
+        telemetry.start_file(url, dest_path, expected_size)
+        result = download_file(url, dest_path, expected_size=expected_size, sha256=sha256,
+                               timeout=60, progress=telemetry.progress_callback(dest_path))
+        telemetry.finish_file(dest_path, result.status, result.message)
+    else:
+        from tqdm import tqdm
+        progress_bar = tqdm(total=expected_size or 0, unit='iB', unit_scale=True,
+                            desc=desc or os.path.basename(dest_path))
         try:
-            if os.path.exists(dest_path):
-                os.remove(dest_path)
-        except Exception:
-            pass
-        return False, f"{dest_path}: {e}"
+            result = download_file(url, dest_path, expected_size=expected_size, sha256=sha256,
+                                   timeout=60, progress=progress_bar.update)
+        finally:
+            progress_bar.close()
+    if result.success:
+        return True, dest_path
+    return False, f"{dest_path}: {result.message}"
 
 def download_harup_data(data_dir):
     """
@@ -371,7 +400,6 @@ def download_harup_data(data_dir):
     import requests
     from tqdm import tqdm
     import webbrowser
-    import zipfile
 
     # Create directory if it doesn't exist
     os.makedirs(data_dir, exist_ok=True)
@@ -416,8 +444,7 @@ def download_harup_data(data_dir):
             if os.path.getsize(zip_path) > 0:
                 print(f"Download completed successfully! File saved to: {zip_path}")
                 print("\nExtracting the downloaded ZIP file...")
-                with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                    zip_ref.extractall(data_dir)
+                extract_members(zip_path, data_dir)
                 # Check for DataSet folder
                 if not os.path.exists(dataset_dir):
                     # Sometimes the zip may contain a top-level folder, e.g., HAR-UP_Dataset/DataSet/...
@@ -461,7 +488,7 @@ def download_harup_data(data_dir):
         return None
 
 
-def extract_harup_data(data_dir):
+def extract_harup_data(data_dir, max_workers: int = 4):
     """
     Extract the HAR-UP dataset zip file if not already extracted.
     """
@@ -474,8 +501,6 @@ def extract_harup_data(data_dir):
         print(f"HAR-UP zip file not found at: {zip_path}")
         print("Please run download_harup_data first.")
         return
-    import zipfile
     print(f"Extracting HAR-UP dataset zip to: {data_dir}")
-    with zipfile.ZipFile(zip_path, "r") as zip_ref:
-        zip_ref.extractall(data_dir)
+    extract_members(zip_path, data_dir, max_workers=max_workers)
     print(f"Extraction complete.")
\ No newline at end of file
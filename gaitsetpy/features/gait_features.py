@@ -11,6 +11,7 @@ import numpy as np
 import logging
 from tqdm import tqdm
 from ..core.base_classes import BaseFeatureExtractor
+from ..core.precision import as_float_array
 from .utils import (
     calculate_mean,
     calculate_standard_deviation,
@@ -262,10 +263,8 @@ class GaitFeatureExtractor(BaseFeatureExtractor):
         return time_features
     
     def _ensure_numpy_array(self, signal):
-        """Convert pandas Series to numpy array if needed."""
-        if hasattr(signal, 'values'):
-            return signal.values
-        return signal
+        """Convert pandas Series (or integer windows) to a float numpy array."""
+        return as_float_array(signal)
     
     def _extract_frequency_domain_features(self, windows: List, fs: int) -> Dict[str, List]:
         """Extract frequency domain features from windows."""
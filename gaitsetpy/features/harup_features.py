@@ -11,10 +11,12 @@ Reference:
 '''
 
 import numpy as np
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from scipy.stats import kurtosis, skew
 from scipy.fftpack import rfft
+from scipy import fft as sp_fft
 from ..core.base_classes import BaseFeatureExtractor
+from ..core.precision import as_float_array, float_dtype
 
 
 class HARUPFeatureExtractor(BaseFeatureExtractor):
@@ -83,23 +85,95 @@ class HARUPFeatureExtractor(BaseFeatureExtractor):
             if self.config['verbose']:
                 print(f"Processing {sensor_name} with {len(sensor_data)} windows")
             
-            # For each window of this sensor
-            for i, window_data in enumerate(sensor_data):
-                features = {}
-                features["sensor"] = sensor_name
-                
-                # Time domain features
-                if self.config['time_domain']:
-                    self._extract_time_domain_features(window_data, features)
-                
-                # Frequency domain features
-                if self.config['frequency_domain']:
-                    self._extract_freq_domain_features(window_data, features)
-                
+            batch = self._stack_windows(sensor_data)
+            if batch is None:
+                # Windows of different lengths: one window at a time
+                for window_data in sensor_data:
+                    window_data = as_float_array(window_data)
+                    features = {"sensor": sensor_name}
+                    if self.config['time_domain']:
+                        self._extract_time_domain_features(window_data, features)
+                    if self.config['frequency_domain']:
+                        self._extract_freq_domain_features(window_data, features)
+                    all_features.append(features)
+                continue
+            
+            # All windows of this sensor at once, one vectorised call per feature
+            columns = {}
+            if self.config['time_domain']:
+                columns.update(self._batch_time_domain_features(batch))
+            if self.config['frequency_domain']:
+                columns.update(self._batch_freq_domain_features(batch))
+            
+            for i in range(len(batch)):
+                features = {"sensor": sensor_name}
+                for key, values in columns.items():
+                    features[key] = values[i]
                 all_features.append(features)
         
         return all_features
     
+    @staticmethod
+    def _stack_windows(sensor_data) -> Optional[np.ndarray]:
+        """
+        Stack equal-length windows into a (n_windows, window_size) array in the
+        precision policy dtype, or return None if the lengths differ.
+        """
+        if len(sensor_data) == 0:
+            return None
+        windows = [np.asarray(w) for w in sensor_data]
+        if len({len(w) for w in windows}) != 1 or windows[0].ndim != 1:
+            return None
+        return np.stack(windows).astype(float_dtype(), copy=False)
+    
+    def _batch_time_domain_features(self, batch: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Extract time domain features from a batch of windows.
+        
+        Args:
+            batch: Windows, shape (n_windows, window_size)
+            
+        Returns:
+            Dictionary mapping feature names to arrays of shape (n_windows,)
+        """
+        abs_batch = np.abs(batch)
+        q1, q3 = np.percentile(batch, [25, 75], axis=1).astype(batch.dtype, copy=False)
+        return {
+            "mean": batch.mean(axis=1),
+            "std": batch.std(axis=1),
+            "rms": np.sqrt(np.mean(batch**2, axis=1)),
+            "max_amp": abs_batch.max(axis=1),
+            "min_amp": abs_batch.min(axis=1),
+            "median": np.median(batch, axis=1),
+            "zero_crossings": np.count_nonzero(np.diff(np.signbit(batch), axis=1), axis=1),
+            "skewness": skew(batch, axis=1),
+            "kurtosis": kurtosis(batch, axis=1),
+            "q1": q1,
+            "q3": q3,
+            "autocorr": np.median(self._autocorrelation(batch), axis=1),
+        }
+    
+    @staticmethod
+    def _autocorrelation(batch: np.ndarray) -> np.ndarray:
+        """Full autocorrelation (all 2n - 1 lags) of every window, via the FFT."""
+        n = batch.shape[1]
+        n_fft = 1 << (2 * n - 2).bit_length()
+        spectrum = sp_fft.rfft(batch, n=n_fft, axis=1)
+        circular = sp_fft.irfft(spectrum * spectrum.conj(), n=n_fft, axis=1)
+        return np.concatenate([circular[:, n_fft - n + 1:], circular[:, :n]], axis=1)
+    
+    def _batch_freq_domain_features(self, batch: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Extract frequency domain features from a batch of windows.
+        
+        Args:
+            batch: Windows, shape (n_windows, window_size)
+            
+        Returns:
+            Dictionary mapping feature names to arrays of shape (n_windows,)
+        """
+        return {"energy": np.sum(rfft(batch, axis=1)**2, axis=1)}
+    
     def _extract_time_domain_features(self, window_data: np.ndarray, features: Dict[str, Any]):
         """
         Extract time domain features from a window.
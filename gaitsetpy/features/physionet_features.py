@@ -16,6 +16,7 @@ from scipy import fftpack
 import logging
 from tqdm import tqdm
 from ..core.base_classes import BaseFeatureExtractor
+from ..core.precision import float_dtype
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -86,7 +87,7 @@ class LBPFeatureExtractor(BaseFeatureExtractor):
         """
         # Convert LBP code to integer values
         if len(lbp_code) == 0:
-            return np.zeros(n_bins)
+            return np.zeros(n_bins, dtype=float_dtype())
         
         # Process LBP code in chunks of 8 bits (or smaller)
         chunk_size = 8
@@ -103,13 +104,14 @@ class LBPFeatureExtractor(BaseFeatureExtractor):
                     continue
         
         if len(lbp_values) == 0:
-            return np.zeros(n_bins)
+            return np.zeros(n_bins, dtype=float_dtype())
         
         # Create histogram
-        hist, _ = np.histogram(lbp_values, bins=n_bins, range=(0, n_bins))
+        counts, _ = np.histogram(lbp_values, bins=n_bins, range=(0, n_bins))
+        hist = counts.astype(float_dtype())
         
-        if normalize and np.sum(hist) > 0:
-            hist = hist / np.sum(hist)
+        if normalize and counts.sum() > 0:
+            hist /= counts.sum()
         
         return hist
     
@@ -4,22 +4,138 @@ Maintainer: @aharshit123456
 
 This module provides a lightweight feature extractor for UrFall depth (PNG16), RGB (PNG), and video (MP4) modalities.
 It extracts simple, fast-to-compute features suitable for sanity checks and baseline models.
+
+Frames are processed in chunks stacked into (T, H, W) arrays. Integer frames (uint8 RGB,
+uint16 depth) stay integer: channels and downsampling blocks are summed rather than averaged
+and frame differences are taken in int32 (int64 if needed), so no frame is ever converted to float. Memory use
+is bounded by one chunk regardless of the window length.
 '''
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
 import numpy as np
 from ..core.base_classes import BaseFeatureExtractor
 
 
+INTENSITY_FEATURES = ['mean_intensity', 'std_intensity', 'motion_mean', 'motion_std']
+DEPTH_FEATURES = ['fg_height_mean', 'fg_height_min', 'fg_height_drop', 'centroid_drop']
+
+
+def _iter_chunks(frames, chunk_size: int) -> Iterator[np.ndarray]:
+    """Yield consecutive frames of a window stacked into (T, H, W[, C]) arrays."""
+    if isinstance(frames, np.ndarray):
+        for i in range(0, len(frames), chunk_size):
+            yield frames[i:i + chunk_size]
+        return
+    if hasattr(frames, 'iter_chunks'):
+        yield from frames.iter_chunks(chunk_size)
+        return
+    chunk = []
+    for frame in frames:
+        chunk.append(np.asarray(frame))
+        if len(chunk) == chunk_size:
+            yield np.stack(chunk)
+            chunk = []
+    if chunk:
+        yield np.stack(chunk)
+
+
+def _work_dtype(dtype: np.dtype, scale: int) -> np.dtype:
+    """Smallest signed type holding block/channel sums and their differences."""
+    if not np.issubdtype(dtype, np.integer):
+        return np.dtype(np.float64)
+    if int(np.iinfo(dtype).max) * scale < 2 ** 31:
+        return np.dtype(np.int32)
+    return np.dtype(np.int64)
+
+
+def block_reduce(chunk: np.ndarray, factor: int = 1) -> np.ndarray:
+    """
+    Sum channels and ``factor`` x ``factor`` pixel blocks of a frame chunk.
+
+    Sums instead of means keep integer frames exact; divide by
+    ``channels * factor ** 2`` to get mean values back.
+
+    Args:
+        chunk: Frames of shape (T, H, W) or (T, H, W, C)
+        factor: Block size; rows and columns beyond a multiple of it are dropped
+
+    Returns:
+        Array of shape (T, H // factor, W // factor), int32/int64 for integer input
+        and float64 otherwise
+    """
+    if factor < 1:
+        raise ValueError("factor must be at least 1")
+    channels = chunk.shape[3] if chunk.ndim == 4 else 1
+    dtype = _work_dtype(chunk.dtype, channels * factor * factor)
+    if chunk.ndim == 4:
+        chunk = chunk.sum(axis=3, dtype=dtype)
+    if factor == 1:
+        return chunk.astype(dtype, copy=False)
+    h, w = chunk.shape[1] - chunk.shape[1] % factor, chunk.shape[2] - chunk.shape[2] % factor
+    chunk = chunk[:, :h, :w]
+    # factor**2 strided adds are several times faster than a reshape-and-sum over
+    # the block axes, and each add only touches the downsampled frame size.
+    out = chunk[:, ::factor, ::factor].astype(dtype)
+    for i in range(factor):
+        for j in range(factor):
+            if i or j:
+                out += chunk[:, i::factor, j::factor]
+    return out
+
+
+def _foreground_profile(depth: np.ndarray, n_valid: np.ndarray, max_depth: Optional[float]):
+    """
+    Per-frame foreground height and centroid row, both as fractions of the frame height.
+
+    ``depth`` holds block sums of the depth frames and ``n_valid`` the number of
+    valid (non-zero) pixels in each block (the frames and ``depth > 0`` without
+    downsampling). Invalid pixels are zero, so each block's mean valid depth is
+    ``depth / n_valid`` and blocks mixing invalid pixels with far depths are not
+    mistaken for near ones. Foreground blocks have a mean valid depth nearer than
+    ``max_depth``, or nearer than the frame's mean valid depth when no threshold
+    is given. Frames without foreground give NaN.
+    """
+    t, h, _ = depth.shape
+    if max_depth is None:
+        frame_valid = n_valid.sum(axis=(1, 2))
+        total = depth.sum(axis=(1, 2), dtype=np.float64)
+        threshold = np.divide(total, frame_valid, out=np.zeros(t), where=frame_valid > 0)[:, None, None]
+    else:
+        threshold = max_depth
+    # mean < threshold without dividing: sum < threshold * count
+    foreground = (n_valid > 0) & (depth < threshold * n_valid)
+    rows = foreground.sum(axis=2)  # foreground blocks per row, (T, H)
+    count = rows.sum(axis=1)
+    occupied = rows > 0
+    first = occupied.argmax(axis=1)
+    last = h - 1 - occupied[:, ::-1].argmax(axis=1)
+
+    height = np.full(t, np.nan)
+    centroid = np.full(t, np.nan)
+    has_fg = count > 0
+    height[has_fg] = (last - first + 1)[has_fg] / h
+    centroid[has_fg] = (rows @ np.arange(h))[has_fg] / count[has_fg] / h
+    return height, centroid
+
+
 class UrFallMediaFeatureExtractor(BaseFeatureExtractor):
     """
     UrFall image/video feature extractor.
 
-    Extracts per-window features from sequences of images or decoded video frames:
+    Extracts per-window features from sequences of images or decoded video frames.
+    A window's 'data' can be a list of frames, a stacked (T, H, W[, C]) array or any
+    iterable of frames such as a lazy ``gaitsetpy.dataset.media.FrameReader``; frames
+    are consumed ``chunk_size`` at a time:
     - mean_intensity
     - std_intensity
     - motion_mean (if pairwise differences are available)
     - motion_std
+
+    Single-channel integer frames (UrFall depth PNG16) also get foreground features,
+    with heights and centroid rows as fractions of the frame height (row 0 at the top):
+    - fg_height_mean, fg_height_min
+    - fg_height_drop (largest fall of the height below its running maximum)
+    - centroid_drop (largest fall of the centroid below its running highest position)
     """
 
     def __init__(self, verbose: bool = False):
@@ -30,40 +146,115 @@ class UrFallMediaFeatureExtractor(BaseFeatureExtractor):
         self.config = {
             'verbose': verbose,
             'use_motion': True,
-            'grayscale': True,  # for RGB convert to gray before stats
+            'grayscale': True,  # for RGB average the channels before stats (motion per channel otherwise)
+            'chunk_size': 8,  # frames stacked per batch (small chunks stay in cache)
+            'downsample': 1,  # block size for spatial downsampling
+            'depth_features': None,  # None: auto for single-channel integer frames
+            'foreground_max_depth': None,  # None: nearer than the frame's mean depth
         }
 
     def extract_features(self, windows: List[Dict], fs: int, **kwargs) -> List[Dict]:
+        """
+        Extract media features from UrFall windows.
+
+        Args:
+            windows: List of window dictionaries with 'name' and 'data' (frames)
+            fs: Frame rate (unused; kept for the extractor interface)
+            **kwargs: Overrides for the extractor config ('use_motion', 'grayscale',
+                      'chunk_size', 'downsample', 'depth_features', 'foreground_max_depth')
+
+        Returns:
+            List of dictionaries with 'name' and 'features'
+        """
         self.config.update(kwargs)
         features: List[Dict[str, Any]] = []
         for window in windows:
-            name = window.get('name', 'unknown')
             frames = window.get('data', [])
-            if not isinstance(frames, list) or len(frames) == 0:
+            if isinstance(frames, (list, np.ndarray)):
+                if len(frames) == 0:
+                    continue
+            elif not hasattr(frames, '__iter__'):
                 continue
-            # frames is a list of numpy arrays (HxW) or (HxWxC)
-            intensities = []
-            motions = []
-            prev_gray = None
-            for f in frames:
-                arr = np.array(f)
-                if arr.ndim == 3 and self.config['grayscale']:
-                    arr = arr.mean(axis=2)
-                intensities.append(float(np.mean(arr)))
-                if self.config['use_motion']:
-                    if prev_gray is not None:
-                        diff = np.abs(arr.astype(np.float32) - prev_gray.astype(np.float32))
-                        motions.append(float(np.mean(diff)))
-                    prev_gray = arr
-            fdict: Dict[str, Any] = {'name': name, 'features': {}}
-            if intensities:
-                fdict['features']['mean_intensity'] = float(np.mean(intensities))
-                fdict['features']['std_intensity'] = float(np.std(intensities))
-            if motions:
-                fdict['features']['motion_mean'] = float(np.mean(motions))
-                fdict['features']['motion_std'] = float(np.std(motions))
-            features.append(fdict)
+            window_features = self._window_features(frames)
+            if window_features is not None:
+                features.append({'name': window.get('name', 'unknown'), 'features': window_features})
         return features
 
+    def _window_features(self, frames) -> Optional[Dict[str, float]]:
+        chunk_size = int(self.config['chunk_size'])
+        factor = int(self.config['downsample'])
+        use_motion = self.config['use_motion']
+        depth_features = self.config['depth_features']
+        max_depth = self.config['foreground_max_depth']
+
+        intensities, motions, heights, centroids = [], [], [], []
+        prev = None
+        for chunk in _iter_chunks(frames, chunk_size):
+            if len(chunk) == 0:
+                continue
+            channels = chunk.shape[3] if chunk.ndim == 4 else 1
+            if depth_features is None:
+                depth_features = channels == 1 and np.issubdtype(chunk.dtype, np.integer)
+            if channels > 1 and not self.config['grayscale']:
+                # Keep the channels so motion is the mean absolute change of every channel
+                reduced = np.stack([block_reduce(chunk[..., c], factor) for c in range(channels)], axis=-1)
+                norm = reduced[0].size * factor * factor
+            else:
+                reduced = block_reduce(chunk, factor)
+                norm = reduced[0].size * channels * factor * factor
+
+            flat = reduced.reshape(len(reduced), -1)
+            intensities.append(flat.sum(axis=1, dtype=np.float64 if flat.dtype.kind == 'f' else np.int64) / norm)
+            if use_motion:
+                if prev is not None:
+                    motions.append(self._motion(prev, reduced[:1], norm))
+                if len(reduced) > 1:
+                    motions.append(self._motion(reduced[:-1], reduced[1:], norm))
+                prev = reduced[-1:]
+            if depth_features:
+                n_valid = block_reduce((chunk > 0).view(np.uint8), factor)
+                height, centroid = _foreground_profile(reduced, n_valid, max_depth)
+                heights.append(height)
+                centroids.append(centroid)
+
+        if not intensities:
+            return None
+        intensity = np.concatenate(intensities)
+        result = {
+            'mean_intensity': float(np.mean(intensity)),
+            'std_intensity': float(np.std(intensity)),
+        }
+        if motions:
+            motion = np.concatenate(motions)
+            result['motion_mean'] = float(np.mean(motion))
+            result['motion_std'] = float(np.std(motion))
+        if heights:
+            result.update(self._depth_summary(np.concatenate(heights), np.concatenate(centroids)))
+        return result
+
+    @staticmethod
+    def _motion(before: np.ndarray, after: np.ndarray, norm: int) -> np.ndarray:
+        """Mean absolute difference of frame pairs, computed in the working dtype."""
+        diff = np.subtract(after, before)
+        np.abs(diff, out=diff)
+        diff = diff.reshape(len(diff), -1)
+        return diff.sum(axis=1, dtype=np.float64 if diff.dtype.kind == 'f' else np.int64) / norm
+
+    @staticmethod
+    def _depth_summary(height: np.ndarray, centroid: np.ndarray) -> Dict[str, float]:
+        seen = ~np.isnan(height)
+        if not seen.any():
+            return {name: 0.0 for name in DEPTH_FEATURES}
+        height, centroid = height[seen], centroid[seen]
+        return {
+            'fg_height_mean': float(np.mean(height)),
+            'fg_height_min': float(np.min(height)),
+            'fg_height_drop': float(np.max(np.maximum.accumulate(height) - height)),
+            'centroid_drop': float(np.max(centroid - np.minimum.accumulate(centroid))),
+        }
+
     def get_feature_names(self) -> List[str]:
-        return ['mean_intensity', 'std_intensity', 'motion_mean', 'motion_std'] 
\ No newline at end of file
+        names = list(INTENSITY_FEATURES)
+        if self.config['depth_features'] is not False:
+            names += DEPTH_FEATURES
+        return names
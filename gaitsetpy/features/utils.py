@@ -27,8 +27,11 @@ def calculate_zero_crossing_rate(signal):
     Returns:
         zcr (float): Zero-crossing rate.
     """
+    signal = np.asarray(signal)
     n = len(signal)
-    zcr = 1 / (n - 1) * sum(0.5 * abs(np.sign(signal[i + 1]) - np.sign(signal[i])) for i in range(n - 1))
+    if n < 2:
+        raise ZeroDivisionError("Zero-crossing rate needs at least two samples")
+    zcr = 0.5 * np.abs(np.diff(np.sign(signal))).sum() / (n - 1)
     return zcr
 
 def calculate_power(signal, fs, band):
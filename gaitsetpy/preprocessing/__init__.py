@@ -7,10 +7,12 @@ All preprocessors inherit from BasePreprocessor and are registered with the Prep
 Features:
 - Clipping and normalization
 - Noise removal (moving average, frequency filtering)
-- Outlier detection and removal
+- Outlier detection and shape-preserving replacement (Z-score, median/MAD, rolling Z-score)
 - Baseline and drift correction
-- Artifact removal and trend removal
+- Artifact removal (vectorised gap filling with a maximum gap length) and trend removal (cached least-squares detrending, batch and piecewise)
 - DC offset correction
+- Compiled pipelines that fuse adjacent stages into a single pass
+- Streaming mode (partial_fit / transform_chunk) with bounded per-channel state
 
 Maintainer: @aharshit123456
 """
@@ -29,6 +31,21 @@ from .preprocessors import (
     DCOffsetRemovalPreprocessor
 )
 
+# Import the compiled pipeline
+from .compiled_pipeline import PreprocessingPipeline
+
+# Import streaming helpers
+from .streaming import RunningStats
+
+# Import the outlier engine
+from .outliers import remove_outliers_array
+
+# Import the gap engine
+from .gaps import fill_gaps, fill_masked, find_gaps
+
+# Import the detrending engine
+from .detrend import detrend, polynomial_trend
+
 # Import legacy functions for backward compatibility
 from .pipeline import (
     clip_sliding_windows,
@@ -90,27 +107,21 @@ def preprocess_data(preprocessor_name: str, data, **kwargs):
     return PreprocessingManager().preprocess_data(preprocessor_name, data, **kwargs)
 
 # Pipeline function for chaining multiple preprocessors
-def create_preprocessing_pipeline(preprocessor_names: list, **kwargs):
+def create_preprocessing_pipeline(preprocessor_names: list, dtype=None, **kwargs):
     """
-    Create a preprocessing pipeline with multiple preprocessors.
+    Create a compiled preprocessing pipeline with multiple preprocessors.
     
     Args:
         preprocessor_names: List of preprocessor names to chain
-        **kwargs: Additional arguments for individual preprocessors
+        dtype: Floating dtype of the working buffer (e.g. np.float32)
+        **kwargs: Configuration for individual preprocessors, keyed by preprocessor name
         
     Returns:
-        Function that applies all preprocessors in sequence
+        Callable PreprocessingPipeline that applies all preprocessors in sequence.
+        The first call fits the pipeline; later calls reuse the fitted state.
     """
-    manager = PreprocessingManager()
-    
-    def pipeline(data):
-        processed_data = data
-        for name in preprocessor_names:
-            preprocessor = manager.get_cached_instance(name, name, f"{name} preprocessor")
-            processed_data = preprocessor.fit_transform(processed_data, **kwargs.get(name, {}))
-        return processed_data
-    
-    return pipeline
+    stages = [(name, kwargs.get(name, {})) for name in preprocessor_names]
+    return PreprocessingPipeline(stages, dtype=dtype)
 
 __all__ = [
     # New class-based preprocessors
@@ -124,6 +135,14 @@ __all__ = [
     'ArtifactRemovalPreprocessor',
     'TrendRemovalPreprocessor',
     'DCOffsetRemovalPreprocessor',
+    'PreprocessingPipeline',
+    'RunningStats',
+    'remove_outliers_array',
+    'fill_gaps',
+    'fill_masked',
+    'find_gaps',
+    'detrend',
+    'polynomial_trend',
     # Legacy functions for backward compatibility
     'clip_sliding_windows',
     'remove_noise',
@@ -0,0 +1,105 @@
+'''
+Polynomial detrending with cached least-squares projections.
+
+Fitting a polynomial of a given order to every signal of the same length solves the
+same least-squares problem over and over. This module caches the Vandermonde matrix
+and its pseudo-inverse for each (length, order) pair, so detrending a whole batch of
+windows is a single matrix multiply.
+
+Maintainer: @aharshit123456
+'''
+
+from functools import lru_cache
+from typing import Optional, Tuple
+import numpy as np
+from ..core.precision import as_float_array
+
+
+@lru_cache(maxsize=64)
+def polynomial_projection(length: int, order: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the Vandermonde matrix and its pseudo-inverse for one (length, order) pair.
+
+    The sample positions are scaled to [-1, 1], which keeps the matrix well conditioned
+    for long signals. The result is cached and read-only.
+
+    Args:
+        length: Number of samples
+        order: Polynomial order
+
+    Returns:
+        Tuple ``(vander, pinv)`` of shapes (length, order + 1) and (order + 1, length)
+    """
+    if order < 0:
+        raise ValueError("order must be non-negative")
+    x = np.linspace(-1.0, 1.0, length) if length > 1 else np.zeros(length)
+    vander = np.vander(x, order + 1)
+    pinv = np.linalg.pinv(vander)
+    vander.setflags(write=False)
+    pinv.setflags(write=False)
+    return vander, pinv
+
+
+def polynomial_trend(values: np.ndarray, order: int = 2, axis: int = 0) -> np.ndarray:
+    """
+    Least-squares polynomial trend of every signal along ``axis``.
+
+    All signals are fitted at once: the data is reshaped to (length, n_signals) and
+    projected with the cached pseudo-inverse.
+
+    Args:
+        values: Array of signals
+        order: Polynomial order
+        axis: Axis along which the signals run (e.g. -1 for (n_windows, window_size))
+
+    Returns:
+        Trend with the shape of ``values``
+    """
+    values = as_float_array(values)
+    moved = np.moveaxis(values, axis, 0)
+    length = moved.shape[0]
+    if length == 0:
+        return np.zeros_like(values)
+    vander, pinv = polynomial_projection(length, order)
+    flat = moved.reshape(length, -1)
+    coeffs = pinv.astype(values.dtype, copy=False) @ flat
+    trend = vander.astype(values.dtype, copy=False) @ coeffs
+    return np.moveaxis(trend.reshape(moved.shape), 0, axis)
+
+
+def detrend(values: np.ndarray, order: int = 2, axis: int = 0,
+            segment_length: Optional[int] = None) -> np.ndarray:
+    """
+    Remove polynomial trends along ``axis``.
+
+    With ``segment_length`` set, the signal is split into consecutive segments that are
+    detrended independently (piecewise polynomial trend), which follows slow drifts in
+    long recordings better than one global polynomial. Full segments share one cached
+    projection and one matrix multiply; a shorter last segment is handled separately.
+
+    Args:
+        values: Array of signals
+        order: Polynomial order
+        axis: Axis along which the signals run
+        segment_length: Length of the segments in samples, or None for one global fit
+
+    Returns:
+        Detrended array with the shape of ``values``
+    """
+    values = as_float_array(values)
+    if segment_length is None:
+        return values - polynomial_trend(values, order, axis)
+    if segment_length < 1:
+        raise ValueError("segment_length must be at least 1")
+
+    moved = np.moveaxis(values, axis, 0)
+    length = moved.shape[0]
+    n_full = length // segment_length
+    split = n_full * segment_length
+    result = np.empty_like(moved)
+    if n_full:
+        segments = moved[:split].reshape((n_full, segment_length) + moved.shape[1:])
+        result[:split] = (segments - polynomial_trend(segments, order, axis=1)).reshape(moved[:split].shape)
+    if split < length:
+        result[split:] = moved[split:] - polynomial_trend(moved[split:], order, axis=0)
+    return np.moveaxis(result, 0, axis)
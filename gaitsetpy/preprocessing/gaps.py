@@ -0,0 +1,155 @@
+'''
+Vectorised gap (NaN run) detection and filling.
+
+This module contains the artifact engine used by ArtifactRemovalPreprocessor and the
+legacy remove_artifacts function. All channels are handled at once: the data is laid
+out channel by channel in one flat array, the runs of unusable samples are found
+with one pass over a byte mask, and every filled sample is computed from the
+valid samples on either side of its run. Index arrays are only built for the runs
+and the filled samples, so data with few gaps needs little memory beyond the
+filled copy and the byte masks.
+
+Gaps longer than ``max_gap`` are left as NaN and reported in an invalid mask instead
+of being filled.
+
+Maintainer: @aharshit123456
+'''
+
+from typing import Optional, Tuple
+import numpy as np
+from ..core.precision import as_float_array
+
+
+FILL_METHODS = ('linear', 'ffill', 'bfill')
+
+
+def _channels_first(values: np.ndarray) -> np.ndarray:
+    """Lay out the channels of a (samples, ...) array contiguously, one per row."""
+    n = values.shape[0]
+    return np.ascontiguousarray(values.reshape(n, -1).T)
+
+
+def _from_channels_first(channels: np.ndarray, shape: Tuple[int, ...]) -> np.ndarray:
+    return channels.T.reshape(shape)
+
+
+def _runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Runs of True in every row of a channels-first mask as (channel, start, end) arrays."""
+    n_channels, n = mask.shape
+    # One False column of padding per channel stops runs from spanning channels.
+    padded = np.zeros((n_channels, n + 1), dtype=np.int8)
+    padded[:, :n] = mask
+    # An int8 prepend keeps the edge array at one byte per sample
+    edges = np.diff(padded.ravel(), prepend=np.int8(0))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    channel, start = np.divmod(starts, n + 1)
+    return channel, start, ends - channel * (n + 1)
+
+
+def find_gaps(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find the runs of missing samples in every channel.
+
+    Args:
+        values: Array with samples along axis 0
+
+    Returns:
+        Tuple ``(channel, start, length)`` of 1-D arrays, one entry per NaN run;
+        ``channel`` indexes the flattened trailing dimensions
+    """
+    values = np.asarray(values, dtype=float)
+    channel, start, end = _runs(_channels_first(np.isnan(values)))
+    return channel, start, end - start
+
+
+def _fill_flat(channels: np.ndarray, fill: np.ndarray, valid: np.ndarray, method: str) -> np.ndarray:
+    """Fill the ``fill`` positions of a channels-first array from its ``valid`` positions."""
+    n_channels, n = channels.shape
+    flat = channels.ravel()
+    targets = np.flatnonzero(fill)
+    if targets.size == 0:
+        return channels
+
+    # Every target lies in a run of non-valid samples; its neighbours are the valid
+    # samples just before and after that run.
+    channel, start, end = _runs(~valid)
+    target_channel, target_pos = np.divmod(targets, n)
+    run = np.searchsorted(channel * (n + 1) + start, target_channel * (n + 1) + target_pos, side='right') - 1
+    prev_pos, next_pos = start[run] - 1, end[run]
+    has_prev = prev_pos >= 0
+    has_next = next_pos < n
+    base = target_channel * n
+    prev_val = flat[base + np.where(has_prev, prev_pos, 0)]
+    next_val = flat[base + np.where(has_next, next_pos, 0)]
+
+    if method == 'linear':
+        weight = (target_pos - prev_pos) / (next_pos - prev_pos)
+        values = prev_val + weight * (next_val - prev_val)
+        values = np.where(has_prev & has_next, values, np.where(has_prev, prev_val, next_val))
+    elif method == 'ffill':
+        values = np.where(has_prev, prev_val, next_val)
+    else:
+        values = np.where(has_next, next_val, prev_val)
+    values[~(has_prev | has_next)] = np.nan
+    flat[targets] = values
+    return channels
+
+
+def fill_masked(values: np.ndarray, mask: np.ndarray, method: str = 'linear') -> np.ndarray:
+    """
+    Fill the masked samples of every channel from the unmasked, non-NaN samples.
+
+    Samples before the first or after the last valid sample of a channel take the
+    nearest valid value. Channels without any valid sample stay NaN.
+
+    Args:
+        values: Array with samples along axis 0
+        mask: Boolean array of the same shape marking the samples to fill
+        method: One of 'linear', 'ffill' or 'bfill'
+
+    Returns:
+        Filled copy of ``values``
+    """
+    if method not in FILL_METHODS:
+        raise ValueError(f"Unknown fill method '{method}'. Available: {list(FILL_METHODS)}")
+    values = as_float_array(values)
+    if values.shape[0] == 0:
+        return values.copy()
+    channels = np.array(values.reshape(values.shape[0], -1).T, order='C')
+    fill = _channels_first(np.asarray(mask, dtype=bool))
+    valid = ~fill & ~np.isnan(channels)
+    return _from_channels_first(_fill_flat(channels, fill, valid, method), values.shape)
+
+
+def fill_gaps(values: np.ndarray, method: str = 'linear',
+              max_gap: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fill NaN runs in all channels at once.
+
+    Args:
+        values: Array with samples along axis 0
+        method: One of 'linear', 'ffill' or 'bfill'
+        max_gap: Longest run (in samples) that is filled; longer runs stay NaN
+
+    Returns:
+        Tuple ``(filled values, invalid mask)``; the mask marks the samples of the runs
+        that were too long to fill (and of channels without any valid sample)
+    """
+    values = as_float_array(values)
+    missing = np.isnan(values)
+    invalid = np.zeros(values.shape, dtype=bool)
+    if max_gap is not None:
+        channel, start, length = find_gaps(values)
+        long_runs = length > max_gap
+        if np.any(long_runs):
+            n = values.shape[0]
+            invalid_channels = np.zeros((invalid[0].size, n), dtype=bool)
+            starts = channel[long_runs] * n + start[long_runs]
+            lengths = length[long_runs]
+            run_offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+            invalid_channels.ravel()[np.repeat(starts, lengths) + run_offsets] = True
+            invalid = _from_channels_first(invalid_channels, values.shape)
+    filled = fill_masked(values, missing & ~invalid, method)
+    invalid |= np.isnan(filled)
+    return filled, invalid
@@ -10,6 +10,10 @@ clip_sliding_windows, remove_noise, remove_outliers, remove_baseline, remove_dri
 import numpy as np
 import pandas as pd
 from scipy.signal import butter, filtfilt
+from .outliers import remove_outliers_array
+from .detrend import detrend
+from .gaps import fill_gaps
+from .streaming import as_chunk, restore_chunk
 
 def clip_sliding_windows(data, min_val=-1, max_val=1):
     """
@@ -23,12 +27,15 @@ def remove_noise(data, window_size=5):
     """
     return data.rolling(window=window_size, center=True).mean().fillna(method="bfill").fillna(method="ffill")
 
-def remove_outliers(data, threshold=3):
+def remove_outliers(data, threshold=3, method='zscore', strategy='nan', window=101):
     """
-    Remove outliers beyond a given threshold using the Z-score method.
+    Replace outliers beyond a given threshold without changing the shape of the data.
+
+    method is 'zscore', 'mad' or 'rolling_zscore'; strategy is 'clip', 'nan' or 'interpolate'.
     """
-    mean, std = data.mean(), data.std()
-    return data[(data - mean).abs() <= threshold * std]
+    cleaned, _ = remove_outliers_array(as_chunk(data), method=method, threshold=threshold,
+                                       strategy=strategy, window=window)
+    return restore_chunk(cleaned, data)
 
 def remove_baseline(data):
     """
@@ -43,20 +50,24 @@ def remove_drift(data, cutoff=0.01, fs=100):
     b, a = butter(1, cutoff / (fs / 2), btype='highpass')
     return filtfilt(b, a, data)
 
-def remove_artifacts(data, method="interpolate"):
+def remove_artifacts(data, method="interpolate", max_gap=None):
     """
     Remove artifacts by interpolating missing values.
+
+    method is 'interpolate' (linear), 'ffill' or 'bfill'; gaps longer than max_gap samples stay NaN.
     """
-    return data.interpolate(method="linear").fillna(method="bfill").fillna(method="ffill")
+    filled, _ = fill_gaps(as_chunk(data), "linear" if method == "interpolate" else method, max_gap)
+    return restore_chunk(filled, data)
 
-def remove_trend(data, order=2):
+def remove_trend(data, order=2, segment_length=None, axis=0):
     """
     Remove trends using polynomial fitting.
+
+    The least-squares projection is cached per (length, order); use axis=-1 to detrend
+    every row of a (n_windows, window_size) array at once and segment_length for a
+    piecewise trend.
     """
-    x = np.arange(len(data))
-    poly_coeffs = np.polyfit(x, data, order)
-    trend = np.polyval(poly_coeffs, x)
-    return data - trend
+    return restore_chunk(detrend(as_chunk(data), order, axis, segment_length), data)
 
 def remove_dc_offset(data):
     """
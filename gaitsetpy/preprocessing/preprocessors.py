@@ -7,11 +7,37 @@ and provide specific preprocessing functionality.
 Maintainer: @aharshit123456
 '''
 
-from typing import Union, Dict, Any
+from typing import Union, Dict, Any, Optional
 import numpy as np
 import pandas as pd
 from scipy.signal import butter, filtfilt
 from ..core.base_classes import BasePreprocessor
+from .streaming import (
+    RunningMeanStreamMixin,
+    RunningStats,
+    SOSFilterStreamMixin,
+    as_chunk,
+    restore_chunk,
+    causal_moving_average,
+    forward_fill,
+)
+from .detrend import detrend
+from .gaps import FILL_METHODS, fill_gaps
+from .outliers import (
+    OUTLIER_METHODS,
+    location_scale,
+    replace_outliers,
+    remove_outliers_array,
+)
+
+
+def _zero_phase(b: np.ndarray, a: np.ndarray, data: Union[pd.DataFrame, pd.Series, np.ndarray]):
+    """Zero-phase filter each DataFrame column, a Series, or an array along its last axis."""
+    if isinstance(data, pd.DataFrame):
+        return pd.DataFrame(filtfilt(b, a, data.to_numpy(), axis=0), index=data.index, columns=data.columns)
+    if isinstance(data, pd.Series):
+        return pd.Series(filtfilt(b, a, data), index=data.index)
+    return filtfilt(b, a, data)
 
 
 class ClippingPreprocessor(BasePreprocessor):
@@ -56,6 +82,31 @@ class ClippingPreprocessor(BasePreprocessor):
         max_val = kwargs.get('max_val', self.config['max_val'])
         
         return np.clip(data, min_val, max_val)
+    
+    def partial_fit(self, data: Union[pd.DataFrame, np.ndarray], **kwargs):
+        """
+        Update the preprocessor with one chunk (clipping is stateless).
+        
+        Args:
+            data: Chunk of samples
+            **kwargs: Additional arguments
+        """
+        self.fit(data, **kwargs)
+    
+    def transform_chunk(self, data: Union[pd.DataFrame, np.ndarray], update: bool = True,
+                        **kwargs) -> Union[pd.DataFrame, np.ndarray]:
+        """
+        Clip one chunk of a stream.
+        
+        Args:
+            data: Chunk of samples
+            update: Unused, clipping keeps no stream state
+            **kwargs: Additional arguments
+            
+        Returns:
+            Clipped chunk
+        """
+        return self.transform(data, **kwargs)
 
 
 class NoiseRemovalPreprocessor(BasePreprocessor):
@@ -71,6 +122,7 @@ class NoiseRemovalPreprocessor(BasePreprocessor):
         self.config = {
             'window_size': window_size
         }
+        self._tail = None
     
     def fit(self, data: Union[pd.DataFrame, np.ndarray], **kwargs):
         """
@@ -104,75 +156,227 @@ class NoiseRemovalPreprocessor(BasePreprocessor):
             # For numpy arrays, use uniform filter
             from scipy.ndimage import uniform_filter1d
             return uniform_filter1d(data, size=window_size, mode='nearest')
+    
+    def partial_fit(self, data: Union[pd.DataFrame, np.ndarray], **kwargs):
+        """
+        Update the preprocessor with one chunk (nothing to learn).
+        
+        Args:
+            data: Chunk of samples
+            **kwargs: Additional arguments
+        """
+        self.fit(data, **kwargs)
+    
+    def transform_chunk(self, data: Union[pd.DataFrame, np.ndarray], update: bool = True,
+                        **kwargs) -> Union[pd.DataFrame, np.ndarray]:
+        """
+        Apply a trailing (causal) moving average to one chunk of a stream.
+        
+        The last ``window_size - 1`` samples are kept between chunks, so the output
+        equals a trailing moving average over the whole stream.
+        
+        Args:
+            data: Chunk of samples
+            update: Whether to keep this chunk's tail for the next chunk
+            **kwargs: Additional arguments
+            
+        Returns:
+            Noise-reduced chunk
+        """
+        window_size = kwargs.get('window_size', self.config['window_size'])
+        values, tail = causal_moving_average(as_chunk(data), window_size, self._tail)
+        if update:
+            self._tail = tail
+        return restore_chunk(values, data)
+    
+    def reset_stream(self):
+        """Forget the tail of the previous chunk."""
+        self._tail = None
 
 
 class OutlierRemovalPreprocessor(BasePreprocessor):
     """
-    Preprocessor for removing outliers using Z-score method.
+    Preprocessor for removing outliers using Z-score, robust (median/MAD) or rolling Z-score detection.
+    
+    Flagged samples are replaced in place (clipped, marked as NaN or interpolated), so
+    the output always has the shape of the input.
     """
     
-    def __init__(self, threshold: float = 3):
+    def __init__(self, threshold: float = 3, alpha: Optional[float] = None, method: str = 'zscore',
+                 strategy: str = 'nan', window: int = 101):
         super().__init__(
             name="outlier_removal",
             description="Removes outliers beyond a given threshold using the Z-score method"
         )
         self.config = {
-            'threshold': threshold
+            'threshold': threshold,
+            'alpha': alpha,
+            'method': method,
+            'strategy': strategy,
+            'window': window
         }
         self.mean_ = None
         self.std_ = None
+        self.median_ = None
+        self.mad_ = None
+        self.mask_ = None
+        self._stats = None
+        self._last_valid = None
     
     def fit(self, data: Union[pd.DataFrame, np.ndarray], **kwargs):
         """
-        Fit the preprocessor by computing mean and standard deviation.
+        Fit the preprocessor by computing per-channel location and scale.
+        
+        The 'zscore' method stores ``mean_``/``std_`` and the 'mad' method stores
+        ``median_``/``mad_`` (scaled to a standard deviation). 'rolling_zscore'
+        computes its statistics during transform.
         
         Args:
             data: Input data to fit on
             **kwargs: Additional arguments
         """
-        self.config.update({k: v for k, v in kwargs.items() if k in ['threshold']})
+        self.config.update({k: v for k, v in kwargs.items()
+                            if k in ['threshold', 'method', 'strategy', 'window']})
+        method = self.config['method']
+        if method not in OUTLIER_METHODS:
+            raise ValueError(f"Unknown outlier method '{method}'. Available: {list(OUTLIER_METHODS)}")
         
-        if isinstance(data, (pd.DataFrame, pd.Series)):
-            self.mean_ = data.mean()
-            self.std_ = data.std()
-        else:
-            self.mean_ = np.mean(data)
-            self.std_ = np.std(data)
+        values = as_chunk(data)
+        if method == 'zscore':
+            self.mean_, self.std_ = location_scale(values, 'zscore')
+        elif method == 'mad':
+            self.median_, self.mad_ = location_scale(values, 'mad')
         
         self.fitted = True
     
     def transform(self, data: Union[pd.DataFrame, np.ndarray], **kwargs) -> Union[pd.DataFrame, np.ndarray]:
         """
-        Remove outliers beyond the threshold using Z-score method.
+        Replace outliers beyond the threshold without changing the shape of the data.
+        
+        The mask of replaced samples is stored in ``mask_``.
         
         Args:
             data: Input data to transform
             **kwargs: Additional arguments
             
         Returns:
-            Data with outliers removed
+            Data with outliers clipped, set to NaN or interpolated
         """
         threshold = kwargs.get('threshold', self.config['threshold'])
+        method = kwargs.get('method', self.config['method'])
+        strategy = kwargs.get('strategy', self.config['strategy'])
+        window = kwargs.get('window', self.config['window'])
         
-        if isinstance(data, (pd.DataFrame, pd.Series)):
-            z_scores = (data - self.mean_).abs() / self.std_
-            return data[z_scores <= threshold]
+        if method == 'zscore':
+            center, scale = self.mean_, self.std_
+        elif method == 'mad':
+            center, scale = self.median_, self.mad_
         else:
-            z_scores = np.abs(data - self.mean_) / self.std_
-            return data[z_scores <= threshold]
+            center, scale = None, None
+        
+        cleaned, self.mask_ = remove_outliers_array(
+            as_chunk(data), method=method, threshold=threshold, strategy=strategy,
+            window=window, center=center, scale=scale
+        )
+        return restore_chunk(cleaned, data)
+    
+    def partial_fit(self, data: Union[pd.DataFrame, np.ndarray], **kwargs):
+        """
+        Update the running per-channel mean and standard deviation with one chunk.
+        
+        With ``alpha`` unset the statistics are exact (Welford) statistics over all
+        chunks seen so far; otherwise they are exponentially weighted.
+        
+        Args:
+            data: Chunk of samples
+            **kwargs: Additional arguments
+        """
+        self.config.update({k: v for k, v in kwargs.items() if k in ['threshold', 'alpha']})
+        stats = self._get_stats()
+        stats.update(as_chunk(data))
+        self.mean_ = stats.mean
+        self.std_ = stats.std
+        self.fitted = True
+    
+    def transform_chunk(self, data: Union[pd.DataFrame, np.ndarray], update: bool = True,
+                        **kwargs) -> Union[pd.DataFrame, np.ndarray]:
+        """
+        Replace outliers in one chunk of a stream using running Z-scores.
+        
+        Each sample is scored against the statistics of the samples before it, whatever
+        the configured ``method``. Samples seen while the standard deviation is still
+        zero pass through. Interpolation needs future samples, so with the
+        'interpolate' strategy an outlier takes the last valid value of its channel.
+        
+        Args:
+            data: Chunk of samples
+            update: Whether to add the chunk to the running statistics
+            **kwargs: Additional arguments
+            
+        Returns:
+            Chunk with outliers replaced
+        """
+        threshold = kwargs.get('threshold', self.config['threshold'])
+        strategy = kwargs.get('strategy', self.config['strategy'])
+        x = as_chunk(data)
+        stats = self._get_stats()
+        
+        if update:
+            if x.shape[0] == 0:
+                return restore_chunk(x.copy(), data)
+            prev_count, prev_mean, prev_var = stats.count, stats.mean, stats.var
+            means, variances = stats.update(x)
+            if prev_count == 0:
+                prev_mean, prev_var = x[0], np.zeros_like(x[0])
+            # Statistics before each sample: the previous state, then the running values.
+            means = np.concatenate([np.asarray(prev_mean)[np.newaxis], means[:-1]], axis=0)
+            variances = np.concatenate([np.asarray(prev_var)[np.newaxis], variances[:-1]], axis=0)
+            self.mean_ = stats.mean
+            self.std_ = stats.std
+            self.fitted = True
+        else:
+            if stats.count == 0:
+                raise ValueError("Preprocessor must be partially fitted before transform_chunk with update=False")
+            means, variances = stats.mean, stats.var
+        
+        std = np.sqrt(variances)
+        std = np.where(std > 0, std, np.inf)
+        lower, upper = means - threshold * std, means + threshold * std
+        if strategy == 'interpolate':
+            _, outliers = replace_outliers(x, lower, upper, 'nan')
+            cleaned, last_valid = forward_fill(x, self._last_valid, mask=outliers)
+            if update:
+                self._last_valid = last_valid
+        else:
+            cleaned, _ = replace_outliers(x, lower, upper, strategy)
+        return restore_chunk(cleaned, data)
+    
+    def reset_stream(self):
+        """Forget the running statistics."""
+        self._stats = None
+        self._last_valid = None
+    
+    def _get_stats(self) -> RunningStats:
+        if self._stats is None:
+            self._stats = RunningStats(self.config.get('alpha'))
+        return self._stats
 
 
-class BaselineRemovalPreprocessor(BasePreprocessor):
+class BaselineRemovalPreprocessor(RunningMeanStreamMixin, BasePreprocessor):
     """
     Preprocessor for removing baseline by subtracting the mean.
     """
     
-    def __init__(self):
+    def __init__(self, alpha: Optional[float] = None):
         super().__init__(
             name="baseline_removal",
             description="Removes baseline by subtracting the mean"
         )
+        self.config = {
+            'alpha': alpha
+        }
         self.mean_ = None
+        self._stats = None
     
     def fit(self, data: Union[pd.DataFrame, np.ndarray], **kwargs):
         """
@@ -203,7 +407,7 @@ class BaselineRemovalPreprocessor(BasePreprocessor):
         return data - self.mean_
 
 
-class DriftRemovalPreprocessor(BasePreprocessor):
+class DriftRemovalPreprocessor(SOSFilterStreamMixin, BasePreprocessor):
     """
     Preprocessor for removing low-frequency drift using high-pass filter.
     """
@@ -217,6 +421,7 @@ class DriftRemovalPreprocessor(BasePreprocessor):
             'cutoff': cutoff,
             'fs': fs
         }
+        self._filter_state = None
     
     def fit(self, data: Union[pd.DataFrame, np.ndarray], **kwargs):
         """
@@ -229,6 +434,23 @@ class DriftRemovalPreprocessor(BasePreprocessor):
         self.config.update({k: v for k, v in kwargs.items() if k in ['cutoff', 'fs']})
         self.fitted = True
     
+    def get_sos(self, **kwargs) -> np.ndarray:
+        """
+        Get the filter as second-order sections.
+        
+        Compiled pipelines cascade adjacent filters through this method instead of
+        running one ``filtfilt`` pass per stage.
+        
+        Args:
+            **kwargs: Optional ``cutoff``/``fs`` overrides
+            
+        Returns:
+            SOS array of shape (n_sections, 6)
+        """
+        cutoff = kwargs.get('cutoff', self.config['cutoff'])
+        fs = kwargs.get('fs', self.config['fs'])
+        return butter(1, cutoff / (fs / 2), btype='highpass', output='sos')
+    
     def transform(self, data: Union[pd.DataFrame, np.ndarray], **kwargs) -> Union[pd.DataFrame, np.ndarray]:
         """
         Remove low-frequency drift using a high-pass filter.
@@ -245,13 +467,10 @@ class DriftRemovalPreprocessor(BasePreprocessor):
         
         b, a = butter(1, cutoff / (fs / 2), btype='highpass')
         
-        if isinstance(data, (pd.DataFrame, pd.Series)):
-            return pd.Series(filtfilt(b, a, data), index=data.index)
-        else:
-            return filtfilt(b, a, data)
+        return _zero_phase(b, a, data)
 
 
-class HighFrequencyNoiseRemovalPreprocessor(BasePreprocessor):
+class HighFrequencyNoiseRemovalPreprocessor(SOSFilterStreamMixin, BasePreprocessor):
     """
     Preprocessor for removing high-frequency noise using low-pass filter.
     """
@@ -265,6 +484,7 @@ class HighFrequencyNoiseRemovalPreprocessor(BasePreprocessor):
             'cutoff': cutoff,
             'fs': fs
         }
+        self._filter_state = None
     
     def fit(self, data: Union[pd.DataFrame, np.ndarray], **kwargs):
         """
@@ -277,6 +497,23 @@ class HighFrequencyNoiseRemovalPreprocessor(BasePreprocessor):
         self.config.update({k: v for k, v in kwargs.items() if k in ['cutoff', 'fs']})
         self.fitted = True
     
+    def get_sos(self, **kwargs) -> np.ndarray:
+        """
+        Get the filter as second-order sections.
+        
+        Compiled pipelines cascade adjacent filters through this method instead of
+        running one ``filtfilt`` pass per stage.
+        
+        Args:
+            **kwargs: Optional ``cutoff``/``fs`` overrides
+            
+        Returns:
+            SOS array of shape (n_sections, 6)
+        """
+        cutoff = kwargs.get('cutoff', self.config['cutoff'])
+        fs = kwargs.get('fs', self.config['fs'])
+        return butter(1, cutoff / (fs / 2), btype='lowpass', output='sos')
+    
     def transform(self, data: Union[pd.DataFrame, np.ndarray], **kwargs) -> Union[pd.DataFrame, np.ndarray]:
         """
         Apply a low-pass filter to remove high-frequency noise.
@@ -293,13 +530,10 @@ class HighFrequencyNoiseRemovalPreprocessor(BasePreprocessor):
         
         b, a = butter(1, cutoff / (fs / 2), btype='lowpass')
         
-        if isinstance(data, (pd.DataFrame, pd.Series)):
-            return pd.Series(filtfilt(b, a, data), index=data.index)
-        else:
-            return filtfilt(b, a, data)
+        return _zero_phase(b, a, data)
 
 
-class LowFrequencyNoiseRemovalPreprocessor(BasePreprocessor):
+class LowFrequencyNoiseRemovalPreprocessor(SOSFilterStreamMixin, BasePreprocessor):
     """
     Preprocessor for removing low-frequency noise using high-pass filter.
     """
@@ -313,6 +547,7 @@ class LowFrequencyNoiseRemovalPreprocessor(BasePreprocessor):
             'cutoff': cutoff,
             'fs': fs
         }
+        self._filter_state = None
     
     def fit(self, data: Union[pd.DataFrame, np.ndarray], **kwargs):
         """
@@ -325,6 +560,23 @@ class LowFrequencyNoiseRemovalPreprocessor(BasePreprocessor):
         self.config.update({k: v for k, v in kwargs.items() if k in ['cutoff', 'fs']})
         self.fitted = True
     
+    def get_sos(self, **kwargs) -> np.ndarray:
+        """
+        Get the filter as second-order sections.
+        
+        Compiled pipelines cascade adjacent filters through this method instead of
+        running one ``filtfilt`` pass per stage.
+        
+        Args:
+            **kwargs: Optional ``cutoff``/``fs`` overrides
+            
+        Returns:
+            SOS array of shape (n_sections, 6)
+        """
+        cutoff = kwargs.get('cutoff', self.config['cutoff'])
+        fs = kwargs.get('fs', self.config['fs'])
+        return butter(1, cutoff / (fs / 2), btype='highpass', output='sos')
+    
     def transform(self, data: Union[pd.DataFrame, np.ndarray], **kwargs) -> Union[pd.DataFrame, np.ndarray]:
         """
         Apply a high-pass filter to remove low-frequency noise.
@@ -341,25 +593,28 @@ class LowFrequencyNoiseRemovalPreprocessor(BasePreprocessor):
         
         b, a = butter(1, cutoff / (fs / 2), btype='highpass')
         
-        if isinstance(data, (pd.DataFrame, pd.Series)):
-            return pd.Series(filtfilt(b, a, data), index=data.index)
-        else:
-            return filtfilt(b, a, data)
+        return _zero_phase(b, a, data)
 
 
 class ArtifactRemovalPreprocessor(BasePreprocessor):
     """
     Preprocessor for removing artifacts by interpolating missing values.
+    
+    Gaps in all channels are filled at once; gaps longer than ``max_gap`` samples are
+    left as NaN and marked in ``invalid_mask_``.
     """
     
-    def __init__(self, method: str = "linear"):
+    def __init__(self, method: str = "linear", max_gap: Optional[int] = None):
         super().__init__(
             name="artifact_removal",
             description="Removes artifacts by interpolating missing values"
         )
         self.config = {
-            'method': method
+            'method': method,
+            'max_gap': max_gap
         }
+        self.invalid_mask_ = None
+        self._last_valid = None
     
     def fit(self, data: Union[pd.DataFrame, np.ndarray], **kwargs):
         """
@@ -369,13 +624,17 @@ class ArtifactRemovalPreprocessor(BasePreprocessor):
             data: Input data to fit on
             **kwargs: Additional arguments
         """
-        self.config.update({k: v for k, v in kwargs.items() if k in ['method']})
+        self.config.update({k: v for k, v in kwargs.items() if k in ['method', 'max_gap']})
         self.fitted = True
     
     def transform(self, data: Union[pd.DataFrame, np.ndarray], **kwargs) -> Union[pd.DataFrame, np.ndarray]:
         """
         Remove artifacts by interpolating missing values.
         
+        The 'linear', 'ffill' and 'bfill' methods use the vectorised gap engine; other
+        pandas interpolation methods (e.g. 'cubic') fall back to ``DataFrame.interpolate``
+        and ignore ``max_gap``. Non-numeric DataFrame columns are left untouched.
+        
         Args:
             data: Input data to transform
             **kwargs: Additional arguments
@@ -384,33 +643,79 @@ class ArtifactRemovalPreprocessor(BasePreprocessor):
             Artifact-free data
         """
         method = kwargs.get('method', self.config['method'])
+        max_gap = kwargs.get('max_gap', self.config['max_gap'])
         
-        if isinstance(data, (pd.DataFrame, pd.Series)):
-            return data.interpolate(method=method).bfill().ffill()
-        else:
-            # For numpy arrays, use linear interpolation
-            from scipy.interpolate import interp1d
-            x = np.arange(len(data))
-            valid_mask = ~np.isnan(data)
-            if np.any(valid_mask):
-                f = interp1d(x[valid_mask], data[valid_mask], kind='linear', fill_value='extrapolate')
-                return f(x)
-            else:
-                return data
+        if method not in FILL_METHODS:
+            if isinstance(data, (pd.DataFrame, pd.Series)):
+                self.invalid_mask_ = None
+                return data.interpolate(method=method).bfill().ffill()
+            raise ValueError(f"Unknown fill method '{method}'. Available: {list(FILL_METHODS)}")
+        
+        if isinstance(data, pd.DataFrame):
+            numeric = data.select_dtypes(include=np.number).columns
+            filled, invalid = fill_gaps(data[numeric].to_numpy(), method, max_gap)
+            result = data.copy()
+            result[numeric] = filled
+            self.invalid_mask_ = pd.DataFrame(invalid, index=data.index, columns=numeric)
+            return result
+        
+        filled, invalid = fill_gaps(as_chunk(data), method, max_gap)
+        self.invalid_mask_ = invalid
+        return restore_chunk(filled, data)
+    
+    def partial_fit(self, data: Union[pd.DataFrame, np.ndarray], **kwargs):
+        """
+        Update the preprocessor with one chunk (nothing to learn).
+        
+        Args:
+            data: Chunk of samples
+            **kwargs: Additional arguments
+        """
+        self.fit(data, **kwargs)
+    
+    def transform_chunk(self, data: Union[pd.DataFrame, np.ndarray], update: bool = True,
+                        **kwargs) -> Union[pd.DataFrame, np.ndarray]:
+        """
+        Fill missing values in one chunk of a stream.
+        
+        Interpolation needs future samples, so in streaming mode each missing value is
+        replaced by the last valid value of its channel (carried across chunks).
+        
+        Args:
+            data: Chunk of samples
+            update: Whether to remember this chunk's last valid values
+            **kwargs: Additional arguments
+            
+        Returns:
+            Filled chunk
+        """
+        values, last_valid = forward_fill(as_chunk(data), self._last_valid)
+        if update:
+            self._last_valid = last_valid
+        return restore_chunk(values, data)
+    
+    def reset_stream(self):
+        """Forget the last valid values."""
+        self._last_valid = None
 
 
 class TrendRemovalPreprocessor(BasePreprocessor):
     """
     Preprocessor for removing trends using polynomial fitting.
+    
+    The least-squares projection is cached per (length, order), so batches of windows
+    are detrended with a single matrix multiply.
     """
     
-    def __init__(self, order: int = 2):
+    def __init__(self, order: int = 2, segment_length: Optional[int] = None, axis: int = 0):
         super().__init__(
             name="trend_removal",
             description="Removes trends using polynomial fitting"
         )
         self.config = {
-            'order': order
+            'order': order,
+            'segment_length': segment_length,
+            'axis': axis
         }
     
     def fit(self, data: Union[pd.DataFrame, np.ndarray], **kwargs):
@@ -421,13 +726,17 @@ class TrendRemovalPreprocessor(BasePreprocessor):
             data: Input data to fit on
             **kwargs: Additional arguments
         """
-        self.config.update({k: v for k, v in kwargs.items() if k in ['order']})
+        self.config.update({k: v for k, v in kwargs.items() if k in ['order', 'segment_length', 'axis']})
         self.fitted = True
     
     def transform(self, data: Union[pd.DataFrame, np.ndarray], **kwargs) -> Union[pd.DataFrame, np.ndarray]:
         """
         Remove trends using polynomial fitting.
         
+        Every signal along ``axis`` is detrended: columns of a DataFrame, or rows of a
+        (n_windows, window_size) array with ``axis=-1``. With ``segment_length`` set,
+        each segment gets its own polynomial.
+        
         Args:
             data: Input data to transform
             **kwargs: Additional arguments
@@ -436,30 +745,27 @@ class TrendRemovalPreprocessor(BasePreprocessor):
             Detrended data
         """
         order = kwargs.get('order', self.config['order'])
+        segment_length = kwargs.get('segment_length', self.config['segment_length'])
+        axis = kwargs.get('axis', self.config['axis'])
         
-        if isinstance(data, (pd.DataFrame, pd.Series)):
-            x = np.arange(len(data))
-            poly_coeffs = np.polyfit(x, data, order)
-            trend = np.polyval(poly_coeffs, x)
-            return data - trend
-        else:
-            x = np.arange(len(data))
-            poly_coeffs = np.polyfit(x, data, order)
-            trend = np.polyval(poly_coeffs, x)
-            return data - trend
+        return restore_chunk(detrend(as_chunk(data), order, axis, segment_length), data)
 
 
-class DCOffsetRemovalPreprocessor(BasePreprocessor):
+class DCOffsetRemovalPreprocessor(RunningMeanStreamMixin, BasePreprocessor):
     """
     Preprocessor for removing DC offset by subtracting the mean.
     """
     
-    def __init__(self):
+    def __init__(self, alpha: Optional[float] = None):
         super().__init__(
             name="dc_offset_removal",
             description="Removes DC offset by subtracting the mean"
         )
+        self.config = {
+            'alpha': alpha
+        }
         self.mean_ = None
+        self._stats = None
     
     def fit(self, data: Union[pd.DataFrame, np.ndarray], **kwargs):
         """
@@ -487,4 +793,4 @@ class DCOffsetRemovalPreprocessor(BasePreprocessor):
         Returns:
             DC-corrected data
         """
-        return data - self.mean_ 
\ No newline at end of file
+        return data - self.mean_
@@ -0,0 +1,418 @@
+'''
+Streaming state helpers for online preprocessing.
+
+This module contains the bounded per-channel state used by the streaming
+(``partial_fit``/``transform_chunk``) mode of the preprocessors:
+
+- RunningStats: Welford or exponentially weighted running mean and variance
+- SOSFilterState: second-order-section filter memory carried across chunks
+- causal_moving_average: trailing moving average with a carried tail buffer
+- forward_fill: carry the last valid value forward across chunks
+- RunningMeanStreamMixin, SOSFilterStreamMixin: the ``partial_fit``/
+  ``transform_chunk``/``reset_stream`` methods shared by the running-mean and
+  causal-filter preprocessors
+
+All state has the shape of one sample (one value per channel), apart from the
+moving average tail which holds ``window_size - 1`` samples.
+
+Maintainer: @aharshit123456
+'''
+
+from typing import Any, Optional, Tuple
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter, sosfilt, sosfilt_zi
+from ..core.precision import as_float_array
+
+
+def as_chunk(data: Any) -> np.ndarray:
+    """
+    Convert a chunk to a floating point array with samples along axis 0.
+
+    Args:
+        data: Chunk as numpy array, DataFrame or Series
+
+    Returns:
+        Floating point array
+    """
+    return as_float_array(data.to_numpy() if isinstance(data, (pd.DataFrame, pd.Series)) else data)
+
+
+def restore_chunk(values: np.ndarray, like: Any) -> Any:
+    """
+    Restore the pandas container of the original chunk.
+
+    Args:
+        values: Transformed values
+        like: Original chunk
+
+    Returns:
+        DataFrame/Series with the original index and labels, or ``values``
+    """
+    if isinstance(like, pd.DataFrame):
+        return pd.DataFrame(values, index=like.index, columns=like.columns)
+    if isinstance(like, pd.Series):
+        return pd.Series(values, index=like.index, name=like.name)
+    return values
+
+
+def _advance_stats(x: np.ndarray, mean: np.ndarray, m2: np.ndarray, n: np.ndarray,
+                   alpha: Optional[float]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Running statistics of NaN-free samples, continuing from a previous state.
+
+    Args:
+        x: Array of samples along axis 0
+        mean: Previous mean per channel (ignored where ``n == 0``)
+        m2: Previous sum of squared deviations (Welford) or variance (exponential)
+        n: Previous number of samples per channel
+        alpha: Smoothing factor, or None for Welford
+
+    Returns:
+        Tuple ``(means, variances, m2)`` with per-sample statistics and the new ``m2``
+    """
+    mean = np.where(n > 0, mean, x[0])
+    m2 = np.where(n > 0, m2, 0)
+    if alpha is None:
+        counts = n + np.arange(1, x.shape[0] + 1).reshape((x.shape[0],) + (1,) * (x.ndim - 1))
+        # Shifting by the previous mean keeps the cumulative sums well conditioned.
+        d = x - mean
+        s1 = np.cumsum(d, axis=0)
+        s2 = np.cumsum(d * d, axis=0)
+        means = mean + s1 / counts
+        m2s = m2 + s2 - s1 * s1 / counts
+        np.maximum(m2s, 0, out=m2s)
+        return means, m2s / counts, m2s[-1].copy()
+    decay = 1.0 - alpha
+    # mean_t = decay * mean_{t-1} + a * x_t
+    means = lfilter([alpha], [1.0, -decay], x, axis=0, zi=(decay * mean)[np.newaxis])[0]
+    prev_means = np.concatenate([mean[np.newaxis], means[:-1]], axis=0)
+    # var_t = decay * (var_{t-1} + a * (x_t - mean_{t-1})^2)
+    u = decay * alpha * (x - prev_means) ** 2
+    variances = lfilter([1.0], [1.0, -decay], u, axis=0, zi=(decay * m2)[np.newaxis])[0]
+    return means, variances, variances[-1].copy()
+
+
+class RunningStats:
+    """
+    Per-channel running mean and variance.
+
+    With ``alpha=None`` the statistics are exact cumulative (Welford) statistics over
+    everything seen so far; with ``0 < alpha <= 1`` they are exponentially weighted,
+    so old samples are forgotten. Each chunk is processed with vectorised cumulative
+    sums / ``lfilter`` instead of a Python loop over samples.
+
+    NaN samples are skipped: they leave the statistics of their channel unchanged,
+    and a channel's statistics are NaN until its first valid sample.
+    """
+
+    def __init__(self, alpha: Optional[float] = None):
+        """
+        Initialize the running statistics.
+
+        Args:
+            alpha: Smoothing factor for exponential weighting, or None for Welford
+        """
+        if alpha is not None and not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.reset()
+
+    def reset(self):
+        """Forget all samples seen so far."""
+        self.count = 0
+        self.mean = None
+        self._m2 = None
+        self._n = None
+
+    @property
+    def var(self) -> Optional[np.ndarray]:
+        """Current (population) variance per channel."""
+        if self.count == 0:
+            return None
+        return self._variance(self._m2, self._n)
+
+    @property
+    def std(self) -> Optional[np.ndarray]:
+        """Current standard deviation per channel."""
+        var = self.var
+        return None if var is None else np.sqrt(var)
+
+    def _variance(self, m2: np.ndarray, n: np.ndarray) -> np.ndarray:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            var = m2 if self.alpha is not None else m2 / n
+        return np.where(n > 0, var, np.nan)
+
+    def update(self, chunk: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Add a chunk and return the per-sample running statistics.
+
+        Args:
+            chunk: Array of samples along axis 0
+
+        Returns:
+            Tuple ``(means, variances)`` of the same shape as ``chunk``; row ``t`` holds
+            the statistics over all valid samples up to and including sample ``t``
+        """
+        x = as_chunk(chunk)
+        n = x.shape[0]
+        if n == 0:
+            return x.copy(), x.copy()
+        if self.count == 0:
+            self.mean = np.full(x.shape[1:], np.nan, dtype=x.dtype)
+            self._m2 = np.zeros(x.shape[1:], dtype=x.dtype)
+            self._n = np.zeros(x.shape[1:], dtype=np.int64)
+
+        missing = np.isnan(x)
+        if missing.any():
+            means, variances = self._update_skipping_nan(x, missing)
+        else:
+            means, variances, self._m2 = _advance_stats(x, self.mean, self._m2, self._n, self.alpha)
+            self.mean = means[-1].copy()
+            self._n = self._n + n
+        self.count += n
+        return means, variances
+
+    def _update_skipping_nan(self, x: np.ndarray, missing: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # Channels have valid samples at different rows, so each is advanced over its own
+        # valid samples; rows with a NaN repeat the statistics of the previous row.
+        flat = x.reshape(x.shape[0], -1)
+        valid = ~missing.reshape(flat.shape)
+        mean, m2, count = self.mean.reshape(-1), self._m2.reshape(-1), self._n.reshape(-1)
+        means, variances = np.empty_like(flat), np.empty_like(flat)
+        for c in range(flat.shape[1]):
+            rows = valid[:, c]
+            history_mean = np.array([mean[c]])
+            history_var = np.array([self._variance(m2[c], count[c])])
+            if rows.any():
+                m, v, m2[c] = _advance_stats(flat[rows, c], mean[c], m2[c], count[c], self.alpha)
+                history_mean = np.concatenate([history_mean, m])
+                history_var = np.concatenate([history_var, v])
+                mean[c] = m[-1]
+                count[c] += rows.sum()
+            latest = np.cumsum(rows)
+            means[:, c] = history_mean[latest]
+            variances[:, c] = history_var[latest]
+        self.mean, self._m2, self._n = (a.reshape(x.shape[1:]) for a in (mean, m2, count))
+        return means.reshape(x.shape), variances.reshape(x.shape)
+
+
+class SOSFilterState:
+    """
+    Causal second-order-section filter whose memory is carried across chunks.
+
+    The filter state is initialised from the first sample as the steady state for a
+    constant input, so the start of a stream does not ring.
+    """
+
+    def __init__(self, sos: np.ndarray):
+        """
+        Initialize the filter state.
+
+        Args:
+            sos: Filter as second-order sections
+        """
+        self.sos = np.asarray(sos)
+        self.zi = None
+
+    def reset(self):
+        """Forget the filter memory."""
+        self.zi = None
+
+    def initial_state(self, first_sample: np.ndarray) -> np.ndarray:
+        """
+        Get the steady-state filter memory for a constant input.
+
+        Args:
+            first_sample: First sample of the stream (one value per channel)
+
+        Returns:
+            Filter state of shape (n_sections, 2, *channels)
+        """
+        first_sample = np.asarray(first_sample)
+        zi = sosfilt_zi(self.sos)
+        return zi.reshape(zi.shape + (1,) * first_sample.ndim) * first_sample
+
+    def process(self, chunk: np.ndarray, update: bool = True) -> np.ndarray:
+        """
+        Filter one chunk.
+
+        Args:
+            chunk: Array of samples along axis 0
+            update: Whether to keep the filter memory after this chunk
+
+        Returns:
+            Filtered chunk
+        """
+        x = as_chunk(chunk)
+        if x.shape[0] == 0:
+            return x.copy()
+        zi = self.zi if self.zi is not None else self.initial_state(x[0])
+        y, zf = sosfilt(self.sos, x, axis=0, zi=zi)
+        if update:
+            self.zi = zf
+        return y
+
+
+def causal_moving_average(chunk: np.ndarray, window_size: int,
+                          tail: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Trailing moving average of a chunk, continuing from the previous chunk's tail.
+
+    At the start of a stream the window is padded with the first sample.
+
+    Args:
+        chunk: Array of samples along axis 0
+        window_size: Number of samples averaged per output sample
+        tail: Last ``window_size - 1`` input samples of the previous chunk, or None
+
+    Returns:
+        Tuple ``(averaged chunk, new tail)``
+    """
+    x = as_chunk(chunk)
+    if x.shape[0] == 0:
+        return x.copy(), tail
+    if tail is None:
+        tail = np.repeat(x[:1], window_size - 1, axis=0)
+    padded = np.concatenate([tail, x], axis=0)
+    csum = np.cumsum(padded, axis=0)
+    csum = np.concatenate([np.zeros_like(csum[:1]), csum], axis=0)
+    averaged = (csum[window_size:] - csum[:-window_size]) / window_size
+    new_tail = padded[padded.shape[0] - (window_size - 1):].copy()
+    return averaged, new_tail
+
+
+def forward_fill(chunk: np.ndarray, last_valid: Optional[np.ndarray] = None,
+                 mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Replace samples by the last valid value of the same channel, across chunks.
+
+    This is the streaming counterpart of ``gaps.fill_masked(..., method='ffill')``.
+
+    Args:
+        chunk: Array of samples along axis 0
+        last_valid: Last valid value per channel from the previous chunk, or None
+        mask: Boolean array marking the samples to replace (default: None, the NaNs);
+              NaNs outside the mask are kept
+
+    Returns:
+        Tuple ``(filled chunk, last valid value per channel)``; valid values are
+        the unmasked, non-NaN samples, and samples before the first valid value of
+        a stream stay NaN
+    """
+    x = as_chunk(chunk)
+    if x.shape[0] == 0:
+        return x.copy(), last_valid
+    if last_valid is None:
+        last_valid = np.full(x.shape[1:], np.nan, dtype=x.dtype)
+    fill = np.isnan(x) if mask is None else np.asarray(mask, dtype=bool)
+    padded = np.concatenate([np.asarray(last_valid, dtype=x.dtype)[np.newaxis], x], axis=0)
+    source = ~fill & ~np.isnan(x)
+    index_shape = (padded.shape[0],) + (1,) * (x.ndim - 1)
+    idx = np.arange(padded.shape[0]).reshape(index_shape) * np.concatenate([np.ones_like(source[:1]), source])
+    np.maximum.accumulate(idx, axis=0, out=idx)
+    filled = np.take_along_axis(padded, idx, axis=0)
+    return np.where(fill, filled[1:], x), filled[-1].copy()
+
+
+class RunningMeanStreamMixin:
+    """
+    Streaming mode of preprocessors that subtract a per-channel mean.
+
+    The preprocessor keeps ``config['alpha']`` (None for the exact mean, otherwise the
+    exponential smoothing factor), ``mean_`` and a ``_stats`` slot initialised to None.
+    """
+
+    def partial_fit(self, data: Any, **kwargs):
+        """
+        Update the running per-channel mean with one chunk.
+
+        With ``alpha`` unset the mean is the exact mean of all chunks seen so far;
+        otherwise it is exponentially weighted. NaN samples are skipped.
+
+        Args:
+            data: Chunk of samples
+            **kwargs: Additional arguments
+        """
+        self.config.update({k: v for k, v in kwargs.items() if k in ['alpha']})
+        stats = self._get_stats()
+        stats.update(as_chunk(data))
+        self.mean_ = stats.mean
+        self.fitted = True
+
+    def transform_chunk(self, data: Any, update: bool = True, **kwargs) -> Any:
+        """
+        Subtract the running mean from one chunk of a stream.
+
+        Args:
+            data: Chunk of samples
+            update: Whether to add the chunk to the running mean. If True, each sample
+                has the mean up to and including itself subtracted; otherwise the
+                current mean is subtracted from the whole chunk.
+            **kwargs: Additional arguments
+
+        Returns:
+            Chunk with the running mean removed
+        """
+        x = as_chunk(data)
+        stats = self._get_stats()
+        if update:
+            means, _ = stats.update(x)
+            self.mean_ = stats.mean
+            self.fitted = True
+        elif stats.count == 0:
+            raise ValueError("Preprocessor must be partially fitted before transform_chunk with update=False")
+        else:
+            means = stats.mean
+        return restore_chunk(x - means, data)
+
+    def reset_stream(self):
+        """Forget the running statistics."""
+        self._stats = None
+
+    def _get_stats(self) -> RunningStats:
+        if self._stats is None:
+            self._stats = RunningStats(self.config.get('alpha'))
+        return self._stats
+
+
+class SOSFilterStreamMixin:
+    """
+    Streaming mode of preprocessors that apply the filter returned by ``get_sos``.
+
+    The preprocessor keeps a ``_filter_state`` slot initialised to None.
+    """
+
+    def partial_fit(self, data: Any, **kwargs):
+        """
+        Update the preprocessor with one chunk (the filter has nothing to learn).
+
+        Args:
+            data: Chunk of samples
+            **kwargs: Additional arguments
+        """
+        self.fit(data, **kwargs)
+
+    def transform_chunk(self, data: Any, update: bool = True, **kwargs) -> Any:
+        """
+        Filter one chunk of a stream causally.
+
+        The filter memory is carried between chunks, so the output equals a single
+        causal ``sosfilt`` pass over the whole stream. Unlike ``transform`` this is
+        not zero-phase.
+
+        Args:
+            data: Chunk of samples
+            update: Whether to keep the filter memory after this chunk
+            **kwargs: Additional arguments
+
+        Returns:
+            Filtered chunk
+        """
+        if self._filter_state is None:
+            self._filter_state = SOSFilterState(self.get_sos())
+        return restore_chunk(self._filter_state.process(as_chunk(data), update=update), data)
+
+    def reset_stream(self):
+        """Forget the filter memory."""
+        self._filter_state = None
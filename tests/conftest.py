@@ -12,6 +12,8 @@ import pandas as pd
 import numpy as np
 import tempfile
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch, MagicMock
 from typing import List, Dict, Any
 
@@ -209,6 +211,42 @@ def sample_features():
     return features
 
 
+@pytest.fixture
+def make_features():
+    """
+    Factory for feature dictionaries whose 'mean' feature separates the labels.
+
+    Call it with the labels of every window, or with a number of windows to draw
+    labels from ``classes``; each sensor gets 'mean' (label plus Gaussian noise)
+    and 'std' (uniform noise) features and the labels as annotations.
+    """
+    def make(labels=60, classes=(0, 1), sensors=('sensor1',), noise=0.1, seed=0):
+        rng = np.random.default_rng(seed)
+        labels = rng.choice(classes, labels) if np.isscalar(labels) else np.asarray(labels)
+        return [{
+            'name': sensor,
+            'features': {'mean': (labels + rng.normal(0, noise, len(labels))).tolist(),
+                         'std': rng.random(len(labels)).tolist()},
+            'annotations': labels.tolist()
+        } for sensor in sensors]
+    return make
+
+
+@pytest.fixture
+def make_arrays():
+    """
+    Factory for a float32 feature matrix and label codes with one cluster per class.
+
+    Every feature of a row is ``spacing * label`` plus Gaussian noise.
+    """
+    def make(n=240, n_features=4, n_classes=3, spacing=1.0, noise=0.4, seed=0):
+        rng = np.random.default_rng(seed)
+        y = rng.integers(0, n_classes, n)
+        X = (spacing * y[:, None] + rng.normal(0, noise, (n, n_features))).astype(np.float32)
+        return X, y
+    return make
+
+
 @pytest.fixture
 def temp_data_dir():
     """Create a temporary directory for test data."""
@@ -234,6 +272,114 @@ def mock_downloads():
             yield mock_download, mock_extract
 
 
+class LocalFileServer:
+    """
+    In-process HTTP server standing in for dataset mirrors in download tests.
+
+    Files are served from the ``files`` dict (name -> bytes) with HTTP/1.1 keep-alive
+    and Range support. Faults can be injected per file:
+
+    - ``fail_count[name] = n``: answer the first n requests with HTTP 503
+    - ``truncate_after[name] = k``: send only k bytes of the next response, then drop
+      the connection
+    - ``ignore_range``: always answer with the whole file (HTTP 200)
+
+    Every request is recorded in ``requests`` as ``(path, range header, client port)``.
+    """
+
+    def __init__(self):
+        self.files: Dict[str, bytes] = {}
+        self.fail_count: Dict[str, int] = {}
+        self.truncate_after: Dict[str, int] = {}
+        self.ignore_range = False
+        self.requests: List[tuple] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={'poll_interval': 0.05},
+                                        daemon=True)
+
+    def url(self, name: str) -> str:
+        """URL of a served file."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/{name}"
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                name = self.path.lstrip('/')
+                range_header = self.headers.get('Range')
+                with server._lock:
+                    server.requests.append((name, range_header, self.client_address[1]))
+                    failures = server.fail_count.get(name, 0)
+                    if failures:
+                        server.fail_count[name] = failures - 1
+                    truncate = server.truncate_after.pop(name, None)
+
+                if name not in server.files:
+                    return self._reply(404, b'not found')
+                if failures:
+                    return self._reply(503, b'unavailable')
+
+                data = server.files[name]
+                start = 0
+                if range_header and not server.ignore_range:
+                    start = int(range_header.split('=', 1)[1].split('-', 1)[0])
+                    if start >= len(data):
+                        return self._reply(416, b'', {'Content-Range': f'bytes */{len(data)}'})
+                    headers = {'Content-Range': f'bytes {start}-{len(data) - 1}/{len(data)}'}
+                    status = 206
+                else:
+                    headers = {}
+                    status = 200
+
+                body = data[start:]
+                self.send_response(status)
+                self.send_header('Content-Length', str(len(body)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                if truncate is not None:
+                    self.wfile.write(body[:truncate])
+                    self.wfile.flush()
+                    self.close_connection = True
+                    return
+                self.wfile.write(body)
+
+            def _reply(self, status, body, headers=None):
+                self.send_response(status)
+                self.send_header('Content-Length', str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+@pytest.fixture
+def http_file_server():
+    """Local HTTP server for exercising the download engine without network access."""
+    server = LocalFileServer()
+    server.start()
+    yield server
+    server.stop()
+
+
 class TestDataGenerator:
     """Utility class for generating test data."""
     
@@ -0,0 +1,166 @@
+"""
+Unit tests for multimodal stream alignment in GaitSetPy.
+
+This module tests the searchsorted-based alignment primitives, align_streams /
+align_frames and the UrFall and HAR-UP alignment entry points.
+
+Maintainer: @aharshit123456
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gaitsetpy.dataset.alignment import (
+    align_frames,
+    align_streams,
+    interpolate,
+    make_timeline,
+    nearest_indices,
+    previous_indices,
+    to_seconds,
+)
+
+
+class TestAlignmentPrimitives:
+    """Test cases for the index and interpolation primitives."""
+
+    def test_nearest_matches_merge_asof(self):
+        """Test nearest matching against pandas merge_asof."""
+        rng = np.random.default_rng(0)
+        source = np.sort(rng.uniform(0, 10, 200))
+        target = np.sort(rng.uniform(-1, 11, 300))
+
+        index, valid = nearest_indices(source, target, tolerance=0.05)
+
+        expected = pd.merge_asof(pd.DataFrame({'t': target}), pd.DataFrame({'t': source, 'i': np.arange(200)}),
+                                 on='t', direction='nearest', tolerance=0.05)
+        np.testing.assert_array_equal(valid, expected['i'].notna().to_numpy())
+        np.testing.assert_allclose(np.abs(source[index[valid]] - target[valid]),
+                                   np.abs(source[expected['i'].dropna().astype(int)] - target[valid]))
+
+    def test_previous_indices(self):
+        """Test sample-and-hold matching."""
+        index, valid = previous_indices(np.array([0.0, 1.0, 2.0]), np.array([-0.5, 0.0, 1.5, 5.0]), tolerance=1.0)
+        assert list(valid) == [False, True, True, False]
+        assert list(index[valid]) == [0, 1]
+
+    def test_interpolate(self):
+        """Test linear interpolation with a maximum gap."""
+        source = np.array([0.0, 1.0, 2.0, 10.0])
+        values = np.column_stack([source * 2, -source])
+        out, valid = interpolate(source, values, np.array([-1.0, 0.0, 0.5, 2.0, 5.0, 10.0, 11.0]), max_gap=2.0)
+
+        assert list(valid) == [False, True, True, True, False, False, False]
+        np.testing.assert_allclose(out[valid], [[0, 0], [1, -0.5], [4, -2]])
+        assert np.isnan(out[~valid]).all()
+
+    def test_to_seconds_and_timeline(self):
+        """Test timestamp conversion and timeline generation."""
+        np.testing.assert_allclose(to_seconds([1000, 1500], unit='ms'), [1.0, 1.5])
+        seconds = to_seconds(np.array(['2018-07-04T12:04:17.500', '2018-07-04T12:04:18.000']))
+        assert seconds[1] - seconds[0] == pytest.approx(0.5)
+        np.testing.assert_allclose(make_timeline(1.0, 2.0, 4), [1.0, 1.25, 1.5, 1.75, 2.0])
+        with pytest.raises(ValueError):
+            to_seconds([1], unit='h')
+
+
+class TestAlignStreams:
+    """Test cases for align_streams and align_frames."""
+
+    def test_reference_timeline_and_masks(self):
+        """Test nearest and linear alignment onto a reference stream."""
+        camera = np.arange(0, 1.0, 1 / 30)
+        accel_t = np.arange(0.1, 0.6, 0.01)
+        aligned = align_streams(
+            {'camera': (camera, np.arange(len(camera))), 'accel': (accel_t, np.column_stack([accel_t, 2 * accel_t]))},
+            reference='camera', method={'accel': 'linear'}, tolerance={'accel': 0.02},
+            channel_names={'accel': ['a', 'b']})
+
+        assert aligned.data.shape == (30, 3)
+        assert aligned.channels == ['camera.0', 'accel.a', 'accel.b']
+        assert aligned.masks['camera'].all()
+        inside = (camera >= 0.1) & (camera <= accel_t[-1])
+        np.testing.assert_array_equal(aligned.masks['accel'], inside)
+        np.testing.assert_allclose(aligned.stream('accel')[inside, 0], camera[inside])
+        assert np.isnan(aligned.stream('accel')[~inside]).all()
+        np.testing.assert_array_equal(aligned.valid, inside)
+
+    def test_unsorted_input_and_rate(self):
+        """Test that unsorted streams are sorted and resampled over their overlap."""
+        t = np.array([0.3, 0.0, 0.2, 0.1])
+        aligned = align_streams({'a': (t, t * 10), 'b': (np.array([0.05, 0.25]), np.array([1.0, 2.0]))},
+                                rate=20, method='previous')
+        np.testing.assert_allclose(aligned.times, [0.05, 0.1, 0.15, 0.2, 0.25])
+        np.testing.assert_allclose(aligned.stream('a')[:, 0], [0, 1, 1, 2, 2])
+        np.testing.assert_allclose(aligned.stream('b')[:, 0], [1, 1, 1, 1, 2])
+
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        stream = {'a': (np.arange(3.0), np.arange(3.0))}
+        with pytest.raises(ValueError):
+            align_streams(stream)
+        with pytest.raises(ValueError):
+            align_streams(stream, rate=10, method='cubic')
+        with pytest.raises(ValueError):
+            align_streams({'a': (np.arange(3.0), np.arange(2.0))}, rate=10)
+
+    def test_align_frames(self):
+        """Test aligning DataFrames by their time columns."""
+        frames = {
+            'acc': pd.DataFrame({'ms': [0, 10, 20, 30], 'x': [0.0, 1.0, 2.0, 3.0], 'tag': list('abcd')}),
+            'sync': pd.DataFrame({'ms': [5, 25], 'frame': [1, 2]}),
+        }
+        aligned = align_frames(frames, time_column='ms', unit='ms', reference='sync', method='linear')
+        assert aligned.channels == ['acc.x', 'sync.frame']
+        np.testing.assert_allclose(aligned.data, [[0.5, 1], [2.5, 2]])
+
+
+class TestLoaderAlignment:
+    """Test cases for the dataset-specific alignment entry points."""
+
+    def test_urfall_align_sequence(self, temp_data_dir):
+        """Test joining UrFall accelerometer, sync and depth-feature streams."""
+        from gaitsetpy.dataset.urfall import UrFallLoader
+
+        frames = np.arange(1, 11)
+        frame_ms = (frames - 1) * 1000 / 30
+        pd.DataFrame({'f': frames, 't': frame_ms, 'sv': frames * 0.1}).to_csv(
+            os.path.join(temp_data_dir, "fall-01-data.csv"), header=False, index=False)
+        acc_ms = np.arange(0, 250, 10)
+        pd.DataFrame({'t': acc_ms, 'sv': acc_ms / 100, 'x': 1.0, 'y': 2.0, 'z': 3.0}).to_csv(
+            os.path.join(temp_data_dir, "fall-01-acc.csv"), header=False, index=False)
+        rows = [['fall-01', f, 1] + [float(f)] * 8 for f in (2, 4, 6, 99)]
+        pd.DataFrame(rows).to_csv(os.path.join(temp_data_dir, "urfall-cam0-falls.csv"), header=False, index=False)
+
+        aligned = UrFallLoader().align_sequence(temp_data_dir, "fall-01")
+
+        np.testing.assert_allclose(aligned.times, frame_ms / 1000)
+        assert aligned.masks['sync'].all()
+        np.testing.assert_array_equal(aligned.masks['accelerometer'], frame_ms <= 240)
+        np.testing.assert_allclose(aligned.stream('accelerometer')[:8, 0], frame_ms[:8] / 100)
+        np.testing.assert_array_equal(np.flatnonzero(aligned.masks['features']), [1, 3, 5])
+        assert 'features.HeightWidthRatio' in aligned.channels
+        with pytest.raises(FileNotFoundError):
+            UrFallLoader().align_sequence(temp_data_dir, "adl-01")
+
+    def test_harup_align_trial(self):
+        """Test splitting a HAR-UP trial into sensor streams with validity masks."""
+        from gaitsetpy.dataset.harup import HARUPLoader
+
+        stamps = pd.date_range('2018-07-04 12:00:00', periods=6, freq='10ms').astype(str)
+        df = pd.DataFrame({
+            'Timestamp': stamps,
+            'Belt_Acc_X': [1.0, 2, 3, 4, 5, 6],
+            'Wrist_Acc_X': [1.0, np.nan, 3, np.nan, 5, np.nan],
+            'activity_id': 1, 'trial_id': [1, 1, 1, 1, 1, 2],
+        })
+
+        aligned = HARUPLoader().align_trial(df, activity_id=1, trial_id=1, tolerance=0.001)
+
+        assert len(aligned.times) == 5
+        assert aligned.masks['belt'].all()
+        assert list(aligned.masks['wrist']) == [True, False, True, False, True]
+        assert aligned.channels == ['belt.Acc_X', 'wrist.Acc_X']
@@ -0,0 +1,157 @@
+"""
+Unit tests for streaming archive access in GaitSetPy.
+
+This module tests reading members straight from zip archives, selective parallel
+extraction and the loaders that parse dataset files without extracting them.
+
+Maintainer: @aharshit123456
+"""
+
+import os
+import zipfile
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from gaitsetpy.dataset.archives import (
+    extract_members,
+    file_crc32,
+    is_extracted,
+    iter_members,
+    list_members,
+    open_member,
+    read_member,
+)
+
+
+@pytest.fixture
+def sample_zip(temp_data_dir):
+    """Zip archive with a few text and binary members."""
+    path = os.path.join(temp_data_dir, "sample.zip")
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("root/", "")
+        zf.writestr("root/b.txt", "bravo")
+        zf.writestr("root/a.txt", "alpha")
+        for i in range(12):
+            zf.writestr(f"root/frames/frame-{i:03d}.png", os.urandom(2000 + i))
+    return path
+
+
+class TestArchiveReading:
+    """Test cases for reading archive members as streams."""
+
+    def test_list_members(self, sample_zip):
+        """Test listing with and without a pattern."""
+        names = [info.filename for info in list_members(sample_zip)]
+        assert names[:2] == ["root/a.txt", "root/b.txt"]
+        assert "root/" not in names
+        assert len(list_members(sample_zip, "*.png")) == 12
+
+    def test_iter_members(self, sample_zip):
+        """Test streaming members in name order."""
+        contents = [(name, stream.read()) for name, stream in iter_members(sample_zip, "*.txt")]
+        assert contents == [("root/a.txt", b"alpha"), ("root/b.txt", b"bravo")]
+
+    def test_open_and_read_member(self, sample_zip):
+        """Test single-member access."""
+        with open_member(sample_zip, "root/b.txt") as stream:
+            assert stream.read() == b"bravo"
+        assert read_member(sample_zip, "root/a.txt") == b"alpha"
+
+
+class TestExtractMembers:
+    """Test cases for selective parallel extraction."""
+
+    def test_extract_all(self, sample_zip, temp_data_dir):
+        """Test that every member is extracted with its contents."""
+        dest = os.path.join(temp_data_dir, "out")
+        stats = extract_members(sample_zip, dest, max_workers=4)
+
+        assert stats == {"extracted": 14, "skipped": 0}
+        with zipfile.ZipFile(sample_zip) as zf:
+            for info in zf.infolist():
+                if not info.is_dir():
+                    with open(os.path.join(dest, info.filename), "rb") as f:
+                        assert f.read() == zf.read(info)
+        assert not any(name.endswith(".part") for _, _, files in os.walk(dest) for name in files)
+
+    def test_selective_extraction(self, sample_zip, temp_data_dir):
+        """Test extraction by pattern and by explicit member list."""
+        dest = os.path.join(temp_data_dir, "out")
+        assert extract_members(sample_zip, dest, pattern="*.txt")["extracted"] == 2
+        assert not os.path.exists(os.path.join(dest, "root/frames"))
+
+        stats = extract_members(sample_zip, dest, members=["root/frames/frame-003.png"])
+        assert stats == {"extracted": 1, "skipped": 0}
+
+        with pytest.raises(KeyError):
+            extract_members(sample_zip, dest, members=["root/missing.txt"])
+
+    def test_skip_matching_and_replace_corrupt(self, sample_zip, temp_data_dir):
+        """Test that present files are skipped only when size and CRC match."""
+        dest = os.path.join(temp_data_dir, "out")
+        extract_members(sample_zip, dest)
+
+        corrupt = os.path.join(dest, "root/frames/frame-005.png")
+        size = os.path.getsize(corrupt)
+        with open(corrupt, "wb") as f:
+            f.write(b"\0" * size)  # same size, different CRC
+        os.remove(os.path.join(dest, "root/a.txt"))
+
+        stats = extract_members(sample_zip, dest)
+
+        assert stats == {"extracted": 2, "skipped": 12}
+        info = zipfile.ZipFile(sample_zip).getinfo("root/frames/frame-005.png")
+        assert is_extracted(info, corrupt)
+        assert file_crc32(corrupt) == info.CRC
+
+    def test_rejects_path_traversal(self, temp_data_dir):
+        """Test that members escaping the destination are refused."""
+        path = os.path.join(temp_data_dir, "evil.zip")
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("../escape.txt", "x")
+
+        with pytest.raises(ValueError):
+            extract_members(path, os.path.join(temp_data_dir, "out"))
+        assert not os.path.exists(os.path.join(temp_data_dir, "escape.txt"))
+
+
+class TestLoadersFromArchive:
+    """Test cases for loaders reading straight from dataset archives."""
+
+    def test_daphnet_from_archive(self, temp_data_dir):
+        """Test that Daphnet recordings are parsed from the zip without extracting it."""
+        from gaitsetpy.dataset.daphnet import DaphnetLoader
+
+        rows = np.column_stack([np.arange(5) * 15.625] + [np.arange(5) + c for c in range(9)]
+                               + [np.ones(5, dtype=int)])
+        text = "\n".join(" ".join(str(v) for v in row) for row in rows) + "\n"
+        with zipfile.ZipFile(os.path.join(temp_data_dir, "daphnet.zip"), "w") as zf:
+            zf.writestr("dataset_fog_release/dataset/S02R01.txt", text)
+            zf.writestr("dataset_fog_release/dataset/S01R01.txt", text)
+            zf.writestr("dataset_fog_release/doc/Summary.txt", "not a recording")
+
+        with patch("gaitsetpy.dataset.daphnet.download_dataset"):
+            data, names = DaphnetLoader().load_data(temp_data_dir)
+
+        assert names == ["S01R01.txt", "S02R01.txt"]
+        assert len(data) == 2
+        assert data[0].shape == (5, 13)
+        np.testing.assert_allclose(data[0]["shank"], np.sqrt(rows[:, 1] ** 2 + rows[:, 2] ** 2 + rows[:, 3] ** 2))
+        assert not os.path.exists(os.path.join(temp_data_dir, "dataset_fog_release"))
+
+    def test_urfall_frame_files(self, temp_data_dir):
+        """Test streaming UrFall frames from a sequence archive."""
+        from gaitsetpy.dataset.urfall import UrFallLoader
+
+        with zipfile.ZipFile(os.path.join(temp_data_dir, "fall-01-cam0-d.zip"), "w") as zf:
+            for i in (2, 1, 3):
+                zf.writestr(f"fall-01-cam0-d/fall-01-cam0-d-{i:03d}.png", bytes([i]) * 10)
+
+        frames = list(UrFallLoader().iter_frame_files(temp_data_dir, "fall-01"))
+
+        assert [name.rsplit("-", 1)[1] for name, _ in frames] == ["001.png", "002.png", "003.png"]
+        assert frames[0][1] == b"\x01" * 10
+        with pytest.raises(FileNotFoundError):
+            next(UrFallLoader().iter_frame_files(temp_data_dir, "fall-02"))
@@ -0,0 +1,131 @@
+"""
+Unit tests for the early-exit cascade classifier.
+
+Maintainer: @aharshit123456
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gaitsetpy.classification import CascadeClassifier, cheap_features, recall_threshold
+from gaitsetpy.classification.models import RandomForestModel
+from gaitsetpy.features.utils import (
+    calculate_energy,
+    calculate_range,
+    calculate_root_mean_square,
+    calculate_zero_crossing_rate,
+)
+
+
+def _recording(n=150, seed=0, length=64, rate=0.1):
+    """One recording of two sensors where events are bursts of high amplitude."""
+    rng = np.random.default_rng(seed)
+    labels = np.where(rng.random(n) < rate, 2, 1)
+    windows = []
+    for sensor in ('shank', 'trunk'):
+        data = []
+        for label in labels:
+            signal = rng.normal(0, 1, length)
+            if label == 2:
+                signal[10:30] += rng.normal(0, 6, 20)
+            data.append(pd.Series(signal))
+        windows.append({'name': sensor, 'data': data})
+    windows.append({'name': 'annotations', 'data': [pd.Series(np.full(length, label)) for label in labels]})
+    return windows
+
+
+def _cascade(**kwargs):
+    return CascadeClassifier(RandomForestModel(n_estimators=10, max_workers=1), fs=64, event_class=2,
+                             time_domain=True, frequency_domain=False, statistical=False, **kwargs)
+
+
+class TestCheapFeatures:
+    """Test cases for the screening features and threshold calibration."""
+
+    def test_matches_feature_functions(self):
+        """Test that the stacked computation equals the per-window feature functions."""
+        rng = np.random.default_rng(0)
+        windows = [rng.normal(0, 1, 50) for _ in range(5)]
+        expected = [[calculate_root_mean_square(w), calculate_range(w), calculate_energy(w),
+                     calculate_zero_crossing_rate(w)] for w in windows]
+        np.testing.assert_allclose(cheap_features(windows), expected)
+        uneven = windows[:2] + [rng.normal(0, 1, 30)]
+        np.testing.assert_allclose(cheap_features(uneven)[:2], expected[:2])
+        assert cheap_features([]).shape == (0, 4)
+
+    def test_recall_threshold(self):
+        """Test that the threshold keeps the target fraction of events."""
+        scores = np.linspace(0.1, 1.0, 10)
+        assert recall_threshold(scores, 1.0) == pytest.approx(0.1)
+        assert recall_threshold(scores, 0.9) == pytest.approx(0.2)
+        assert recall_threshold(scores, 0.85) == pytest.approx(0.2)
+        assert (scores >= recall_threshold(scores, 0.7)).mean() >= 0.7
+        with pytest.raises(ValueError):
+            recall_threshold(scores, 0)
+        with pytest.raises(ValueError):
+            recall_threshold([], 0.9)
+
+
+class TestCascadeClassifier:
+    """Test cases for fitting, prediction and the cascade report."""
+
+    def test_fit_predict_and_report(self):
+        """Test that the screen rejects most windows while keeping event recall."""
+        cascade = _cascade(target_recall=1.0).fit(_recording())
+        assert cascade.model.trained and cascade.n_features == cascade.model.model.n_features_in_
+        assert cascade.label_map == {1: 0, 2: 1} and cascade.negative_code == 0
+        assert cascade.calibration['screen_recall'] == 1.0 and cascade.calibration['pass_rate'] < 0.5
+
+        test = _recording(seed=1)
+        predictions, passed = cascade.predict(test, return_passed=True)
+        assert predictions.shape == passed.shape == (300,)
+        assert (predictions[~passed] == cascade.negative_code).all() and passed.mean() < 0.5
+
+        report = cascade.evaluate(test)
+        assert report['cascade']['recall'] >= 0.9 and report['full']['recall'] >= 0.9
+        assert report['recall_change'] == pytest.approx(report['cascade']['recall'] - report['full']['recall'])
+        assert report['speedup'] > 1 and report['threshold'] == cascade.threshold
+        assert np.sum(report['cascade']['confusion_matrix']) == 300
+
+    def test_pretrained_model(self):
+        """Test that a trained full model is kept and its feature width enforced."""
+        first = _cascade().fit(_recording())
+        model = first.model
+        splits = [tree.tree_.threshold.copy() for tree in model.model.estimators_]
+        cascade = CascadeClassifier(model, fs=64, event_class=2, time_domain=True,
+                                    frequency_domain=False, statistical=False).fit(_recording(seed=2))
+        assert all(np.array_equal(a, tree.tree_.threshold) for a, tree in zip(splits, model.model.estimators_))
+        assert cascade.n_features == first.n_features
+        assert len(cascade.predict(_recording(n=20, seed=3))) == 40
+
+    def test_subset_columns_match_full_matrix(self):
+        """Test that screened subsets get the columns of the full matrix despite variable-length features."""
+        cascade = CascadeClassifier(RandomForestModel(n_estimators=10, max_workers=1), fs=64, event_class=2,
+                                    target_recall=1.0).fit(_recording(n=60))
+        assert cascade.feature_widths['step_time'] > 1
+
+        test = _recording(n=30, seed=4)
+        sensors = [w for w in test if w['name'] != 'annotations']
+        keep = np.zeros(60, dtype=bool)
+        keep[[3, 40]] = True
+        full = cascade._full_matrix(sensors)
+        np.testing.assert_allclose(cascade._full_matrix(sensors, keep), full[keep])
+
+        predictions, passed = cascade.predict(test, return_passed=True)
+        assert 0 < passed.sum() < len(passed)
+        np.testing.assert_array_equal(predictions[passed], cascade.predict_full(test)[passed])
+
+    def test_invalid_input(self):
+        """Test errors for missing annotations, event class and fitting."""
+        windows = _recording(n=40)
+        with pytest.raises(ValueError, match="annotations"):
+            _cascade().fit(windows[:2])
+        with pytest.raises(ValueError, match="event class"):
+            CascadeClassifier(RandomForestModel(), fs=64, event_class=7).fit(windows)
+        with pytest.raises(ValueError, match="fitted"):
+            _cascade().predict(windows)
+        with pytest.raises(ValueError, match="same number"):
+            _cascade().fit([windows[0], {'name': 'trunk', 'data': windows[1]['data'][:5]}, windows[2]])
+        with pytest.raises(ValueError):
+            _cascade(target_recall=1.5)
@@ -16,7 +16,7 @@ import tempfile
 import os
 
 from gaitsetpy.classification.models.random_forest import RandomForestModel
-from gaitsetpy.classification.utils.preprocess import preprocess_features
+from gaitsetpy.classification.utils.preprocess import preprocess_features, feature_widths
 
 
 class TestPreprocessFeatures:
@@ -107,6 +107,28 @@ class TestPreprocessFeatures:
         assert len(X) > 0
         assert len(y) > 0
 
+    def test_preprocess_features_fixed_widths(self):
+        """Test that fixed widths keep list-valued feature columns aligned across calls."""
+        features = [{
+            'name': 'sensor1',
+            'features': {
+                'step_time': [np.array([0.5, 0.6, 0.7]), np.array([]), np.array([0.4])],
+                'mean': [1.0, 2.0, 3.0]
+            },
+            'annotations': [1, 2, 1]
+        }]
+        widths = feature_widths(features)
+        assert widths == {'step_time': 3, 'mean': 1}
+        X, _ = preprocess_features(features, widths=widths)
+
+        # One window alone pads step_time to its own length unless the widths are given
+        subset = [{'name': 'sensor1', 'annotations': [2],
+                   'features': {'step_time': [np.array([0.4])], 'mean': [3.0]}}]
+        assert preprocess_features(subset)[0].shape == (1, 2)
+        np.testing.assert_array_equal(preprocess_features(subset, widths=widths)[0], X[2:])
+        truncated, _ = preprocess_features(features, widths={'step_time': 1})
+        np.testing.assert_allclose(truncated[:, 0], [0.5, 0.0, 0.4])
+
 
 class TestRandomForestModel:
     """Test cases for RandomForestModel."""
@@ -527,3 +549,76 @@ class TestRandomForestModelIntegration:
         finally:
             if os.path.exists(tmp_path):
                 os.unlink(tmp_path)
+
+
+class TestRandomForestModelParallel:
+    """Test cases for parallel and warm-start Random Forest training."""
+    
+    def test_max_workers(self):
+        """Test that max_workers maps to n_jobs and is validated."""
+        assert RandomForestModel().model.n_jobs == -1
+        model = RandomForestModel(max_workers=2)
+        assert model.model.n_jobs == 2 and model.config['max_workers'] == 2
+        model.set_max_workers(1)
+        assert model.model.n_jobs == 1
+        with pytest.raises(ValueError, match="at least 1"):
+            RandomForestModel(max_workers=0)
+        with pytest.raises(ValueError, match="at least 1"):
+            model.set_max_workers(0)
+    
+    def test_no_rescoring_by_default(self, capsys, make_features):
+        """Test that accuracies are only computed when requested."""
+        model = RandomForestModel(n_estimators=5, max_workers=1)
+        with patch.object(model.model, 'score', wraps=model.model.score) as score:
+            model.train(make_features([0, 1, 2] * 10))
+            assert score.call_count == 0
+            model.train(make_features([0, 1, 2] * 10), report_accuracy=True)
+            assert score.call_count == 2
+        assert "Validation accuracy" in capsys.readouterr().out
+    
+    def test_add_trees(self, make_features):
+        """Test warm-start growth with a batch that lacks a class."""
+        model = RandomForestModel(n_estimators=5, max_workers=1)
+        model.train(make_features([3, 5, 7] * 10), validation_split=False)
+        old_trees = list(model.model.estimators_)
+        
+        # The new batch only has labels 5 and 7, encoded as 0 and 1 on their own
+        model.add_trees(make_features([5, 7] * 10, seed=1), n_trees=4)
+        assert len(model.model.estimators_) == model.n_trees == 9
+        assert model.config['n_estimators'] == 5
+        assert model.model.estimators_[:5] == old_trees
+        assert all(tree.n_classes_ == 3 for tree in model.model.estimators_)
+        
+        probabilities = model.predict(make_features([3, 5, 7]), return_probabilities=True)
+        assert probabilities.shape == (3, 3)
+        assert list(model.predict(make_features([5, 7] * 5, seed=2))) == [1, 2] * 5
+        
+        # A fresh fit rebuilds the forest with the configured number of trees
+        model.train(make_features([3, 5, 7] * 10), validation_split=False)
+        assert model.model.warm_start is False
+        assert model.n_trees == 5
+        assert not set(map(id, model.model.estimators_)) & set(map(id, old_trees))
+    
+    def test_add_trees_errors(self, make_features):
+        """Test add_trees argument validation."""
+        model = RandomForestModel(n_estimators=5, max_workers=1)
+        with pytest.raises(ValueError, match="trained"):
+            model.add_trees(make_features([0, 1] * 5))
+        model.train(make_features([0, 1] * 10), validation_split=False)
+        with pytest.raises(ValueError, match="not seen"):
+            model.add_trees(make_features([0, 2] * 5))
+        with pytest.raises(ValueError, match="n_trees"):
+            model.add_trees(make_features([0, 1] * 5), n_trees=0)
+    
+    def test_add_trees_after_fit_arrays(self, make_features):
+        """Test that a partial-class batch is not re-encoded from zero without a label map."""
+        from gaitsetpy.classification.utils.preprocess import preprocess_features
+        X, y, label_map = preprocess_features(make_features([0, 1, 2] * 10), return_label_map=True)
+        model = RandomForestModel(n_estimators=5, max_workers=1)
+        model.fit_arrays(X, y)
+        with pytest.raises(ValueError, match="label map"):
+            model.add_trees(make_features([1, 2] * 5))
+        
+        model.fit_arrays(X, y, label_map=label_map)
+        model.add_trees(make_features([1, 2] * 10, seed=1), n_trees=20)
+        assert list(model.predict(make_features([2, 1], seed=2))) == [2, 1]
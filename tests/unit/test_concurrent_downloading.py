@@ -35,6 +35,13 @@ from gaitsetpy.dataset.arduous import ArduousLoader
 from gaitsetpy.core.base_classes import BaseDatasetLoader
 
 
+@pytest.fixture(autouse=True)
+def no_retry_backoff():
+    """Skip the backoff delay between download retries."""
+    with patch('gaitsetpy.core.downloads.time.sleep'):
+        yield
+
+
 class TestBaseDatasetLoaderConcurrency:
     """Test concurrent downloading functionality in BaseDatasetLoader."""
     
@@ -110,7 +117,7 @@ class TestBaseDatasetLoaderConcurrency:
         assert stats['failed'] == 0
         assert stats['skipped'] == 0
     
-    @patch('gaitsetpy.core.base_classes.requests.get')
+    @patch('gaitsetpy.core.downloads.requests.Session.get')
     def test_download_file_success(self, mock_get, temp_dir):
         """
         Test successful file download.
@@ -138,7 +145,7 @@ class TestBaseDatasetLoaderConcurrency:
         assert os.path.exists(dest_path)
         assert "Successfully downloaded" in message
     
-    @patch('gaitsetpy.core.base_classes.requests.get')
+    @patch('gaitsetpy.core.downloads.requests.Session.get')
     def test_download_file_already_exists(self, mock_get, temp_dir):
         """
         Test behavior when file already exists.
@@ -164,7 +171,7 @@ class TestBaseDatasetLoaderConcurrency:
         # Verify no request was made
         mock_get.assert_not_called()
     
-    @patch('gaitsetpy.core.base_classes.requests.get')
+    @patch('gaitsetpy.core.downloads.requests.Session.get')
     def test_download_file_http_error(self, mock_get, temp_dir):
         """
         Test handling of HTTP errors.
@@ -189,7 +196,7 @@ class TestBaseDatasetLoaderConcurrency:
         assert success is False
         assert "HTTP 404" in message
     
-    @patch('gaitsetpy.core.base_classes.requests.get')
+    @patch('gaitsetpy.core.downloads.requests.Session.get')
     def test_download_file_timeout(self, mock_get, temp_dir):
         """
         Test handling of timeout errors.
@@ -212,7 +219,7 @@ class TestBaseDatasetLoaderConcurrency:
         assert success is False
         assert "Timeout" in message
     
-    @patch('gaitsetpy.core.base_classes.requests.get')
+    @patch('gaitsetpy.core.downloads.requests.Session.get')
     def test_download_file_request_exception(self, mock_get, temp_dir):
         """
         Test handling of general request exceptions.
@@ -235,7 +242,7 @@ class TestBaseDatasetLoaderConcurrency:
         assert success is False
         assert "Request error" in message
     
-    @patch('gaitsetpy.core.base_classes.requests.get')
+    @patch('gaitsetpy.core.downloads.requests.Session.get')
     @patch('builtins.open', side_effect=IOError("Disk full"))
     def test_download_file_io_error(self, mock_open, mock_get, temp_dir):
         """
@@ -261,7 +268,7 @@ class TestBaseDatasetLoaderConcurrency:
         assert success is False
         assert "IO error" in message
     
-    @patch('gaitsetpy.core.base_classes.requests.get')
+    @patch('gaitsetpy.core.downloads.requests.Session.get')
     def test_download_file_unexpected_error(self, mock_get, temp_dir):
         """
         Test handling of unexpected exceptions.
@@ -283,7 +290,7 @@ class TestBaseDatasetLoaderConcurrency:
         assert success is False
         assert "Unexpected error" in message
     
-    @patch('gaitsetpy.core.base_classes.requests.get')
+    @patch('gaitsetpy.core.downloads.requests.Session.get')
     def test_download_files_concurrent(self, mock_get, temp_dir):
         """
         Test concurrent downloading of multiple files.
@@ -325,7 +332,7 @@ class TestBaseDatasetLoaderConcurrency:
         for i in range(10):
             assert os.path.exists(os.path.join(temp_dir, f'file{i}.txt'))
     
-    @patch('gaitsetpy.core.base_classes.requests.get')
+    @patch('gaitsetpy.core.downloads.requests.Session.get')
     def test_download_files_concurrent_mixed_results(self, mock_get, temp_dir):
         """
         Test concurrent downloading with mixed success/failure results.
@@ -373,7 +380,7 @@ class TestBaseDatasetLoaderConcurrency:
         assert results['failed'] == 3
         assert len(results['failed_downloads']) == 3
     
-    @patch('gaitsetpy.core.base_classes.requests.get')
+    @patch('gaitsetpy.core.downloads.requests.Session.get')
     def test_download_files_concurrent_with_existing(self, mock_get, temp_dir):
         """
         Test concurrent downloading when some files already exist.
@@ -414,7 +421,7 @@ class TestBaseDatasetLoaderConcurrency:
         assert results['skipped'] == 3  # Files 0, 2, 4 already existed
         assert results['success'] == 3  # Files 1, 3, 5 were downloaded
     
-    @patch('gaitsetpy.core.base_classes.requests.get')
+    @patch('gaitsetpy.core.downloads.requests.Session.get')
     def test_download_files_concurrent_empty_list(self, mock_get, temp_dir):
         """
         Test concurrent downloading with empty task list.
@@ -440,7 +447,7 @@ class TestBaseDatasetLoaderConcurrency:
         # Verify no requests were made
         mock_get.assert_not_called()
     
-    @patch('gaitsetpy.core.base_classes.requests.get')
+    @patch('gaitsetpy.core.downloads.requests.Session.get')
     def test_download_files_concurrent_exception_in_future(self, mock_get, temp_dir):
         """
         Test handling of exceptions during concurrent execution.
@@ -485,7 +492,7 @@ class TestBaseDatasetLoaderConcurrency:
         assert any('Exception' in r['message'] or 'Unexpected' in r['message'] 
                   for r in results['all_results'] if not r['success'])
     
-    @patch('gaitsetpy.core.base_classes.requests.get')
+    @patch('gaitsetpy.core.downloads.requests.Session.get')
     def test_download_file_creates_directory(self, mock_get, temp_dir):
         """
         Test that _download_file creates parent directories if needed.
@@ -713,7 +720,7 @@ class TestThreadSafety:
         yield temp_path
         shutil.rmtree(temp_path, ignore_errors=True)
     
-    @patch('gaitsetpy.core.base_classes.requests.get')
+    @patch('gaitsetpy.core.downloads.requests.Session.get')
     def test_concurrent_access_to_stats(self, mock_get, temp_dir):
         """
         Test that download statistics are thread-safe.
@@ -854,7 +861,7 @@ class TestIntegrationScenarios:
         info = loader.get_info()
         assert info['max_workers'] == 16
     
-    @patch('gaitsetpy.core.base_classes.requests.get')
+    @patch('gaitsetpy.core.downloads.requests.Session.get')
     def test_stats_reset_between_downloads(self, mock_get, temp_dir):
         """
         Test that download statistics are reset between operations.
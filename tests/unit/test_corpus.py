@@ -0,0 +1,162 @@
+"""
+Unit tests for the memory-mapped corpus store in GaitSetPy.
+
+Maintainer: @aharshit123456
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from gaitsetpy.dataset.corpus import CorpusStore, CorpusWriter, open_corpus, windows_to_arrays, write_corpus
+
+
+def _recordings(n_recordings=4, window_size=16, channels=3, n_features=5):
+    rng = np.random.default_rng(0)
+    recordings = []
+    for i in range(n_recordings):
+        n = 3 + i
+        recordings.append({
+            'name': f"rec-{i}",
+            'subject': i % 2 + 1,
+            'windows': rng.standard_normal((n, window_size, channels)).astype(np.float32),
+            'features': rng.standard_normal((n, n_features)),
+            'labels': rng.integers(0, 3, n),
+            'offsets': np.arange(n) * window_size // 2,
+        })
+    return recordings
+
+
+@pytest.fixture
+def corpus(temp_data_dir):
+    """Corpus with four recordings from two subjects."""
+    recordings = _recordings()
+    path = os.path.join(temp_data_dir, "corpus")
+    write_corpus(path, recordings, feature_names=[f"f{i}" for i in range(5)], metadata={'fs': 64})
+    return path, recordings
+
+
+class TestCorpusStore:
+    """Test cases for writing and reading corpora."""
+
+    def test_round_trip(self, corpus):
+        """Test that arrays, names and metadata round-trip as memory maps."""
+        path, recordings = corpus
+        store = open_corpus(path)
+
+        assert len(store) == sum(len(r['labels']) for r in recordings)
+        assert isinstance(store.windows, np.memmap)
+        assert store.windows.dtype == np.float32
+        np.testing.assert_array_equal(store.features, np.concatenate([r['features'] for r in recordings]))
+        assert store.feature_names == ["f0", "f1", "f2", "f3", "f4"]
+        assert store.metadata == {'fs': 64}
+        assert store.subjects == [1, 2]
+
+    def test_recording_access_is_a_view(self, corpus):
+        """Test that a recording is a slice of the memory map."""
+        path, recordings = corpus
+        store = CorpusStore(path)
+        rec = store.recording("rec-2")
+
+        assert isinstance(rec['windows'], np.memmap)
+        np.testing.assert_array_equal(rec['windows'], recordings[2]['windows'])
+        np.testing.assert_array_equal(rec['offsets'], recordings[2]['offsets'])
+        with pytest.raises(KeyError):
+            store.recording("rec-9")
+
+    def test_subject_access_and_groups(self, corpus):
+        """Test gathering a subject's non-contiguous recordings and group labels."""
+        path, recordings = corpus
+        store = CorpusStore(path)
+        subject = store.subject(2)
+
+        expected = np.concatenate([recordings[1]['labels'], recordings[3]['labels']])
+        np.testing.assert_array_equal(subject['labels'], expected)
+        groups = store.groups()
+        np.testing.assert_array_equal(np.flatnonzero(groups == 2), store.rows(subjects=[2]))
+        assert store.groups('recording')[-1] == 3
+        assert len(store.rows(recordings=["rec-0"], subjects=[2])) == 3 + 4 + 6
+
+    def test_in_memory_mode(self, corpus):
+        """Test opening without memory mapping."""
+        path, _ = corpus
+        store = CorpusStore(path, mmap_mode=None)
+        assert not isinstance(store.windows, np.memmap)
+
+    def test_files_are_plain_npy(self, corpus):
+        """Test that array files load with numpy alone and the manifest is JSON."""
+        path, recordings = corpus
+        labels = np.load(os.path.join(path, "labels.npy"))
+        np.testing.assert_array_equal(labels, np.concatenate([r['labels'] for r in recordings]))
+        with open(os.path.join(path, "manifest.json")) as f:
+            manifest = json.load(f)
+        assert manifest['recordings'][1] == {'name': 'rec-1', 'subject': 2, 'start': 3, 'stop': 7}
+
+
+class TestCorpusWriter:
+    """Test cases for corpus writing and validation."""
+
+    def test_existing_corpus_requires_overwrite(self, corpus):
+        """Test that an existing corpus is not replaced by accident."""
+        path, _ = corpus
+        with pytest.raises(FileExistsError):
+            CorpusWriter(path)
+        store = write_corpus(path, _recordings(n_recordings=1), overwrite=True)
+        assert len(store.recordings) == 1
+        assert store.feature_names is None
+
+    def test_inconsistent_recordings_rejected(self, temp_data_dir):
+        """Test validation of lengths, shapes, dtypes and names."""
+        writer = CorpusWriter(os.path.join(temp_data_dir, "c"))
+        writer.add_recording("a", windows=np.zeros((2, 4)), labels=np.zeros(2, dtype=int))
+        with pytest.raises(ValueError):
+            writer.add_recording("b", windows=np.zeros((2, 4)), labels=np.zeros(3, dtype=int))
+        with pytest.raises(ValueError):
+            writer.add_recording("b", windows=np.zeros((2, 5)), labels=np.zeros(2, dtype=int))
+        with pytest.raises(ValueError):
+            writer.add_recording("b", windows=np.zeros((2, 4)))
+        with pytest.raises(ValueError):
+            writer.add_recording("a", windows=np.zeros((2, 4)), labels=np.zeros(2, dtype=int))
+        writer.add_recording("b", windows=np.ones((1, 4), dtype=np.float32), labels=np.ones(1, dtype=np.int8))
+        store = writer.close()
+        assert store.windows.shape == (3, 4)
+        assert store.windows.dtype == np.float64
+
+    def test_incomplete_corpus_cannot_be_opened(self, temp_data_dir):
+        """Test that a corpus is only readable once the writer is closed."""
+        path = os.path.join(temp_data_dir, "c")
+        with pytest.raises(RuntimeError):
+            with CorpusWriter(path) as writer:
+                writer.add_recording("a", features=np.zeros((2, 3)))
+                raise RuntimeError("interrupted")
+        with pytest.raises(FileNotFoundError):
+            CorpusStore(path)
+
+    def test_add_sliding_windows(self, temp_data_dir):
+        """Test storing a loader's sliding-window output."""
+        entry = {'name': 'S01R01', 'windows': [
+            {'name': 'shank', 'data': np.arange(12.0).reshape(3, 4)},
+            {'name': 'thigh', 'data': -np.arange(12.0).reshape(3, 4)},
+            {'name': 'annotations', 'data': np.array([[1, 1, 2, 2], [2, 2, 2, 2], [1, 1, 1, 1]])},
+        ]}
+        assert windows_to_arrays(entry['windows'])['channel_names'] == ['shank', 'thigh']
+
+        with CorpusWriter(os.path.join(temp_data_dir, "c")) as writer:
+            writer.add_windows(entry, subject="S01")
+        store = writer.store
+
+        assert store.windows.shape == (3, 4, 2)
+        assert store.channel_names == ['shank', 'thigh']
+        np.testing.assert_array_equal(store.labels, [1, 2, 1])
+        np.testing.assert_array_equal(store.recording('S01R01')['windows'][..., 1], -np.arange(12.0).reshape(3, 4))
+
+    def test_rejected_recording_leaves_corpus_consistent(self, temp_data_dir):
+        """Test that a recording failing validation on a later array writes nothing."""
+        writer = CorpusWriter(os.path.join(temp_data_dir, "c"))
+        writer.add_recording("a", windows=np.zeros((2, 4)), labels=np.zeros(2, dtype=np.int8))
+        with pytest.raises(ValueError):
+            writer.add_recording("b", windows=np.zeros((2, 4)), labels=np.zeros(2, dtype=np.float64))
+        store = writer.close()
+        assert store.windows.shape == (2, 4) and store.labels.shape == (2,)
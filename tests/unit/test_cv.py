@@ -0,0 +1,97 @@
+"""
+Unit tests for subject-grouped cross-validation and hyperparameter search.
+
+Maintainer: @aharshit123456
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from gaitsetpy.classification import cross_validate, grid_search, subject_folds
+from gaitsetpy.classification.models.random_forest import RandomForestModel
+from gaitsetpy.core.managers import ClassificationManager
+from gaitsetpy.dataset.corpus import CorpusStore, write_corpus
+
+
+GROUPS = np.repeat([f"S{i}" for i in range(4)], 40)
+
+
+class TestSubjectFolds:
+    """Test cases for subject-grouped fold generation."""
+
+    def test_leave_one_subject_out(self):
+        """Test that each fold holds out exactly one subject."""
+        folds = subject_folds(GROUPS)
+        assert len(folds) == 4
+        for train, test in folds:
+            assert len(np.unique(GROUPS[test])) == 1
+            assert not set(GROUPS[train]) & set(GROUPS[test])
+        assert sorted(np.concatenate([test for _, test in folds])) == list(range(len(GROUPS)))
+
+    def test_grouped_k_fold(self):
+        """Test subject-grouped folds and argument validation."""
+        folds = subject_folds(GROUPS, n_splits=2)
+        assert len(folds) == 2
+        assert all(len(np.unique(GROUPS[test])) == 2 for _, test in folds)
+        with pytest.raises(ValueError):
+            subject_folds(GROUPS, n_splits=5)
+        with pytest.raises(ValueError):
+            subject_folds(['S1'] * 10)
+
+
+class TestCrossValidation:
+    """Test cases for cross_validate and grid_search."""
+
+    def test_cross_validate(self, make_arrays):
+        """Test per-fold results and shared label codes."""
+        X, y = make_arrays(n=len(GROUPS), n_features=3, noise=0.3)
+        result = cross_validate('random_forest', X, y * 10 + 1, GROUPS,
+                                params={'n_estimators': 10, 'max_workers': 1}, max_workers=1)
+        assert len(result['folds']) == 4
+        assert result['label_map'] == {1: 0, 11: 1, 21: 2}
+        assert [fold['test_groups'] for fold in result['folds']] == [['S0'], ['S1'], ['S2'], ['S3']]
+        assert result['mean_accuracy'] > 0.8
+        assert {'mean_f1_macro', 'std_accuracy', 'mean_fit_seconds'} <= set(result)
+
+    def test_grid_search_in_process_pool(self, make_arrays, temp_data_dir):
+        """Test a parallel search and that cached folds are reused."""
+        X, y = make_arrays(n=len(GROUPS), n_features=3, noise=0.3)
+        grid = {'n_estimators': [2, 10], 'max_depth': [1, None], 'max_workers': [1]}
+        search = grid_search(RandomForestModel, grid, X, y, GROUPS, n_splits=2,
+                             max_workers=2, cache_dir=temp_data_dir)
+        assert len(search['results']) == 4 and search['n_folds'] == 2
+        assert search['best_params']['max_depth'] is None
+        assert search['best_score'] == max(r['mean_accuracy'] for r in search['results'])
+
+        cached = grid_search(RandomForestModel, grid, X, y, GROUPS, n_splits=2,
+                             max_workers=1, cache_dir=temp_data_dir)
+        assert [r['folds'] for r in cached['results']] == [r['folds'] for r in search['results']]
+
+    def test_corpus_input_and_manager(self, make_arrays, temp_data_dir):
+        """Test reading features, labels and subjects from a corpus via the manager."""
+        X, y = make_arrays(n=len(GROUPS), n_features=3, noise=0.3)
+        path = os.path.join(temp_data_dir, 'corpus')
+        write_corpus(path, [{'name': f'{s}_R1', 'subject': s, 'features': X[GROUPS == s], 'labels': y[GROUPS == s]}
+                            for s in np.unique(GROUPS)])
+        manager = ClassificationManager()
+        manager.register_model('cv_forest', RandomForestModel)
+        try:
+            result = manager.cross_validate('cv_forest', CorpusStore(path),
+                                            params={'n_estimators': 5, 'max_workers': 1}, max_workers=1)
+        finally:
+            manager.unregister('cv_forest')
+        assert len(result['folds']) == 4
+
+    def test_invalid_arguments(self, make_arrays):
+        """Test rejection of bad scoring, worker counts and inconsistent inputs."""
+        X, y = make_arrays(n=len(GROUPS), n_features=3, noise=0.3)
+        with pytest.raises(ValueError, match="scoring"):
+            grid_search('random_forest', {}, X, y, GROUPS, scoring='auc')
+        with pytest.raises(ValueError, match="max_workers"):
+            cross_validate('random_forest', X, y, GROUPS, max_workers=0)
+        with pytest.raises(ValueError, match="same length"):
+            cross_validate('random_forest', X, y[:-1], GROUPS)
+        with pytest.raises(ValueError, match="required"):
+            cross_validate('random_forest', X, y)
@@ -253,6 +253,30 @@ class TestDownloadUrfallData:
                 assert result == "/test/data"
                 mock_makedirs.assert_called_once_with("/test/data", exist_ok=True)
     
+    def test_download_urfall_async_backend(self, temp_data_dir):
+        """Test that the async backend receives every missing file in one batch."""
+        from gaitsetpy.core.downloads import DownloadResult
+        
+        with patch('gaitsetpy.core.async_downloads.download_files') as mock_download_files:
+            mock_download_files.side_effect = lambda tasks, **kwargs: [
+                DownloadResult(True, 'downloaded', 'ok') for _ in tasks
+            ]
+            result = download_urfall_data(temp_data_dir, sequences=['fall-01', 'adl-01'],
+                                          data_types=['accelerometer', 'features'],
+                                          max_workers=16, backend='async')
+        
+        assert result == temp_data_dir
+        tasks = mock_download_files.call_args.args[0]
+        names = sorted(os.path.basename(t['dest_path']) for t in tasks)
+        assert names == ['adl-01-acc.csv', 'fall-01-acc.csv',
+                         'urfall-cam0-adls.csv', 'urfall-cam0-falls.csv']
+        assert mock_download_files.call_args.kwargs['limit_per_host'] == 16
+    
+    def test_download_urfall_unknown_backend(self, temp_data_dir):
+        """Test that unknown backends are rejected."""
+        with pytest.raises(ValueError):
+            download_urfall_data(temp_data_dir, backend='processes')
+    
     @patch('gaitsetpy.dataset.utils.os.path.exists')
     def test_download_urfall_all_files_exist(self, mock_exists):
         """Test UrFall download when all files already exist."""
@@ -306,7 +330,7 @@ class TestDownloadHarupData:
         
         with patch('gaitsetpy.dataset.utils.requests.get') as mock_get:
             with patch('tqdm.tqdm') as mock_tqdm:
-                with patch('gaitsetpy.dataset.utils.zipfile.ZipFile') as mock_zip:
+                with patch('gaitsetpy.dataset.archives.zipfile.ZipFile') as mock_zip:
                     with patch('builtins.open', mock_open()) as mock_file:
                         # Mock successful download
                         mock_response = Mock()
@@ -423,26 +447,25 @@ class TestExtractDataset:
 class TestExtractDaphnetData:
     """Test cases for Daphnet dataset extraction."""
     
-    @patch('gaitsetpy.dataset.utils.zipfile.ZipFile')
-    @patch('gaitsetpy.dataset.utils.os.path.join')
-    def test_extract_daphnet_success(self, mock_join, mock_zip):
+    def test_extract_daphnet_success(self, temp_data_dir):
         """Test successful Daphnet extraction."""
-        mock_join.return_value = "/test/data/daphnet.zip"
-        
-        mock_zip_instance = Mock()
-        mock_zip.return_value.__enter__.return_value = mock_zip_instance
-        mock_zip.return_value.__exit__.return_value = None
+        zip_path = os.path.join(temp_data_dir, "daphnet.zip")
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("dataset_fog_release/dataset/S01R01.txt", "0 1 2 3 4 5 6 7 8 9 1\n")
+            zf.writestr("dataset_fog_release/doc/readme.txt", "readme")
         
-        extract_daphnet_data("/test/data")
+        stats = extract_daphnet_data(temp_data_dir)
         
-        mock_zip.assert_called_once_with("/test/data/daphnet.zip", "r")
-        mock_zip_instance.extractall.assert_called_once_with("/test/data")
+        assert stats == {'extracted': 2, 'skipped': 0}
+        assert os.path.exists(os.path.join(temp_data_dir, "dataset_fog_release/dataset/S01R01.txt"))
+        # A second run finds every file in place
+        assert extract_daphnet_data(temp_data_dir) == {'extracted': 0, 'skipped': 2}
 
 
 class TestExtractUrfallData:
     """Test cases for UrFall dataset extraction."""
     
-    @patch('gaitsetpy.dataset.utils.zipfile.ZipFile')
+    @patch('gaitsetpy.dataset.archives.zipfile.ZipFile')
     @patch('gaitsetpy.dataset.utils.os.path.exists')
     @patch('gaitsetpy.dataset.utils.os.path.join')
     def test_extract_urfall_success(self, mock_join, mock_exists, mock_zip):
@@ -474,21 +497,16 @@ class TestExtractUrfallData:
 class TestExtractHarupData:
     """Test cases for HAR-UP dataset extraction."""
     
-    @patch('gaitsetpy.dataset.utils.os.path.exists')
-    @patch('gaitsetpy.dataset.utils.zipfile.ZipFile')
-    def test_extract_harup_success(self, mock_zip, mock_exists):
+    def test_extract_harup_success(self, temp_data_dir):
         """Test successful HAR-UP extraction."""
-        # Mock dataset doesn't exist but zip does
-        mock_exists.side_effect = lambda path: path.endswith("DataSet") == False
+        zip_path = os.path.join(temp_data_dir, "HAR-UP_Dataset.zip")
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("UP_Fall_Detection_Dataset/Subject_01/A01/S01_A01_T01.csv", "a,b\n1,2\n")
         
-        mock_zip_instance = Mock()
-        mock_zip.return_value.__enter__.return_value = mock_zip_instance
-        mock_zip.return_value.__exit__.return_value = None
-        
-        extract_harup_data("/test/data")
+        extract_harup_data(temp_data_dir)
         
-        mock_zip.assert_called_once()
-        mock_zip_instance.extractall.assert_called_once_with("/test/data")
+        assert os.path.exists(os.path.join(
+            temp_data_dir, "UP_Fall_Detection_Dataset/Subject_01/A01/S01_A01_T01.csv"))
     
     @patch('gaitsetpy.dataset.utils.os.path.exists')
     def test_extract_harup_already_extracted(self, mock_exists):
@@ -610,129 +628,93 @@ class TestSlidingWindow:
 class TestDownloadFile:
     """Test cases for the _download_file utility function."""
     
-    @patch('gaitsetpy.dataset.utils.requests.get')
-    @patch('tqdm.tqdm')
-    @patch('builtins.open', new_callable=mock_open)
-    @patch('gaitsetpy.dataset.utils.os.path.getsize')
-    def test_download_file_success(self, mock_getsize, mock_file, mock_tqdm, mock_get):
+    @pytest.fixture(autouse=True)
+    def no_retry_backoff(self):
+        """Skip the backoff delay between download retries."""
+        with patch('gaitsetpy.core.downloads.time.sleep'):
+            yield
+    
+    def test_download_file_success(self, http_file_server, temp_data_dir):
         """Test successful file download."""
-        # Mock HTTP response
-        mock_response = Mock()
-        mock_response.headers = {'content-length': '1024'}
-        mock_response.iter_content.return_value = [b'chunk1', b'chunk2']
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
-        
-        # Mock file size
-        mock_getsize.return_value = 1024
-        
-        # Mock tqdm
-        mock_progress = Mock()
-        mock_tqdm.return_value = mock_progress
+        http_file_server.files['file.txt'] = b'x' * 1024
+        dest = os.path.join(temp_data_dir, 'file.txt')
         
-        success, result = _download_file("http://example.com/file.txt", "/test/file.txt", "file.txt")
+        success, result = _download_file(http_file_server.url('file.txt'), dest, "file.txt")
         
         assert success is True
-        assert result == "/test/file.txt"
-        mock_get.assert_called_once_with("http://example.com/file.txt", stream=True, timeout=60)
+        assert result == dest
+        with open(dest, 'rb') as f:
+            assert f.read() == b'x' * 1024
+        assert not os.path.exists(dest + '.part')
     
-    @patch('gaitsetpy.dataset.utils.requests.get')
-    @patch('builtins.open', new_callable=mock_open)
-    @patch('gaitsetpy.dataset.utils.os.path.exists')
-    def test_download_file_http_error(self, mock_exists, mock_file, mock_get):
+    def test_download_file_http_error(self, http_file_server, temp_data_dir):
         """Test file download with HTTP error."""
-        # Mock HTTP error
-        mock_get.side_effect = requests.exceptions.HTTPError("404 Not Found")
+        dest = os.path.join(temp_data_dir, 'missing.txt')
         
-        # Mock file doesn't exist initially
-        mock_exists.return_value = False
-        
-        success, result = _download_file("http://example.com/file.txt", "/test/file.txt", "file.txt")
+        success, result = _download_file(http_file_server.url('missing.txt'), dest, "missing.txt")
         
         assert success is False
-        assert "404 Not Found" in result
+        assert "HTTP 404" in result
+        assert not os.path.exists(dest)
+        # 404 is not retried
+        assert len(http_file_server.requests) == 1
     
-    @patch('gaitsetpy.dataset.utils.requests.get')
-    @patch('builtins.open', new_callable=mock_open)
-    @patch('gaitsetpy.dataset.utils.os.path.exists')
-    def test_download_file_timeout(self, mock_exists, mock_file, mock_get):
+    @patch('gaitsetpy.core.downloads.requests.Session.get')
+    def test_download_file_timeout(self, mock_get, temp_data_dir):
         """Test file download with timeout."""
-        # Mock timeout error
         mock_get.side_effect = requests.exceptions.Timeout("Request timed out")
+        dest = os.path.join(temp_data_dir, 'file.txt')
         
-        # Mock file doesn't exist initially
-        mock_exists.return_value = False
-        
-        success, result = _download_file("http://example.com/file.txt", "/test/file.txt", "file.txt")
+        success, result = _download_file("http://example.com/file.txt", dest, "file.txt")
         
         assert success is False
-        assert "Request timed out" in result
+        assert "Timeout" in result
+        assert mock_get.call_count == 4  # first attempt + 3 retries
     
-    @patch('gaitsetpy.dataset.utils.requests.get')
-    @patch('builtins.open', new_callable=mock_open)
-    @patch('gaitsetpy.dataset.utils.os.path.exists')
-    def test_download_file_io_error(self, mock_exists, mock_file, mock_get):
+    def test_download_file_io_error(self, http_file_server, temp_data_dir):
         """Test file download with IO error."""
-        # Mock HTTP response
-        mock_response = Mock()
-        mock_response.headers = {'content-length': '1024'}
-        mock_response.iter_content.return_value = [b'chunk1', b'chunk2']
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        http_file_server.files['file.txt'] = b'data'
+        dest = os.path.join(temp_data_dir, 'file.txt')
         
-        # Mock IO error
-        mock_file.side_effect = IOError("Permission denied")
-        
-        # Mock file doesn't exist initially
-        mock_exists.return_value = False
-        
-        success, result = _download_file("http://example.com/file.txt", "/test/file.txt", "file.txt")
+        with patch('builtins.open', side_effect=IOError("Permission denied")):
+            success, result = _download_file(http_file_server.url('file.txt'), dest, "file.txt")
         
         assert success is False
         assert "Permission denied" in result
     
-    @patch('gaitsetpy.dataset.utils.requests.get')
-    @patch('tqdm.tqdm')
-    @patch('builtins.open', new_callable=mock_open)
-    @patch('gaitsetpy.dataset.utils.os.path.getsize')
-    def test_download_file_incomplete(self, mock_getsize, mock_file, mock_tqdm, mock_get):
-        """Test file download with incomplete file."""
-        # Mock HTTP response
-        mock_response = Mock()
-        mock_response.headers = {'content-length': '1024'}
-        mock_response.iter_content.return_value = [b'chunk1', b'chunk2']
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
-        
-        # Mock file size smaller than expected
-        mock_getsize.return_value = 512  # Less than 1024
+    def test_download_file_incomplete(self, http_file_server, temp_data_dir):
+        """Test that a dropped connection is resumed with a Range request."""
+        payload = os.urandom(300_000)
+        http_file_server.files['file.bin'] = payload
+        http_file_server.truncate_after['file.bin'] = 200_000
+        dest = os.path.join(temp_data_dir, 'file.bin')
         
-        # Mock tqdm
-        mock_progress = Mock()
-        mock_tqdm.return_value = mock_progress
-        
-        success, result = _download_file("http://example.com/file.txt", "/test/file.txt", "file.txt")
-        
-        assert success is False
-        assert "Incomplete download" in result
-    
-    @patch('gaitsetpy.dataset.utils.requests.get')
-    @patch('builtins.open', new_callable=mock_open)
-    @patch('gaitsetpy.dataset.utils.os.path.exists')
-    @patch('gaitsetpy.dataset.utils.os.remove')
-    def test_download_file_cleanup_on_error(self, mock_remove, mock_exists, mock_file, mock_get):
-        """Test that partial files are cleaned up on error."""
-        # Mock HTTP error
-        mock_get.side_effect = requests.exceptions.RequestException("Network error")
-        
-        # Mock file doesn't exist initially
-        mock_exists.return_value = False
+        success, result = _download_file(http_file_server.url('file.bin'), dest, "file.bin")
         
-        success, result = _download_file("http://example.com/file.txt", "/test/file.txt", "file.txt")
+        assert success is True
+        with open(dest, 'rb') as f:
+            assert f.read() == payload
+        ranges = [r for _, r, _ in http_file_server.requests]
+        assert len(ranges) == 2
+        assert ranges[0] is None
+        # Resumes after the last complete chunk that reached the disk
+        resumed_at = int(ranges[1].split('=')[1].rstrip('-'))
+        assert 0 < resumed_at <= 200_000
+    
+    def test_download_file_resumes_partial_file(self, http_file_server, temp_data_dir):
+        """Test that a .part file left by an earlier run is resumed instead of discarded."""
+        payload = os.urandom(2048)
+        http_file_server.files['file.bin'] = payload
+        dest = os.path.join(temp_data_dir, 'file.bin')
+        with open(dest + '.part', 'wb') as f:
+            f.write(payload[:512])
+        
+        success, _ = _download_file(http_file_server.url('file.bin'), dest, "file.bin")
         
-        assert success is False
-        # Should attempt to remove the partial file
-        mock_remove.assert_called_once_with("/test/file.txt")
+        assert success is True
+        with open(dest, 'rb') as f:
+            assert f.read() == payload
+        assert http_file_server.requests[0][1] == 'bytes=512-'
 
 
 class TestDatasetUtilsEdgeCases:
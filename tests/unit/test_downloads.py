@@ -0,0 +1,459 @@
+"""
+Unit tests for the shared download engine and download telemetry in GaitSetPy.
+
+These tests run the engine against a local HTTP server (see the http_file_server
+fixture in conftest.py) to exercise resume, retries, verification, connection
+pooling and statistics without network access.
+
+Maintainer: @aharshit123456
+"""
+
+import hashlib
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from gaitsetpy.core.async_downloads import AIOHTTP_AVAILABLE
+from gaitsetpy.core.telemetry import DownloadTelemetry
+from gaitsetpy.core.downloads import (
+    download_file,
+    get_session,
+    load_manifest,
+    sha256_file,
+    verify_file,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_retry_backoff():
+    """Skip the backoff delay between download retries."""
+    with patch('gaitsetpy.core.downloads.time.sleep') as mock_sleep:
+        with patch('gaitsetpy.core.async_downloads.asyncio.sleep', side_effect=_no_sleep):
+            yield mock_sleep
+
+
+async def _no_sleep(delay):
+    return None
+
+
+@pytest.fixture
+def payload():
+    """Random file contents larger than one download chunk."""
+    return os.urandom(150_000)
+
+
+class TestVerification:
+    """Test cases for checksum and manifest helpers."""
+
+    def test_sha256_file(self, temp_data_dir, payload):
+        """Test that the file digest matches hashlib."""
+        path = os.path.join(temp_data_dir, 'file.bin')
+        with open(path, 'wb') as f:
+            f.write(payload)
+        assert sha256_file(path, chunk_size=4096) == hashlib.sha256(payload).hexdigest()
+
+    def test_verify_file(self, temp_data_dir, payload):
+        """Test size and digest checks."""
+        path = os.path.join(temp_data_dir, 'file.bin')
+        with open(path, 'wb') as f:
+            f.write(payload)
+        digest = hashlib.sha256(payload).hexdigest()
+
+        assert verify_file(path, len(payload), digest) == (True, "ok")
+        assert verify_file(path, len(payload) + 1)[0] is False
+        assert verify_file(path, sha256='0' * 64) == (False, "SHA-256 mismatch")
+        assert verify_file(os.path.join(temp_data_dir, 'missing'))[0] is False
+
+    def test_load_manifest(self, temp_data_dir):
+        """Test loading manifests from dicts and JSON files."""
+        entries = {'a.csv': {'size': 10, 'sha256': 'ab'}}
+        assert load_manifest(entries) == entries
+        assert load_manifest({'files': entries}) == entries
+
+        path = os.path.join(temp_data_dir, 'manifest.json')
+        with open(path, 'w') as f:
+            json.dump({'files': entries}, f)
+        assert load_manifest(path) == entries
+
+
+class TestDownloadEngine:
+    """Test cases for download_file against a local HTTP server."""
+
+    def test_download(self, http_file_server, temp_data_dir, payload):
+        """Test a plain download with verification."""
+        http_file_server.files['file.bin'] = payload
+        dest = os.path.join(temp_data_dir, 'sub', 'file.bin')
+
+        result = download_file(http_file_server.url('file.bin'), dest, expected_size=len(payload),
+                               sha256=hashlib.sha256(payload).hexdigest())
+
+        assert result.success is True
+        assert result.status == 'downloaded'
+        assert result.bytes_downloaded == len(payload)
+        with open(dest, 'rb') as f:
+            assert f.read() == payload
+        assert not os.path.exists(dest + '.part')
+
+    def test_resume_after_dropped_connection(self, http_file_server, temp_data_dir, payload):
+        """Test that a truncated response is resumed with a Range request."""
+        http_file_server.files['file.bin'] = payload
+        http_file_server.truncate_after['file.bin'] = 100_000
+        dest = os.path.join(temp_data_dir, 'file.bin')
+
+        result = download_file(http_file_server.url('file.bin'), dest, chunk_size=16_384)
+
+        assert result.success is True
+        assert result.status == 'resumed'
+        with open(dest, 'rb') as f:
+            assert f.read() == payload
+        first, second = http_file_server.requests
+        assert first[1] is None
+        assert second[1].startswith('bytes=') and second[1] != 'bytes=0-'
+
+    def test_failed_download_keeps_part_file(self, http_file_server, temp_data_dir, payload):
+        """Test that an interrupted download leaves only a .part file, which the next call resumes."""
+        http_file_server.files['file.bin'] = payload
+        http_file_server.truncate_after['file.bin'] = 100_000
+        dest = os.path.join(temp_data_dir, 'file.bin')
+
+        result = download_file(http_file_server.url('file.bin'), dest, chunk_size=16_384, retries=0)
+        assert result.success is False
+        assert not os.path.exists(dest)
+        partial = os.path.getsize(dest + '.part')
+        assert 0 < partial < len(payload)
+
+        result = download_file(http_file_server.url('file.bin'), dest, chunk_size=16_384)
+        assert result.success is True
+        assert result.bytes_downloaded == len(payload) - partial
+        assert http_file_server.requests[-1][1] == f'bytes={partial}-'
+
+    def test_server_ignoring_range(self, http_file_server, temp_data_dir, payload):
+        """Test that a full 200 response to a Range request overwrites the part file."""
+        http_file_server.files['file.bin'] = payload
+        http_file_server.ignore_range = True
+        dest = os.path.join(temp_data_dir, 'file.bin')
+        with open(dest + '.part', 'wb') as f:
+            f.write(b'stale')
+
+        result = download_file(http_file_server.url('file.bin'), dest)
+
+        assert result.success is True
+        with open(dest, 'rb') as f:
+            assert f.read() == payload
+
+    def test_complete_part_file(self, http_file_server, temp_data_dir, payload):
+        """Test that a part file holding the whole file is finished without refetching."""
+        http_file_server.files['file.bin'] = payload
+        dest = os.path.join(temp_data_dir, 'file.bin')
+        with open(dest + '.part', 'wb') as f:
+            f.write(payload)
+
+        result = download_file(http_file_server.url('file.bin'), dest, expected_size=len(payload))
+
+        assert result.success is True
+        assert result.bytes_downloaded == 0
+        assert os.path.getsize(dest) == len(payload)
+
+    def test_retry_with_backoff(self, http_file_server, temp_data_dir, payload, no_retry_backoff):
+        """Test that transient HTTP errors are retried with exponential backoff."""
+        http_file_server.files['file.bin'] = payload
+        http_file_server.fail_count['file.bin'] = 2
+        dest = os.path.join(temp_data_dir, 'file.bin')
+
+        result = download_file(http_file_server.url('file.bin'), dest, backoff=0.5)
+
+        assert result.success is True
+        assert len(http_file_server.requests) == 3
+        assert [c.args[0] for c in no_retry_backoff.call_args_list] == [0.5, 1.0]
+
+    def test_retries_exhausted(self, http_file_server, temp_data_dir, payload):
+        """Test the failure after the last retry."""
+        http_file_server.files['file.bin'] = payload
+        http_file_server.fail_count['file.bin'] = 10
+        dest = os.path.join(temp_data_dir, 'file.bin')
+
+        result = download_file(http_file_server.url('file.bin'), dest, retries=2)
+
+        assert result.success is False
+        assert "HTTP 503" in result.message
+        assert "after 3 attempts" in result.message
+        assert len(http_file_server.requests) == 3
+
+    def test_not_found_is_not_retried(self, http_file_server, temp_data_dir):
+        """Test that permanent HTTP errors fail immediately."""
+        dest = os.path.join(temp_data_dir, 'missing.bin')
+
+        result = download_file(http_file_server.url('missing.bin'), dest)
+
+        assert result.success is False
+        assert "HTTP 404" in result.message
+        assert len(http_file_server.requests) == 1
+        assert not os.path.exists(dest)
+
+    def test_checksum_mismatch(self, http_file_server, temp_data_dir, payload):
+        """Test that a corrupt download never reaches the destination path."""
+        http_file_server.files['file.bin'] = payload
+        dest = os.path.join(temp_data_dir, 'file.bin')
+
+        result = download_file(http_file_server.url('file.bin'), dest, sha256='0' * 64, retries=1)
+
+        assert result.success is False
+        assert "SHA-256 mismatch" in result.message
+        assert not os.path.exists(dest)
+        assert not os.path.exists(dest + '.part')
+
+    def test_existing_file_skipped_when_verified(self, http_file_server, temp_data_dir, payload):
+        """Test that a verified destination file is not downloaded again."""
+        http_file_server.files['file.bin'] = payload
+        dest = os.path.join(temp_data_dir, 'file.bin')
+        with open(dest, 'wb') as f:
+            f.write(payload)
+
+        result = download_file(http_file_server.url('file.bin'), dest,
+                               sha256=hashlib.sha256(payload).hexdigest())
+
+        assert result.status == 'skipped'
+        assert http_file_server.requests == []
+
+    def test_existing_file_redownloaded_when_corrupt(self, http_file_server, temp_data_dir, payload):
+        """Test that a destination file failing verification is replaced."""
+        http_file_server.files['file.bin'] = payload
+        dest = os.path.join(temp_data_dir, 'file.bin')
+        with open(dest, 'wb') as f:
+            f.write(b'\0' * len(payload))
+
+        result = download_file(http_file_server.url('file.bin'), dest, expected_size=len(payload),
+                               sha256=hashlib.sha256(payload).hexdigest())
+
+        assert result.status == 'downloaded'
+        with open(dest, 'rb') as f:
+            assert f.read() == payload
+
+    def test_short_existing_file_resumed(self, http_file_server, temp_data_dir, payload):
+        """Test that a truncated destination file is resumed when the expected size is known."""
+        http_file_server.files['file.bin'] = payload
+        dest = os.path.join(temp_data_dir, 'file.bin')
+        with open(dest, 'wb') as f:
+            f.write(payload[:1000])
+
+        result = download_file(http_file_server.url('file.bin'), dest, expected_size=len(payload))
+
+        assert result.status == 'resumed'
+        assert http_file_server.requests[0][1] == 'bytes=1000-'
+
+    def test_connection_reuse(self, http_file_server, temp_data_dir):
+        """Test that sequential downloads on one thread share a pooled connection."""
+        for i in range(3):
+            http_file_server.files[f'f{i}.bin'] = os.urandom(1000)
+        session = requests.Session()
+
+        for i in range(3):
+            result = download_file(http_file_server.url(f'f{i}.bin'),
+                                   os.path.join(temp_data_dir, f'f{i}.bin'), session=session)
+            assert result.success is True
+
+        ports = {port for _, _, port in http_file_server.requests}
+        assert len(ports) == 1
+
+    def test_get_session_is_per_thread(self):
+        """Test that each thread gets its own pooled session."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        main = get_session()
+        assert get_session() is main
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(get_session).result()
+        assert other is not main
+
+
+class TestDownloadTelemetry:
+    """Test cases for DownloadTelemetry."""
+
+    def test_counts_under_contention(self):
+        """Test that concurrent updates are not lost."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        telemetry = DownloadTelemetry(total_files=400)
+        statuses = ['downloaded', 'resumed', 'skipped', 'failed']
+
+        def worker(i):
+            key = f'/data/f{i}'
+            telemetry.start_file(f'http://host/f{i}', key)
+            for _ in range(50):
+                telemetry.add_bytes(key, 10)
+            telemetry.finish_file(key, statuses[i % 4])
+
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            list(executor.map(worker, range(400)))
+
+        assert telemetry.counts() == {'success': 200, 'failed': 100, 'skipped': 100}
+        assert telemetry.bytes_downloaded == 400 * 500
+        stats = telemetry.to_dict()
+        assert stats['total'] == 400
+        assert len(stats['files']) == 400
+        assert all(f['bytes'] == 500 for f in stats['files'])
+
+    def test_to_dict_is_json_serialisable(self):
+        """Test the structured export."""
+        telemetry = DownloadTelemetry()
+        telemetry.start_file('http://host/a', '/data/a', expected_size=3)
+        telemetry.add_bytes('/data/a', 3)
+        telemetry.finish_file('/data/a', 'downloaded', 'ok')
+
+        stats = json.loads(json.dumps(telemetry.to_dict()))
+        assert stats['success'] == 1
+        assert stats['bytes_downloaded'] == 3
+        assert stats['bytes_per_second'] > 0
+        assert stats['files'][0]['status'] == 'downloaded'
+        assert stats['files'][0]['bytes_per_second'] > 0
+
+    def test_unknown_status(self):
+        """Test that invalid statuses are rejected."""
+        telemetry = DownloadTelemetry()
+        with pytest.raises(ValueError):
+            telemetry.finish_file('/data/a', 'done')
+
+    def test_single_progress_bar(self, temp_data_dir):
+        """Test that one aggregate progress bar tracks all bytes."""
+        with patch('gaitsetpy.core.telemetry.tqdm') as mock_tqdm:
+            with DownloadTelemetry(total_files=2, total_bytes=30, show_progress=True) as telemetry:
+                for key in ('/data/a', '/data/b'):
+                    telemetry.start_file('http://host', key)
+                    telemetry.progress_callback(key)(15)
+                    telemetry.finish_file(key, 'downloaded')
+
+        mock_tqdm.assert_called_once()
+        assert mock_tqdm.call_args.kwargs['total'] == 30
+        bar = mock_tqdm.return_value
+        assert [c.args[0] for c in bar.update.call_args_list] == [15, 15]
+        bar.close.assert_called_once()
+
+    def test_loader_telemetry(self, http_file_server, temp_data_dir):
+        """Test exact statistics for a concurrent batch through a dataset loader."""
+        from gaitsetpy.dataset.physionet import PhysioNetLoader
+
+        tasks = []
+        for i in range(40):
+            http_file_server.files[f'f{i}.bin'] = os.urandom(1000 + i)
+            tasks.append({'url': http_file_server.url(f'f{i}.bin'),
+                          'dest_path': os.path.join(temp_data_dir, f'f{i}.bin'),
+                          'size': 1000 + i})
+        tasks.append({'url': http_file_server.url('missing.bin'),
+                      'dest_path': os.path.join(temp_data_dir, 'missing.bin')})
+        loader = PhysioNetLoader(max_workers=16)
+
+        results = loader.download_files_concurrent(tasks, show_progress=False)
+
+        assert (results['success'], results['failed'], results['skipped']) == (40, 1, 0)
+        assert results['bytes_downloaded'] == sum(1000 + i for i in range(40))
+        assert loader.get_download_stats() == {'success': 40, 'failed': 1, 'skipped': 0}
+        telemetry = loader.get_download_telemetry()
+        assert len(telemetry['files']) == 41
+        sizes = {os.path.basename(f['dest_path']): f['bytes'] for f in telemetry['files']}
+        assert sizes['f7.bin'] == 1007
+        assert sizes['missing.bin'] == 0
+
+
+@pytest.mark.skipif(not AIOHTTP_AVAILABLE, reason="aiohttp not available")
+class TestAsyncDownloadBackend:
+    """Test cases for the asyncio download backend."""
+
+    def test_download_files(self, http_file_server, temp_data_dir):
+        """Test a batch download with results in task order."""
+        from gaitsetpy.core.async_downloads import download_files
+
+        payloads = {f'f{i}.bin': os.urandom(5000 + i) for i in range(20)}
+        http_file_server.files.update(payloads)
+        tasks = [{'url': http_file_server.url(name), 'dest_path': os.path.join(temp_data_dir, name),
+                  'sha256': hashlib.sha256(data).hexdigest()} for name, data in payloads.items()]
+        tasks.append({'url': http_file_server.url('missing.bin'),
+                      'dest_path': os.path.join(temp_data_dir, 'missing.bin')})
+        telemetry = DownloadTelemetry()
+
+        results = download_files(tasks, max_concurrency=8, limit_per_host=4, telemetry=telemetry)
+
+        assert [r.success for r in results] == [True] * 20 + [False]
+        assert "HTTP 404" in results[-1].message
+        for name, data in payloads.items():
+            with open(os.path.join(temp_data_dir, name), 'rb') as f:
+                assert f.read() == data
+        assert telemetry.counts() == {'success': 20, 'failed': 1, 'skipped': 0}
+        assert telemetry.bytes_downloaded == sum(len(d) for d in payloads.values())
+
+    def test_per_host_connection_limit(self, http_file_server, temp_data_dir):
+        """Test that the connector never opens more connections than the per-host limit."""
+        from gaitsetpy.core.async_downloads import download_files
+
+        tasks = []
+        for i in range(30):
+            http_file_server.files[f'f{i}.bin'] = os.urandom(2000)
+            tasks.append({'url': http_file_server.url(f'f{i}.bin'),
+                          'dest_path': os.path.join(temp_data_dir, f'f{i}.bin')})
+
+        results = download_files(tasks, max_concurrency=30, limit_per_host=3)
+
+        assert all(r.success for r in results)
+        ports = {port for _, _, port in http_file_server.requests}
+        assert len(ports) <= 3
+
+    def test_resume_and_retry(self, http_file_server, temp_data_dir, payload):
+        """Test resume after a dropped connection and retry after HTTP 503."""
+        from gaitsetpy.core.async_downloads import download_files
+
+        http_file_server.files['a.bin'] = payload
+        http_file_server.files['b.bin'] = payload
+        http_file_server.fail_count['a.bin'] = 2
+        dest = os.path.join(temp_data_dir, 'b.bin')
+        with open(dest + '.part', 'wb') as f:
+            f.write(payload[:1234])
+        tasks = [{'url': http_file_server.url('a.bin'), 'dest_path': os.path.join(temp_data_dir, 'a.bin')},
+                 {'url': http_file_server.url('b.bin'), 'dest_path': dest, 'size': len(payload)}]
+
+        results = download_files(tasks)
+
+        assert [r.status for r in results] == ['downloaded', 'resumed']
+        assert ('b.bin', 'bytes=1234-') in [(name, rng) for name, rng, _ in http_file_server.requests]
+        with open(dest, 'rb') as f:
+            assert f.read() == payload
+
+    def test_from_running_event_loop(self, http_file_server, temp_data_dir):
+        """Test that the blocking wrapper works inside a running event loop."""
+        import asyncio
+        from gaitsetpy.core.async_downloads import download_files
+
+        http_file_server.files['a.bin'] = b'abc'
+        tasks = [{'url': http_file_server.url('a.bin'), 'dest_path': os.path.join(temp_data_dir, 'a.bin')}]
+
+        async def caller():
+            return download_files(tasks)
+
+        results = asyncio.run(caller())
+        assert results[0].success is True
+
+    def test_loader_async_backend(self, http_file_server, temp_data_dir):
+        """Test selecting the async backend on a dataset loader."""
+        from gaitsetpy.dataset.physionet import PhysioNetLoader
+
+        tasks = []
+        for i in range(10):
+            http_file_server.files[f'f{i}.txt'] = b'1 2 3\n' * (i + 1)
+            tasks.append({'url': http_file_server.url(f'f{i}.txt'),
+                          'dest_path': os.path.join(temp_data_dir, f'f{i}.txt')})
+        loader = PhysioNetLoader()
+
+        results = loader.download_files_concurrent(tasks, show_progress=False, backend='async')
+
+        assert results['success'] == 10
+        assert results['bytes_downloaded'] == sum(6 * (i + 1) for i in range(10))
+        assert [r['dest_path'] for r in results['all_results']] == [t['dest_path'] for t in tasks]
+        assert loader.get_download_stats()['success'] == 10
+
+    def test_unknown_backend(self):
+        """Test that unknown backends are rejected."""
+        from gaitsetpy.dataset.physionet import PhysioNetLoader
+
+        with pytest.raises(ValueError):
+            PhysioNetLoader().download_files_concurrent([], backend='processes')
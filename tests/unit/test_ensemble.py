@@ -0,0 +1,140 @@
+"""
+Unit tests for the voting and stacking ensemble over a shared feature matrix.
+
+Maintainer: @aharshit123456
+"""
+
+import os
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from gaitsetpy.classification import EnsembleModel
+from gaitsetpy.classification.models import RandomForestModel, get_classification_model
+
+try:
+    import torch
+    PYTORCH_AVAILABLE = True
+except ImportError:
+    PYTORCH_AVAILABLE = False
+
+SENSORS = ('shank', 'thigh')
+FAST_MEMBERS = [('random_forest', {'n_estimators': 20, 'max_workers': 1}), ('mlp', {'max_iter': 300})]
+
+
+class TestEnsembleModel:
+    """Test cases for EnsembleModel training, voting and persistence."""
+
+    @pytest.mark.parametrize("voting", ['soft', 'hard', 'stacking'])
+    def test_voting_methods(self, voting, make_arrays):
+        """Test that every voting method fits and predicts valid labels."""
+        X, y = make_arrays()
+        ensemble = EnsembleModel(FAST_MEMBERS, voting=voting, stack_folds=3)
+        ensemble.fit_arrays(X[:180], y[:180])
+        proba = ensemble.predict_arrays(X[180:], return_probabilities=True)
+        assert proba.shape == (60, 3)
+        np.testing.assert_allclose(proba.sum(axis=1), 1.0)
+        assert (ensemble.predict_arrays(X[180:]) == y[180:]).mean() > 0.8
+        assert (ensemble.model is not None) == (voting == 'stacking')
+
+    def test_soft_voting_averages_members(self, make_arrays):
+        """Test that soft voting is the weighted mean of member probabilities."""
+        X, y = make_arrays()
+        ensemble = EnsembleModel(FAST_MEMBERS, weights=[3, 1])
+        ensemble.fit_arrays(X, y)
+        probabilities = ensemble.member_probabilities(X)
+        expected = (3 * probabilities['random_forest'] + probabilities['mlp']) / 4
+        np.testing.assert_allclose(ensemble.combine(probabilities), expected)
+
+    def test_train_evaluate_and_timings(self, make_features):
+        """Test training from feature dictionaries, per-member metrics and the timing report."""
+        ensemble = EnsembleModel(FAST_MEMBERS, max_workers=2)
+        ensemble.train(make_features(120, sensors=SENSORS, noise=0.3), test_size=0.25)
+        metrics = ensemble.evaluate(make_features(120, sensors=SENSORS, noise=0.3), detailed_report=True)
+        assert set(metrics['members']) == {'random_forest', 'mlp'}
+        assert metrics['accuracy'] > 0.8 and 'classification_report' in metrics['members']['mlp']
+        assert np.sum(metrics['confusion_matrix']) == len(ensemble.y_test)
+        timings = metrics['timings']
+        assert timings['preprocess_seconds'] >= 0 and timings['fit_wall_seconds'] > 0
+        assert all({'fit_seconds', 'predict_seconds'} <= set(t) for t in timings['members'].values())
+        report = ensemble.timing_report()
+        assert 'random_forest' in report and 'preprocess' in report
+
+    def test_stacking_with_groups(self, make_arrays):
+        """Test stacking folds that keep subjects together."""
+        X, y = make_arrays()
+        groups = np.repeat(['S1', 'S2', 'S3', 'S4'], 60)
+        ensemble = EnsembleModel(FAST_MEMBERS, voting='stacking', stack_folds=10)
+        folds = ensemble._stack_folds(y, groups)
+        assert len(folds) == 4 and all(len(np.unique(groups[rows])) == 1 for rows in folds)
+        ensemble.fit_arrays(X, y, groups=groups)
+        assert ensemble.timings['members']['mlp']['stack_fit_seconds'] > 0
+        assert ensemble.model.coef_.shape == (3, 6)
+
+    def test_member_specifications(self):
+        """Test names, instances, numbering of repeated models and rejected members."""
+        ensemble = EnsembleModel(['mlp', RandomForestModel(n_estimators=5), ('MLP', {'max_iter': 50})])
+        assert ensemble.member_names == ['mlp', 'random_forest', 'mlp_2']
+        with pytest.raises(ValueError, match="Unsupported voting"):
+            EnsembleModel(voting='median')
+        with pytest.raises(ValueError, match="weights"):
+            EnsembleModel(['mlp'], weights=[1, 2])
+        with pytest.raises(ValueError):
+            EnsembleModel([])
+        with pytest.raises(ValueError):
+            EnsembleModel(max_workers=0)
+        with pytest.raises(ValueError, match="must be trained"):
+            EnsembleModel().predict_arrays(np.zeros((1, 4)))
+
+    def test_missing_class_columns_aligned(self, make_arrays):
+        """Test that a member trained without one class gets a zero column for it."""
+        X, y = make_arrays()
+        ensemble = EnsembleModel(FAST_MEMBERS)
+        ensemble.fit_arrays(X, y)
+        partial = RandomForestModel(n_estimators=5, max_workers=1)
+        partial.fit_arrays(X[y != 1], y[y != 1])
+        proba = ensemble._probabilities(partial, X)
+        assert proba.shape == (len(X), 3) and not proba[:, 1].any()
+
+    def test_save_and_load(self, temp_data_dir, make_arrays):
+        """Test that a loaded ensemble predicts like the saved one."""
+        X, y = make_arrays()
+        ensemble = EnsembleModel(FAST_MEMBERS, voting='stacking', stack_folds=2)
+        ensemble.fit_arrays(X, y)
+        path = os.path.join(temp_data_dir, 'ensemble.joblib')
+        ensemble.save_model(path)
+        loaded = EnsembleModel()
+        loaded.load_model(path)
+        assert loaded.member_names == ['random_forest', 'mlp'] and loaded.config['voting'] == 'stacking'
+        np.testing.assert_array_equal(loaded.predict_arrays(X), ensemble.predict_arrays(X))
+
+    def test_factory(self):
+        """Test creating the ensemble through get_classification_model."""
+        ensemble = get_classification_model('ensemble', models=['mlp'], voting='hard')
+        assert isinstance(ensemble, EnsembleModel) and ensemble.config['voting'] == 'hard'
+
+    @pytest.mark.skipif(not PYTORCH_AVAILABLE, reason="PyTorch not available")
+    def test_pytorch_members_sized_from_data(self, make_arrays):
+        """Test that PyTorch members get their input size and classes from the data."""
+        torch.manual_seed(0)
+        X, y = make_arrays()
+        members = [('lstm', {'epochs': 3, 'lr': 0.01, 'device': 'cpu'}),
+                   ('cnn', {'epochs': 3, 'lr': 0.01, 'device': 'cpu'})]
+        ensemble = EnsembleModel(members + FAST_MEMBERS[:1])
+        ensemble.fit_arrays(X, y)
+        assert ensemble.members['lstm'].config['input_size'] == 4
+        assert ensemble.members['cnn'].config['num_classes'] == 3
+        assert ensemble.predict_arrays(X[:10], return_probabilities=True).shape == (10, 3)
+
+    @pytest.mark.skipif(not PYTORCH_AVAILABLE, reason="PyTorch not available")
+    def test_members_checked_without_instantiation(self):
+        """Test that named members are checked on their class without building a network."""
+        with patch('gaitsetpy.classification.models.lstm.LSTMModel.__init__', side_effect=AssertionError):
+            assert EnsembleModel(['lstm', 'mlp']).member_names == ['lstm', 'mlp']
+
+    @pytest.mark.skipif(not PYTORCH_AVAILABLE, reason="PyTorch not available")
+    def test_gnn_rejected(self):
+        """Test that models without array training are rejected."""
+        with pytest.raises(ValueError, match="arrays"):
+            EnsembleModel(['gnn'])
@@ -0,0 +1,102 @@
+"""
+Unit tests for compact inference-only model export.
+
+Maintainer: @aharshit123456
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from gaitsetpy.classification import InferenceModel, export_model, load_exported
+from gaitsetpy.classification.models.mlp import MLPModel
+from gaitsetpy.classification.models.random_forest import RandomForestModel
+
+try:
+    import torch
+    from gaitsetpy.classification.models import BiLSTMModel, CNNModel, GNNModel, LSTMModel
+    PYTORCH_AVAILABLE = True
+except ImportError:
+    PYTORCH_AVAILABLE = False
+
+CLASSES = (1, 3, 5)
+
+
+class TestSklearnExport:
+    """Test cases for exporting scikit-learn based models."""
+
+    @pytest.mark.parametrize("compress", [0, 3])
+    def test_random_forest_roundtrip(self, temp_data_dir, compress, make_features):
+        """Test that an exported forest predicts like the original and keeps its schema."""
+        model = RandomForestModel(n_estimators=5, max_workers=1)
+        model.train(make_features(classes=CLASSES), validation_split=False)
+        schema = export_model(model, temp_data_dir, compress=compress)
+
+        with open(os.path.join(temp_data_dir, 'schema.json')) as f:
+            assert json.load(f) == schema
+        assert schema['n_features'] == 2 and schema['input_layout'] == 'flat'
+        assert schema['class_labels'] == [1, 3, 5]
+
+        inference = load_exported(temp_data_dir)
+        assert isinstance(inference, InferenceModel)
+        features = make_features(classes=CLASSES, seed=1)
+        np.testing.assert_array_equal(inference.predict(features), model.predict(features))
+        np.testing.assert_allclose(inference.predict(features, return_probabilities=True),
+                                   model.predict(features, return_probabilities=True))
+        assert list(inference.decode([0, 2])) == [1, 5]
+
+    def test_mlp_drops_training_state(self, temp_data_dir, make_features):
+        """Test that optimiser state is not exported and the trained model is untouched."""
+        model = MLPModel(hidden_layer_sizes=(8,), max_iter=20)
+        model.train(make_features(classes=CLASSES))
+        export_model(model, temp_data_dir, label_map={1: 0, 3: 1, 5: 2})
+
+        inference = load_exported(temp_data_dir, mmap_mode=None)
+        assert not hasattr(inference.model, '_optimizer')
+        assert not hasattr(inference.model, 'loss_curve_')
+        assert hasattr(model.model, '_optimizer')
+        assert inference.class_labels == [1, 3, 5]
+        np.testing.assert_array_equal(inference.predict(make_features(classes=CLASSES)), model.predict(make_features(classes=CLASSES)))
+
+    def test_errors(self, temp_data_dir, make_features):
+        """Test rejection of untrained models and wrongly shaped input."""
+        with pytest.raises(ValueError, match="trained"):
+            export_model(RandomForestModel(), temp_data_dir)
+        model = RandomForestModel(n_estimators=2, max_workers=1)
+        model.train(make_features(classes=CLASSES), validation_split=False)
+        export_model(model, temp_data_dir)
+        with pytest.raises(ValueError, match="shape"):
+            load_exported(temp_data_dir).predict_array(np.zeros((4, 3)))
+
+
+@pytest.mark.skipif(not PYTORCH_AVAILABLE, reason="PyTorch not available")
+class TestTorchScriptExport:
+    """Test cases for exporting PyTorch models as TorchScript."""
+
+    @pytest.mark.parametrize("model_class, kwargs, layout", [
+        (LSTMModel if PYTORCH_AVAILABLE else None, {'input_size': 2}, 'sequence'),
+        (BiLSTMModel if PYTORCH_AVAILABLE else None, {'input_size': 2}, 'sequence'),
+        (CNNModel if PYTORCH_AVAILABLE else None, {'input_channels': 2}, 'channels'),
+    ])
+    def test_roundtrip(self, temp_data_dir, model_class, kwargs, layout, make_features):
+        """Test that traced modules reproduce the model's predictions."""
+        torch.manual_seed(0)
+        model = model_class(num_classes=3, epochs=2, device='cpu', **kwargs)
+        model.train(make_features(classes=CLASSES))
+        schema = export_model(model, temp_data_dir)
+        assert schema['backend'] == 'torchscript' and schema['input_layout'] == layout
+
+        inference = load_exported(temp_data_dir)
+        assert isinstance(inference.model, torch.jit.ScriptModule)
+        np.testing.assert_array_equal(inference.predict(make_features(classes=CLASSES, seed=1)), model.predict(make_features(classes=CLASSES, seed=1)))
+        probabilities = inference.predict(make_features(classes=CLASSES), return_probabilities=True)
+        np.testing.assert_allclose(probabilities.sum(axis=1), 1, rtol=1e-5)
+
+    def test_gnn_not_exportable(self, temp_data_dir, make_features):
+        """Test that graph models are rejected."""
+        model = GNNModel(input_dim=2, output_dim=3, epochs=1, graph='knn')
+        model.train(make_features(classes=CLASSES))
+        with pytest.raises(ValueError, match="No export format"):
+            export_model(model, temp_data_dir)
@@ -574,3 +574,94 @@ def test_urfall_media_extractor_rgb_to_gray():
     assert 'mean_intensity' in f
     # green channel mean -> ~1/3 if simple mean over channels
     assert 0.2 <= f['mean_intensity'] <= 0.5
+
+
+def _reference_media_features(frames):
+    """Per-frame float implementation the batched extractor must match."""
+    intensities, motions, prev = [], [], None
+    for f in frames:
+        arr = np.asarray(f, dtype=np.float64)
+        if arr.ndim == 3:
+            arr = arr.mean(axis=2)
+        intensities.append(arr.mean())
+        if prev is not None:
+            motions.append(np.abs(arr - prev).mean())
+        prev = arr
+    return {
+        'mean_intensity': np.mean(intensities), 'std_intensity': np.std(intensities),
+        'motion_mean': np.mean(motions), 'motion_std': np.std(motions),
+    }
+
+
+def test_urfall_media_extractor_chunked_integer_matches_reference():
+    rng = np.random.default_rng(1)
+    extractor = UrFallMediaFeatureExtractor(verbose=False)
+    for frames in (rng.integers(0, 8000, size=(23, 12, 16), dtype=np.uint16),
+                   rng.integers(0, 256, size=(23, 12, 16, 3), dtype=np.uint8)):
+        expected = _reference_media_features(frames)
+        for data in (frames, list(frames)):
+            f = extractor.extract_features([{'name': 's', 'data': data}], fs=30, chunk_size=5)[0]['features']
+            for key, value in expected.items():
+                assert f[key] == pytest.approx(value)
+
+
+def test_urfall_media_extractor_downsample():
+    frames = np.random.default_rng(2).integers(0, 256, size=(6, 9, 8), dtype=np.uint8)
+    extractor = UrFallMediaFeatureExtractor(verbose=False)
+    f = extractor.extract_features([{'name': 's', 'data': frames}], fs=30, downsample=4)[0]['features']
+    # Block means over the 8x8 region that fits whole 4x4 blocks.
+    expected = _reference_media_features(frames[:, :8, :8])
+    assert f['mean_intensity'] == pytest.approx(expected['mean_intensity'])
+    assert f['motion_mean'] <= expected['motion_mean'] + 1e-9
+
+
+def test_urfall_media_extractor_colour_motion():
+    # Red and blue swap: the channel mean is unchanged but every channel moves
+    first = np.zeros((2, 4, 4, 3), dtype=np.uint8)
+    first[0, ..., 0] = 90
+    first[1, ..., 2] = 90
+    extractor = UrFallMediaFeatureExtractor(verbose=False)
+    gray = extractor.extract_features([{'name': 's', 'data': first}], fs=30, grayscale=True)[0]['features']
+    colour = extractor.extract_features([{'name': 's', 'data': first}], fs=30, grayscale=False)[0]['features']
+    assert gray['motion_mean'] == 0.0
+    assert colour['motion_mean'] == pytest.approx(60.0)
+    assert colour['mean_intensity'] == pytest.approx(gray['mean_intensity'])
+
+
+def test_urfall_media_extractor_downsampled_foreground_ignores_invalid_edges():
+    # Far wall with an invalid band whose edge cuts through 4x4 blocks, and a near object
+    frames = np.full((3, 40, 20), 4000, dtype=np.uint16)
+    frames[:, :6, :] = 0
+    frames[:, 16:36, 8:12] = 1000
+    extractor = UrFallMediaFeatureExtractor(verbose=False)
+    for max_depth in (2000, None):
+        full = extractor.extract_features([{'name': 's', 'data': frames}], fs=30,
+                                          foreground_max_depth=max_depth)[0]['features']
+        reduced = extractor.extract_features([{'name': 's', 'data': frames}], fs=30, downsample=4,
+                                             foreground_max_depth=max_depth)[0]['features']
+        assert full['fg_height_mean'] == pytest.approx(20 / 40)
+        assert reduced['fg_height_mean'] == pytest.approx(5 / 10)
+
+
+def test_urfall_media_extractor_depth_fall_features():
+    # A near object (depth 1000) against a far wall (4000) that collapses to the floor.
+    frames = np.full((8, 40, 20), 4000, dtype=np.uint16)
+    for t in range(8):
+        top = 4 if t < 4 else 30
+        frames[t, top:36, 8:12] = 1000
+    frames[:, :2, :] = 0  # invalid depth
+    extractor = UrFallMediaFeatureExtractor(verbose=False)
+    f = extractor.extract_features([{'name': 'fall', 'data': frames}], fs=30, chunk_size=3)[0]['features']
+
+    assert f['fg_height_min'] == pytest.approx(6 / 40)
+    assert f['fg_height_drop'] == pytest.approx((32 - 6) / 40)
+    assert f['centroid_drop'] == pytest.approx((32.5 - 19.5) / 40)
+    still = extractor.extract_features([{'name': 'adl', 'data': frames[:4]}], fs=30)[0]['features']
+    assert still['centroid_drop'] == 0.0
+
+    fixed = extractor.extract_features([{'name': 'fall', 'data': frames}], fs=30,
+                                       foreground_max_depth=2000)[0]['features']
+    assert fixed['centroid_drop'] == pytest.approx(f['centroid_drop'])
+    rgb = extractor.extract_features([{'name': 'rgb', 'data': np.zeros((2, 4, 4, 3), np.uint8)}], fs=30,
+                                     foreground_max_depth=None)[0]['features']
+    assert 'centroid_drop' not in rgb
@@ -0,0 +1,144 @@
+"""
+Unit tests for graph construction, neighbour sampling and sparse GNN training.
+
+Maintainer: @aharshit123456
+"""
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from gaitsetpy.classification.utils.graph import (
+    NeighborSampler,
+    body_location,
+    feature_node_layout,
+    knn_graph,
+    normalize_adjacency,
+    topology_graph,
+)
+
+try:
+    import torch
+    from gaitsetpy.classification.models.gnn import GNNModel, SimpleGCN, to_torch_sparse
+    PYTORCH_AVAILABLE = True
+except ImportError:
+    PYTORCH_AVAILABLE = False
+
+SENSORS = ('shank', 'thigh', 'trunk')
+
+
+class TestGraphConstruction:
+    """Test cases for the k-NN and topology graph builders."""
+
+    def test_knn_graph_matches_brute_force(self):
+        """Test kNN edges against a dense distance computation."""
+        X = np.random.default_rng(0).standard_normal((60, 4))
+        adj = knn_graph(X, k=3, symmetric=False, normalize=False)
+
+        distances = ((X[:, None] - X[None]) ** 2).sum(-1)
+        np.fill_diagonal(distances, np.inf)
+        expected = np.argsort(distances, axis=1)[:, :3]
+        for i in range(60):
+            assert set(adj[i].indices) == set(expected[i])
+        assert sp.issparse(adj) and adj.nnz == 180
+
+    def test_knn_graph_symmetric_normalized(self):
+        """Test symmetry and normalisation of the default kNN graph."""
+        adj = knn_graph(np.random.default_rng(1).standard_normal((30, 2)), k=4)
+        assert abs(adj - adj.T).max() < 1e-6
+        assert np.all(adj.diagonal() > 0)
+        with pytest.raises(ValueError):
+            knn_graph(np.zeros((5, 2)), k=0)
+
+    def test_topology_graph(self):
+        """Test spatial edges between neighbouring body locations and temporal edges."""
+        sensors = ['shank'] * 2 + ['thigh'] * 2 + ['WRST_ACC_X'] * 2
+        adj = topology_graph(sensors, [0, 1] * 3, normalize=False).toarray()
+
+        assert body_location('BELT_ACC_X') == 'trunk'
+        assert adj[0, 2] and adj[1, 3]  # shank - thigh, same window
+        assert not adj[0, 4]  # shank - wrist are not adjacent
+        assert not adj[0, 3]  # different windows of different sensors
+        assert adj[0, 1] and adj[4, 5]  # consecutive windows
+        np.testing.assert_array_equal(adj, adj.T)
+
+    def test_feature_node_layout(self, make_features):
+        """Test that the layout follows preprocess_features' row order."""
+        features = make_features(5, sensors=SENSORS)
+        features.append({'name': 'bad', 'annotations': [0] * 5, 'features': {'mean': [1.0] * 3}})
+        sensors, windows = feature_node_layout(features)
+        assert list(sensors[:6]) == ['shank'] * 5 + ['thigh']
+        assert list(windows[:6]) == [0, 1, 2, 3, 4, 0]
+        assert len(sensors) == 15
+
+
+class TestNeighborSampler:
+    """Test cases for neighbour-sampled mini-batches."""
+
+    def test_full_neighbourhood_is_exact(self):
+        """Test that sampling all neighbours reproduces two full propagation steps."""
+        rng = np.random.default_rng(0)
+        adj = knn_graph(rng.standard_normal((200, 3)), k=5)
+        H = rng.standard_normal((200, 4))
+        out = np.zeros((200, 4))
+        for node_ids, (block1, block2) in NeighborSampler(adj, [None, None], batch_size=32, shuffle=False):
+            out[node_ids[:block2.shape[0]]] = block2 @ (block1 @ H[node_ids])
+        np.testing.assert_allclose(out, adj @ (adj @ H), atol=1e-5)
+
+    def test_sampled_blocks_are_bounded(self):
+        """Test block shapes, fan-out limits and unbiased rescaling."""
+        adj = normalize_adjacency(sp.random(300, 300, density=0.1, random_state=0) > 0)
+        sampler = NeighborSampler(adj, [4, 2], batch_size=16, random_state=0)
+        node_ids, (block1, block2) = sampler.sample(np.arange(16))
+
+        assert block2.shape == (16, block1.shape[0])
+        assert block1.shape[1] == len(node_ids) == len(np.unique(node_ids))
+        assert np.diff(block2.indptr).max() <= 4
+        assert np.diff(block1.indptr).max() <= 2
+        np.testing.assert_allclose(block2.sum(axis=1).A.ravel()[:16], adj[:16].sum(axis=1).A.ravel(), rtol=0.5)
+        assert len(sampler) == 19
+
+
+@pytest.mark.skipif(not PYTORCH_AVAILABLE, reason="PyTorch not available")
+class TestSparseGNN:
+    """Test cases for sparse and mini-batch GNN training."""
+
+    def test_sparse_matches_dense(self):
+        """Test that sparse propagation gives the dense result."""
+        model = SimpleGCN(3, 8, 2)
+        adj = knn_graph(np.random.default_rng(0).standard_normal((20, 3)), k=3)
+        x = torch.randn(20, 3)
+        dense = model(x, torch.tensor(adj.toarray()))
+        assert torch.allclose(model(x, to_torch_sparse(adj)), dense, atol=1e-5)
+        assert torch.allclose(model(x, to_torch_sparse(torch.tensor(adj.toarray()).to_sparse_csr())), dense, atol=1e-5)
+
+    @pytest.mark.parametrize("graph", ["knn", "topology"])
+    def test_minibatch_training_with_built_graph(self, graph, make_features):
+        """Test training and prediction on a built graph with sampled mini-batches."""
+        torch.manual_seed(0)
+        features = make_features(40, sensors=SENSORS)
+        model = GNNModel(input_dim=2, hidden_dim=16, lr=0.05, epochs=30, graph=graph, k=5,
+                         batch_size=16, num_neighbors=[5, 5], random_state=0)
+        model.train(features)
+        predictions = model.predict(features)
+        assert predictions.shape == (120,)
+        assert model.evaluate(features)['accuracy'] > 0.8
+
+    def test_minibatch_inference_matches_full_graph(self, make_features):
+        """Test that mini-batch inference equals full-graph inference."""
+        features = make_features(40, sensors=SENSORS)
+        model = GNNModel(input_dim=2, epochs=2, graph='knn')
+        model.train(features)
+        full = model.predict(features)
+        model.config['batch_size'] = 7
+        np.testing.assert_array_equal(model.predict(features), full)
+
+    def test_invalid_graph_arguments(self, make_features):
+        """Test rejection of unknown graph types and mismatched adjacency."""
+        with pytest.raises(ValueError):
+            GNNModel(graph='complete')
+        model = GNNModel(input_dim=2, epochs=1)
+        with pytest.raises(ValueError, match="Adjacency matrix must be provided"):
+            model.train(make_features(40, sensors=SENSORS))
+        with pytest.raises(ValueError, match="does not match"):
+            model.train(make_features(40, sensors=SENSORS), adjacency_matrix=sp.identity(5))
@@ -0,0 +1,118 @@
+"""
+Unit tests for int8 and bfloat16 CPU inference of the PyTorch models.
+
+Maintainer: @aharshit123456
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+try:
+    import torch
+    from gaitsetpy.classification import export_model, load_exported
+    from gaitsetpy.classification.models import BiLSTMModel, CNNModel, LSTMModel
+    from gaitsetpy.classification.models.torch_utils import quantize_dynamic, run_inference
+    PYTORCH_AVAILABLE = True
+except ImportError:
+    PYTORCH_AVAILABLE = False
+
+pytestmark = pytest.mark.skipif(not PYTORCH_AVAILABLE, reason="PyTorch not available")
+
+ARRAYS = {'n': 400, 'n_features': 6, 'spacing': 2.0, 'noise': 0.3}
+
+
+@pytest.fixture
+def trained(make_arrays):
+    """Factory for a model of the given class trained on well separated classes."""
+    def train(model_class):
+        torch.manual_seed(0)
+        kwargs = {'input_channels': 6} if model_class is CNNModel else {'input_size': 6, 'hidden_size': 16}
+        model = model_class(num_classes=3, epochs=30, device='cpu', **kwargs)
+        model.fit_arrays(*make_arrays(**ARRAYS))
+        return model
+    return train
+
+
+class TestInferenceModes:
+    """Test cases for optimize_for_inference on the LSTM, BiLSTM and CNN models."""
+
+    @pytest.mark.parametrize("model_class", [LSTMModel, BiLSTMModel, CNNModel] if PYTORCH_AVAILABLE else [])
+    @pytest.mark.parametrize("mode", ['int8', 'bfloat16'])
+    def test_parity_with_float32(self, model_class, mode, make_arrays, trained):
+        """Test that optimised predictions match the float model."""
+        model = trained(model_class)
+        X, _ = make_arrays(**ARRAYS, seed=1)
+        expected = model.predict_arrays(X, return_probabilities=True)
+
+        report = model.optimize_for_inference(mode, reference=X)
+        assert model.inference_mode == mode and model.float_model is not None
+        assert report['agreement'] >= 0.99
+        np.testing.assert_allclose(model.predict_arrays(X, return_probabilities=True), expected, atol=0.05)
+
+        model.optimize_for_inference('float32')
+        assert model.float_model is None
+        np.testing.assert_array_equal(model.predict_arrays(X, return_probabilities=True), expected)
+
+    def test_int8_replaces_lstm_and_linear(self, trained):
+        """Test that dynamic quantisation swaps the LSTM and Linear layers."""
+        model = trained(LSTMModel)
+        model.optimize_for_inference('int8')
+        layer_types = {type(m).__name__ for m in model.model.modules()}
+        assert 'LSTM' in layer_types and 'Linear' in layer_types
+        assert any('quantized' in type(m).__module__ for m in model.model.modules())
+        assert not any('quantized' in type(m).__module__ for m in model.float_model.modules())
+
+    def test_invalid_requests(self, make_arrays, trained):
+        """Test unknown modes, untrained models and failed parity checks."""
+        model = trained(LSTMModel)
+        with pytest.raises(ValueError, match="Unsupported inference mode"):
+            model.optimize_for_inference('float16')
+        with pytest.raises(ValueError, match="trained"):
+            LSTMModel(input_size=6, device='cpu').optimize_for_inference()
+        X, _ = make_arrays(**ARRAYS, seed=1)
+        with pytest.raises(ValueError, match="keeping float32"):
+            model.optimize_for_inference('int8', reference=X, min_agreement=1.01)
+        assert model.inference_mode == 'float32' and model.float_model is None
+
+    def test_save_and_retrain_use_float_weights(self, temp_data_dir, make_arrays, trained):
+        """Test that saving writes float weights and training drops the optimised model."""
+        model = trained(CNNModel)
+        X, y = make_arrays(**ARRAYS, seed=1)
+        expected = model.predict_arrays(X, return_probabilities=True)
+        model.optimize_for_inference('int8')
+        path = os.path.join(temp_data_dir, 'cnn.pth')
+        model.save_model(path)
+
+        loaded = CNNModel(input_channels=6, num_classes=3, device='cpu')
+        loaded.load_model(path)
+        assert loaded.inference_mode == 'float32'
+        np.testing.assert_allclose(loaded.predict_arrays(X, return_probabilities=True), expected, atol=1e-6)
+
+        model.fit_arrays(X, y)
+        assert model.inference_mode == 'float32' and model.float_model is None
+
+    def test_export_keeps_mode(self, temp_data_dir, make_arrays, trained):
+        """Test exporting a quantised model and predicting with the artifact."""
+        model = trained(LSTMModel)
+        model.optimize_for_inference('int8')
+        X, _ = make_arrays(**ARRAYS, seed=1)
+        schema = export_model(model, temp_data_dir)
+        assert schema['inference_mode'] == 'int8'
+        np.testing.assert_allclose(load_exported(temp_data_dir).predict_proba_array(X),
+                                   model.predict_arrays(X, return_probabilities=True), atol=1e-5)
+
+
+class TestTorchUtils:
+    """Test cases for the module-level inference helpers."""
+
+    def test_run_inference_batches(self):
+        """Test that batched and unbatched inference agree and the source is untouched."""
+        net = torch.nn.Sequential(torch.nn.Linear(4, 8), torch.nn.ReLU(), torch.nn.Linear(8, 2)).eval()
+        X = torch.randn(50, 4)
+        np.testing.assert_allclose(run_inference(net, X, batch_size=7), run_inference(net, X), atol=1e-6)
+        quantized = quantize_dynamic(net)
+        assert isinstance(net[0], torch.nn.Linear) and type(net[0]) is not type(quantized[0])
+        assert run_inference(quantized, X, 'int8').dtype == torch.float32
+        assert run_inference(net, X, 'bfloat16').dtype == torch.float32
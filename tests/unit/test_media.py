@@ -0,0 +1,165 @@
+"""
+Unit tests for the lazy media frame reader in GaitSetPy.
+
+This module tests FrameReader on zip archives and directories of PNG frames
+(16-bit depth and RGB), its stride/ROI/prefetch options and its use as the data
+of UrFall media windows.
+
+Maintainer: @aharshit123456
+"""
+
+import io
+import os
+import threading
+import zipfile
+
+import numpy as np
+import pytest
+
+from gaitsetpy.dataset.media import PIL_AVAILABLE, FrameReader
+
+pytestmark = pytest.mark.skipif(not PIL_AVAILABLE, reason="Pillow not available")
+
+
+def _png_bytes(array: np.ndarray) -> bytes:
+    from PIL import Image
+    buffer = io.BytesIO()
+    Image.fromarray(array).save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def depth_frames():
+    """Ten 16-bit depth frames with distinct values."""
+    rng = np.random.default_rng(0)
+    return [rng.integers(0, 8000, size=(24, 32), dtype=np.uint16) + i for i in range(10)]
+
+
+@pytest.fixture
+def depth_zip(temp_data_dir, depth_frames):
+    """UrFall-style depth archive for sequence fall-01."""
+    path = os.path.join(temp_data_dir, 'fall-01-cam0-d.zip')
+    with zipfile.ZipFile(path, 'w') as zf:
+        for i, frame in enumerate(depth_frames):
+            zf.writestr(f'fall-01-cam0-d/fall-01-cam0-d-{i + 1:03d}.png', _png_bytes(frame))
+    return path
+
+
+class TestFrameReader:
+    """Test cases for FrameReader."""
+
+    def test_depth_frames_from_zip(self, depth_zip, depth_frames):
+        """Test that 16-bit depth frames round-trip exactly."""
+        reader = FrameReader(depth_zip)
+        frames = list(reader)
+
+        assert len(reader) == 10
+        assert all(frame.dtype == np.uint16 for frame in frames)
+        for frame, expected in zip(frames, depth_frames):
+            np.testing.assert_array_equal(frame, expected)
+
+    def test_stride_start_stop(self, depth_zip, depth_frames):
+        """Test frame subsampling."""
+        reader = FrameReader(depth_zip, start=1, stop=9, stride=3)
+        frames = list(reader)
+
+        assert len(reader) == len(frames) == 3
+        for frame, expected in zip(frames, depth_frames[1:9:3]):
+            np.testing.assert_array_equal(frame, expected)
+
+    def test_roi(self, depth_zip, depth_frames):
+        """Test region-of-interest cropping."""
+        frame = next(iter(FrameReader(depth_zip, roi=(4, 20, 8, 16))))
+        np.testing.assert_array_equal(frame, depth_frames[0][4:20, 8:16])
+
+        with pytest.raises(ValueError):
+            FrameReader(depth_zip, roi=(10, 5, 0, 4))
+
+    def test_prefetch_matches_inline_decoding(self, depth_zip):
+        """Test that decode-ahead yields the same frames in the same order."""
+        inline = list(FrameReader(depth_zip))
+        ahead = list(FrameReader(depth_zip, prefetch=2))
+
+        assert len(ahead) == len(inline)
+        for a, b in zip(ahead, inline):
+            np.testing.assert_array_equal(a, b)
+
+    def test_prefetch_early_stop_releases_thread(self, depth_zip):
+        """Test that abandoning an iteration stops the decode thread."""
+        before = threading.active_count()
+        iterator = iter(FrameReader(depth_zip, prefetch=1))
+        next(iterator)
+        iterator.close()
+
+        assert threading.active_count() == before
+
+    def test_prefetch_propagates_errors(self, temp_data_dir):
+        """Test that decode errors reach the consumer."""
+        path = os.path.join(temp_data_dir, 'broken.zip')
+        with zipfile.ZipFile(path, 'w') as zf:
+            zf.writestr('frame-001.png', b'not a png')
+
+        with pytest.raises(Exception):
+            list(FrameReader(path, prefetch=2))
+
+    def test_rgb_and_grayscale(self, temp_data_dir):
+        """Test RGB decoding and grayscale conversion from a directory."""
+        rgb = np.zeros((6, 8, 3), dtype=np.uint8)
+        rgb[..., 1] = 200
+        with open(os.path.join(temp_data_dir, 'frame-001.png'), 'wb') as f:
+            f.write(_png_bytes(rgb))
+
+        colour = next(iter(FrameReader(temp_data_dir)))
+        gray = next(iter(FrameReader(temp_data_dir, grayscale=True)))
+
+        np.testing.assert_array_equal(colour, rgb)
+        assert gray.shape == (6, 8) and gray.dtype == np.uint8
+        assert 0 < gray.mean() < 200
+
+    def test_iter_chunks(self, depth_zip):
+        """Test stacking frames into fixed-size chunks."""
+        chunks = list(FrameReader(depth_zip).iter_chunks(4))
+        assert [chunk.shape for chunk in chunks] == [(4, 24, 32), (4, 24, 32), (2, 24, 32)]
+
+    def test_invalid_source(self, temp_data_dir):
+        """Test errors for missing and unsupported sources."""
+        with pytest.raises(FileNotFoundError):
+            FrameReader(os.path.join(temp_data_dir, 'missing.zip'))
+        path = os.path.join(temp_data_dir, 'notes.txt')
+        with open(path, 'w') as f:
+            f.write('x')
+        with pytest.raises(ValueError):
+            FrameReader(path)
+
+
+class TestUrFallFrames:
+    """Test cases for UrFall frame access through the loader and media extractor."""
+
+    def test_get_frame_reader(self, temp_data_dir, depth_zip, depth_frames):
+        """Test that the loader finds zipped and extracted frames."""
+        from gaitsetpy.dataset.archives import extract_members
+        from gaitsetpy.dataset.urfall import UrFallLoader
+
+        loader = UrFallLoader()
+        reader = loader.get_frame_reader(temp_data_dir, 'fall-01', 'depth', stride=2)
+        assert len(reader) == 5
+
+        extract_members(depth_zip, os.path.join(temp_data_dir, 'fall-01-cam0-d'))
+        os.remove(depth_zip)
+        reader = loader.get_frame_reader(temp_data_dir, 'fall-01', 'depth')
+        np.testing.assert_array_equal(next(iter(reader)), depth_frames[0])
+
+        with pytest.raises(FileNotFoundError):
+            loader.get_frame_reader(temp_data_dir, 'adl-01', 'rgb')
+
+    def test_media_extractor_accepts_reader(self, depth_zip, depth_frames):
+        """Test that media features from a lazy reader match a materialised list."""
+        from gaitsetpy.features.urfall_features import UrFallMediaFeatureExtractor
+
+        extractor = UrFallMediaFeatureExtractor()
+        lazy = extractor.extract_features([{'name': 'fall-01', 'data': FrameReader(depth_zip, prefetch=4)}], fs=30)
+        eager = extractor.extract_features([{'name': 'fall-01', 'data': depth_frames}], fs=30)
+
+        assert lazy[0]['features'].keys() == eager[0]['features'].keys()
+        for key, value in eager[0]['features'].items():
+            assert lazy[0]['features'][key] == pytest.approx(value)
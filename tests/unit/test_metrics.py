@@ -0,0 +1,120 @@
+"""
+Unit tests for streaming confusion matrices and event detection metrics.
+
+Maintainer: @aharshit123456
+"""
+
+import numpy as np
+import pytest
+from sklearn.metrics import classification_report, confusion_matrix, f1_score, recall_score
+
+from gaitsetpy.classification import StreamingConfusionMatrix, StreamingEventLatency, confusion_by_group
+
+
+def _predictions(n=2000, n_classes=4, seed=0):
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, n_classes, n)
+    y_pred = np.where(rng.random(n) < 0.7, y_true, rng.integers(0, n_classes, n))
+    return y_true, y_pred
+
+
+class TestStreamingConfusionMatrix:
+    """Test cases for incremental confusion matrices and derived metrics."""
+
+    def test_chunked_updates_match_sklearn(self):
+        """Test that chunked accumulation equals sklearn's matrix and metrics."""
+        y_true, y_pred = _predictions()
+        confusion = StreamingConfusionMatrix()
+        for start in range(0, len(y_true), 333):
+            confusion.update(y_true[start:start + 333], y_pred[start:start + 333])
+        np.testing.assert_array_equal(confusion.matrix, confusion_matrix(y_true, y_pred))
+        assert confusion.total == len(y_true)
+        np.testing.assert_allclose(confusion.f1(), f1_score(y_true, y_pred, average=None))
+        np.testing.assert_allclose(confusion.sensitivity(), recall_score(y_true, y_pred, average=None))
+        negatives = y_true != 0
+        assert confusion.specificity()[0] == pytest.approx((y_pred[negatives] != 0).mean())
+
+        expected = classification_report(y_true, y_pred, output_dict=True)
+        report = confusion.classification_report()
+        assert report.keys() == expected.keys()
+        for key, value in expected.items():
+            if isinstance(value, dict):
+                for metric, number in value.items():
+                    assert report[key][metric] == pytest.approx(number)
+            else:
+                assert report[key] == pytest.approx(value)
+
+    def test_merge_partial_matrices(self):
+        """Test merging matrices of different sizes, sum() and the summary."""
+        y_true, y_pred = _predictions()
+        parts = [StreamingConfusionMatrix.from_predictions(y_true[i::3], y_pred[i::3]) for i in range(3)]
+        merged = sum(parts)
+        np.testing.assert_array_equal(merged.matrix, confusion_matrix(y_true, y_pred))
+        assert parts[0].total == len(y_true[0::3])
+
+        small = StreamingConfusionMatrix.from_predictions([0, 1], [1, 1])
+        grown = small + StreamingConfusionMatrix.from_predictions([3], [2])
+        assert grown.n_classes == 4 and small.n_classes == 2 and grown.total == 3
+
+        summary = StreamingConfusionMatrix(n_classes=3).update([0, 0, 1], [0, 1, 1]).summary()
+        assert summary['accuracy'] == pytest.approx(2 / 3)
+        assert summary['balanced_accuracy'] == pytest.approx(0.75)
+        assert summary['support'] == [2, 1, 0] and summary['f1'][2] == 0.0
+
+    def test_invalid_input(self):
+        """Test rejection of mismatched lengths and non-code labels."""
+        confusion = StreamingConfusionMatrix()
+        with pytest.raises(ValueError, match="same length"):
+            confusion.update([0, 1], [0])
+        with pytest.raises(ValueError, match="label codes"):
+            confusion.update(['walk'], ['walk'])
+        with pytest.raises(ValueError, match="negative"):
+            confusion.update([-1], [0])
+        assert confusion.update([], []).total == 0 and confusion.accuracy() == 0.0
+
+    def test_confusion_by_group(self):
+        """Test per-group matrices from one pass."""
+        y_true, y_pred = _predictions()
+        groups = np.random.default_rng(1).choice(['S01', 'S02', 'S03'], len(y_true))
+        matrices = confusion_by_group(y_true, y_pred, groups, n_classes=5)
+        assert list(matrices) == ['S01', 'S02', 'S03']
+        for group, confusion in matrices.items():
+            mask = groups == group
+            np.testing.assert_array_equal(confusion.matrix,
+                                          confusion_matrix(y_true[mask], y_pred[mask], labels=range(5)))
+        np.testing.assert_array_equal(sum(matrices.values()).matrix[:4, :4], confusion_matrix(y_true, y_pred))
+
+
+class TestStreamingEventLatency:
+    """Test cases for event detection latency and false alarms."""
+
+    y_true = np.array([0, 0, 1, 1, 1, 0, 0, 1, 1, 0, 0, 0, 1, 1, 1, 1, 0])
+    y_pred = np.array([0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 0, 1])
+
+    def test_event_metrics(self):
+        """Test latencies, missed events and false alarms of one stream."""
+        result = StreamingEventLatency(event_class=1, sample_rate=2.0).update(self.y_true, self.y_pred).result()
+        assert result['n_events'] == 3 and result['n_detected'] == 2 and result['n_missed'] == 1
+        assert result['false_alarms'] == 3
+        assert result['mean_latency'] == pytest.approx(0.75) and result['max_latency'] == pytest.approx(1.0)
+        assert result['false_alarms_per_hour'] == pytest.approx(3 / (17 / 2 / 3600))
+
+    def test_chunk_boundaries(self):
+        """Test that any split of the stream into chunks gives the same result."""
+        expected = StreamingEventLatency().update(self.y_true, self.y_pred).result()
+        n = len(self.y_true)
+        for first in range(1, n):
+            for second in range(first, n):
+                tracker = StreamingEventLatency()
+                for start, stop in ((0, first), (first, second), (second, n)):
+                    tracker.update(self.y_true[start:stop], self.y_pred[start:stop])
+                assert tracker.result() == expected
+
+    def test_merge_streams(self):
+        """Test merging recordings evaluated separately."""
+        first = StreamingEventLatency().update(self.y_true[:10], self.y_pred[:10])
+        second = StreamingEventLatency().update([1, 1, 0], [0, 1, 0])
+        merged = first.merge(second).result()
+        assert merged['n_events'] == 3 and merged['n_detected'] == 2
+        assert sorted(first.latencies) == [1, 2]
+        assert StreamingEventLatency().result()['mean_latency'] is None
@@ -0,0 +1,110 @@
+"""
+Unit tests for feature mini-batches and out-of-core training.
+
+Maintainer: @aharshit123456
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from gaitsetpy.classification import iter_batches
+from gaitsetpy.classification.models.mlp import MLPModel
+from gaitsetpy.classification.models.random_forest import RandomForestModel
+from gaitsetpy.classification.utils.batches import encode_batch, is_reiterable, source_classes
+from gaitsetpy.dataset.corpus import write_corpus
+
+
+class TestIterBatches:
+    """Test cases for batch iteration over feature sources."""
+
+    def test_array_batches_cover_rows(self, make_arrays):
+        """Test equal-sized batches in storage order and shuffled."""
+        X, y = make_arrays(n=1001, noise=0.5)
+        batches = list(iter_batches((X, y), batch_size=300))
+        assert [len(b[0]) for b in batches] == [250, 250, 250, 251]
+        np.testing.assert_array_equal(np.concatenate([b[0] for b in batches]), X)
+
+        shuffled = list(iter_batches((X, y), batch_size=300, shuffle=True, random_state=0))
+        rows = np.concatenate([b[0][:, 0] for b in shuffled])
+        assert not np.array_equal(rows, X[:, 0])
+        np.testing.assert_array_equal(np.sort(rows), np.sort(X[:, 0]))
+
+    def test_corpus_and_generator_sources(self, make_arrays, temp_data_dir):
+        """Test memory-mapped corpus sources and pass-through generators."""
+        X, y = make_arrays(n=100, noise=0.5)
+        store = write_corpus(os.path.join(temp_data_dir, 'corpus'),
+                             [{'name': 'r1', 'features': X[:60], 'labels': y[:60]},
+                              {'name': 'r2', 'features': X[60:], 'labels': y[60:]}])
+        batches = list(iter_batches(store, batch_size=50))
+        assert len(batches) == 2 and batches[0][0].dtype == np.float32
+        np.testing.assert_array_equal(source_classes(store), [0, 1, 2])
+
+        generator = ((X[i:i + 10], y[i:i + 10]) for i in range(0, 100, 10))
+        assert not is_reiterable(generator) and is_reiterable(store)
+        assert len(list(iter_batches(generator))) == 10
+        with pytest.raises(ValueError):
+            source_classes(iter([]))
+
+    def test_encode_batch(self):
+        """Test encoding against the full class list."""
+        classes = np.array([2, 5, 9])
+        assert list(encode_batch([9, 2, 9], classes)) == [2, 0, 2]
+        with pytest.raises(ValueError, match="not in classes"):
+            encode_batch([2, 7], classes)
+        with pytest.raises(ValueError):
+            encode_batch([10], classes)
+
+
+class TestOutOfCoreTraining:
+    """Test cases for fit_batches on the scikit-learn models."""
+
+    def test_random_forest_fit_batches(self, make_arrays):
+        """Test per-batch tree growth, label codes and accuracy."""
+        X, y = make_arrays(n=3000, noise=0.5)
+        model = RandomForestModel(max_workers=1)
+        model.fit_batches((X, y * 2 + 1), trees_per_batch=4, batch_size=1000, random_state=0)
+        assert model.n_trees == 12 and model.config['n_estimators'] == 100
+        assert model.label_map == {1: 0, 3: 1, 5: 2}
+        assert (model.predict_arrays(X) == y).mean() > 0.9
+
+        # A second call starts a new forest
+        model.fit_batches((X, y), trees_per_batch=2, batch_size=1500)
+        assert len(model.model.estimators_) == 4
+
+        # A fresh in-memory fit grows the configured forest again
+        model.fit_arrays(X[:500], y[:500])
+        assert model.n_trees == 100
+
+    def test_random_forest_batches_missing_classes(self, make_arrays):
+        """Test storage-order shards that each cover only some classes."""
+        X, y = make_arrays(n=3000, noise=0.5)
+        order = np.argsort(y, kind='stable')
+        model = RandomForestModel(max_workers=1)
+        model.fit_batches(((X[order[i:i + 1000]], y[order[i:i + 1000]]) for i in range(0, 3000, 1000)),
+                          classes=[0, 1, 2], trees_per_batch=3)
+        assert model.predict_arrays(X[:5], return_probabilities=True).shape == (5, 3)
+        assert all(tree.n_classes_ == 3 for tree in model.model.estimators_)
+
+    def test_mlp_fit_batches(self, make_arrays):
+        """Test partial_fit training over several epochs."""
+        X, y = make_arrays(n=3000, noise=0.5)
+        model = MLPModel(hidden_layer_sizes=(16,))
+        model.fit_batches((X, y), epochs=40, batch_size=500, random_state=0)
+        assert model.trained and len(model.feature_names) == 4
+        assert (model.predict_arrays(X) == y).mean() > 0.9
+
+    def test_invalid_arguments(self, make_arrays):
+        """Test rejection of unsupported solvers, one-shot sources and bad sizes."""
+        X, y = make_arrays(n=100, noise=0.5)
+        with pytest.raises(ValueError, match="solver"):
+            MLPModel(solver='lbfgs').fit_batches((X, y))
+        with pytest.raises(ValueError, match="re-iterable"):
+            MLPModel().fit_batches(iter([(X, y)]), classes=[0, 1, 2], epochs=2)
+        with pytest.raises(ValueError, match="trees_per_batch"):
+            RandomForestModel().fit_batches((X, y), trees_per_batch=0)
+        with pytest.raises(ValueError, match="batch_size"):
+            RandomForestModel().fit_batches((X, y), batch_size=0)
+        with pytest.raises(ValueError, match="classes"):
+            RandomForestModel().fit_batches(iter([(X, y)]))
@@ -0,0 +1,124 @@
+"""
+Unit tests for the floating point precision policy in GaitSetPy.
+
+Maintainer: @aharshit123456
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import gaitsetpy as gsp
+from gaitsetpy.core.precision import (
+    as_float_array,
+    cast_frame,
+    encode_labels,
+    float_dtype,
+    get_precision,
+    label_dtype,
+    precision,
+    set_precision,
+)
+
+
+class TestPrecisionPolicy:
+    """Test cases for the global precision setting and helpers."""
+
+    def test_default_and_context(self):
+        """Test the float64 default and temporary switching."""
+        assert get_precision() == 'float64'
+        with precision(np.float32):
+            assert float_dtype() == np.float32
+            assert as_float_array([1, 2]).dtype == np.float32
+            assert as_float_array(np.zeros(2)).dtype == np.float64
+        assert float_dtype() == np.float64
+        assert gsp.precision is precision
+
+    def test_policy_shared_by_threads(self):
+        """Test that the documented process-wide policy reaches worker threads."""
+        from concurrent.futures import ThreadPoolExecutor
+        with precision('float32'), ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(get_precision).result() == 'float32'
+        assert get_precision() == 'float64'
+
+    def test_invalid_precision(self):
+        """Test that unsupported precisions are rejected."""
+        with pytest.raises(ValueError):
+            set_precision('float16')
+        with pytest.raises(ValueError):
+            set_precision('double-ish')
+        assert get_precision() == 'float64'
+
+    def test_encode_labels(self):
+        """Test compact zero-based label codes."""
+        codes, label_map = encode_labels(np.array([3, 7, 3, 5]))
+        assert codes.dtype == np.int8
+        assert list(codes) == [0, 2, 0, 1]
+        assert label_map == {3: 0, 5: 1, 7: 2}
+        assert isinstance(next(iter(label_map)), int)
+        assert label_dtype(200) == np.int16
+
+    def test_cast_frame(self):
+        """Test casting float columns and integer-coded columns."""
+        df = pd.DataFrame({'x': [0.5, 1.5], 'label': [1.0, 2.0], 'name': ['a', 'b'], 'gap': [1.0, np.nan]})
+        with precision('float32'):
+            cast_frame(df, int_columns=['label', 'gap'])
+        assert df['x'].dtype == np.float32
+        assert df['label'].dtype == np.int8
+        assert df['gap'].dtype == np.float64
+        assert df['name'].dtype == object
+
+
+class TestPrecisionPipeline:
+    """Test cases for the policy applied through loaders, preprocessing and features."""
+
+    def test_daphnet_parse(self, temp_data_dir):
+        """Test that Daphnet recordings parse into the policy dtype with int8 annotations."""
+        from gaitsetpy.dataset.daphnet import _read_subject
+
+        path = os.path.join(temp_data_dir, "S01R01.txt")
+        np.savetxt(path, np.column_stack([np.arange(4) * 15, np.ones((4, 9)) * 100, [0, 1, 2, 1]]), fmt='%d')
+        with precision('float32'):
+            df = _read_subject(path)
+        assert df['shank_v'].dtype == np.float32
+        assert df['shank'].dtype == np.float32
+        assert df['annotations'].dtype == np.int8
+
+    def test_preprocessing_follows_policy(self):
+        """Test that integer input is processed in the policy dtype."""
+        from gaitsetpy.preprocessing.detrend import detrend
+
+        with precision('float32'):
+            assert detrend(np.arange(10), order=1).dtype == np.float32
+        assert detrend(np.arange(10), order=1).dtype == np.float64
+
+    def test_harup_features_in_policy_dtype(self):
+        """Test that batched HAR-UP features match the per-window reference in float32."""
+        from gaitsetpy.features.harup_features import HARUPFeatureExtractor
+
+        rng = np.random.default_rng(0)
+        data = [rng.standard_normal(50) for _ in range(6)]
+        extractor = HARUPFeatureExtractor()
+        with precision('float32'):
+            features = extractor.extract_features([{'name': 'a', 'data': data}], fs=100)
+        for window, row in zip(data, features):
+            reference = {}
+            extractor._extract_time_domain_features(window, reference)
+            extractor._extract_freq_domain_features(window, reference)
+            assert list(row) == ['sensor'] + list(reference)
+            assert row['mean'].dtype == np.float32
+            for key, value in reference.items():
+                np.testing.assert_allclose(row[key], value, rtol=1e-4, atol=1e-4)
+
+    def test_preprocess_features_compact_labels(self):
+        """Test that preprocess_features returns float32 X, int8 codes and the label map."""
+        from gaitsetpy.classification.utils.preprocess import preprocess_features
+
+        features = [{'name': 's', 'features': {'mean': [0.1, 0.2, 0.3], 'std': [1.0, 2.0, 3.0]},
+                     'annotations': [1, 2, 1]}]
+        X, y, label_map = preprocess_features(features, return_label_map=True)
+        assert X.dtype == np.float32 and X.shape == (3, 2)
+        assert y.dtype == np.int8 and list(y) == [0, 1, 0]
+        assert label_map == {1: 0, 2: 1}
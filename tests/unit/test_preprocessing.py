@@ -12,6 +12,8 @@ import pandas as pd
 import numpy as np
 from unittest.mock import patch, Mock
 
+from gaitsetpy.core.managers import PreprocessingManager
+
 from gaitsetpy.preprocessing.preprocessors import (
     ClippingPreprocessor,
     NoiseRemovalPreprocessor,
@@ -167,9 +169,10 @@ class TestOutlierRemovalPreprocessor:
         preprocessor.fit(data)
         result = preprocessor.transform(data)
         
-        # Should remove the outlier
-        assert len(result) < len(data)
-        assert 100 not in result
+        # Should replace the outlier with NaN and keep the shape
+        assert result.shape == data.shape
+        assert np.isnan(result[-1])
+        np.testing.assert_array_equal(result[:-1], data[:-1])
     
     def test_transform_pandas_dataframe(self):
         """Test transform method with pandas DataFrame."""
@@ -182,6 +185,63 @@ class TestOutlierRemovalPreprocessor:
         # Should replace the outlier with NaN
         assert len(result) == len(data)
         assert np.isnan(result['col1'].iloc[-1])  # Last value should be NaN (outlier)
+    
+    def test_transform_strategies(self):
+        """Test clip and interpolate replacement strategies."""
+        data = np.array([1.0, 2.0, 3.0, 100.0, 5.0, 6.0])
+        
+        clipped = OutlierRemovalPreprocessor(threshold=2, method='mad', strategy='clip').fit_transform(data)
+        interpolated = OutlierRemovalPreprocessor(threshold=2, method='mad', strategy='interpolate').fit_transform(data)
+        
+        assert clipped.shape == data.shape
+        assert 5.0 < clipped[3] < 100.0
+        np.testing.assert_allclose(interpolated, [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    
+    def test_transform_per_channel(self):
+        """Test that statistics are computed per channel."""
+        rng = np.random.default_rng(0)
+        data = np.column_stack([rng.normal(0, 1, 500), rng.normal(1000, 50, 500)])
+        data[100, 0] = 20.0
+        data[200, 1] = 2000.0
+        
+        preprocessor = OutlierRemovalPreprocessor(threshold=5, method='mad')
+        result = preprocessor.fit_transform(data)
+        
+        assert result.shape == data.shape
+        assert preprocessor.mask_.sum() == 2
+        assert preprocessor.mask_[100, 0] and preprocessor.mask_[200, 1]
+        assert np.isnan(result[100, 0]) and np.isnan(result[200, 1])
+    
+    def test_rolling_zscore(self):
+        """Test that rolling Z-scores follow a drifting signal."""
+        t = np.arange(2000, dtype=float)
+        data = 0.01 * t + np.sin(t / 10.0)
+        data[1500] += 10.0
+        
+        rolling = OutlierRemovalPreprocessor(method='rolling_zscore', window=101, strategy='nan')
+        result = rolling.fit_transform(data)
+        
+        assert np.flatnonzero(rolling.mask_).tolist() == [1500]
+        assert np.isnan(result[1500])
+    
+    def test_invalid_method(self):
+        """Test that unknown methods and strategies raise errors."""
+        data = np.arange(10.0)
+        with pytest.raises(ValueError):
+            OutlierRemovalPreprocessor(method='unknown').fit(data)
+        with pytest.raises(ValueError):
+            OutlierRemovalPreprocessor(strategy='drop').fit_transform(data)
+    
+    def test_legacy_remove_outliers(self):
+        """Test that the legacy function preserves shape and index."""
+        from gaitsetpy.preprocessing import remove_outliers
+        series = pd.Series([1.0, 2.0, 3.0, 4.0, 5.0, 100.0], index=list('abcdef'))
+        
+        result = remove_outliers(series, threshold=2)
+        
+        assert list(result.index) == list('abcdef')
+        assert np.isnan(result['f'])
+        np.testing.assert_array_equal(remove_outliers(series.values, threshold=2, strategy='clip') <= 100.0, True)
 
 
 class TestBaselineRemovalPreprocessor:
@@ -411,6 +471,75 @@ class TestArtifactRemovalPreprocessor:
         assert isinstance(result, pd.DataFrame)
         assert len(result) == len(data)
         assert not result['col1'].isna().any()
+    
+    @staticmethod
+    def _frame_with_gaps():
+        rng = np.random.default_rng(0)
+        data = rng.standard_normal((200, 4)).cumsum(axis=0)
+        data[10:15, :] = np.nan       # dropout across all channels
+        data[0:3, 1] = np.nan         # leading gap
+        data[190:, 2] = np.nan        # trailing gap
+        data[50:120, 3] = np.nan      # long gap
+        return data
+    
+    def test_linear_matches_pandas(self):
+        """Test that linear filling of all channels matches pandas interpolate."""
+        data = self._frame_with_gaps()
+        expected = pd.DataFrame(data).interpolate(method='linear').bfill().ffill().values
+        
+        result = ArtifactRemovalPreprocessor().fit_transform(data)
+        
+        np.testing.assert_allclose(result, expected)
+        assert not np.isnan(result).any()
+    
+    def test_forward_and_backward_fill(self):
+        """Test ffill and bfill methods."""
+        data = np.array([[np.nan, 1.0], [2.0, np.nan], [np.nan, np.nan], [4.0, 5.0]])
+        
+        ffilled = ArtifactRemovalPreprocessor(method='ffill').fit_transform(data)
+        bfilled = ArtifactRemovalPreprocessor(method='bfill').fit_transform(data)
+        
+        np.testing.assert_array_equal(ffilled, [[2.0, 1.0], [2.0, 1.0], [2.0, 1.0], [4.0, 5.0]])
+        np.testing.assert_array_equal(bfilled, [[2.0, 1.0], [2.0, 5.0], [4.0, 5.0], [4.0, 5.0]])
+    
+    def test_max_gap_marks_invalid(self):
+        """Test that gaps longer than max_gap stay NaN and are reported."""
+        data = self._frame_with_gaps()
+        preprocessor = ArtifactRemovalPreprocessor(max_gap=20)
+        
+        result = preprocessor.fit_transform(data)
+        
+        assert np.all(np.isnan(result[50:120, 3]))
+        assert preprocessor.invalid_mask_[50:120, 3].all()
+        assert preprocessor.invalid_mask_.sum() == 70
+        assert not np.isnan(np.delete(result, np.s_[50:120], axis=0)).any()
+    
+    def test_dataframe_non_numeric_columns(self):
+        """Test that non-numeric DataFrame columns are left untouched."""
+        data = pd.DataFrame({'a': [1.0, np.nan, 3.0], 'label': ['x', None, 'z']})
+        
+        result = ArtifactRemovalPreprocessor().fit_transform(data)
+        
+        assert result['a'].tolist() == [1.0, 2.0, 3.0]
+        assert result['label'].tolist() == ['x', None, 'z']
+    
+    def test_find_gaps(self):
+        """Test that runs are found per channel and do not span channels."""
+        from gaitsetpy.preprocessing import find_gaps
+        data = np.array([[np.nan, 1.0], [np.nan, np.nan], [3.0, np.nan]])
+        
+        channel, start, length = find_gaps(data)
+        
+        assert channel.tolist() == [0, 1]
+        assert start.tolist() == [0, 1]
+        assert length.tolist() == [2, 2]
+    
+    def test_legacy_remove_artifacts(self):
+        """Test the legacy function on a Series."""
+        from gaitsetpy.preprocessing import remove_artifacts
+        series = pd.Series([np.nan, 1.0, np.nan, 3.0])
+        
+        assert remove_artifacts(series).tolist() == [1.0, 1.0, 2.0, 3.0]
 
 
 class TestTrendRemovalPreprocessor:
@@ -456,6 +585,55 @@ class TestTrendRemovalPreprocessor:
         
         assert isinstance(result, pd.Series)
         assert len(result) == len(data)
+    
+    def test_matches_polyfit(self):
+        """Test that the cached projection matches np.polyfit."""
+        rng = np.random.default_rng(0)
+        data = 0.002 * np.arange(500) ** 2 + rng.standard_normal(500)
+        x = np.arange(500)
+        expected = data - np.polyval(np.polyfit(x, data, 2), x)
+        
+        result = TrendRemovalPreprocessor(order=2).fit_transform(data)
+        
+        np.testing.assert_allclose(result, expected, atol=1e-8)
+    
+    def test_batch_of_windows(self):
+        """Test that a (n_windows, window_size) batch matches per-window detrending."""
+        rng = np.random.default_rng(1)
+        windows = rng.standard_normal((50, 128)).cumsum(axis=1)
+        x = np.arange(128)
+        expected = np.array([w - np.polyval(np.polyfit(x, w, 3), x) for w in windows])
+        
+        result = TrendRemovalPreprocessor(order=3, axis=-1).fit_transform(windows)
+        
+        assert result.shape == windows.shape
+        np.testing.assert_allclose(result, expected, atol=1e-8)
+    
+    def test_segment_mode(self):
+        """Test that segments are detrended independently, including a short last segment."""
+        from gaitsetpy.preprocessing import detrend
+        data = np.concatenate([np.arange(100.0), 50 - 2 * np.arange(100.0), 3 * np.arange(30.0)])
+        
+        result = detrend(data, order=1, segment_length=100)
+        
+        np.testing.assert_allclose(result, 0, atol=1e-9)
+        assert np.abs(detrend(data, order=1)).max() > 1
+    
+    def test_projection_is_cached(self):
+        """Test that the projection is computed once per (length, order)."""
+        from gaitsetpy.preprocessing.detrend import polynomial_projection
+        first = polynomial_projection(64, 2)
+        
+        assert polynomial_projection(64, 2) is first
+        assert first[0].flags.writeable is False
+    
+    def test_legacy_remove_trend(self):
+        """Test the legacy function on a Series and on windows."""
+        from gaitsetpy.preprocessing import remove_trend
+        series = pd.Series(np.arange(10.0) * 3 + 1)
+        
+        np.testing.assert_allclose(remove_trend(series, order=1).values, 0, atol=1e-9)
+        assert remove_trend(np.ones((4, 16)), order=1, axis=-1).shape == (4, 16)
 
 
 class TestDCOffsetRemovalPreprocessor:
@@ -607,3 +785,345 @@ class TestPreprocessorChaining:
         assert len(final_signal) == len(signal)
         assert np.all(final_signal >= 0)
         assert np.all(final_signal <= 8)
+
+
+class TestPreprocessingPipeline:
+    """Test cases for the compiled PreprocessingPipeline."""
+    
+    @staticmethod
+    def _signal(n=2000, channels=3):
+        rng = np.random.default_rng(0)
+        t = np.arange(n) / 100.0
+        base = np.sin(2 * np.pi * 2 * t)[:, None] + 0.5 * t[:, None]
+        return base + 0.3 * rng.standard_normal((n, channels)) + 4.0
+    
+    def test_plan_fuses_adjacent_stages(self):
+        """Adjacent filters and mean-subtraction stages are fused."""
+        from gaitsetpy.preprocessing import PreprocessingPipeline
+        pipeline = PreprocessingPipeline([
+            'dc_offset_removal',
+            'baseline_removal',
+            'high_frequency_noise_removal',
+            'low_frequency_noise_removal',
+            'clipping'
+        ])
+        
+        assert pipeline.get_plan() == [
+            ['dc_offset_removal', 'baseline_removal'],
+            ['high_frequency_noise_removal', 'low_frequency_noise_removal'],
+            ['clipping']
+        ]
+    
+    def test_single_filter_matches_preprocessor(self):
+        """A single filter stage matches the standalone preprocessor."""
+        from gaitsetpy.preprocessing import PreprocessingPipeline
+        signal = self._signal(channels=1)[:, 0]
+        pipeline = PreprocessingPipeline([('high_frequency_noise_removal', {'cutoff': 5, 'fs': 100})])
+        
+        expected = HighFrequencyNoiseRemovalPreprocessor(cutoff=5, fs=100).fit_transform(signal)
+        
+        np.testing.assert_allclose(pipeline.fit_transform(signal), expected, atol=1e-10)
+    
+    def test_fused_filters_match_sequential_interior(self):
+        """Fused filter cascade matches sequential filtering away from the edges."""
+        from gaitsetpy.preprocessing import PreprocessingPipeline
+        signal = self._signal(channels=1)[:, 0]
+        pipeline = PreprocessingPipeline([
+            ('high_frequency_noise_removal', {'cutoff': 10, 'fs': 100}),
+            ('low_frequency_noise_removal', {'cutoff': 0.5, 'fs': 100})
+        ])
+        
+        sequential = LowFrequencyNoiseRemovalPreprocessor(cutoff=0.5, fs=100).fit_transform(
+            HighFrequencyNoiseRemovalPreprocessor(cutoff=10, fs=100).fit_transform(signal)
+        )
+        fused = pipeline.fit_transform(signal)
+        
+        np.testing.assert_allclose(fused[500:-500], sequential[500:-500], atol=1e-6)
+    
+    def test_fit_once_then_transform(self):
+        """Stateful stages are fitted once and reused on later calls."""
+        from gaitsetpy.preprocessing import PreprocessingPipeline
+        train = self._signal()
+        pipeline = PreprocessingPipeline(['baseline_removal', 'dc_offset_removal'])
+        pipeline.fit(train)
+        
+        other = train + 10.0
+        result = pipeline.transform(other)
+        
+        np.testing.assert_allclose(result, other - train.mean(axis=0))
+    
+    def test_transform_requires_fit(self):
+        """Transform before fit raises an error."""
+        from gaitsetpy.preprocessing import PreprocessingPipeline
+        pipeline = PreprocessingPipeline(['baseline_removal'])
+        
+        with pytest.raises(ValueError, match="must be fitted"):
+            pipeline.transform(np.arange(10.0))
+    
+    def test_float32_buffer_and_timings(self):
+        """The working buffer honours dtype and timings are reported per fused step."""
+        from gaitsetpy.preprocessing import PreprocessingPipeline
+        pipeline = PreprocessingPipeline(
+            ['dc_offset_removal', ('clipping', {'min_val': -2, 'max_val': 2})],
+            dtype=np.float32
+        )
+        
+        result = pipeline.fit_transform(self._signal())
+        
+        assert result.dtype == np.float32
+        assert np.all(np.abs(result) <= 2)
+        assert set(pipeline.get_timings()) == {'dc_offset_removal', 'clipping'}
+    
+    def test_dataframe_round_trip(self):
+        """DataFrames keep their index and columns."""
+        from gaitsetpy.preprocessing import PreprocessingPipeline
+        df = pd.DataFrame(self._signal(), columns=['x', 'y', 'z'])
+        pipeline = PreprocessingPipeline(['dc_offset_removal'])
+        
+        result = pipeline.fit_transform(df)
+        
+        assert isinstance(result, pd.DataFrame)
+        assert list(result.columns) == ['x', 'y', 'z']
+        np.testing.assert_allclose(result.values, (df - df.mean()).values)
+    
+    @pytest.mark.parametrize("name", PreprocessingManager().get_available_components())
+    def test_single_stage_matches_fit_transform_on_dataframe(self, name):
+        """Every stage on a (samples, channels) DataFrame matches its standalone fit_transform."""
+        from gaitsetpy.preprocessing import PreprocessingPipeline
+        rng = np.random.default_rng(2)
+        walk = np.cumsum(rng.standard_normal((2000, 3)), axis=0)
+        walk[[100, 900], [0, 2]] += 40.0
+        df = pd.DataFrame(walk, columns=['x', 'y', 'z'], index=np.arange(2000) * 10)
+        
+        expected = PreprocessingManager().create_instance(name).fit_transform(df.copy())
+        result = PreprocessingPipeline([name]).fit_transform(df)
+        
+        assert isinstance(result, pd.DataFrame)
+        pd.testing.assert_index_equal(result.index, df.index)
+        np.testing.assert_allclose(result.to_numpy(), np.asarray(expected), atol=1e-8)
+    
+    def test_legacy_noise_removal_smooths_along_time(self):
+        """The legacy factory smooths each column of a DataFrame and each Series over time."""
+        from gaitsetpy.preprocessing import create_preprocessing_pipeline
+        rng = np.random.default_rng(3)
+        df = pd.DataFrame(np.cumsum(rng.standard_normal((500, 4)), axis=0))
+        expected = df.rolling(window=5, center=True).mean().bfill().ffill()
+        
+        pd.testing.assert_frame_equal(create_preprocessing_pipeline(['noise_removal'])(df), expected)
+        pd.testing.assert_series_equal(create_preprocessing_pipeline(['noise_removal'])(df[0]), expected[0])
+    
+    def test_pickle_round_trip(self):
+        """Fitted pipelines can be pickled for process pools."""
+        import pickle
+        from gaitsetpy.preprocessing import PreprocessingPipeline
+        signal = self._signal()
+        pipeline = PreprocessingPipeline(['baseline_removal', 'high_frequency_noise_removal'])
+        expected = pipeline.fit_transform(signal)
+        
+        restored = pickle.loads(pickle.dumps(pipeline))
+        
+        np.testing.assert_allclose(restored.transform(signal), expected)
+    
+    def test_invalid_stages(self):
+        """Invalid stage specifications are rejected at construction."""
+        from gaitsetpy.preprocessing import PreprocessingPipeline
+        with pytest.raises(ValueError):
+            PreprocessingPipeline([])
+        with pytest.raises(ValueError):
+            PreprocessingPipeline(['not_a_preprocessor'])
+        with pytest.raises(TypeError):
+            PreprocessingPipeline([('clipping', 'min_val=0')])
+    
+    def test_create_preprocessing_pipeline(self):
+        """The legacy factory returns a callable compiled pipeline."""
+        from gaitsetpy.preprocessing import create_preprocessing_pipeline
+        pipeline = create_preprocessing_pipeline(
+            ['baseline_removal', 'clipping'], clipping={'min_val': -1, 'max_val': 1}
+        )
+        data = np.array([1.0, 2.0, 3.0, 10.0])
+        
+        result = pipeline(data)
+        
+        assert pipeline.fitted is True
+        assert np.all(result <= 1) and np.all(result >= -1)
+
+
+class TestStreamingPreprocessing:
+    """Test cases for the streaming (partial_fit / transform_chunk) mode."""
+    
+    @staticmethod
+    def _signal(n=1000, channels=3):
+        rng = np.random.default_rng(1)
+        t = np.arange(n) / 100.0
+        return np.sin(2 * np.pi * 1.5 * t)[:, None] + 0.2 * rng.standard_normal((n, channels)) + 2.0
+    
+    @staticmethod
+    def _stream(preprocessor, data, sizes=(1, 7, 64, 3, 250)):
+        """Feed ``data`` to ``preprocessor`` in chunks of varying size."""
+        outputs, start, i = [], 0, 0
+        while start < len(data):
+            stop = start + sizes[i % len(sizes)]
+            outputs.append(preprocessor.transform_chunk(data[start:stop]))
+            start, i = stop, i + 1
+        return np.concatenate(outputs, axis=0)
+    
+    def test_filter_chunks_match_causal_batch(self):
+        """Chunked filtering equals one causal sosfilt pass over the whole signal."""
+        from scipy.signal import sosfilt, sosfilt_zi
+        data = self._signal()
+        for preprocessor in [HighFrequencyNoiseRemovalPreprocessor(cutoff=5, fs=100),
+                             LowFrequencyNoiseRemovalPreprocessor(cutoff=0.5, fs=100),
+                             DriftRemovalPreprocessor(cutoff=0.05, fs=100)]:
+            sos = preprocessor.get_sos()
+            zi = sosfilt_zi(sos)[:, :, None] * data[0]
+            expected, _ = sosfilt(sos, data, axis=0, zi=zi)
+            
+            np.testing.assert_allclose(self._stream(preprocessor, data), expected, atol=1e-12)
+    
+    def test_baseline_chunks_match_expanding_mean(self):
+        """Welford baseline removal subtracts the expanding mean."""
+        data = self._signal()
+        expected = data - pd.DataFrame(data).expanding().mean().values
+        
+        np.testing.assert_allclose(self._stream(BaselineRemovalPreprocessor(), data), expected, atol=1e-12)
+    
+    def test_dc_offset_chunks_match_ewm(self):
+        """Exponentially weighted DC offset removal matches pandas ewm."""
+        data = self._signal()
+        expected = data - pd.DataFrame(data).ewm(alpha=0.05, adjust=False).mean().values
+        
+        result = self._stream(DCOffsetRemovalPreprocessor(alpha=0.05), data)
+        
+        np.testing.assert_allclose(result, expected, atol=1e-12)
+    
+    def test_running_stats(self):
+        """Running variance matches the expanding variance and final batch statistics."""
+        from gaitsetpy.preprocessing import RunningStats
+        data = self._signal()
+        stats = RunningStats()
+        variances = np.concatenate([stats.update(data[:10])[1], stats.update(data[10:])[1]])
+        
+        np.testing.assert_allclose(variances, pd.DataFrame(data).expanding().var(ddof=0).fillna(0).values,
+                                   atol=1e-10)
+        np.testing.assert_allclose(stats.mean, data.mean(axis=0))
+        np.testing.assert_allclose(stats.std, data.std(axis=0))
+        assert stats.count == len(data)
+        
+        with pytest.raises(ValueError):
+            RunningStats(alpha=0)
+
+    @pytest.mark.parametrize("alpha", [None, 0.1])
+    def test_running_stats_skip_nan(self, alpha):
+        """NaN samples leave the statistics unchanged instead of poisoning them."""
+        from gaitsetpy.preprocessing import RunningStats
+        data = self._signal()
+        gappy = data.copy()
+        gappy[[0, 5, 6, 300], 0] = np.nan
+        gappy[700, 1] = np.nan
+        stats = RunningStats(alpha)
+        means = np.concatenate([stats.update(gappy[:100])[0], stats.update(gappy[100:])[0]])
+
+        for channel in range(data.shape[1]):
+            valid = ~np.isnan(gappy[:, channel])
+            reference = RunningStats(alpha)
+            expected, _ = reference.update(data[valid, channel])
+            np.testing.assert_allclose(means[valid, channel], expected, atol=1e-12)
+            np.testing.assert_allclose(stats.mean[channel], reference.mean)
+            np.testing.assert_allclose(stats.var[channel], reference.var)
+        assert np.isnan(means[0, 0]) and means[6, 0] == means[4, 0]
+        assert stats.count == len(data)
+
+        baseline = BaselineRemovalPreprocessor(alpha=alpha)
+        result = self._stream(baseline, gappy)
+        assert np.isnan(result[300, 0]) and np.isfinite(result[301:, 0]).all()
+
+    def test_outlier_partial_fit_matches_batch_fit(self):
+        """partial_fit over chunks yields the global per-channel statistics."""
+        data = self._signal()
+        preprocessor = OutlierRemovalPreprocessor()
+        for start in range(0, len(data), 128):
+            preprocessor.partial_fit(data[start:start + 128])
+        
+        assert preprocessor.fitted is True
+        np.testing.assert_allclose(preprocessor.mean_, data.mean(axis=0))
+        np.testing.assert_allclose(preprocessor.std_, data.std(axis=0))
+    
+    def test_outlier_chunks_clip_spikes(self):
+        """Streaming outlier removal keeps the length and clips spikes."""
+        data = self._signal(channels=1)[:, 0]
+        data[500] = 50.0
+        
+        chunked = self._stream(OutlierRemovalPreprocessor(threshold=3, strategy='clip'), data)
+        whole = OutlierRemovalPreprocessor(threshold=3, strategy='clip').transform_chunk(data)
+        
+        assert chunked.shape == data.shape
+        np.testing.assert_allclose(chunked, whole)
+        assert chunked[500] < 5.0
+        np.testing.assert_allclose(chunked[50:500], data[50:500])
+    
+    def test_outlier_chunks_interpolate_only_outliers(self):
+        """Streaming interpolation fills outliers but keeps NaNs that were in the input."""
+        data = self._signal(channels=1)[:, 0]
+        data[500] = 50.0
+        data[600:603] = np.nan
+        
+        result = self._stream(OutlierRemovalPreprocessor(threshold=3, strategy='interpolate'), data)
+        
+        assert result[500] == data[499]
+        assert np.isnan(result[600:603]).all()
+        np.testing.assert_allclose(result[603:], data[603:])
+    
+    def test_noise_removal_chunks_match_trailing_average(self):
+        """Chunked noise removal equals a trailing moving average padded with the first sample."""
+        data = self._signal()
+        padded = np.concatenate([np.repeat(data[:1], 4, axis=0), data])
+        expected = pd.DataFrame(padded).rolling(5).mean().values[4:]
+        
+        result = self._stream(NoiseRemovalPreprocessor(window_size=5), data)
+        
+        np.testing.assert_allclose(result, expected, atol=1e-12)
+    
+    def test_artifact_removal_carries_last_value(self):
+        """Missing values are filled with the last valid value across chunk boundaries."""
+        preprocessor = ArtifactRemovalPreprocessor()
+        first = preprocessor.transform_chunk(np.array([np.nan, 1.0, 2.0]))
+        second = preprocessor.transform_chunk(np.array([np.nan, np.nan, 5.0]))
+        
+        assert np.isnan(first[0])
+        np.testing.assert_array_equal(first[1:], [1.0, 2.0])
+        np.testing.assert_array_equal(second, [2.0, 2.0, 5.0])
+    
+    def test_update_false_and_reset(self):
+        """update=False leaves the state untouched and reset_stream starts over."""
+        data = self._signal()
+        preprocessor = HighFrequencyNoiseRemovalPreprocessor(cutoff=5, fs=100)
+        first = preprocessor.transform_chunk(data[:100])
+        preprocessor.transform_chunk(data[100:200], update=False)
+        np.testing.assert_allclose(
+            preprocessor.transform_chunk(data[100:200]),
+            HighFrequencyNoiseRemovalPreprocessor(cutoff=5, fs=100).transform_chunk(data[:200])[100:]
+        )
+        
+        preprocessor.reset_stream()
+        np.testing.assert_allclose(preprocessor.transform_chunk(data[:100]), first)
+        
+        with pytest.raises(ValueError):
+            BaselineRemovalPreprocessor().transform_chunk(data, update=False)
+    
+    def test_pipeline_streaming(self):
+        """A pipeline streams chunk by chunk with the same result as one chunk."""
+        from gaitsetpy.preprocessing import PreprocessingPipeline
+        stages = ['dc_offset_removal', ('high_frequency_noise_removal', {'cutoff': 5, 'fs': 100}), 'clipping']
+        data = pd.DataFrame(self._signal(), columns=['x', 'y', 'z'])
+        
+        pipeline = PreprocessingPipeline(stages)
+        chunks = [pipeline.transform_chunk(data.iloc[i:i + 100]) for i in range(0, len(data), 100)]
+        whole = PreprocessingPipeline(stages).transform_chunk(data)
+        
+        assert isinstance(chunks[0], pd.DataFrame)
+        pd.testing.assert_frame_equal(pd.concat(chunks), whole)
+    
+    def test_unsupported_preprocessor(self):
+        """Preprocessors without a streaming mode raise NotImplementedError."""
+        with pytest.raises(NotImplementedError):
+            TrendRemovalPreprocessor().transform_chunk(np.arange(10.0))
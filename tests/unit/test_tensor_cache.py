@@ -0,0 +1,161 @@
+"""
+Unit tests for the shared tensor cache and batch prefetching.
+
+Maintainer: @aharshit123456
+"""
+
+import os
+import threading
+import warnings
+
+import numpy as np
+import pytest
+
+try:
+    import torch
+    from gaitsetpy.classification import TensorCache, prefetch
+    from gaitsetpy.classification.models import CNNModel, LSTMModel
+    PYTORCH_AVAILABLE = True
+except ImportError:
+    PYTORCH_AVAILABLE = False
+
+pytestmark = pytest.mark.skipif(not PYTORCH_AVAILABLE, reason="PyTorch not available")
+
+ARRAYS = {'n': 300, 'n_features': 5, 'spacing': 2.0, 'noise': 0.3}
+
+
+class TestTensorCache:
+    """Test cases for TensorCache construction, row access and batches."""
+
+    def test_zero_copy_construction(self, make_arrays, temp_data_dir):
+        """Test that float32 arrays and read-only memmaps are wrapped without copying."""
+        X, y = make_arrays(**ARRAYS)
+        cache = TensorCache(X, y)
+        assert cache.features.data_ptr() == X.ctypes.data
+        assert len(cache) == 300 and cache.n_features == 5 and cache.labels.dtype == torch.int64
+
+        path = os.path.join(temp_data_dir, 'features.npy')
+        np.save(path, X)
+        mapped = np.load(path, mmap_mode='r')
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            cache = TensorCache(mapped)
+        assert cache.features.data_ptr() == mapped.ctypes.data and cache.labels is None
+
+        converted = TensorCache(X.astype(np.float64))
+        assert converted.features.dtype == torch.float32
+        with pytest.raises(ValueError, match="2-D"):
+            TensorCache(X[:, 0])
+        with pytest.raises(ValueError, match="same length"):
+            TensorCache(X, y[:10])
+
+    def test_take_rows(self, make_arrays):
+        """Test full views, index and mask selection."""
+        X, y = make_arrays(**ARRAYS)
+        cache = TensorCache(X, y)
+        features, labels = cache.take()
+        assert features.data_ptr() == X.ctypes.data
+        features, labels = cache.take([5, 1])
+        np.testing.assert_array_equal(features.numpy(), X[[5, 1]])
+        np.testing.assert_array_equal(labels.numpy(), y[[5, 1]])
+        mask = y == 2
+        np.testing.assert_array_equal(cache.take(mask, device='cpu')[0].numpy(), X[mask])
+
+    def test_batches(self, make_arrays):
+        """Test batch sizes, coverage, views, shuffling and row subsets."""
+        X, y = make_arrays(**ARRAYS)
+        cache = TensorCache(X, y)
+        batches = list(cache.batches(batch_size=64))
+        assert [len(b[0]) for b in batches] == [60] * 5
+        assert batches[1][0].data_ptr() == cache.features[60].data_ptr()
+        np.testing.assert_array_equal(torch.cat([b[1] for b in batches]).numpy(), y)
+
+        torch.manual_seed(0)
+        first = torch.cat([b[1] for b in cache.batches(batch_size=64, shuffle=True)])
+        torch.manual_seed(0)
+        second = torch.cat([b[1] for b in cache.batches(batch_size=64, shuffle=True, prefetch_depth=0)])
+        assert torch.equal(first, second) and not torch.equal(first, cache.labels)
+        assert torch.equal(first.sort().values, cache.labels.sort().values)
+
+        rows = np.arange(0, 300, 3)
+        subset = torch.cat([b[0] for b in cache.batches(rows, batch_size=32, shuffle=True)])
+        np.testing.assert_array_equal(np.sort(subset[:, 0].numpy()), np.sort(X[rows, 0]))
+        with pytest.raises(ValueError, match="batch_size"):
+            cache.batches(batch_size=0)
+
+
+class TestPrefetch:
+    """Test cases for background prefetching."""
+
+    def test_order_and_lookahead(self):
+        """Test that items keep their order and are produced ahead in another thread."""
+        produced = []
+
+        def source():
+            for i in range(10):
+                produced.append(threading.get_ident())
+                yield i
+
+        iterator = prefetch(source(), depth=2)
+        assert next(iterator) == 0
+        assert list(iterator) == list(range(1, 10))
+        assert threading.get_ident() not in produced
+        assert list(prefetch(range(5), depth=0)) == list(range(5))
+
+    def test_errors_and_early_exit(self):
+        """Test that source errors propagate and breaking out stops cleanly."""
+        def failing():
+            yield 1
+            raise RuntimeError("read failed")
+
+        with pytest.raises(RuntimeError, match="read failed"):
+            list(prefetch(failing()))
+        for item in prefetch(iter(range(100))):
+            break
+        assert item == 0
+
+
+class TestModelsWithCache:
+    """Test cases for training the PyTorch models from a shared cache."""
+
+    def test_fit_and_predict_from_cache_rows(self, make_arrays):
+        """Test training several models on index views of one cache."""
+        X, y = make_arrays(**ARRAYS)
+        cache = TensorCache(X, y * 2)
+        train_rows, test_rows = np.arange(200), np.arange(200, 300)
+        torch.manual_seed(0)
+        for model in (LSTMModel(input_size=5, num_classes=5, epochs=20, lr=0.01, device='cpu', mini_batch=True),
+                      CNNModel(input_channels=5, num_classes=5, epochs=20, lr=0.01, device='cpu', mini_batch=True)):
+            model.fit_arrays(cache, rows=train_rows)
+            assert sorted(model.class_names) == [0, 2, 4]
+            predictions = model.predict_arrays(cache, rows=test_rows)
+            assert (predictions == y[test_rows] * 2).mean() > 0.9
+            np.testing.assert_array_equal(predictions, model.predict_arrays(X[test_rows]))
+        np.testing.assert_array_equal(cache.features.numpy(), X)
+
+        with pytest.raises(ValueError, match="label codes"):
+            LSTMModel(input_size=5, device='cpu').fit_arrays(TensorCache(X))
+
+    def test_full_batch_by_default(self, make_arrays, monkeypatch):
+        """Test that training takes one full-batch step per epoch unless mini_batch is set."""
+        X, y = make_arrays(**ARRAYS)
+        steps = []
+        monkeypatch.setattr(torch.optim.Adam, 'step', lambda self, *args, **kwargs: steps.append(1))
+        LSTMModel(input_size=5, num_classes=3, epochs=4, device='cpu').fit_arrays(X, y)
+        assert len(steps) == 4
+        steps.clear()
+        LSTMModel(input_size=5, num_classes=3, epochs=4, batch_size=100, device='cpu',
+                  mini_batch=True).fit_arrays(X, y)
+        assert len(steps) == 4 * 3
+
+    def test_train_caches_test_split(self, make_arrays):
+        """Test that train keeps the held-out split as a tensor for evaluate."""
+        X, y = make_arrays(**ARRAYS)
+        features = [{'name': 'sensor', 'annotations': y.tolist(),
+                     'features': {f'f{i}': X[:, i].tolist() for i in range(5)}}]
+        torch.manual_seed(0)
+        model = LSTMModel(input_size=5, num_classes=3, epochs=60, lr=0.05, device='cpu')
+        model.train(features)
+        assert torch.is_tensor(model.X_test) and model.X_test.shape == (60, 1, 5)
+        assert len(model.y_test) == 60
+        assert model.evaluate(features)['accuracy'] > 0.9
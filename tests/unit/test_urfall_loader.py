@@ -0,0 +1,154 @@
+"""
+Unit tests for UrFall tabular loading in GaitSetPy.
+
+This module tests the typed, indexed loading of the UrFall feature CSVs and the
+parallel loading of per-sequence accelerometer and synchronization files.
+
+Maintainer: @aharshit123456
+"""
+
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gaitsetpy.dataset.urfall import UrFallLoader, _rows_are_lines, build_sequence_index
+
+
+def _write_features(path, sequences, frames_per_sequence=5):
+    rows = []
+    for seq in sequences:
+        for frame in range(1, frames_per_sequence + 1):
+            rows.append([seq, frame, -1 if frame < 3 else 1] + [frame * 0.5 + k for k in range(8)])
+    pd.DataFrame(rows).to_csv(path, header=False, index=False)
+    return rows
+
+
+@pytest.fixture
+def urfall_dir(temp_data_dir):
+    """UrFall directory with feature CSVs and per-sequence accelerometer/sync files."""
+    _write_features(os.path.join(temp_data_dir, "urfall-cam0-falls.csv"), ["fall-01", "fall-02", "fall-03"])
+    _write_features(os.path.join(temp_data_dir, "urfall-cam0-adls.csv"), ["adl-01", "adl-02"])
+    for i, seq in enumerate(["fall-01", "fall-02", "adl-01"]):
+        pd.DataFrame({'time': np.arange(4), 'SV': np.arange(4) + i}).to_csv(
+            os.path.join(temp_data_dir, f"{seq}-acc.csv"), index=False)
+        pd.DataFrame({'frame': np.arange(3), 'time': np.arange(3) * 33}).to_csv(
+            os.path.join(temp_data_dir, f"{seq}-data.csv"), index=False)
+    return temp_data_dir
+
+
+class TestSequenceIndex:
+    """Test cases for the sequence -> row-range index."""
+
+    def test_build_sequence_index(self):
+        """Test contiguous and split sequences."""
+        index = build_sequence_index(["a", "a", "b", "b", "b", "a"])
+        assert index == {"a": [[0, 2], [5, 6]], "b": [[2, 5]]}
+        assert build_sequence_index([]) == {}
+
+    def test_rows_are_lines(self, temp_data_dir):
+        """Test line counting with and without a final newline or blank lines."""
+        path = os.path.join(temp_data_dir, "lines.csv")
+        for content, n_rows in [(b"a\nb\n", 2), (b"a\nb", 2), (b"", 0), (b"a\n\nb\n", 2)]:
+            with open(path, "wb") as f:
+                f.write(content)
+            assert _rows_are_lines(path, n_rows) == (content != b"a\n\nb\n")
+
+
+class TestUrFallFeatures:
+    """Test cases for loading the pre-extracted feature CSVs."""
+
+    def test_typed_columns(self, urfall_dir):
+        """Test that features are parsed with typed columns."""
+        data, names = UrFallLoader().load_data(urfall_dir)
+
+        assert names == ["urfall-cam0-falls", "urfall-cam0-adls"]
+        falls = data[0]
+        assert len(falls) == 15
+        assert falls['frame_number'].dtype == np.int32
+        assert falls['label'].dtype == np.int8
+        assert falls['H'].dtype == np.float64
+        assert falls['sequence_name'].dtype == object
+        assert falls['sequence_name'].str.startswith('fall-').all()
+        assert list(falls['activity_id'].unique()) == [1]
+
+    def test_sequence_filter_matches_full_load(self, urfall_dir):
+        """Test that index-based filtering keeps file order and row labels."""
+        loader = UrFallLoader()
+        full = loader.load_data(urfall_dir, use_adls=False)[0][0]
+        selected = loader.load_data(urfall_dir, sequences=["fall-03", "fall-01"], use_adls=False)[0][0]
+
+        expected = full[full['sequence_name'].isin(["fall-01", "fall-03"])]
+        pd.testing.assert_frame_equal(selected, expected)
+
+    def test_csv_parsed_once_per_loader(self, urfall_dir):
+        """Test that repeated loads hit the loader cache."""
+        loader = UrFallLoader()
+        with patch("gaitsetpy.dataset.urfall.pd.read_csv", wraps=pd.read_csv) as read_csv:
+            loader.load_data(urfall_dir, use_adls=False)
+            loader.load_data(urfall_dir, sequences=["fall-02"], use_adls=False)
+            loader.load_data(urfall_dir, use_adls=False)
+        assert read_csv.call_count == 1
+
+    def test_cached_frame_not_modified_by_callers(self, urfall_dir):
+        """Test that returned frames are copies of the cached frame."""
+        loader = UrFallLoader()
+        first = loader.load_data(urfall_dir, use_adls=False)[0][0]
+        first['H'] = 0.0
+        second = loader.load_data(urfall_dir, use_adls=False)[0][0]
+        assert second['H'].iloc[0] != 0.0
+
+    def test_persisted_index_reads_only_selected_rows(self, urfall_dir):
+        """Test that a fresh loader uses the persisted index for sequence filtering."""
+        expected = UrFallLoader().load_data(urfall_dir, sequences=["fall-02"], use_adls=False)[0][0]
+        assert os.path.exists(os.path.join(urfall_dir, ".gaitsetpy_cache", "urfall-cam0-falls.index.json"))
+
+        with patch("gaitsetpy.dataset.urfall.pd.read_csv", wraps=pd.read_csv) as read_csv:
+            selected = UrFallLoader().load_data(urfall_dir, sequences=["fall-02"], use_adls=False)[0][0]
+        assert read_csv.call_args.kwargs['nrows'] == 5
+        pd.testing.assert_frame_equal(selected, expected)
+
+    def test_stale_index_is_rebuilt(self, urfall_dir):
+        """Test that changing the CSV invalidates both caches."""
+        loader = UrFallLoader()
+        csv_path = os.path.join(urfall_dir, "urfall-cam0-falls.csv")
+        assert loader.get_sequence_index(urfall_dir)["fall-02"] == [[5, 10]]
+
+        _write_features(csv_path, ["fall-02", "fall-05"], frames_per_sequence=3)
+        os.utime(csv_path, ns=(0, 10 ** 9))
+
+        assert loader.get_sequence_index(urfall_dir) == {"fall-02": [[0, 3]], "fall-05": [[3, 6]]}
+        selected = UrFallLoader().load_data(urfall_dir, sequences=["fall-05"], use_adls=False)[0][0]
+        assert list(selected.index) == [3, 4, 5]
+
+    def test_unknown_sequence_gives_empty_frame(self, urfall_dir):
+        """Test filtering on a sequence that is not in the file."""
+        df = UrFallLoader().load_data(urfall_dir, sequences=["fall-09"], use_adls=False)[0][0]
+        assert df.empty
+        with pytest.raises(ValueError):
+            UrFallLoader().get_sequence_index(urfall_dir, "walk")
+
+
+class TestUrFallSequenceFiles:
+    """Test cases for per-sequence accelerometer and synchronization files."""
+
+    def test_parallel_load_keeps_order(self, urfall_dir):
+        """Test that files load in sequence order and missing ones are skipped."""
+        data, names = UrFallLoader(max_workers=4).load_data(
+            urfall_dir, data_types=['accelerometer', 'synchronization'])
+
+        assert names == ["fall-01-accelerometer", "fall-02-accelerometer", "adl-01-accelerometer",
+                         "fall-01-synchronization", "fall-02-synchronization", "adl-01-synchronization"]
+        assert [df['SV'].iloc[0] for df in data[:3]] == [0, 1, 2]
+        assert list(data[2]['activity_type'].unique()) == ['adl']
+        assert list(data[3]['sequence_name'].unique()) == ['fall-01']
+
+    def test_unreadable_file_is_skipped(self, urfall_dir):
+        """Test that a file that fails to parse only produces a warning."""
+        with open(os.path.join(urfall_dir, "fall-02-acc.csv"), "w") as f:
+            f.write("")
+        data, names = UrFallLoader().load_data(urfall_dir, data_types=['accelerometer'],
+                                               sequences=["fall-01", "fall-02"])
+        assert names == ["fall-01-accelerometer"]